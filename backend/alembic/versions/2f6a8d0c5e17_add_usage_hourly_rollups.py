@@ -0,0 +1,109 @@
+"""add usage hourly rollups
+
+Revision ID: 2f6a8d0c5e17
+Revises: 9b4e1f7c2d83
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2f6a8d0c5e17"
+down_revision: Union[str, Sequence[str], None] = "9b4e1f7c2d83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "usage_hourly_rollups",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.String(length=255), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "log_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "input_tokens", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "output_tokens",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "cache_creation_input_tokens",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "cache_read_input_tokens",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "total_tokens", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "bucket_start", name="uq_usage_hourly_rollups_user_bucket"
+        ),
+    )
+
+    # Backfill from existing logs, bucketed by UTC hour like live writes.
+    op.execute(
+        """
+        INSERT INTO usage_hourly_rollups (
+            user_id,
+            bucket_start,
+            log_count,
+            input_tokens,
+            output_tokens,
+            cache_creation_input_tokens,
+            cache_read_input_tokens,
+            total_tokens
+        )
+        SELECT
+            s.user_id,
+            date_trunc('hour', l.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            count(*),
+            coalesce(sum(l.input_tokens), 0),
+            coalesce(sum(l.output_tokens), 0),
+            coalesce(sum(l.cache_creation_input_tokens), 0),
+            coalesce(sum(l.cache_read_input_tokens), 0),
+            coalesce(sum(l.total_tokens), 0)
+        FROM usage_logs AS l
+        JOIN agent_sessions AS s ON s.id = l.session_id
+        WHERE l.include_in_user_analytics
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("usage_hourly_rollups")
@@ -0,0 +1,45 @@
+"""add workspace manifests
+
+Revision ID: 5a0d3c8e9f21
+Revises: 2f6a8d0c5e17
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a0d3c8e9f21"
+down_revision: Union[str, Sequence[str], None] = "2f6a8d0c5e17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workspace_manifests",
+        sa.Column("manifest_key", sa.Text(), nullable=False),
+        sa.Column("content", sa.JSON(), nullable=False),
+        sa.Column("file_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("manifest_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workspace_manifests")
@@ -0,0 +1,30 @@
+"""add agent run callback sequence
+
+Revision ID: 7d2c9e41a6b5
+Revises: f3b9c4d7e8a1
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2c9e41a6b5"
+down_revision: Union[str, Sequence[str], None] = "f3b9c4d7e8a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agent_runs",
+        sa.Column("last_callback_sequence", sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("agent_runs", "last_callback_sequence")
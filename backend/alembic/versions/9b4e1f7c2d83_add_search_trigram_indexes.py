@@ -0,0 +1,43 @@
+"""add search trigram indexes
+
+Revision ID: 9b4e1f7c2d83
+Revises: 7d2c9e41a6b5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e1f7c2d83"
+down_revision: Union[str, Sequence[str], None] = "7d2c9e41a6b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_agent_messages_text_preview_trgm",
+        "agent_messages",
+        ["text_preview"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"text_preview": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_agent_sessions_title_trgm",
+        "agent_sessions",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agent_sessions_title_trgm", table_name="agent_sessions")
+    op.drop_index("ix_agent_messages_text_preview_trgm", table_name="agent_messages")
@@ -0,0 +1,96 @@
+"""add background job leases and session title jobs
+
+Revision ID: b6f2d9a4c1e7
+Revises: 8c1e5b7d3f42
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6f2d9a4c1e7"
+down_revision: Union[str, Sequence[str], None] = "8c1e5b7d3f42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_JOB_TABLES = ("skill_import_jobs", "plugin_import_jobs", "memory_create_jobs")
+
+
+def upgrade() -> None:
+    for table in _JOB_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "attempt_count",
+                sa.Integer(),
+                server_default=sa.text("0"),
+                nullable=False,
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        )
+
+    op.create_table(
+        "session_title_jobs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("session_id", sa.UUID(), nullable=False),
+        sa.Column("prompt", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column(
+            "attempt_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_id"], ["agent_sessions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_session_title_jobs_session_id"),
+        "session_title_jobs",
+        ["session_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_session_title_jobs_status"),
+        "session_title_jobs",
+        ["status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_session_title_jobs_status"), table_name="session_title_jobs")
+    op.drop_index(
+        op.f("ix_session_title_jobs_session_id"), table_name="session_title_jobs"
+    )
+    op.drop_table("session_title_jobs")
+    for table in _JOB_TABLES:
+        op.drop_column(table, "lease_expires_at")
+        op.drop_column(table, "attempt_count")
@@ -0,0 +1,31 @@
+"""add agent_messages (session_id, id) index for keyset windows
+
+Revision ID: d3a7e1f9b2c4
+Revises: b6f2d9a4c1e7
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a7e1f9b2c4"
+down_revision: Union[str, Sequence[str], None] = "b6f2d9a4c1e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_agent_messages_session_id_id",
+        "agent_messages",
+        ["session_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agent_messages_session_id_id", table_name="agent_messages")
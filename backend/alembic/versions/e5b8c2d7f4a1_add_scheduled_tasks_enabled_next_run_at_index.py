@@ -0,0 +1,36 @@
+"""add agent_scheduled_tasks (enabled, next_run_at) index for dispatch
+
+Revision ID: e5b8c2d7f4a1
+Revises: d3a7e1f9b2c4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8c2d7f4a1"
+down_revision: Union[str, Sequence[str], None] = "d3a7e1f9b2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_agent_scheduled_tasks_enabled_next_run_at",
+        "agent_scheduled_tasks",
+        ["enabled", "next_run_at"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_agent_scheduled_tasks_enabled_next_run_at",
+        table_name="agent_scheduled_tasks",
+    )
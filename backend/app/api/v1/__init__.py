@@ -10,6 +10,7 @@ from app.api.v1 import (
     env_vars,
     filesystem,
     models,
+    internal_background_jobs,
     internal_claude_md,
     internal_env_vars,
     internal_memories,
@@ -77,6 +78,7 @@ api_v1_router.include_router(claude_md.router)
 api_v1_router.include_router(models.router)
 api_v1_router.include_router(search.router)
 api_v1_router.include_router(im.router)
+api_v1_router.include_router(internal_background_jobs.router)
 api_v1_router.include_router(internal_claude_md.router)
 api_v1_router.include_router(internal_env_vars.router)
 api_v1_router.include_router(internal_memories.router)
@@ -48,7 +48,7 @@ async def login_with_feishu(
 
 
 @router.get("/config", response_model=ResponseSchema[AuthConfigResponse])
-async def get_auth_config() -> JSONResponse:
+def get_auth_config() -> JSONResponse:
     return Response.success(
         data=service.get_auth_config(),
         message="Auth config retrieved successfully",
@@ -77,7 +77,7 @@ async def feishu_callback(
 
 
 @router.get("/me", response_model=ResponseSchema[CurrentUserResponse])
-async def get_current_account(
+def get_current_account(
     user: User = Depends(get_current_user),
 ) -> JSONResponse:
     return Response.success(
@@ -87,7 +87,7 @@ async def get_current_account(
 
 
 @router.post("/logout", response_model=ResponseSchema[dict[str, bool]])
-async def logout(
+def logout(
     request: Request,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
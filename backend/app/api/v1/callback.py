@@ -1,12 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
 
-from app.core.deps import get_db
 from app.schemas.callback import AgentCallbackRequest, CallbackResponse
 from app.schemas.response import Response, ResponseSchema
+from app.services.callback_ingest_service import CallbackIngestService
 from app.services.callback_service import CallbackService
 
 logger = logging.getLogger(__name__)
@@ -14,15 +13,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/callback", tags=["callback"])
 
 callback_service = CallbackService()
+callback_ingest_service = CallbackIngestService(callback_service=callback_service)
 
 
 @router.post("", response_model=ResponseSchema[CallbackResponse])
-async def receive_callback(
-    callback: AgentCallbackRequest,
-    db: Session = Depends(get_db),
-) -> JSONResponse:
+async def receive_callback(callback: AgentCallbackRequest) -> JSONResponse:
     """Receives executor callback and updates session status."""
-    result = callback_service.process_agent_callback(db, callback)
+    result = await callback_ingest_service.submit(callback)
     return Response.success(
         data=result,
         message="Callback processed successfully",
@@ -30,6 +27,6 @@ async def receive_callback(
 
 
 @router.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "callback-receiver"}
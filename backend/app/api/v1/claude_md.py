@@ -13,7 +13,7 @@ service = ClaudeMdService()
 
 
 @router.get("", response_model=ResponseSchema[ClaudeMdResponse])
-async def get_claude_md(
+def get_claude_md(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -22,7 +22,7 @@ async def get_claude_md(
 
 
 @router.put("", response_model=ResponseSchema[ClaudeMdResponse])
-async def upsert_claude_md(
+def upsert_claude_md(
     request: ClaudeMdUpsertRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -32,7 +32,7 @@ async def upsert_claude_md(
 
 
 @router.delete("", response_model=ResponseSchema[dict])
-async def delete_claude_md(
+def delete_claude_md(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -8,7 +8,7 @@ router = APIRouter(prefix="/filesystem", tags=["filesystem"])
 
 
 @router.get("/support")
-async def get_local_filesystem_support():
+def get_local_filesystem_support():
     """Return frontend-facing local filesystem availability metadata."""
     settings = get_settings()
     payload = LocalFilesystemSupport(
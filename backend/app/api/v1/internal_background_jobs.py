@@ -0,0 +1,22 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.core.deps import require_internal_token
+from app.schemas.response import Response, ResponseSchema
+from app.services.background_job_runner import background_job_runner
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get(
+    "/background-jobs/stats",
+    response_model=ResponseSchema[dict[str, dict[str, Any]]],
+)
+def get_background_job_stats(
+    _: None = Depends(require_internal_token),
+) -> JSONResponse:
+    """Queue depth and worker usage per background job type."""
+    result = background_job_runner.queue_stats()
+    return Response.success(data=result, message="Background job stats retrieved")
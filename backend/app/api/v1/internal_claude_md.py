@@ -13,7 +13,7 @@ service = ClaudeMdService()
 
 
 @router.get("/claude-md", response_model=ResponseSchema[ClaudeMdResponse])
-async def get_claude_md_internal(
+def get_claude_md_internal(
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -17,7 +17,7 @@ env_var_service = EnvVarService()
 
 
 @router.get("/env-vars/map", response_model=ResponseSchema[dict[str, str]])
-async def get_env_map(
+def get_env_map(
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -30,7 +30,7 @@ async def get_env_map(
     "/system-env-vars",
     response_model=ResponseSchema[list[SystemEnvVarResponse]],
 )
-async def list_system_env_vars(
+def list_system_env_vars(
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -42,7 +42,7 @@ async def list_system_env_vars(
     "/system-env-vars",
     response_model=ResponseSchema[SystemEnvVarResponse],
 )
-async def create_system_env_var(
+def create_system_env_var(
     request: SystemEnvVarCreateRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -55,7 +55,7 @@ async def create_system_env_var(
     "/system-env-vars/{env_var_id}",
     response_model=ResponseSchema[SystemEnvVarResponse],
 )
-async def update_system_env_var(
+def update_system_env_var(
     env_var_id: int,
     request: SystemEnvVarUpdateRequest,
     _: None = Depends(require_internal_token),
@@ -69,7 +69,7 @@ async def update_system_env_var(
     "/system-env-vars/{env_var_id}",
     response_model=ResponseSchema[dict],
 )
-async def delete_system_env_var(
+def delete_system_env_var(
     env_var_id: int,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
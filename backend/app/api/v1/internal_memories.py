@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -26,9 +26,8 @@ memory_create_job_service = MemoryCreateJobService(memory_service=memory_service
 
 
 @router.post("/memories", response_model=ResponseSchema[MemoryCreateJobEnqueueResponse])
-async def create_memories_internal(
+def create_memories_internal(
     request: InternalMemoryCreateRequest,
-    background_tasks: BackgroundTasks,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_user_id_by_session_id),
     db: Session = Depends(get_db),
@@ -42,10 +41,6 @@ async def create_memories_internal(
         user_id=user_id,
         request=memory_request,
     )
-    background_tasks.add_task(
-        memory_create_job_service.process_create_job,
-        result.job_id,
-    )
     return Response.success(
         data=result, message="Memory create job queued successfully"
     )
@@ -55,7 +50,7 @@ async def create_memories_internal(
     "/memories/jobs/{job_id:uuid}",
     response_model=ResponseSchema[MemoryCreateJobResponse],
 )
-async def get_memory_create_job_internal(
+def get_memory_create_job_internal(
     job_id: uuid.UUID,
     _token: None = Depends(require_internal_token),
     user_id: str = Depends(get_user_id_by_session_id),
@@ -72,7 +67,7 @@ async def get_memory_create_job_internal(
 
 
 @router.get("/memories", response_model=ResponseSchema[Any])
-async def list_memories_internal(
+def list_memories_internal(
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_user_id_by_session_id),
 ) -> JSONResponse:
@@ -83,7 +78,7 @@ async def list_memories_internal(
 
 
 @router.post("/memories/search", response_model=ResponseSchema[Any])
-async def search_memories_internal(
+def search_memories_internal(
     request: InternalMemorySearchRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_user_id_by_session_id),
@@ -97,7 +92,7 @@ async def search_memories_internal(
 
 
 @router.get("/memories/{memory_id}", response_model=ResponseSchema[Any])
-async def get_memory_internal(
+def get_memory_internal(
     memory_id: str,
     _token: None = Depends(require_internal_token),
     _user_id: str = Depends(get_user_id_by_session_id),
@@ -107,7 +102,7 @@ async def get_memory_internal(
 
 
 @router.put("/memories/{memory_id}", response_model=ResponseSchema[Any])
-async def update_memory_internal(
+def update_memory_internal(
     memory_id: str,
     request: InternalMemoryUpdateRequest,
     _token: None = Depends(require_internal_token),
@@ -118,7 +113,7 @@ async def update_memory_internal(
 
 
 @router.get("/memories/{memory_id}/history", response_model=ResponseSchema[Any])
-async def get_memory_history_internal(
+def get_memory_history_internal(
     memory_id: str,
     _token: None = Depends(require_internal_token),
     _user_id: str = Depends(get_user_id_by_session_id),
@@ -130,7 +125,7 @@ async def get_memory_history_internal(
 
 
 @router.delete("/memories/{memory_id}", response_model=ResponseSchema[dict[str, str]])
-async def delete_memory_internal(
+def delete_memory_internal(
     memory_id: str,
     _token: None = Depends(require_internal_token),
     _user_id: str = Depends(get_user_id_by_session_id),
@@ -142,7 +137,7 @@ async def delete_memory_internal(
 
 
 @router.delete("/memories", response_model=ResponseSchema[dict[str, bool]])
-async def delete_all_memories_internal(
+def delete_all_memories_internal(
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_user_id_by_session_id),
 ) -> JSONResponse:
@@ -16,7 +16,7 @@ service = PluginConfigService()
     "/plugin-config/resolve",
     response_model=ResponseSchema[dict],
 )
-async def resolve_plugin_config(
+def resolve_plugin_config(
     request: PluginConfigResolveRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
@@ -27,7 +27,7 @@ session_service = SessionService()
 
 
 @router.post("", response_model=ResponseSchema[SessionResponse])
-async def create_session_internal(
+def create_session_internal(
     request: SessionCreateRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
@@ -41,7 +41,7 @@ async def create_session_internal(
 
 
 @router.get("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def get_session_internal(
+def get_session_internal(
     session_id: uuid.UUID,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -54,7 +54,7 @@ async def get_session_internal(
 
 
 @router.get("/{session_id}/state", response_model=ResponseSchema[SessionStateResponse])
-async def get_session_state_internal(
+def get_session_state_internal(
     session_id: uuid.UUID,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -67,7 +67,7 @@ async def get_session_state_internal(
 
 
 @router.patch("/{session_id}/status", response_model=ResponseSchema[SessionResponse])
-async def update_session_status_internal(
+def update_session_status_internal(
     session_id: uuid.UUID,
     request: InternalSessionStatusUpdateRequest,
     _: None = Depends(require_internal_token),
@@ -88,7 +88,7 @@ async def update_session_status_internal(
     "/cancellations/claim",
     response_model=ResponseSchema[SessionCancellationClaimResponse | None],
 )
-async def claim_session_cancellation_internal(
+def claim_session_cancellation_internal(
     request: SessionCancellationClaimRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -110,7 +110,7 @@ async def claim_session_cancellation_internal(
     "/{session_id}/cancellation-complete",
     response_model=ResponseSchema[SessionCancellationCompleteResponse],
 )
-async def complete_session_cancellation_internal(
+def complete_session_cancellation_internal(
     session_id: uuid.UUID,
     request: SessionCancellationCompleteRequest,
     _: None = Depends(require_internal_token),
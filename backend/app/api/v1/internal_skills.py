@@ -20,7 +20,7 @@ pending_skill_creation_service = PendingSkillCreationService()
     "/skills/submit-from-workspace",
     response_model=ResponseSchema[SubmitSkillResponse],
 )
-async def submit_skill_from_workspace(
+def submit_skill_from_workspace(
     request: SubmitSkillRequest,
     session_id: uuid.UUID,
     _: None = Depends(require_internal_token),
@@ -16,7 +16,7 @@ service = SubAgentService()
     "/subagents/resolve",
     response_model=ResponseSchema[SubAgentResolveResponse],
 )
-async def resolve_subagents(
+def resolve_subagents(
     request: SubAgentResolveRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -10,7 +10,10 @@ from app.schemas.user_input_request import (
     UserInputRequestCreateRequest,
     UserInputRequestResponse,
 )
-from app.services.user_input_request_service import UserInputRequestService
+from app.services.user_input_request_service import (
+    MAX_WAIT_SECONDS,
+    UserInputRequestService,
+)
 
 router = APIRouter(prefix="/internal", tags=["internal"])
 
@@ -21,7 +24,7 @@ user_input_service = UserInputRequestService()
     "/user-input-requests",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def create_user_input_request(
+def create_user_input_request(
     request: UserInputRequestCreateRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -34,10 +37,27 @@ async def create_user_input_request(
     "/user-input-requests/{request_id}",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def get_user_input_request(
+def get_user_input_request(
     request_id: uuid.UUID,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = user_input_service.get_request(db, request_id=str(request_id))
     return Response.success(data=result, message="User input request retrieved")
+
+
+@router.get(
+    "/user-input-requests/{request_id}/wait",
+    response_model=ResponseSchema[UserInputRequestResponse],
+)
+async def wait_user_input_request(
+    request_id: uuid.UUID,
+    timeout_seconds: float = Query(default=25.0, ge=0, le=MAX_WAIT_SECONDS),
+    _: None = Depends(require_internal_token),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Long-poll until the request is answered or expired, or the timeout elapses."""
+    result = await user_input_service.wait_for_answer(
+        db, request_id=str(request_id), timeout_seconds=timeout_seconds
+    )
+    return Response.success(data=result, message="User input request retrieved")
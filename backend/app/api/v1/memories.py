@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -15,17 +15,15 @@ from app.schemas.memory import (
     MemoryUpdateRequest,
 )
 from app.schemas.response import Response, ResponseSchema
-from app.services.memory_create_job_service import MemoryCreateJobService
-from app.services.memory_service import MemoryService
+from app.services.memory_create_job_service import memory_create_job_service
 
 router = APIRouter(prefix="/memories", tags=["memories"])
 
-memory_service = MemoryService()
-memory_create_job_service = MemoryCreateJobService(memory_service=memory_service)
+memory_service = memory_create_job_service.memory_service
 
 
 @router.post("/configure", response_model=ResponseSchema[dict[str, bool]])
-async def configure_memory(
+def configure_memory(
     request: MemoryConfigureRequest,
     _: None = Depends(require_internal_token),
 ) -> JSONResponse:
@@ -37,9 +35,8 @@ async def configure_memory(
 
 
 @router.post("", response_model=ResponseSchema[MemoryCreateJobEnqueueResponse])
-async def create_memories(
+def create_memories(
     request: MemoryCreateRequest,
-    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -48,10 +45,6 @@ async def create_memories(
         user_id=user_id,
         request=request,
     )
-    background_tasks.add_task(
-        memory_create_job_service.process_create_job,
-        result.job_id,
-    )
     return Response.success(
         data=result, message="Memory create job queued successfully"
     )
@@ -61,7 +54,7 @@ async def create_memories(
     "/jobs/active",
     response_model=ResponseSchema[MemoryCreateJobResponse | None],
 )
-async def get_active_memory_create_job(
+def get_active_memory_create_job(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -78,7 +71,7 @@ async def get_active_memory_create_job(
     "/jobs/{job_id:uuid}",
     response_model=ResponseSchema[MemoryCreateJobResponse],
 )
-async def get_memory_create_job(
+def get_memory_create_job(
     job_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -94,7 +87,7 @@ async def get_memory_create_job(
 
 
 @router.get("", response_model=ResponseSchema[Any])
-async def list_memories(
+def list_memories(
     run_id: str | None = None,
     user_id: str = Depends(get_current_user_id),
 ) -> JSONResponse:
@@ -106,7 +99,7 @@ async def list_memories(
 
 
 @router.post("/search", response_model=ResponseSchema[Any])
-async def search_memories(
+def search_memories(
     request: MemorySearchRequest,
     user_id: str = Depends(get_current_user_id),
 ) -> JSONResponse:
@@ -115,13 +108,13 @@ async def search_memories(
 
 
 @router.get("/{memory_id}", response_model=ResponseSchema[Any])
-async def get_memory(memory_id: str) -> JSONResponse:
+def get_memory(memory_id: str) -> JSONResponse:
     result = memory_service.get_memory(memory_id)
     return Response.success(data=result, message="Memory retrieved successfully")
 
 
 @router.put("/{memory_id}", response_model=ResponseSchema[Any])
-async def update_memory(
+def update_memory(
     memory_id: str,
     request: MemoryUpdateRequest,
 ) -> JSONResponse:
@@ -130,7 +123,7 @@ async def update_memory(
 
 
 @router.get("/{memory_id}/history", response_model=ResponseSchema[Any])
-async def get_memory_history(memory_id: str) -> JSONResponse:
+def get_memory_history(memory_id: str) -> JSONResponse:
     result = memory_service.get_memory_history(memory_id=memory_id)
     return Response.success(
         data=result, message="Memory history retrieved successfully"
@@ -138,7 +131,7 @@ async def get_memory_history(memory_id: str) -> JSONResponse:
 
 
 @router.delete("/{memory_id}", response_model=ResponseSchema[dict[str, str]])
-async def delete_memory(memory_id: str) -> JSONResponse:
+def delete_memory(memory_id: str) -> JSONResponse:
     memory_service.delete_memory(memory_id=memory_id)
     return Response.success(
         data={"id": memory_id}, message="Memory deleted successfully"
@@ -146,7 +139,7 @@ async def delete_memory(memory_id: str) -> JSONResponse:
 
 
 @router.delete("", response_model=ResponseSchema[dict[str, bool]])
-async def delete_all_memories(
+def delete_all_memories(
     run_id: str | None = None,
     user_id: str = Depends(get_current_user_id),
 ) -> JSONResponse:
@@ -161,7 +154,7 @@ async def delete_all_memories(
 
 
 @router.post("/reset", response_model=ResponseSchema[dict[str, bool]])
-async def reset_memories(
+def reset_memories(
     _: None = Depends(require_internal_token),
 ) -> JSONResponse:
     memory_service.reset()
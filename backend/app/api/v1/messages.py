@@ -8,21 +8,23 @@ from app.core.errors.exceptions import AppException
 from app.schemas.message import MessageResponse
 from app.schemas.response import Response, ResponseSchema
 from app.services.message_service import MessageService
+from app.services.payload_offload_service import PayloadOffloadService
 from app.services.session_service import SessionService
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
 message_service = MessageService()
 session_service = SessionService()
+payload_offload_service = PayloadOffloadService()
 
 
 @router.get("/{message_id}", response_model=ResponseSchema[MessageResponse])
-async def get_message(
+def get_message(
     message_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets a message by ID."""
+    """Gets a message by ID, including content offloaded to object storage."""
     message = message_service.get_message(db, message_id)
     db_session = session_service.get_session(db, message.session_id)
     if db_session.user_id != user_id:
@@ -30,7 +32,9 @@ async def get_message(
             error_code=ErrorCode.FORBIDDEN,
             message="Message does not belong to the user",
         )
+    data = MessageResponse.model_validate(message)
+    data.content = payload_offload_service.hydrate(data.content)
     return Response.success(
-        data=MessageResponse.model_validate(message),
+        data=data,
         message="Message retrieved successfully",
     )
@@ -12,7 +12,7 @@ model_config_service = ModelConfigService()
 
 
 @router.get("", response_model=ResponseSchema[ModelConfigResponse])
-async def get_model_config(
+def get_model_config(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -19,7 +19,7 @@ service = PresetService()
 
 
 @router.get("", response_model=ResponseSchema[list[PresetResponse]])
-async def list_presets(
+def list_presets(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -28,7 +28,7 @@ async def list_presets(
 
 
 @router.get("/visuals", response_model=ResponseSchema[list[PresetVisualSummary]])
-async def list_preset_visuals(
+def list_preset_visuals(
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = service.list_preset_visuals(db)
@@ -39,7 +39,7 @@ async def list_preset_visuals(
 
 
 @router.get("/visuals/{visual_key}/content")
-async def get_preset_visual_content(
+def get_preset_visual_content(
     visual_key: str,
     db: Session = Depends(get_db),
 ) -> FastApiResponse:
@@ -48,7 +48,7 @@ async def get_preset_visual_content(
 
 
 @router.get("/{preset_id}", response_model=ResponseSchema[PresetResponse])
-async def get_preset(
+def get_preset(
     preset_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -58,7 +58,7 @@ async def get_preset(
 
 
 @router.post("", response_model=ResponseSchema[PresetResponse])
-async def create_preset(
+def create_preset(
     request: PresetCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -68,7 +68,7 @@ async def create_preset(
 
 
 @router.put("/{preset_id}", response_model=ResponseSchema[PresetResponse])
-async def update_preset(
+def update_preset(
     preset_id: int,
     request: PresetUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -79,7 +79,7 @@ async def update_preset(
 
 
 @router.delete("/{preset_id}", response_model=ResponseSchema[dict])
-async def delete_preset(
+def delete_preset(
     preset_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -15,7 +15,7 @@ service = ProjectFileService()
 
 
 @router.get("", response_model=ResponseSchema[list[ProjectFileResponse]])
-async def list_project_files(
+def list_project_files(
     project_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -28,7 +28,7 @@ async def list_project_files(
 
 
 @router.post("", response_model=ResponseSchema[ProjectFileResponse])
-async def add_project_file(
+def add_project_file(
     project_id: uuid.UUID,
     request: ProjectFileAddRequest,
     user_id: str = Depends(get_current_user_id),
@@ -47,7 +47,7 @@ async def add_project_file(
 
 
 @router.delete("/{file_id}", response_model=ResponseSchema[dict])
-async def remove_project_file(
+def remove_project_file(
     project_id: uuid.UUID,
     file_id: int,
     user_id: str = Depends(get_current_user_id),
@@ -25,13 +25,9 @@ from app.services.session_service import SessionService
 from app.services.storage_service import S3StorageService
 from app.services.tool_execution_service import ToolExecutionService
 from app.services.workspace_archive_service import WorkspaceArchiveService
+from app.services.workspace_manifest_service import workspace_manifest_service
 from app.utils.computer import build_browser_screenshot_key
-from app.utils.workspace import build_workspace_file_nodes
-from app.utils.workspace_manifest import (
-    build_nodes_from_manifest,
-    extract_manifest_files,
-    normalize_manifest_path,
-)
+from app.utils.workspace_manifest import normalize_manifest_path
 
 router = APIRouter(prefix="/runs", tags=["runs"])
 
@@ -43,7 +39,7 @@ workspace_archive_service = WorkspaceArchiveService()
 
 
 @router.post("/claim", response_model=ResponseSchema[RunClaimResponse | None])
-async def claim_next_run(
+def claim_next_run(
     request: RunClaimRequest,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -53,7 +49,7 @@ async def claim_next_run(
 
 
 @router.post("/{run_id}/start", response_model=ResponseSchema[RunResponse])
-async def start_run(
+def start_run(
     run_id: uuid.UUID,
     request: RunStartRequest,
     db: Session = Depends(get_db),
@@ -64,7 +60,7 @@ async def start_run(
 
 
 @router.post("/{run_id}/fail", response_model=ResponseSchema[RunResponse])
-async def fail_run(
+def fail_run(
     run_id: uuid.UUID,
     request: RunFailRequest,
     db: Session = Depends(get_db),
@@ -75,7 +71,7 @@ async def fail_run(
 
 
 @router.get("/{run_id}", response_model=ResponseSchema[RunResponse])
-async def get_run(
+def get_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -92,7 +88,7 @@ async def get_run(
 
 
 @router.get("/session/{session_id}", response_model=ResponseSchema[list[RunResponse]])
-async def list_runs_by_session(
+def list_runs_by_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
@@ -114,7 +110,7 @@ async def list_runs_by_session(
     "/{run_id}/tool-executions",
     response_model=ResponseSchema[list[ToolExecutionResponse]],
 )
-async def list_tool_executions_by_run(
+def list_tool_executions_by_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=500, ge=1, le=2000),
@@ -141,7 +137,7 @@ async def list_tool_executions_by_run(
     "/{run_id}/tool-executions/delta",
     response_model=ResponseSchema[ToolExecutionDeltaResponse],
 )
-async def list_tool_executions_delta_by_run(
+def list_tool_executions_delta_by_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     after_created_at: datetime | None = Query(default=None),
@@ -175,51 +171,12 @@ async def list_tool_executions_delta_by_run(
     )
 
 
-def _build_file_nodes_from_export(
-    *,
-    manifest_key: str | None,
-    workspace_files_prefix: str | None,
-) -> list[FileNode]:
-    if not manifest_key:
-        return []
-
-    manifest = storage_service.get_manifest(manifest_key)
-    raw_nodes = build_nodes_from_manifest(manifest)
-    manifest_files = extract_manifest_files(manifest)
-    prefix = (workspace_files_prefix or "").rstrip("/")
-    file_url_map: dict[str, str] = {}
-
-    for file_entry in manifest_files:
-        file_path = normalize_manifest_path(file_entry.get("path"))
-        if not file_path:
-            continue
-        object_key = (
-            file_entry.get("key")
-            or file_entry.get("object_key")
-            or file_entry.get("oss_key")
-            or file_entry.get("s3_key")
-        )
-        if not object_key and prefix:
-            object_key = f"{prefix}/{file_path.lstrip('/')}"
-        if not object_key:
-            continue
-        mime_type = file_entry.get("mimeType") or file_entry.get("mime_type")
-        file_url_map[file_path] = storage_service.presign_get(
-            object_key,
-            response_content_disposition="inline",
-            response_content_type=mime_type,
-        )
-
-    def build_file_url(file_path: str) -> str | None:
-        normalized = normalize_manifest_path(file_path) or file_path
-        return file_url_map.get(normalized)
-
-    return build_workspace_file_nodes(raw_nodes, file_url_builder=build_file_url)
-
-
 @router.get("/{run_id}/workspace/files", response_model=ResponseSchema[list[FileNode]])
-async def get_run_workspace_files(
+def get_run_workspace_files(
     run_id: uuid.UUID,
+    path: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -235,9 +192,13 @@ async def get_run_workspace_files(
             error_code=ErrorCode.FORBIDDEN,
             message="Run does not belong to the user",
         )
-    nodes = _build_file_nodes_from_export(
+    nodes = workspace_manifest_service.build_file_nodes(
+        db,
         manifest_key=db_run.workspace_manifest_key,
         workspace_files_prefix=db_run.workspace_files_prefix,
+        folder_path=path,
+        limit=limit,
+        offset=offset,
     )
     return Response.success(data=nodes, message="Run workspace files retrieved")
 
@@ -246,7 +207,7 @@ async def get_run_workspace_files(
     "/{run_id}/workspace/archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_run_workspace_archive(
+def get_run_workspace_archive(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -287,7 +248,7 @@ async def get_run_workspace_archive(
     "/{run_id}/workspace/folder-archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_run_workspace_folder_archive(
+def get_run_workspace_folder_archive(
     run_id: uuid.UUID,
     path: str = Query(...),
     user_id: str = Depends(get_current_user_id),
@@ -319,6 +280,7 @@ async def get_run_workspace_folder_archive(
             message="Run workspace export not ready",
         )
     archive = workspace_archive_service.get_folder_archive_for_run(
+        db,
         session=db_session,
         run=db_run,
         folder_path=path,
@@ -333,7 +295,7 @@ async def get_run_workspace_folder_archive(
     "/{run_id}/computer/browser/{tool_use_id}",
     response_model=ResponseSchema[ComputerBrowserScreenshotResponse],
 )
-async def get_run_browser_screenshot(
+def get_run_browser_screenshot(
     run_id: uuid.UUID,
     tool_use_id: str,
     user_id: str = Depends(get_current_user_id),
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/schedules", tags=["schedules"])
 
 
 @router.get("", response_model=ResponseSchema[dict])
-async def get_schedules() -> JSONResponse:
+def get_schedules() -> JSONResponse:
     """Proxy schedules from Executor Manager for frontend display."""
     settings = get_settings()
     url = f"{settings.executor_manager_url}/api/v1/schedules"
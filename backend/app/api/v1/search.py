@@ -15,11 +15,12 @@ search_service = SearchService()
 
 
 @router.get("", response_model=ResponseSchema[GlobalSearchResponse])
-async def global_search(
+def global_search(
     q: str = Query(default="", max_length=200),
     limit_tasks: int = Query(default=10, ge=0, le=20),
     limit_projects: int = Query(default=5, ge=0, le=20),
     limit_messages: int = Query(default=10, ge=0, le=20),
+    offset_messages: int = Query(default=0, ge=0, le=1000),
     project_id: uuid.UUID | None = Query(default=None),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -31,6 +32,7 @@ async def global_search(
         limit_tasks=limit_tasks,
         limit_projects=limit_projects,
         limit_messages=limit_messages,
+        offset_messages=offset_messages,
         project_id=project_id,
     )
     return Response.success(data=result, message="Search completed successfully")
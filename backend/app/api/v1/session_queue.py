@@ -35,7 +35,7 @@ def _get_owned_session(db: Session, session_id: uuid.UUID, user_id: str):
 
 
 @router.get("", response_model=ResponseSchema[list[SessionQueueItemResponse]])
-async def list_queued_queries(
+def list_queued_queries(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -46,7 +46,7 @@ async def list_queued_queries(
 
 
 @router.patch("/{item_id}", response_model=ResponseSchema[SessionQueueItemResponse])
-async def update_queued_query(
+def update_queued_query(
     session_id: uuid.UUID,
     item_id: uuid.UUID,
     request: SessionQueueItemUpdateRequest,
@@ -64,7 +64,7 @@ async def update_queued_query(
 
 
 @router.delete("/{item_id}", response_model=ResponseSchema[SessionQueueItemResponse])
-async def delete_queued_query(
+def delete_queued_query(
     session_id: uuid.UUID,
     item_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
@@ -81,7 +81,7 @@ async def delete_queued_query(
 
 
 @router.post("/{item_id}/send-now", response_model=ResponseSchema[TaskEnqueueResponse])
-async def send_queued_query_now(
+def send_queued_query_now(
     session_id: uuid.UUID,
     item_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
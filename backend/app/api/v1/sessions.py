@@ -4,9 +4,10 @@ import shutil
 from datetime import datetime
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user_id, get_db
@@ -17,7 +18,9 @@ from app.schemas.message import (
     MessageAttachmentsResponse,
     MessageDeltaResponse,
     MessageWithFilesDeltaResponse,
+    MessageWithFilesWindowResponse,
     MessageResponse,
+    MessageWindowResponse,
     MessageWithFilesResponse,
 )
 from app.schemas.response import Response, ResponseSchema
@@ -28,6 +31,7 @@ from app.schemas.session import (
     SessionCancelResponse,
     SessionCreateRequest,
     SessionEditMessageRequest,
+    SessionPageResponse,
     SessionRegenerateRequest,
     SessionResponse,
     SessionStateResponse,
@@ -42,22 +46,24 @@ from app.schemas.workspace import SubmitSkillRequest, SubmitSkillResponse
 from app.services.message_service import MessageService
 from app.services.local_mount_browser_service import LocalMountBrowserService
 from app.services.pending_skill_creation_service import PendingSkillCreationService
+from app.services.session_event_service import (
+    SessionEventCursor,
+    SessionEventStreamService,
+)
 from app.services.session_service import SessionService
 from app.services.storage_service import S3StorageService
 from app.services.tool_execution_service import ToolExecutionService
 from app.services.usage_service import UsageService
 from app.services.workspace_archive_service import WorkspaceArchiveService
+from app.services.workspace_diff_service import WorkspaceDiffService
+from app.services.workspace_manifest_service import workspace_manifest_service
 from app.utils.computer import build_browser_screenshot_key
-from app.utils.workspace import build_workspace_file_nodes
-from app.utils.workspace_manifest import (
-    build_nodes_from_manifest,
-    extract_manifest_files,
-    normalize_manifest_path,
-)
+from app.utils.workspace_manifest import normalize_manifest_path
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 session_service = SessionService()
+session_event_stream_service = SessionEventStreamService()
 message_service = MessageService()
 tool_execution_service = ToolExecutionService()
 usage_service = UsageService()
@@ -65,6 +71,7 @@ storage_service = S3StorageService()
 pending_skill_creation_service = PendingSkillCreationService()
 workspace_archive_service = WorkspaceArchiveService()
 local_mount_browser_service = LocalMountBrowserService()
+workspace_diff_service = WorkspaceDiffService()
 
 
 def _local_mount_file_url(
@@ -101,7 +108,7 @@ def _attach_local_mount_file_urls(
 
 
 @router.post("", response_model=ResponseSchema[SessionResponse])
-async def create_session(
+def create_session(
     request: SessionCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -115,7 +122,7 @@ async def create_session(
 
 
 @router.get("", response_model=ResponseSchema[list[SessionResponse]])
-async def list_sessions(
+def list_sessions(
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
@@ -140,8 +147,45 @@ async def list_sessions(
     )
 
 
+@router.get("/page", response_model=ResponseSchema[SessionPageResponse])
+def list_sessions_page(
+    user_id: str = Depends(get_current_user_id),
+    limit: int = Query(default=50, ge=1, le=200),
+    before_created_at: datetime | None = Query(default=None),
+    before_id: uuid.UUID | None = Query(default=None),
+    after_created_at: datetime | None = Query(default=None),
+    after_id: uuid.UUID | None = Query(default=None),
+    project_id: uuid.UUID | None = Query(default=None),
+    kind: str = Query(default="chat"),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Lists sessions newest first, paged by (created_at, id) cursor."""
+    if (before_created_at is None) != (before_id is None) or (
+        after_created_at is None
+    ) != (after_id is None):
+        raise AppException(
+            error_code=ErrorCode.BAD_REQUEST,
+            message="Cursor created_at and id must be provided together",
+        )
+    kind_filter = kind.strip().lower()
+    kind_value = None if kind_filter in {"", "all"} else kind_filter
+    payload = session_service.list_sessions_page(
+        db,
+        user_id,
+        limit=limit,
+        project_id=project_id,
+        kind=kind_value,
+        before=(before_created_at, before_id) if before_id is not None else None,
+        after=(after_created_at, after_id) if after_id is not None else None,
+    )
+    return Response.success(
+        data=payload,
+        message="Sessions retrieved successfully",
+    )
+
+
 @router.get("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def get_session(
+def get_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -160,7 +204,7 @@ async def get_session(
 
 
 @router.get("/{session_id}/state", response_model=ResponseSchema[SessionStateResponse])
-async def get_session_state(
+def get_session_state(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -178,8 +222,40 @@ async def get_session_state(
     )
 
 
+@router.get("/{session_id}/events")
+async def stream_session_events(
+    session_id: uuid.UUID,
+    user_id: str = Depends(get_current_user_id),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Streams message, tool execution, state and run change notifications.
+
+    Events only say what changed; clients fetch it through the delta endpoints.
+    Each event id is a resume cursor that reconnecting clients send back through
+    `Last-Event-ID` (or `cursor`); without one the stream starts at the tail.
+    """
+    db_session = await run_in_threadpool(session_service.get_session, db, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+    # The stream outlives this request's DB session; return its connection now.
+    await run_in_threadpool(db.close)
+
+    return StreamingResponse(
+        session_event_stream_service.stream(
+            session_id, cursor=SessionEventCursor.decode(last_event_id or cursor)
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def update_session(
+def update_session(
     session_id: uuid.UUID,
     request: SessionUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -202,7 +278,7 @@ async def update_session(
 @router.post(
     "/{session_id}/cancel", response_model=ResponseSchema[SessionCancelResponse]
 )
-async def cancel_session(
+def cancel_session(
     session_id: uuid.UUID,
     request: SessionCancelRequest,
     user_id: str = Depends(get_current_user_id),
@@ -225,7 +301,7 @@ async def cancel_session(
 @router.post(
     "/{session_id}/branch", response_model=ResponseSchema[SessionBranchResponse]
 )
-async def branch_session(
+def branch_session(
     session_id: uuid.UUID,
     request: SessionBranchRequest,
     user_id: str = Depends(get_current_user_id),
@@ -251,7 +327,7 @@ async def branch_session(
 @router.post(
     "/{session_id}/regenerate", response_model=ResponseSchema[TaskEnqueueResponse]
 )
-async def regenerate_message(
+def regenerate_message(
     session_id: uuid.UUID,
     request: SessionRegenerateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -273,7 +349,7 @@ async def regenerate_message(
 @router.post(
     "/{session_id}/edit-message", response_model=ResponseSchema[TaskEnqueueResponse]
 )
-async def edit_message_and_regenerate(
+def edit_message_and_regenerate(
     session_id: uuid.UUID,
     request: SessionEditMessageRequest,
     user_id: str = Depends(get_current_user_id),
@@ -293,7 +369,7 @@ async def edit_message_and_regenerate(
 
 
 @router.delete("/{session_id}", response_model=ResponseSchema[dict])
-async def delete_session(
+def delete_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -315,7 +391,7 @@ async def delete_session(
 @router.get(
     "/{session_id}/messages", response_model=ResponseSchema[list[MessageResponse]]
 )
-async def get_session_messages(
+def get_session_messages(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -339,7 +415,7 @@ async def get_session_messages(
     "/{session_id}/messages/delta",
     response_model=ResponseSchema[MessageDeltaResponse],
 )
-async def get_session_messages_delta(
+def get_session_messages_delta(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     after_message_id: int = Query(default=0, ge=0),
@@ -366,11 +442,55 @@ async def get_session_messages_delta(
     )
 
 
+@router.get(
+    "/{session_id}/messages/window",
+    response_model=ResponseSchema[MessageWindowResponse],
+)
+def get_session_messages_window(
+    session_id: uuid.UUID,
+    user_id: str = Depends(get_current_user_id),
+    before_message_id: int | None = Query(default=None, ge=1),
+    after_message_id: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=50, ge=1, le=500),
+    include_content: bool = Query(default=False),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Gets a window of messages, the latest ones when no cursor is given.
+
+    Items are summaries unless `include_content` is set; full (non-offloaded)
+    content of a single message is available from `/messages/{message_id}`.
+    """
+    db_session = session_service.get_session(db, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+    if before_message_id is not None and after_message_id is not None:
+        raise AppException(
+            error_code=ErrorCode.BAD_REQUEST,
+            message="Only one of before_message_id and after_message_id can be provided",
+        )
+
+    payload = message_service.get_messages_window(
+        db,
+        session_id,
+        before_message_id=before_message_id,
+        after_message_id=after_message_id,
+        limit=limit,
+        include_content=include_content,
+    )
+    return Response.success(
+        data=payload,
+        message="Messages retrieved successfully",
+    )
+
+
 @router.get(
     "/{session_id}/messages-with-files",
     response_model=ResponseSchema[list[MessageWithFilesResponse]],
 )
-async def get_session_messages_with_files(
+def get_session_messages_with_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -390,11 +510,43 @@ async def get_session_messages_with_files(
     )
 
 
+@router.get(
+    "/{session_id}/messages-with-files/window",
+    response_model=ResponseSchema[MessageWithFilesWindowResponse],
+)
+def get_session_messages_with_files_window(
+    session_id: uuid.UUID,
+    user_id: str = Depends(get_current_user_id),
+    before_message_id: int | None = Query(default=None, ge=1),
+    limit: int = Query(default=50, ge=1, le=500),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Gets the latest messages with attachments, or those before a cursor."""
+    db_session = session_service.get_session(db, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+
+    payload = message_service.get_messages_with_files_window(
+        db,
+        session_id,
+        user_id=user_id,
+        before_message_id=before_message_id,
+        limit=limit,
+    )
+    return Response.success(
+        data=payload,
+        message="Messages retrieved successfully",
+    )
+
+
 @router.get(
     "/{session_id}/messages-with-files/delta",
     response_model=ResponseSchema[MessageWithFilesDeltaResponse],
 )
-async def get_session_messages_with_files_delta(
+def get_session_messages_with_files_delta(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     after_message_id: int = Query(default=0, ge=0),
@@ -427,7 +579,7 @@ async def get_session_messages_with_files_delta(
     "/{session_id}/message-attachments",
     response_model=ResponseSchema[list[MessageAttachmentsResponse]],
 )
-async def get_session_message_attachments(
+def get_session_message_attachments(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -453,7 +605,7 @@ async def get_session_message_attachments(
     "/{session_id}/message-attachments/delta",
     response_model=ResponseSchema[MessageAttachmentsDeltaResponse],
 )
-async def get_session_message_attachments_delta(
+def get_session_message_attachments_delta(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     after_message_id: int = Query(default=0, ge=0),
@@ -485,7 +637,7 @@ async def get_session_message_attachments_delta(
     "/{session_id}/tool-executions",
     response_model=ResponseSchema[list[ToolExecutionResponse]],
 )
-async def get_session_tool_executions(
+def get_session_tool_executions(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=500, ge=1, le=2000),
@@ -516,7 +668,7 @@ async def get_session_tool_executions(
     "/{session_id}/tool-executions/delta",
     response_model=ResponseSchema[ToolExecutionDeltaResponse],
 )
-async def get_session_tool_executions_delta(
+def get_session_tool_executions_delta(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     after_created_at: datetime | None = Query(default=None),
@@ -554,7 +706,7 @@ async def get_session_tool_executions_delta(
     "/{session_id}/computer/browser/{tool_use_id}",
     response_model=ResponseSchema[ComputerBrowserScreenshotResponse],
 )
-async def get_session_browser_screenshot(
+def get_session_browser_screenshot(
     session_id: uuid.UUID,
     tool_use_id: str,
     user_id: str = Depends(get_current_user_id),
@@ -588,7 +740,7 @@ async def get_session_browser_screenshot(
 
 
 @router.get("/{session_id}/usage", response_model=ResponseSchema[UsageResponse])
-async def get_session_usage(
+def get_session_usage(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -612,12 +764,19 @@ async def get_session_usage(
     "/{session_id}/workspace/files",
     response_model=ResponseSchema[list[FileNode]],
 )
-async def get_session_workspace_files(
+def get_session_workspace_files(
     session_id: uuid.UUID,
+    path: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """List workspace files for a session (served via OSS manifest)."""
+    """List workspace files for a session from its stored export manifest.
+
+    Pass `path` to list a single folder's direct children, paginated by
+    `offset`/`limit`; otherwise the whole tree is returned.
+    """
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
         raise AppException(
@@ -627,49 +786,45 @@ async def get_session_workspace_files(
     if not db_session.workspace_manifest_key:
         return Response.success(data=[], message="Workspace export not ready")
 
-    manifest = storage_service.get_manifest(db_session.workspace_manifest_key)
-    raw_nodes = build_nodes_from_manifest(manifest)
-    manifest_files = extract_manifest_files(manifest)
-    prefix = (db_session.workspace_files_prefix or "").rstrip("/")
-    file_url_map: dict[str, str] = {}
-
-    for file_entry in manifest_files:
-        file_path = normalize_manifest_path(file_entry.get("path"))
-        if not file_path:
-            continue
-        object_key = (
-            file_entry.get("key")
-            or file_entry.get("object_key")
-            or file_entry.get("oss_key")
-            or file_entry.get("s3_key")
-        )
-        if not object_key and prefix:
-            object_key = f"{prefix}/{file_path.lstrip('/')}"
-        if not object_key:
-            continue
-        mime_type = file_entry.get("mimeType") or file_entry.get("mime_type")
-        file_url_map[file_path] = storage_service.presign_get(
-            object_key,
-            response_content_disposition="inline",
-            response_content_type=mime_type,
-        )
-
-    def build_file_url(file_path: str) -> str | None:
-        normalized = normalize_manifest_path(file_path) or file_path
-        return file_url_map.get(normalized)
-
-    nodes = build_workspace_file_nodes(
-        raw_nodes,
-        file_url_builder=build_file_url,
+    nodes = workspace_manifest_service.build_file_nodes(
+        db,
+        manifest_key=db_session.workspace_manifest_key,
+        workspace_files_prefix=db_session.workspace_files_prefix,
+        folder_path=path,
+        limit=limit,
+        offset=offset,
     )
     return Response.success(data=nodes, message="Workspace files retrieved")
 
 
+@router.get("/{session_id}/workspace/diff", response_model=ResponseSchema[dict])
+def get_session_workspace_file_diff(
+    session_id: uuid.UUID,
+    path: str = Query(..., min_length=1),
+    staged: bool = Query(default=False),
+    repo_dir: str | None = Query(default=None),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Fetch the full diff of a file whose workspace state diff was truncated."""
+    db_session = session_service.get_session(db, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+
+    result = workspace_diff_service.get_file_diff(
+        session_id=str(session_id), path=path, staged=staged, repo_dir=repo_dir
+    )
+    return Response.success(data=result, message="Workspace diff retrieved")
+
+
 @router.get(
     "/{session_id}/local-mounts/files",
     response_model=ResponseSchema[list[FileNode]],
 )
-async def get_session_local_mount_files(
+def get_session_local_mount_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -688,7 +843,7 @@ async def get_session_local_mount_files(
 
 
 @router.get("/{session_id}/local-mounts/file")
-async def get_session_local_mount_file(
+def get_session_local_mount_file(
     session_id: uuid.UUID,
     mount_id: str = Query(...),
     path: str = Query(...),
@@ -724,7 +879,7 @@ async def get_session_local_mount_file(
     "/{session_id}/local-mounts/folder-archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_session_local_mount_folder_archive(
+def get_session_local_mount_folder_archive(
     session_id: uuid.UUID,
     mount_id: str = Query(...),
     path: str = Query(...),
@@ -755,7 +910,7 @@ async def get_session_local_mount_folder_archive(
 
 
 @router.get("/{session_id}/local-mounts/archive")
-async def download_session_local_mount_archive(
+def download_session_local_mount_archive(
     session_id: uuid.UUID,
     mount_id: str = Query(...),
     path: str = Query(...),
@@ -794,7 +949,7 @@ async def download_session_local_mount_archive(
     "/{session_id}/workspace/archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_session_workspace_archive(
+def get_session_workspace_archive(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -830,7 +985,7 @@ async def get_session_workspace_archive(
     "/{session_id}/workspace/folder-archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_session_workspace_folder_archive(
+def get_session_workspace_folder_archive(
     session_id: uuid.UUID,
     path: str = Query(..., description="Folder path within the workspace"),
     user_id: str = Depends(get_current_user_id),
@@ -859,6 +1014,7 @@ async def get_session_workspace_folder_archive(
         )
 
     archive = workspace_archive_service.get_folder_archive(
+        db,
         session=db_session,
         folder_path=path,
     )
@@ -872,7 +1028,7 @@ async def get_session_workspace_folder_archive(
     "/{session_id}/workspace/submit-skill",
     response_model=ResponseSchema[SubmitSkillResponse],
 )
-async def submit_session_workspace_skill(
+def submit_session_workspace_skill(
     session_id: uuid.UUID,
     request: SubmitSkillRequest,
     user_id: str = Depends(get_current_user_id),
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, UploadFile
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -46,12 +46,10 @@ def discover_skill_import(
 )
 def commit_skill_import(
     request: SkillImportCommitRequest,
-    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = job_service.enqueue_commit(db, user_id=user_id, request=request)
-    background_tasks.add_task(job_service.process_commit_job, result.job_id)
     return Response.success(data=result, message="Skill import queued")
 
 
@@ -24,7 +24,7 @@ import_service = SkillImportService()
     "/status",
     response_model=ResponseSchema[SkillsMpMarketplaceStatusResponse],
 )
-async def get_skills_marketplace_status(
+def get_skills_marketplace_status(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -42,10 +42,8 @@ async def search_skills_marketplace(
     page_size: int = Query(default=12, ge=1, le=50),
     semantic: bool = Query(default=False),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = await skillsmp_service.search(
-        db=db,
         user_id=user_id,
         query=q,
         page=page,
@@ -64,10 +62,8 @@ async def search_skills_marketplace(
 async def list_skills_marketplace_recommendations(
     limit: int = Query(default=9, ge=1, le=24),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = await skillsmp_service.list_recommendations(
-        db=db,
         user_id=user_id,
         limit=limit,
     )
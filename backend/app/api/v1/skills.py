@@ -18,7 +18,7 @@ service = SkillService()
 
 
 @router.get("", response_model=ResponseSchema[list[SkillResponse]])
-async def list_skills(
+def list_skills(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -27,7 +27,7 @@ async def list_skills(
 
 
 @router.get("/{skill_id}", response_model=ResponseSchema[SkillResponse])
-async def get_skill(
+def get_skill(
     skill_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -37,7 +37,7 @@ async def get_skill(
 
 
 @router.get("/{skill_id}/files", response_model=ResponseSchema[list[FileNode]])
-async def list_skill_files(
+def list_skill_files(
     skill_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -47,7 +47,7 @@ async def list_skill_files(
 
 
 @router.post("", response_model=ResponseSchema[SkillResponse])
-async def create_skill(
+def create_skill(
     request: SkillCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -57,7 +57,7 @@ async def create_skill(
 
 
 @router.patch("/{skill_id}", response_model=ResponseSchema[SkillResponse])
-async def update_skill(
+def update_skill(
     skill_id: int,
     request: SkillUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -68,7 +68,7 @@ async def update_skill(
 
 
 @router.delete("/{skill_id}", response_model=ResponseSchema[dict])
-async def delete_skill(
+def delete_skill(
     skill_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
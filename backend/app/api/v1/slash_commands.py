@@ -20,7 +20,7 @@ config_service = SlashCommandConfigService()
 
 
 @router.get("", response_model=ResponseSchema[list[SlashCommandResponse]])
-async def list_slash_commands(
+def list_slash_commands(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -32,7 +32,7 @@ async def list_slash_commands(
     "/suggestions",
     response_model=ResponseSchema[list[SlashCommandSuggestionResponse]],
 )
-async def list_slash_command_suggestions(
+def list_slash_command_suggestions(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -41,7 +41,7 @@ async def list_slash_command_suggestions(
 
 
 @router.get("/{command_id}", response_model=ResponseSchema[SlashCommandResponse])
-async def get_slash_command(
+def get_slash_command(
     command_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -51,7 +51,7 @@ async def get_slash_command(
 
 
 @router.post("", response_model=ResponseSchema[SlashCommandResponse])
-async def create_slash_command(
+def create_slash_command(
     request: SlashCommandCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -61,7 +61,7 @@ async def create_slash_command(
 
 
 @router.patch("/{command_id}", response_model=ResponseSchema[SlashCommandResponse])
-async def update_slash_command(
+def update_slash_command(
     command_id: int,
     request: SlashCommandUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -77,7 +77,7 @@ async def update_slash_command(
 
 
 @router.delete("/{command_id}", response_model=ResponseSchema[dict])
-async def delete_slash_command(
+def delete_slash_command(
     command_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
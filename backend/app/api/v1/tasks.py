@@ -1,4 +1,4 @@
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -15,16 +15,13 @@ title_service = SessionTitleService()
 
 
 @router.post("", response_model=ResponseSchema[TaskEnqueueResponse])
-async def enqueue_task(
+def enqueue_task(
     request: TaskEnqueueRequest,
-    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     """Enqueue a task (agent run) for execution."""
     result = task_service.enqueue_task(db, user_id, request)
     if request.session_id is None:
-        background_tasks.add_task(
-            title_service.generate_and_update, result.session_id, request.prompt
-        )
+        title_service.enqueue(db, result.session_id, request.prompt)
     return Response.success(data=result, message="Task enqueued successfully")
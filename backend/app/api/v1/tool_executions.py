@@ -9,6 +9,7 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.tool_execution import ToolExecutionResponse
+from app.services.payload_offload_service import PayloadOffloadService
 from app.services.session_service import SessionService
 from app.services.tool_execution_service import ToolExecutionService
 
@@ -16,15 +17,16 @@ router = APIRouter(prefix="/tool-executions", tags=["tool-executions"])
 
 tool_execution_service = ToolExecutionService()
 session_service = SessionService()
+payload_offload_service = PayloadOffloadService()
 
 
 @router.get("/{execution_id}", response_model=ResponseSchema[ToolExecutionResponse])
-async def get_tool_execution(
+def get_tool_execution(
     execution_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets a tool execution by ID."""
+    """Gets a tool execution by ID, including output offloaded to object storage."""
     execution = tool_execution_service.get_tool_execution(db, execution_id)
     db_session = session_service.get_session(db, execution.session_id)
     if db_session.user_id != user_id:
@@ -32,7 +34,9 @@ async def get_tool_execution(
             error_code=ErrorCode.FORBIDDEN,
             message="Tool execution does not belong to the user",
         )
+    data = ToolExecutionResponse.model_validate(execution)
+    data.tool_output = payload_offload_service.hydrate(data.tool_output)
     return Response.success(
-        data=ToolExecutionResponse.model_validate(execution),
+        data=data,
         message="Tool execution retrieved successfully",
     )
@@ -41,7 +41,7 @@ def _parse_day(raw_day: str | None) -> date | None:
 
 
 @router.get("/analytics", response_model=ResponseSchema[UsageAnalyticsResponse])
-async def get_usage_analytics(
+def get_usage_analytics(
     month: str | None = Query(default=None),
     day: str | None = Query(default=None),
     timezone: str = Query(default="UTC"),
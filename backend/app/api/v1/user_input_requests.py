@@ -18,7 +18,7 @@ user_input_service = UserInputRequestService()
 
 
 @router.get("", response_model=ResponseSchema[list[UserInputRequestResponse]])
-async def list_pending_user_input_requests(
+def list_pending_user_input_requests(
     user_id: str = Depends(get_current_user_id),
     session_id: uuid.UUID | None = Query(default=None),
     db: Session = Depends(get_db),
@@ -33,7 +33,7 @@ async def list_pending_user_input_requests(
     "/{request_id}/answer",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def answer_user_input_request(
+def answer_user_input_request(
     request_id: uuid.UUID,
     request: UserInputAnswerRequest,
     user_id: str = Depends(get_current_user_id),
@@ -19,7 +19,7 @@ service = UserMcpInstallService()
 
 
 @router.get("", response_model=ResponseSchema[list[UserMcpInstallResponse]])
-async def list_user_mcp_installs(
+def list_user_mcp_installs(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -28,7 +28,7 @@ async def list_user_mcp_installs(
 
 
 @router.post("", response_model=ResponseSchema[UserMcpInstallResponse])
-async def create_user_mcp_install(
+def create_user_mcp_install(
     request: UserMcpInstallCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -38,7 +38,7 @@ async def create_user_mcp_install(
 
 
 @router.patch("/bulk", response_model=ResponseSchema[UserMcpInstallBulkUpdateResponse])
-async def bulk_update_user_mcp_installs(
+def bulk_update_user_mcp_installs(
     request: UserMcpInstallBulkUpdateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -48,7 +48,7 @@ async def bulk_update_user_mcp_installs(
 
 
 @router.patch("/{install_id}", response_model=ResponseSchema[UserMcpInstallResponse])
-async def update_user_mcp_install(
+def update_user_mcp_install(
     install_id: int,
     request: UserMcpInstallUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -59,7 +59,7 @@ async def update_user_mcp_install(
 
 
 @router.delete("/{install_id}", response_model=ResponseSchema[dict])
-async def delete_user_mcp_install(
+def delete_user_mcp_install(
     install_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -58,9 +58,9 @@ def get_current_user_id(
         settings.auth_cookie_name
     ) or _extract_bearer_token(authorization)
     if session_token:
-        user_session = auth_service.authenticate_session_token(db, session_token)
-        if user_session and user_session.user_id:
-            return user_session.user_id
+        user_id = auth_service.authenticate_session_user_id(db, session_token)
+        if user_id:
+            return user_id
         raise HTTPException(status_code=401, detail="Authentication required")
 
     if _is_valid_internal_token(x_internal_token):
@@ -22,15 +22,32 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=5)
     db_max_overflow: int = Field(default=10)
     db_pool_timeout_seconds: int = Field(default=30)
+    # Sync route handlers run in the AnyIO worker threadpool. Defaults to
+    # db_pool_size + db_max_overflow so threads never outnumber DB connections.
+    api_threadpool_size: int | None = Field(default=None, alias="API_THREADPOOL_SIZE")
 
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://127.0.0.1:3000"]
     )
 
     secret_key: str = Field(default="change-this-secret-key-in-production")
+    # Comma-separated previous secret keys; values encrypted with them still decrypt
+    # and are re-encrypted with SECRET_KEY at startup.
+    secret_key_fallbacks: str = Field(default="", alias="SECRET_KEY_FALLBACKS")
+    # Decrypted env maps are cached per process for up to this long. 0 disables.
+    env_var_cache_ttl_seconds: int = Field(
+        default=300, alias="ENV_VAR_CACHE_TTL_SECONDS"
+    )
     auth_cookie_name: str = Field(default="poco_session", alias="AUTH_COOKIE_NAME")
     auth_cookie_secure: bool = Field(default=False, alias="AUTH_COOKIE_SECURE")
     auth_session_ttl_days: int = Field(default=30, alias="AUTH_SESSION_TTL_DAYS")
+    # In-process cache of authenticated session tokens. 0 seconds disables it.
+    auth_session_cache_ttl_seconds: int = Field(
+        default=60, alias="AUTH_SESSION_CACHE_TTL_SECONDS"
+    )
+    auth_session_cache_max_entries: int = Field(
+        default=10000, alias="AUTH_SESSION_CACHE_MAX_ENTRIES"
+    )
     oauth_session_cookie_name: str = Field(
         default="poco_oauth", alias="OAUTH_SESSION_COOKIE_NAME"
     )
@@ -65,6 +82,11 @@ class Settings(BaseSettings):
     im_event_dispatch_lease_seconds: int = Field(
         default=30, alias="IM_EVENT_DISPATCH_LEASE_SECONDS"
     )
+    im_event_dispatch_concurrency: int = Field(
+        default=8, alias="IM_EVENT_DISPATCH_CONCURRENCY"
+    )
+    # Failed sends of one outbox event before it is dead-lettered as "failed".
+    im_event_max_attempts: int = Field(default=10, alias="IM_EVENT_MAX_ATTEMPTS")
 
     # Embedded IM integration
     backend_user_id: str = Field(default="default", alias="BACKEND_USER_ID")
@@ -157,6 +179,60 @@ class Settings(BaseSettings):
     )
     s3_read_timeout_seconds: int = Field(default=60, alias="S3_READ_TIMEOUT_SECONDS")
     s3_max_attempts: int = Field(default=3, alias="S3_MAX_ATTEMPTS")
+    s3_max_pool_connections: int = Field(default=50, alias="S3_MAX_POOL_CONNECTIONS")
+    # Message contents / tool outputs whose JSON exceeds this size are stored in S3
+    # (gzip) and replaced by a preview plus a reference. 0 disables offloading.
+    payload_offload_threshold_bytes: int = Field(
+        default=64 * 1024, alias="PAYLOAD_OFFLOAD_THRESHOLD_BYTES"
+    )
+    payload_preview_chars: int = Field(default=2000, alias="PAYLOAD_PREVIEW_CHARS")
+    # Max consecutive callbacks of one session applied in a single transaction.
+    callback_ingest_batch_size: int = Field(
+        default=32, alias="CALLBACK_INGEST_BATCH_SIZE"
+    )
+    # In-process scheduled task dispatcher; sleeps until the next task is due.
+    scheduled_task_dispatcher_enabled: bool = Field(
+        default=True, alias="SCHEDULED_TASK_DISPATCHER_ENABLED"
+    )
+    scheduled_task_dispatch_batch_size: int = Field(
+        default=200, alias="SCHEDULED_TASK_DISPATCH_BATCH_SIZE"
+    )
+    scheduled_task_dispatch_max_sleep_seconds: float = Field(
+        default=30.0, alias="SCHEDULED_TASK_DISPATCH_MAX_SLEEP_SECONDS"
+    )
+    # Import, memory, title and post-export jobs; set false to leave them to other
+    # processes.
+    background_jobs_enabled: bool = Field(default=True, alias="BACKGROUND_JOBS_ENABLED")
+    background_job_poll_interval_seconds: float = Field(
+        default=2.0, alias="BACKGROUND_JOB_POLL_INTERVAL_SECONDS"
+    )
+    background_job_lease_seconds: int = Field(
+        default=60, alias="BACKGROUND_JOB_LEASE_SECONDS"
+    )
+    background_job_max_attempts: int = Field(
+        default=3, alias="BACKGROUND_JOB_MAX_ATTEMPTS"
+    )
+    skill_import_job_concurrency: int = Field(
+        default=2, alias="SKILL_IMPORT_JOB_CONCURRENCY"
+    )
+    plugin_import_job_concurrency: int = Field(
+        default=2, alias="PLUGIN_IMPORT_JOB_CONCURRENCY"
+    )
+    memory_create_job_concurrency: int = Field(
+        default=2, alias="MEMORY_CREATE_JOB_CONCURRENCY"
+    )
+    session_title_job_concurrency: int = Field(
+        default=4, alias="SESSION_TITLE_JOB_CONCURRENCY"
+    )
+    workspace_export_job_concurrency: int = Field(
+        default=2, alias="WORKSPACE_EXPORT_JOB_CONCURRENCY"
+    )
+    # Parallel S3 uploads/copies per imported skill or plugin.
+    import_upload_concurrency: int = Field(default=8, alias="IMPORT_UPLOAD_CONCURRENCY")
+    # Parallel GitHub contents API requests when importing a repository subtree.
+    github_contents_fetch_concurrency: int = Field(
+        default=8, alias="GITHUB_CONTENTS_FETCH_CONCURRENCY"
+    )
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
     anthropic_base_url: str = Field(
         default="https://api.anthropic.com", alias="ANTHROPIC_BASE_URL"
@@ -176,6 +252,13 @@ class Settings(BaseSettings):
     siliconflow_timeout_seconds: float = Field(
         default=15.0, alias="SILICONFLOW_TIMEOUT_SECONDS"
     )
+    # Capabilities shortlisted locally (BM25) before the rerank request.
+    capability_recommendation_rerank_candidates: int = Field(
+        default=30, alias="CAPABILITY_RECOMMENDATION_RERANK_CANDIDATES"
+    )
+    capability_recommendation_cache_ttl_seconds: int = Field(
+        default=600, alias="CAPABILITY_RECOMMENDATION_CACHE_TTL_SECONDS"
+    )
     default_model: str = Field(
         default="claude-sonnet-4-20250514", alias="DEFAULT_MODEL"
     )
@@ -189,6 +272,13 @@ class Settings(BaseSettings):
     skillsmp_timeout_seconds: float = Field(
         default=10.0, alias="SKILLSMP_TIMEOUT_SECONDS"
     )
+    # Marketplace pages are fresh for the TTL, then served stale while refreshing.
+    skillsmp_cache_ttl_seconds: float = Field(
+        default=300.0, alias="SKILLSMP_CACHE_TTL_SECONDS"
+    )
+    skillsmp_cache_stale_seconds: float = Field(
+        default=3600.0, alias="SKILLSMP_CACHE_STALE_SECONDS"
+    )
 
     # Memory (Mem0)
     mem0_enabled: bool = Field(default=False, alias="MEM0_ENABLED")
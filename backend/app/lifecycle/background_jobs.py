@@ -0,0 +1,69 @@
+from app.core.settings import get_settings
+from app.models.memory_create_job import MemoryCreateJob
+from app.models.plugin_import_job import PluginImportJob
+from app.models.session_title_job import SessionTitleJob
+from app.models.skill_import_job import SkillImportJob
+from app.models.workspace_export_job import WorkspaceExportJob
+from app.repositories.workspace_export_job_repository import (
+    WorkspaceExportJobRepository,
+)
+from app.services.background_job_runner import (
+    MEMORY_CREATE_JOB,
+    PLUGIN_IMPORT_JOB,
+    SESSION_TITLE_JOB,
+    SKILL_IMPORT_JOB,
+    WORKSPACE_EXPORT_JOB,
+    BackgroundJobRunner,
+    BackgroundJobType,
+)
+from app.services.memory_create_job_service import memory_create_job_service
+from app.services.plugin_import_job_service import PluginImportJobService
+from app.services.session_title_service import SessionTitleService
+from app.services.skill_import_job_service import SkillImportJobService
+from app.services.workspace_export_job_service import WorkspaceExportJobService
+
+
+def register_background_jobs(runner: BackgroundJobRunner) -> None:
+    """Registers the job tables the background job runner drains."""
+    settings = get_settings()
+    runner.register(
+        BackgroundJobType(
+            name=SKILL_IMPORT_JOB,
+            model=SkillImportJob,
+            handler=SkillImportJobService().process_commit_job,
+            concurrency=settings.skill_import_job_concurrency,
+        )
+    )
+    runner.register(
+        BackgroundJobType(
+            name=PLUGIN_IMPORT_JOB,
+            model=PluginImportJob,
+            handler=PluginImportJobService().process_commit_job,
+            concurrency=settings.plugin_import_job_concurrency,
+        )
+    )
+    runner.register(
+        BackgroundJobType(
+            name=MEMORY_CREATE_JOB,
+            model=MemoryCreateJob,
+            handler=memory_create_job_service.process_create_job,
+            concurrency=settings.memory_create_job_concurrency,
+        )
+    )
+    runner.register(
+        BackgroundJobType(
+            name=SESSION_TITLE_JOB,
+            model=SessionTitleJob,
+            handler=SessionTitleService().process_title_job,
+            concurrency=settings.session_title_job_concurrency,
+        )
+    )
+    runner.register(
+        BackgroundJobType(
+            name=WORKSPACE_EXPORT_JOB,
+            model=WorkspaceExportJob,
+            handler=WorkspaceExportJobService().process_job,
+            concurrency=settings.workspace_export_job_concurrency,
+            repository=WorkspaceExportJobRepository,
+        )
+    )
@@ -4,6 +4,7 @@ from app.core.database import SessionLocal
 from app.lifecycle.builtin_mcp import McpServerBootstrapService
 from app.lifecycle.builtin_preset_visuals import BuiltinPresetVisualBootstrapService
 from app.lifecycle.builtin_skills import SkillBootstrapService
+from app.services.env_var_service import EnvVarService
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ class LifecycleBootstrapService:
             SkillBootstrapService.bootstrap_builtin_skills(db)
             McpServerBootstrapService.bootstrap_builtin_servers(db)
             BuiltinPresetVisualBootstrapService.bootstrap_builtin_preset_visuals(db)
+            rotated = EnvVarService().rotate_ciphertexts(db)
+            if rotated:
+                logger.info("env_var_ciphertexts_rotated", extra={"count": rotated})
             db.commit()
         except Exception:
             db.rollback()
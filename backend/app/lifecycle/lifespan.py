@@ -2,19 +2,44 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from starlette.concurrency import run_in_threadpool
 
 from app.core.database import engine
 from app.core.settings import get_settings
+from app.lifecycle.background_jobs import register_background_jobs
+from app.services.env_var_cache import ENV_VAR_CHANGES_CHANNEL
+from app.services.env_var_service import env_var_cache
+from app.services.im_providers import close_shared_providers
 from app.services.im_streams import DingTalkStreamService
 from app.services.im_streams import FeishuStreamService
 from app.lifecycle.bootstrap import LifecycleBootstrapService
+from app.services.background_job_runner import background_job_runner
 from app.services.im import ImEventDispatcher
+from app.services.scheduled_task_dispatcher import ScheduledTaskDispatcher
+from app.services.scheduled_task_service import SCHEDULED_TASK_CHANGES_CHANNEL
+from app.services.session_event_service import session_event_broker
+from app.services.session_token_cache import (
+    SESSION_REVOCATIONS_CHANNEL,
+    session_token_cache,
+)
+from app.services.skillsmp_service import close_skillsmp_http_client
 
 logger = logging.getLogger(__name__)
 
 
+def _configure_threadpool() -> None:
+    """Size the worker threadpool that runs sync handlers to the DB connection pool."""
+    settings = get_settings()
+    size = settings.api_threadpool_size or (
+        settings.db_pool_size + settings.db_max_overflow
+    )
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(1, size)
+    logger.info("API threadpool size set to %s", limiter.total_tokens)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application startup and shutdown tasks."""
@@ -22,6 +47,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting application...")
     logger.info("Database engine initialized")
 
+    _configure_threadpool()
+
     settings = get_settings()
     if settings.bootstrap_on_startup:
         await run_in_threadpool(LifecycleBootstrapService.bootstrap_all)
@@ -30,21 +57,42 @@ async def lifespan(app: FastAPI):
     dispatcher = ImEventDispatcher()
     dingtalk_stream = DingTalkStreamService()
     feishu_stream = FeishuStreamService()
+    scheduled_task_dispatcher = ScheduledTaskDispatcher()
+    register_background_jobs(background_job_runner)
     tasks: list[asyncio.Task[None]] = []
 
     try:
+        if session_event_broker.enabled:
+            session_event_broker.register_channel(
+                SESSION_REVOCATIONS_CHANNEL, session_token_cache.handle_notification
+            )
+            session_event_broker.register_channel(
+                ENV_VAR_CHANGES_CHANNEL, env_var_cache.handle_notification
+            )
+            if scheduled_task_dispatcher.enabled:
+                session_event_broker.register_channel(
+                    SCHEDULED_TASK_CHANGES_CHANNEL,
+                    scheduled_task_dispatcher.handle_notification,
+                )
+            tasks.append(asyncio.create_task(session_event_broker.run_forever()))
         if dispatcher.enabled:
             tasks.append(asyncio.create_task(dispatcher.run_forever()))
         if dingtalk_stream.enabled:
             tasks.append(asyncio.create_task(dingtalk_stream.run_forever()))
         if feishu_stream.enabled:
             tasks.append(asyncio.create_task(feishu_stream.run_forever()))
+        if scheduled_task_dispatcher.enabled:
+            tasks.append(asyncio.create_task(scheduled_task_dispatcher.run_forever()))
+        if background_job_runner.enabled:
+            tasks.append(asyncio.create_task(background_job_runner.run_forever()))
         yield
     finally:
         for task in tasks:
             task.cancel()
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
+        await close_shared_providers()
+        await close_skillsmp_http_client()
         logger.info("Shutting down database engine...")
         engine.dispose()
         logger.info("Database engine disposed")
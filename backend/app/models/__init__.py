@@ -18,6 +18,7 @@ from app.models.im import (
 from app.models.mcp_server import McpServer
 from app.models.memory_create_job import MemoryCreateJob
 from app.models.pending_skill_creation import PendingSkillCreation
+from app.models.workspace_export_job import WorkspaceExportJob
 from app.models.plugin import Plugin
 from app.models.plugin_import_job import PluginImportJob
 from app.models.preset import Preset
@@ -26,11 +27,13 @@ from app.models.project import Project
 from app.models.project_file import ProjectFile
 from app.models.project_local_mount import ProjectLocalMount
 from app.models.session_queue_item import AgentSessionQueueItem
+from app.models.session_title_job import SessionTitleJob
 from app.models.skill import Skill
 from app.models.skill_import_job import SkillImportJob
 from app.models.slash_command import SlashCommand
 from app.models.sub_agent import SubAgent
 from app.models.tool_execution import ToolExecution
+from app.models.usage_hourly_rollup import UsageHourlyRollup
 from app.models.usage_log import UsageLog
 from app.models.user import User
 from app.models.user_input_request import UserInputRequest
@@ -38,6 +41,7 @@ from app.models.user_session import UserSession
 from app.models.user_mcp_install import UserMcpInstall
 from app.models.user_plugin_install import UserPluginInstall
 from app.models.user_skill_install import UserSkillInstall
+from app.models.workspace_manifest import WorkspaceManifest
 
 __all__ = [
     "Base",
@@ -58,6 +62,7 @@ __all__ = [
     "McpServer",
     "MemoryCreateJob",
     "PendingSkillCreation",
+    "WorkspaceExportJob",
     "Plugin",
     "PluginImportJob",
     "Preset",
@@ -65,11 +70,13 @@ __all__ = [
     "Project",
     "ProjectFile",
     "ProjectLocalMount",
+    "SessionTitleJob",
     "Skill",
     "SkillImportJob",
     "SlashCommand",
     "SubAgent",
     "ToolExecution",
+    "UsageHourlyRollup",
     "UsageLog",
     "User",
     "UserInputRequest",
@@ -78,4 +85,5 @@ __all__ = [
     "UserPluginInstall",
     "UserSkillInstall",
     "WatchedSession",
+    "WorkspaceManifest",
 ]
@@ -20,6 +20,15 @@ class AgentMessage(Base, TimestampMixin):
             "created_at",
             "id",
         ),
+        # Keyset windows over a session's history page by message id.
+        Index("ix_agent_messages_session_id_id", "session_id", "id"),
+        # Trigram index backing substring search (requires the pg_trgm extension).
+        Index(
+            "ix_agent_messages_text_preview_trgm",
+            "text_preview",
+            postgresql_using="gin",
+            postgresql_ops={"text_preview": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
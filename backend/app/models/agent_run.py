@@ -61,6 +61,10 @@ class AgentRun(Base, TimestampMixin):
         String(50), default="default", nullable=False, index=True
     )
     progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Highest executor callback sequence applied to this run; replays are skipped.
+    last_callback_sequence: Mapped[int | None] = mapped_column(
+        BigInteger, nullable=True
+    )
 
     schedule_mode: Mapped[str] = mapped_column(
         String(50), default="immediate", nullable=False, index=True
@@ -2,7 +2,16 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, JSON, String, Text, text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    JSON,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, TimestampMixin
@@ -14,6 +23,15 @@ if TYPE_CHECKING:
 
 class AgentScheduledTask(Base, TimestampMixin):
     __tablename__ = "agent_scheduled_tasks"
+    __table_args__ = (
+        # The dispatcher's due-task claims and next-wakeup lookups.
+        Index(
+            "ix_agent_scheduled_tasks_enabled_next_run_at",
+            "enabled",
+            "next_run_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
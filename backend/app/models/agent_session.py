@@ -37,6 +37,12 @@ class AgentSession(Base, TimestampMixin):
             "cancellation_target_worker_id",
             "cancellation_requested_at",
         ),
+        Index(
+            "ix_agent_sessions_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -26,6 +26,13 @@ class MemoryCreateJob(Base, TimestampMixin):
         String(50), default="queued", nullable=False, index=True
     )
     progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Set by the background job runner; a lapsed lease means the worker died.
+    attempt_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     result: Mapped[dict | list | str | int | float | bool | None] = mapped_column(
         JSON, nullable=True
@@ -0,0 +1,20 @@
+from typing import Any
+
+from sqlalchemy import JSON, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, TimestampMixin
+
+
+class WorkspaceManifest(Base, TimestampMixin):
+    """Copy of an exported workspace manifest.json, keyed by its S3 key.
+
+    Export keys are reused by later exports of the same session, so `updated_at`
+    doubles as the content version.
+    """
+
+    __tablename__ = "workspace_manifests"
+
+    manifest_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    content: Mapped[Any] = mapped_column(JSON, nullable=False)
+    file_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -0,0 +1,103 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+
+class BackgroundJobRepository:
+    """Queue operations shared by job tables run by the background job runner.
+
+    A job model needs `id`, `status` ("queued"/"running"/terminal), `error`,
+    `finished_at`, `attempt_count`, `lease_expires_at` and `created_at`.
+    """
+
+    @staticmethod
+    def _claimable(model: Any, now: datetime):
+        return or_(
+            model.status == "queued",
+            # Running without a live lease: the worker crashed or the process
+            # restarted mid-job.
+            and_(
+                model.status == "running",
+                or_(model.lease_expires_at.is_(None), model.lease_expires_at < now),
+            ),
+        )
+
+    @staticmethod
+    def claim_due_batch(
+        session_db: Session,
+        model: Any,
+        *,
+        limit: int,
+        lease_seconds: int,
+        max_attempts: int,
+    ) -> list[uuid.UUID]:
+        """Leases up to `limit` jobs, marks them running and returns their ids.
+
+        Claimed jobs leave the queued state, so only an expired lease makes them
+        claimable again. Jobs that were already claimed `max_attempts` times are
+        marked failed instead of being handed out again.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(model)
+            .where(BackgroundJobRepository._claimable(model, now))
+            .order_by(model.created_at.asc())
+            .with_for_update(skip_locked=True)
+            .limit(limit)
+        )
+        claimed: list[uuid.UUID] = []
+        for job in session_db.execute(stmt).scalars().all():
+            if int(job.attempt_count or 0) >= max_attempts:
+                job.status = "failed"
+                job.error = job.error or f"Job abandoned after {max_attempts} attempts"
+                job.finished_at = now
+                job.lease_expires_at = None
+                continue
+            job.status = "running"
+            job.attempt_count = int(job.attempt_count or 0) + 1
+            job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            claimed.append(job.id)
+        return claimed
+
+    @staticmethod
+    def renew_leases(
+        session_db: Session,
+        model: Any,
+        *,
+        job_ids: list[uuid.UUID],
+        lease_seconds: int,
+    ) -> None:
+        if not job_ids:
+            return
+        session_db.execute(
+            update(model)
+            .where(model.id.in_(job_ids))
+            .where(model.status.in_(["queued", "running"]))
+            .values(
+                lease_expires_at=datetime.now(timezone.utc)
+                + timedelta(seconds=lease_seconds)
+            )
+        )
+
+    @staticmethod
+    def queue_stats(session_db: Session, model: Any) -> dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        queued, running, oldest = session_db.execute(
+            select(
+                func.count().filter(model.status == "queued"),
+                func.count().filter(
+                    model.status == "running", model.lease_expires_at >= now
+                ),
+                func.min(model.created_at).filter(
+                    BackgroundJobRepository._claimable(model, now)
+                ),
+            )
+        ).one()
+        return {
+            "queued": int(queued or 0),
+            "running": int(running or 0),
+            "oldest_queued_at": oldest,
+        }
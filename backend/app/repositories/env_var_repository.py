@@ -23,6 +23,10 @@ class EnvVarRepository:
             .first()
         )
 
+    @staticmethod
+    def list_all(session_db: Session) -> list[UserEnvVar]:
+        return session_db.query(UserEnvVar).order_by(UserEnvVar.id.asc()).all()
+
     @staticmethod
     def list_by_user(session_db: Session, user_id: str) -> list[UserEnvVar]:
         return (
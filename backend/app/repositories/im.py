@@ -155,6 +155,10 @@ class WatchRepository:
         return list(db.execute(stmt).scalars().all())
 
 
+# Outbox statuses that will not be sent again; "failed" is the dead letter.
+_OUTBOX_TERMINAL_STATUSES = ("delivered", "failed")
+
+
 class ImEventOutboxRepository:
     @staticmethod
     def _normalize_id(event_id: uuid.UUID | str) -> uuid.UUID:
@@ -218,7 +222,7 @@ class ImEventOutboxRepository:
         lease_until = now + timedelta(seconds=max(5, lease_seconds))
         stmt = (
             select(ImEventOutbox)
-            .where(ImEventOutbox.status != "delivered")
+            .where(ImEventOutbox.status.not_in(_OUTBOX_TERMINAL_STATUSES))
             .where(ImEventOutbox.next_attempt_at <= now)
             .where(
                 or_(
@@ -240,6 +244,29 @@ class ImEventOutboxRepository:
             row.lease_expires_at = lease_until
         return rows
 
+    @staticmethod
+    def list_undelivered_before(
+        db: Session,
+        *,
+        before: datetime,
+        exclude_ids: list[uuid.UUID],
+        limit: int,
+    ) -> list[ImEventOutbox]:
+        """Oldest undelivered events created before `before`, excluding a batch.
+
+        These are events in retry backoff or leased by another dispatcher;
+        dead-lettered events no longer hold later ones back.
+        """
+        stmt = (
+            select(ImEventOutbox)
+            .where(ImEventOutbox.status.not_in(_OUTBOX_TERMINAL_STATUSES))
+            .where(ImEventOutbox.created_at < before)
+            .where(ImEventOutbox.id.not_in(exclude_ids))
+            .order_by(ImEventOutbox.created_at.asc(), ImEventOutbox.id.asc())
+            .limit(limit)
+        )
+        return list(db.execute(stmt).scalars().all())
+
     @staticmethod
     def mark_delivered(db: Session, *, event_id: uuid.UUID | str) -> None:
         row = db.get(ImEventOutbox, ImEventOutboxRepository._normalize_id(event_id))
@@ -257,11 +284,20 @@ class ImEventOutboxRepository:
         event_id: uuid.UUID | str,
         error_message: str,
         delay_seconds: float,
+        give_up: bool = False,
+        attempted: bool = True,
     ) -> None:
+        """Schedules another attempt, or dead-letters the event when `give_up`.
+
+        `attempted=False` is for events that were only held back behind an
+        earlier one; their claim is not counted as a send attempt.
+        """
         row = db.get(ImEventOutbox, ImEventOutboxRepository._normalize_id(event_id))
         if row is None:
             return
-        row.status = "pending"
+        row.status = "failed" if give_up else "pending"
+        if not attempted:
+            row.attempt_count = max(0, int(row.attempt_count or 0) - 1)
         row.lease_expires_at = None
         row.last_error = error_message[:4000]
         row.next_attempt_at = datetime.now(timezone.utc) + timedelta(
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.models.agent_message import AgentMessage
 
@@ -46,6 +46,17 @@ class MessageRepository:
             .first()
         )
 
+    @staticmethod
+    def get_latest_id(session_db: Session, session_id: uuid.UUID) -> int | None:
+        """Gets the id of the latest message for a session."""
+        return (
+            session_db.query(AgentMessage.id)
+            .filter(AgentMessage.session_id == session_id)
+            .order_by(AgentMessage.id.desc())
+            .limit(1)
+            .scalar()
+        )
+
     @staticmethod
     def list_by_session(
         session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
@@ -76,6 +87,65 @@ class MessageRepository:
             query = query.filter(AgentMessage.id > after_id)
         return query.order_by(AgentMessage.id.asc()).limit(limit).all()
 
+    @staticmethod
+    def list_window_by_session(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        before_id: int | None = None,
+        after_id: int | None = None,
+        limit: int = 50,
+        include_content: bool = False,
+    ) -> list[AgentMessage]:
+        """Lists a window of messages by id cursor, in ascending order.
+
+        With `after_id` the window starts right after it; otherwise it ends right
+        before `before_id`, or at the latest message. Without `include_content`
+        only the summary columns are loaded.
+        """
+        query = session_db.query(AgentMessage).filter(
+            AgentMessage.session_id == session_id
+        )
+        if not include_content:
+            query = query.options(
+                load_only(
+                    AgentMessage.id,
+                    AgentMessage.role,
+                    AgentMessage.text_preview,
+                    AgentMessage.created_at,
+                )
+            )
+        if after_id is not None:
+            return (
+                query.filter(AgentMessage.id > after_id)
+                .order_by(AgentMessage.id.asc())
+                .limit(limit)
+                .all()
+            )
+        if before_id is not None:
+            query = query.filter(AgentMessage.id < before_id)
+        messages = query.order_by(AgentMessage.id.desc()).limit(limit).all()
+        messages.reverse()
+        return messages
+
+    @staticmethod
+    def exists_in_session(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        before_id: int | None = None,
+        after_id: int | None = None,
+    ) -> bool:
+        """Whether the session has a message before `before_id` / after `after_id`."""
+        query = session_db.query(AgentMessage.id).filter(
+            AgentMessage.session_id == session_id
+        )
+        if before_id is not None:
+            query = query.filter(AgentMessage.id < before_id)
+        if after_id is not None:
+            query = query.filter(AgentMessage.id > after_id)
+        return query.limit(1).first() is not None
+
     @staticmethod
     def list_ids_by_session_after_id(
         session_db: Session,
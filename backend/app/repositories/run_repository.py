@@ -81,6 +81,23 @@ class RunRepository:
             .first()
         )
 
+    @staticmethod
+    def list_session_ids_with_status(
+        session_db: Session,
+        session_ids: list[uuid.UUID],
+        statuses: tuple[str, ...],
+    ) -> set[uuid.UUID]:
+        if not session_ids:
+            return set()
+        rows = (
+            session_db.query(AgentRun.session_id)
+            .filter(AgentRun.session_id.in_(session_ids))
+            .filter(AgentRun.status.in_(statuses))
+            .distinct()
+            .all()
+        )
+        return {row.session_id for row in rows}
+
     @staticmethod
     def get_latest_terminal_by_session(
         session_db: Session, session_id: uuid.UUID
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from app.models.agent_scheduled_task import AgentScheduledTask
@@ -108,3 +108,13 @@ class ScheduledTaskRepository:
             .limit(limit)
         )
         return list(session_db.execute(stmt).scalars().all())
+
+    @staticmethod
+    def get_next_run_at(session_db: Session) -> datetime | None:
+        """Returns the earliest `next_run_at` among enabled tasks."""
+        stmt = (
+            select(func.min(AgentScheduledTask.next_run_at))
+            .where(AgentScheduledTask.is_deleted.is_(False))
+            .where(AgentScheduledTask.enabled.is_(True))
+        )
+        return session_db.execute(stmt).scalar_one_or_none()
@@ -9,11 +9,24 @@ from app.models.project import Project
 
 
 class SearchRepository:
-    """Data access layer for lightweight global search."""
+    """Data access layer for global search.
 
-    @staticmethod
-    def _build_pattern(query: str) -> str:
-        return f"%{query.lower()}%"
+    Titles and message previews are matched with ILIKE backed by pg_trgm GIN
+    indexes and ranked by trigram word similarity, so lookups stay index scans as
+    history grows. Message search expects queries of at least three characters;
+    shorter patterns cannot use the index.
+    """
+
+    _LIKE_ESCAPE = "\\"
+
+    @classmethod
+    def _build_pattern(cls, query: str) -> str:
+        escaped = (
+            query.replace(cls._LIKE_ESCAPE, cls._LIKE_ESCAPE * 2)
+            .replace("%", f"{cls._LIKE_ESCAPE}%")
+            .replace("_", f"{cls._LIKE_ESCAPE}_")
+        )
+        return f"%{escaped}%"
 
     @classmethod
     def search_sessions_by_title(
@@ -36,8 +49,11 @@ class SearchRepository:
         if project_id is not None:
             q = q.filter(AgentSession.project_id == project_id)
         return (
-            q.filter(func.lower(AgentSession.title).like(pattern))
-            .order_by(AgentSession.updated_at.desc())
+            q.filter(AgentSession.title.ilike(pattern, escape=cls._LIKE_ESCAPE))
+            .order_by(
+                func.word_similarity(query, AgentSession.title).desc(),
+                AgentSession.updated_at.desc(),
+            )
             .limit(limit)
             .all()
         )
@@ -58,7 +74,7 @@ class SearchRepository:
                 Project.user_id == user_id,
                 Project.is_deleted.is_(False),
             )
-            .filter(func.lower(Project.name).like(pattern))
+            .filter(Project.name.ilike(pattern, escape=cls._LIKE_ESCAPE))
             .order_by(Project.updated_at.desc())
             .limit(limit)
             .all()
@@ -72,6 +88,7 @@ class SearchRepository:
         user_id: str,
         query: str,
         limit: int,
+        offset: int = 0,
         project_id: uuid.UUID | None = None,
         kind: str = "chat",
     ) -> list[AgentMessage]:
@@ -89,8 +106,13 @@ class SearchRepository:
         if project_id is not None:
             q = q.filter(AgentSession.project_id == project_id)
         return (
-            q.filter(func.lower(AgentMessage.text_preview).like(pattern))
-            .order_by(AgentMessage.created_at.desc())
+            q.filter(AgentMessage.text_preview.ilike(pattern, escape=cls._LIKE_ESCAPE))
+            .order_by(
+                func.word_similarity(query, AgentMessage.text_preview).desc(),
+                AgentMessage.created_at.desc(),
+                AgentMessage.id.desc(),
+            )
+            .offset(offset)
             .limit(limit)
             .all()
         )
@@ -123,6 +123,25 @@ class SessionQueueItemRepository:
             is not None
         )
 
+    @staticmethod
+    def list_session_ids_with_active_items(
+        session_db: Session, session_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        if not session_ids:
+            return set()
+        rows = (
+            session_db.query(AgentSessionQueueItem.session_id)
+            .filter(AgentSessionQueueItem.session_id.in_(session_ids))
+            .filter(
+                AgentSessionQueueItem.status.in_(
+                    SessionQueueItemRepository.ACTIVE_STATUSES
+                )
+            )
+            .distinct()
+            .all()
+        )
+        return {row.session_id for row in rows}
+
     @staticmethod
     def get_head_for_update(
         session_db: Session,
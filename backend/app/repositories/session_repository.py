@@ -1,7 +1,9 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, Session
 
 from app.models.agent_session import AgentSession
 
@@ -39,6 +41,21 @@ class SessionRepository:
             .first()
         )
 
+    @staticmethod
+    def list_by_ids(
+        session_db: Session, session_ids: list[uuid.UUID]
+    ) -> list[AgentSession]:
+        if not session_ids:
+            return []
+        return (
+            session_db.query(AgentSession)
+            .filter(
+                AgentSession.id.in_(session_ids),
+                AgentSession.is_deleted.is_(False),
+            )
+            .all()
+        )
+
     @staticmethod
     def get_by_id_for_update(
         session_db: Session, session_id: uuid.UUID
@@ -90,6 +107,94 @@ class SessionRepository:
             .all()
         )
 
+    @staticmethod
+    def _user_sessions_query(
+        session_db: Session,
+        user_id: str,
+        project_id: uuid.UUID | None,
+        kind: str | None,
+    ) -> Query:
+        query = session_db.query(AgentSession).filter(
+            AgentSession.user_id == user_id,
+            AgentSession.is_deleted.is_(False),
+        )
+        if kind:
+            query = query.filter(AgentSession.kind == kind)
+        if project_id is not None:
+            query = query.filter(AgentSession.project_id == project_id)
+        return query
+
+    @staticmethod
+    def _created_before(cursor: tuple[datetime, uuid.UUID]):
+        created_at, session_id = cursor
+        return or_(
+            AgentSession.created_at < created_at,
+            and_(AgentSession.created_at == created_at, AgentSession.id < session_id),
+        )
+
+    @staticmethod
+    def _created_after(cursor: tuple[datetime, uuid.UUID]):
+        created_at, session_id = cursor
+        return or_(
+            AgentSession.created_at > created_at,
+            and_(AgentSession.created_at == created_at, AgentSession.id > session_id),
+        )
+
+    @staticmethod
+    def list_page_by_user(
+        session_db: Session,
+        user_id: str,
+        *,
+        limit: int = 50,
+        project_id: uuid.UUID | None = None,
+        kind: str | None = None,
+        older_than: tuple[datetime, uuid.UUID] | None = None,
+        newer_than: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[AgentSession]:
+        """Keyset page of a user's sessions, newest first.
+
+        Cursors are the (created_at, id) of a previously returned session. With
+        `newer_than` the page holds the sessions right above that cursor.
+        """
+        query = SessionRepository._user_sessions_query(
+            session_db, user_id, project_id, kind
+        )
+        if newer_than is not None:
+            sessions = (
+                query.filter(SessionRepository._created_after(newer_than))
+                .order_by(AgentSession.created_at.asc(), AgentSession.id.asc())
+                .limit(limit)
+                .all()
+            )
+            sessions.reverse()
+            return sessions
+        if older_than is not None:
+            query = query.filter(SessionRepository._created_before(older_than))
+        return (
+            query.order_by(AgentSession.created_at.desc(), AgentSession.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def exists_by_user(
+        session_db: Session,
+        user_id: str,
+        *,
+        project_id: uuid.UUID | None = None,
+        kind: str | None = None,
+        older_than: tuple[datetime, uuid.UUID] | None = None,
+        newer_than: tuple[datetime, uuid.UUID] | None = None,
+    ) -> bool:
+        query = SessionRepository._user_sessions_query(
+            session_db, user_id, project_id, kind
+        )
+        if older_than is not None:
+            query = query.filter(SessionRepository._created_before(older_than))
+        if newer_than is not None:
+            query = query.filter(SessionRepository._created_after(newer_than))
+        return query.with_entities(AgentSession.id).limit(1).first() is not None
+
     @staticmethod
     def list_all(
         session_db: Session,
@@ -0,0 +1,24 @@
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.models.session_title_job import SessionTitleJob
+
+
+class SessionTitleJobRepository:
+    """Data access layer for session title generation jobs."""
+
+    @staticmethod
+    def create(
+        session_db: Session,
+        *,
+        session_id: uuid.UUID,
+        prompt: str,
+    ) -> SessionTitleJob:
+        job = SessionTitleJob(session_id=session_id, prompt=prompt, status="queued")
+        session_db.add(job)
+        return job
+
+    @staticmethod
+    def get_by_id(session_db: Session, job_id: uuid.UUID) -> SessionTitleJob | None:
+        return session_db.get(SessionTitleJob, job_id)
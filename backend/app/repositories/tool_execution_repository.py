@@ -2,7 +2,8 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, or_
+from sqlalchemy import Integer, and_, cast, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.tool_execution import ToolExecution
@@ -41,6 +42,97 @@ class ToolExecutionRepository:
         session_db.add(tool_execution)
         return tool_execution
 
+    @staticmethod
+    def upsert_tool_uses(
+        session_db: Session,
+        session_id: uuid.UUID,
+        message_id: int,
+        run_id: uuid.UUID | None,
+        tool_uses: dict[str, tuple[str, dict[str, Any] | None]],
+    ) -> None:
+        """Inserts or refreshes tool calls keyed by tool_use_id in one statement.
+
+        ``tool_uses`` maps tool_use_id to ``(tool_name, tool_input)``. A row that
+        already exists (for example created by an earlier ToolResultBlock) keeps
+        its output and only takes the call details.
+        """
+        if not tool_uses:
+            return
+        stmt = pg_insert(ToolExecution).values(
+            [
+                {
+                    "session_id": session_id,
+                    "run_id": run_id,
+                    "message_id": message_id,
+                    "tool_use_id": tool_use_id,
+                    "tool_name": tool_name,
+                    "tool_input": tool_input,
+                    "is_error": False,
+                }
+                for tool_use_id, (tool_name, tool_input) in tool_uses.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ToolExecution.session_id, ToolExecution.tool_use_id],
+            set_={
+                "tool_name": stmt.excluded.tool_name,
+                "tool_input": stmt.excluded.tool_input,
+                "message_id": stmt.excluded.message_id,
+                "run_id": func.coalesce(ToolExecution.run_id, stmt.excluded.run_id),
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
+
+    @staticmethod
+    def upsert_tool_results(
+        session_db: Session,
+        session_id: uuid.UUID,
+        message_id: int,
+        run_id: uuid.UUID | None,
+        tool_results: dict[str, tuple[dict[str, Any], bool]],
+    ) -> None:
+        """Records tool results keyed by tool_use_id in one statement.
+
+        ``tool_results`` maps tool_use_id to ``(tool_output, is_error)``. Results
+        whose call was never seen are stored with tool_name ``"unknown"``; for
+        known calls the duration is measured from the row's creation time.
+        """
+        if not tool_results:
+            return
+        stmt = pg_insert(ToolExecution).values(
+            [
+                {
+                    "session_id": session_id,
+                    "run_id": run_id,
+                    "message_id": message_id,
+                    "tool_use_id": tool_use_id,
+                    "tool_name": "unknown",
+                    "tool_output": tool_output,
+                    "result_message_id": message_id,
+                    "is_error": is_error,
+                }
+                for tool_use_id, (tool_output, is_error) in tool_results.items()
+            ]
+        )
+        elapsed_ms = cast(
+            func.extract("epoch", func.clock_timestamp() - ToolExecution.created_at)
+            * 1000,
+            Integer,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ToolExecution.session_id, ToolExecution.tool_use_id],
+            set_={
+                "tool_output": stmt.excluded.tool_output,
+                "result_message_id": stmt.excluded.result_message_id,
+                "is_error": stmt.excluded.is_error,
+                "run_id": func.coalesce(ToolExecution.run_id, stmt.excluded.run_id),
+                "duration_ms": func.coalesce(ToolExecution.duration_ms, elapsed_ms),
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
+
     @staticmethod
     def get_by_id(session_db: Session, execution_id: uuid.UUID) -> ToolExecution | None:
         """Gets a tool execution by ID."""
@@ -110,6 +202,19 @@ class ToolExecutionRepository:
             .all()
         )
 
+    @staticmethod
+    def get_latest_cursor(
+        session_db: Session, session_id: uuid.UUID
+    ) -> tuple[datetime, uuid.UUID] | None:
+        """Gets the (updated_at, id) of the most recently updated tool execution."""
+        row = (
+            session_db.query(ToolExecution.updated_at, ToolExecution.id)
+            .filter(ToolExecution.session_id == session_id)
+            .order_by(ToolExecution.updated_at.desc(), ToolExecution.id.desc())
+            .first()
+        )
+        return (row[0], row[1]) if row is not None else None
+
     @staticmethod
     def list_by_session_after_cursor(
         session_db: Session,
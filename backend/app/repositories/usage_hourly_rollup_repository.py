@@ -0,0 +1,57 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.usage_hourly_rollup import UsageHourlyRollup
+
+
+def _utc_hour(timestamp):
+    # Plain date_trunc on timestamptz follows the session TimeZone.
+    return func.timezone(
+        "UTC", func.date_trunc("hour", func.timezone("UTC", timestamp))
+    )
+
+
+class UsageHourlyRollupRepository:
+    """Data access layer for hourly usage rollups."""
+
+    @staticmethod
+    def add_usage(
+        session_db: Session,
+        *,
+        user_id: str,
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+        cache_creation_input_tokens: int | None = None,
+        cache_read_input_tokens: int | None = None,
+        total_tokens: int | None = None,
+    ) -> None:
+        """Adds one usage log to the current hour's rollup for a user.
+
+        The bucket is taken from the transaction's now(), the same clock that
+        stamps the usage log's created_at, so both land in the same hour.
+        """
+        values = {
+            "input_tokens": int(input_tokens or 0),
+            "output_tokens": int(output_tokens or 0),
+            "cache_creation_input_tokens": int(cache_creation_input_tokens or 0),
+            "cache_read_input_tokens": int(cache_read_input_tokens or 0),
+            "total_tokens": int(total_tokens or 0),
+        }
+        stmt = pg_insert(UsageHourlyRollup).values(
+            user_id=user_id,
+            bucket_start=_utc_hour(func.now()),
+            log_count=1,
+            **values,
+        )
+        set_ = {
+            column: getattr(UsageHourlyRollup, column) + stmt.excluded[column]
+            for column in values
+        }
+        set_["log_count"] = UsageHourlyRollup.log_count + 1
+        set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UsageHourlyRollup.user_id, UsageHourlyRollup.bucket_start],
+            set_=set_,
+        )
+        session_db.execute(stmt)
@@ -0,0 +1,179 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.workspace_export_job import WorkspaceExportJob
+
+
+class WorkspaceExportJobRepository:
+    """Data access layer for queued workspace export jobs.
+
+    `claim_due_batch`, `renew_leases` and `queue_stats` follow the
+    BackgroundJobRepository interface so the background job runner can drain
+    this table; the `model` argument is always WorkspaceExportJob.
+    """
+
+    @staticmethod
+    def _claimable(now: datetime):
+        table = WorkspaceExportJob
+        return or_(
+            and_(table.status == "pending", table.next_attempt_at <= now),
+            # A worker died mid-job; its lease lapsed.
+            and_(table.status == "running", table.lease_expires_at < now),
+        )
+
+    @staticmethod
+    def get_by_id(session_db: Session, job_id: uuid.UUID) -> WorkspaceExportJob | None:
+        return session_db.get(WorkspaceExportJob, job_id)
+
+    @staticmethod
+    def enqueue(session_db: Session, *, session_id: uuid.UUID) -> None:
+        """Queues post-export work for a session, coalescing with an existing job.
+
+        A job that is already running keeps running; the generation bump makes
+        its worker requeue it instead of marking it done.
+        """
+        table = WorkspaceExportJob
+        stmt = pg_insert(table).values(session_id=session_id)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.session_id],
+            set_={
+                "generation": table.generation + 1,
+                "status": case((table.status == "running", "running"), else_="pending"),
+                "attempt_count": 0,
+                "next_attempt_at": func.now(),
+                "last_error": None,
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
+
+    @staticmethod
+    def claim_due_batch(
+        session_db: Session,
+        model: Any = WorkspaceExportJob,
+        *,
+        limit: int,
+        lease_seconds: int,
+        max_attempts: int,
+    ) -> list[uuid.UUID]:
+        """Leases up to `limit` due jobs, marks them running and returns their ids.
+
+        A job whose lease lapsed after `max_attempts` claims is marked failed
+        instead of being handed out again.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(WorkspaceExportJob)
+            .where(WorkspaceExportJobRepository._claimable(now))
+            .order_by(WorkspaceExportJob.next_attempt_at.asc())
+            .with_for_update(skip_locked=True)
+            .limit(limit)
+        )
+        claimed: list[uuid.UUID] = []
+        for row in session_db.execute(stmt).scalars().all():
+            if int(row.attempt_count or 0) >= max_attempts:
+                row.status = "failed"
+                row.last_error = (
+                    row.last_error or f"Job abandoned after {max_attempts} attempts"
+                )
+                row.lease_expires_at = None
+                continue
+            row.status = "running"
+            row.attempt_count = int(row.attempt_count or 0) + 1
+            row.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            claimed.append(row.id)
+        return claimed
+
+    @staticmethod
+    def renew_leases(
+        session_db: Session,
+        model: Any = WorkspaceExportJob,
+        *,
+        job_ids: list[uuid.UUID],
+        lease_seconds: int,
+    ) -> None:
+        if not job_ids:
+            return
+        session_db.execute(
+            update(WorkspaceExportJob)
+            .where(WorkspaceExportJob.id.in_(job_ids))
+            .where(WorkspaceExportJob.status == "running")
+            .values(
+                lease_expires_at=datetime.now(timezone.utc)
+                + timedelta(seconds=lease_seconds)
+            )
+        )
+
+    @staticmethod
+    def queue_stats(
+        session_db: Session, model: Any = WorkspaceExportJob
+    ) -> dict[str, Any]:
+        table = WorkspaceExportJob
+        now = datetime.now(timezone.utc)
+        queued, running, oldest = session_db.execute(
+            select(
+                func.count().filter(table.status == "pending"),
+                func.count().filter(
+                    table.status == "running", table.lease_expires_at >= now
+                ),
+                func.min(table.next_attempt_at).filter(
+                    WorkspaceExportJobRepository._claimable(now)
+                ),
+            )
+        ).one()
+        return {
+            "queued": int(queued or 0),
+            "running": int(running or 0),
+            "oldest_queued_at": oldest,
+        }
+
+    @staticmethod
+    def mark_done(
+        session_db: Session,
+        *,
+        job_id: uuid.UUID,
+        generation: int,
+    ) -> None:
+        """Marks the claimed generation done, or requeues if it was re-triggered."""
+        table = WorkspaceExportJob
+        session_db.execute(
+            update(table)
+            .where(table.id == job_id)
+            .values(
+                status=case((table.generation == generation, "done"), else_="pending"),
+                attempt_count=case(
+                    (table.generation == generation, table.attempt_count),
+                    else_=0,
+                ),
+                lease_expires_at=None,
+                last_error=None,
+                updated_at=func.now(),
+            )
+        )
+
+    @staticmethod
+    def mark_retry(
+        session_db: Session,
+        *,
+        job_id: uuid.UUID,
+        error_message: str,
+        delay_seconds: float,
+        give_up: bool,
+    ) -> None:
+        session_db.execute(
+            update(WorkspaceExportJob)
+            .where(WorkspaceExportJob.id == job_id)
+            .values(
+                status="failed" if give_up else "pending",
+                lease_expires_at=None,
+                last_error=error_message[:4000],
+                next_attempt_at=datetime.now(timezone.utc)
+                + timedelta(seconds=max(0.5, delay_seconds)),
+                updated_at=func.now(),
+            )
+        )
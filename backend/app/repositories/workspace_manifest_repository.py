@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.workspace_manifest import WorkspaceManifest
+
+
+class WorkspaceManifestRepository:
+    """Data access layer for stored workspace manifests."""
+
+    @staticmethod
+    def get_by_key(session_db: Session, manifest_key: str) -> WorkspaceManifest | None:
+        return session_db.get(WorkspaceManifest, manifest_key)
+
+    @staticmethod
+    def get_version(session_db: Session, manifest_key: str) -> datetime | None:
+        """Returns the row's updated_at without loading the manifest content."""
+        return (
+            session_db.query(WorkspaceManifest.updated_at)
+            .filter(WorkspaceManifest.manifest_key == manifest_key)
+            .scalar()
+        )
+
+    @staticmethod
+    def delete(session_db: Session, manifest_key: str) -> None:
+        session_db.query(WorkspaceManifest).filter(
+            WorkspaceManifest.manifest_key == manifest_key
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def upsert(
+        session_db: Session,
+        *,
+        manifest_key: str,
+        content: Any,
+        file_count: int,
+        overwrite: bool = True,
+    ) -> None:
+        stmt = pg_insert(WorkspaceManifest).values(
+            manifest_key=manifest_key,
+            content=content,
+            file_count=file_count,
+            updated_at=func.clock_timestamp(),
+        )
+        if overwrite:
+            # clock_timestamp() so two refreshes in one transaction still get
+            # distinct versions.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[WorkspaceManifest.manifest_key],
+                set_={
+                    "content": stmt.excluded.content,
+                    "file_count": stmt.excluded.file_count,
+                    "updated_at": func.clock_timestamp(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[WorkspaceManifest.manifest_key]
+            )
+        session_db.execute(stmt)
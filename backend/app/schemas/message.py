@@ -50,6 +50,34 @@ class MessageWithFilesDeltaResponse(BaseModel):
     has_more: bool = False
 
 
+class MessageSummaryResponse(BaseModel):
+    """Lightweight message row; `content` is only filled when requested."""
+
+    id: int
+    role: str
+    text_preview: str | None
+    created_at: datetime
+    content: dict[str, Any] | None = None
+
+
+class MessageWindowResponse(BaseModel):
+    """Messages in ascending order, paged by message id in both directions."""
+
+    items: list[MessageSummaryResponse]
+    next_before_message_id: int | None = None
+    next_after_message_id: int | None = None
+    has_more_before: bool = False
+    has_more_after: bool = False
+
+
+class MessageWithFilesWindowResponse(BaseModel):
+    """Messages with attachments in ascending order, paged back by message id."""
+
+    items: list[MessageWithFilesResponse]
+    next_before_message_id: int | None = None
+    has_more_before: bool = False
+
+
 class MessageAttachmentsResponse(BaseModel):
     """Attachment payload for a specific message."""
 
@@ -52,6 +52,21 @@ class RunResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class RunStatusResponse(BaseModel):
+    """Lightweight run status pushed on the session event stream."""
+
+    run_id: UUID = Field(validation_alias="id")
+    user_message_id: int
+    status: str
+    progress: int
+    last_error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
 class RunClaimRequest(BaseModel):
     """Claim next run request."""
 
@@ -59,3 +59,5 @@ class ScheduledTaskDispatchResponse(BaseModel):
     run_ids: list[UUID] = Field(default_factory=list)
     skipped: int = 0
     errors: int = 0
+    # How late the most overdue claimed task was dispatched.
+    max_lag_ms: int = 0
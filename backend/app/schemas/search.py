@@ -4,11 +4,19 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 
+class SearchHighlight(BaseModel):
+    """Matched character range, end exclusive."""
+
+    start: int
+    end: int
+
+
 class SearchTaskResult(BaseModel):
     session_id: UUID
     title: str | None = None
     status: str
     timestamp: datetime
+    highlights: list[SearchHighlight] = Field(default_factory=list)
 
 
 class SearchProjectResult(BaseModel):
@@ -21,6 +29,9 @@ class SearchMessageResult(BaseModel):
     session_id: UUID
     text_preview: str
     timestamp: datetime
+    # Window of text_preview around the first match; highlights index into it.
+    snippet: str = ""
+    highlights: list[SearchHighlight] = Field(default_factory=list)
 
 
 class GlobalSearchResponse(BaseModel):
@@ -28,3 +39,4 @@ class GlobalSearchResponse(BaseModel):
     tasks: list[SearchTaskResult] = Field(default_factory=list)
     projects: list[SearchProjectResult] = Field(default_factory=list)
     messages: list[SearchMessageResult] = Field(default_factory=list)
+    messages_has_more: bool = False
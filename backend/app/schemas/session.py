@@ -88,6 +88,22 @@ class SessionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class SessionPageResponse(BaseModel):
+    """Keyset page of sessions, newest first.
+
+    Pass `next_before_*` back to load older sessions and `next_after_*` to load
+    newer ones.
+    """
+
+    items: list[SessionResponse]
+    next_before_created_at: datetime | None = None
+    next_before_id: UUID | None = None
+    next_after_created_at: datetime | None = None
+    next_after_id: UUID | None = None
+    has_more_before: bool = False
+    has_more_after: bool = False
+
+
 class SessionStateResponse(BaseModel):
     """Session state response."""
 
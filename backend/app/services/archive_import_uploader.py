@@ -0,0 +1,157 @@
+import hashlib
+import io
+import logging
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.services.storage_service import S3StorageService
+
+logger = logging.getLogger(__name__)
+
+_INDEX_ROOT = "import-index"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class ArchiveMember:
+    """One file of an imported skill or plugin."""
+
+    # Path relative to the skill/plugin root, used as the key suffix.
+    path: str
+    content_type: str | None
+    info: zipfile.ZipInfo | None = None
+    # Replaces the archive member's bytes (e.g. a patched plugin manifest).
+    data: bytes | None = None
+
+
+class ArchiveImportUploader:
+    """Stores the files of one imported skill or plugin under a version prefix.
+
+    Files are uploaded straight to the version prefix. Afterwards a small index
+    object, `import-index/<kind>/<sha256>`, keyed by a digest of every file's path
+    and bytes, records that prefix. Importing content someone already imported (a
+    popular skill) then only hashes the archive locally and server-side copies the
+    objects from the recorded prefix. If that prefix is gone (the version was
+    deleted), the files are uploaded again and the index points at the new copy,
+    so the bucket holds no objects beyond the version prefixes themselves.
+    Hashing, uploads and copies run on `IMPORT_UPLOAD_CONCURRENCY` threads.
+    """
+
+    def __init__(self, storage_service: S3StorageService, *, kind: str) -> None:
+        self.storage_service = storage_service
+        self._kind = kind
+        self._concurrency = max(1, int(get_settings().import_upload_concurrency))
+
+    def upload(
+        self,
+        *,
+        zipf: zipfile.ZipFile,
+        members: list[ArchiveMember],
+        destination_prefix: str,
+    ) -> None:
+        if not members:
+            return
+        digest = self._digest(zipf, members)
+        index_key = f"{_INDEX_ROOT}/{self._kind}/{digest}"
+
+        source_prefix = self._indexed_prefix(index_key)
+        if source_prefix is not None and source_prefix != destination_prefix:
+            try:
+                self._copy_all(members, source_prefix, destination_prefix)
+                logger.info(
+                    "archive_import_content_reused",
+                    extra={"kind": self._kind, "digest": digest, "files": len(members)},
+                )
+                return
+            except AppException:
+                logger.warning(
+                    "archive_import_content_copy_failed",
+                    extra={
+                        "kind": self._kind,
+                        "digest": digest,
+                        "source_prefix": source_prefix,
+                    },
+                )
+
+        self._map(lambda m: self._upload_member(zipf, m, destination_prefix), members)
+        self.storage_service.put_object(
+            key=index_key,
+            body=destination_prefix.encode("utf-8"),
+            content_type="text/plain",
+        )
+
+    def _indexed_prefix(self, index_key: str) -> str | None:
+        try:
+            if not self.storage_service.exists(index_key):
+                return None
+            return self.storage_service.get_text(index_key).strip() or None
+        except AppException:
+            return None
+
+    def _digest(self, zipf: zipfile.ZipFile, members: list[ArchiveMember]) -> str:
+        ordered = sorted(members, key=lambda m: m.path)
+        file_digests = self._map(lambda m: self._hash_member(zipf, m), ordered)
+        digest = hashlib.sha256()
+        for member, file_digest in zip(ordered, file_digests, strict=True):
+            digest.update(member.path.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(file_digest)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_member(zipf: zipfile.ZipFile, member: ArchiveMember) -> bytes:
+        if member.data is not None:
+            return hashlib.sha256(member.data).digest()
+        digest = hashlib.sha256()
+        with zipf.open(member.info, "r") as f:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                digest.update(chunk)
+        return digest.digest()
+
+    def _upload_member(
+        self, zipf: zipfile.ZipFile, member: ArchiveMember, prefix: str
+    ) -> None:
+        key = f"{prefix}{member.path}"
+        if member.data is not None:
+            self.storage_service.upload_fileobj(
+                fileobj=io.BytesIO(member.data),
+                key=key,
+                content_type=member.content_type,
+            )
+            return
+        with zipf.open(member.info, "r") as f:
+            self.storage_service.upload_fileobj(
+                fileobj=f, key=key, content_type=member.content_type
+            )
+
+    def _copy_all(
+        self, members: list[ArchiveMember], source_prefix: str, destination_prefix: str
+    ) -> None:
+        self._map(
+            lambda m: self.storage_service.copy_object(
+                source_key=f"{source_prefix}{m.path}",
+                destination_key=f"{destination_prefix}{m.path}",
+            ),
+            members,
+        )
+
+    def _map(
+        self, fn: Callable[[ArchiveMember], _T], members: list[ArchiveMember]
+    ) -> list[_T]:
+        workers = min(self._concurrency, len(members))
+        if workers <= 1:
+            return [fn(member) for member in members]
+        pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{self._kind}-import"
+        )
+        try:
+            return list(pool.map(fn, members))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -21,6 +21,7 @@ from app.schemas.auth import AuthConfigResponse, AuthProviderName, AuthProviderS
 from app.repositories.auth_identity_repository import AuthIdentityRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.user_session_repository import UserSessionRepository
+from app.services.session_token_cache import session_token_cache
 
 GOOGLE_USERINFO_URL = "https://openidconnect.googleapis.com/v1/userinfo"
 GITHUB_USER_URL = "https://api.github.com/user"
@@ -689,19 +690,31 @@ class AuthService:
                 return email, bool(item.get("verified"))
         return None, False
 
-    def authenticate_session_token(
+    def authenticate_session_user_id(
         self,
         db: Session,
         session_token: str,
-    ) -> UserSession | None:
+    ) -> str | None:
+        """Resolves the user of a session token, served from the token cache."""
         value = session_token.strip()
         if not value:
             return None
-        return UserSessionRepository.get_active_by_token_hash(
+        token_hash = self.hash_session_token(value)
+        user_id = session_token_cache.get(token_hash)
+        if user_id is not None:
+            return user_id
+
+        user_session = UserSessionRepository.get_active_by_token_hash(
             db,
-            self.hash_session_token(value),
+            token_hash,
             datetime.now(timezone.utc),
         )
+        if user_session is None or not user_session.user_id:
+            return None
+        session_token_cache.put(
+            token_hash, user_session.user_id, user_session.expires_at
+        )
+        return user_session.user_id
 
     def ensure_single_user(self, db: Session) -> User:
         settings = self._get_settings()
@@ -738,9 +751,12 @@ class AuthService:
     def logout(self, db: Session, session_token: str | None) -> None:
         if session_token is None or not session_token.strip():
             return
+        token_hash = self.hash_session_token(session_token.strip())
         UserSessionRepository.revoke_by_token_hash(
             db,
-            self.hash_session_token(session_token.strip()),
+            token_hash,
             datetime.now(timezone.utc),
         )
+        session_token_cache.publish_revocation(db, token_hash)
         db.commit()
+        session_token_cache.invalidate(token_hash)
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.repositories.background_job_repository import BackgroundJobRepository
+
+logger = logging.getLogger(__name__)
+
+SKILL_IMPORT_JOB = "skill_import"
+PLUGIN_IMPORT_JOB = "plugin_import"
+MEMORY_CREATE_JOB = "memory_create"
+SESSION_TITLE_JOB = "session_title"
+WORKSPACE_EXPORT_JOB = "workspace_export"
+
+
+@dataclass(frozen=True, slots=True)
+class BackgroundJobType:
+    name: str
+    model: Any
+    handler: Callable[[uuid.UUID], None]
+    concurrency: int
+    # Claim, lease renewal and stats for the table; see BackgroundJobRepository.
+    repository: Any = BackgroundJobRepository
+
+
+class BackgroundJobRunner:
+    """Runs queued job rows on per-type thread pools.
+
+    Each job type polls its table for queued rows (and running rows whose lease
+    lapsed), claiming at most as many as it has free workers with `SKIP LOCKED`,
+    so several processes can share a queue. Leases of running jobs are renewed
+    while their handler runs. Enqueuers call `notify` to skip the poll wait.
+    """
+
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        self._job_types: dict[str, BackgroundJobType] = {}
+        self._wakeups: dict[str, asyncio.Event] = {}
+        self._in_flight: dict[str, set[uuid.UUID]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.settings.background_jobs_enabled) and bool(self._job_types)
+
+    def register(self, job_type: BackgroundJobType) -> None:
+        self._job_types[job_type.name] = job_type
+
+    def notify(self, name: str) -> None:
+        """Wakes the workers of a job type; safe to call from any thread."""
+        loop = self._loop
+        event = self._wakeups.get(name)
+        if loop is None or event is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(event.set)
+
+    async def run_forever(self) -> None:
+        if not self.enabled:
+            logger.info("background_job_runner_disabled")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                *(self._run_job_type(job_type) for job_type in self._job_types.values())
+            )
+        finally:
+            self._loop = None
+
+    async def _run_job_type(self, job_type: BackgroundJobType) -> None:
+        concurrency = max(1, int(job_type.concurrency))
+        interval = max(0.2, float(self.settings.background_job_poll_interval_seconds))
+        lease_seconds = max(10, int(self.settings.background_job_lease_seconds))
+        renew_every = lease_seconds / 3
+        wakeup = self._wakeups.setdefault(job_type.name, asyncio.Event())
+        in_flight = self._in_flight.setdefault(job_type.name, set())
+        running: dict[asyncio.Future, uuid.UUID] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix=f"job-{job_type.name}"
+        )
+        loop = asyncio.get_running_loop()
+        last_renewal = time.monotonic()
+        try:
+            while True:
+                wakeup.clear()
+                free = concurrency - len(running)
+                if free > 0:
+                    try:
+                        job_ids = await asyncio.to_thread(
+                            self._claim, job_type, free, lease_seconds
+                        )
+                    except Exception:
+                        logger.exception(
+                            "background_job_claim_failed",
+                            extra={"job_type": job_type.name},
+                        )
+                        job_ids = []
+                    for job_id in job_ids:
+                        future = loop.run_in_executor(
+                            executor, self._run_job, job_type, job_id
+                        )
+                        running[future] = job_id
+                        in_flight.add(job_id)
+
+                waiter = asyncio.ensure_future(wakeup.wait())
+                try:
+                    await asyncio.wait(
+                        {waiter, *running},
+                        timeout=min(interval, renew_every) if running else interval,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    waiter.cancel()
+
+                for future in [f for f in running if f.done()]:
+                    in_flight.discard(running.pop(future))
+
+                if running and time.monotonic() - last_renewal >= renew_every:
+                    last_renewal = time.monotonic()
+                    try:
+                        await asyncio.to_thread(
+                            self._renew_leases,
+                            job_type,
+                            list(running.values()),
+                            lease_seconds,
+                        )
+                    except Exception:
+                        logger.exception(
+                            "background_job_lease_renewal_failed",
+                            extra={"job_type": job_type.name},
+                        )
+        finally:
+            in_flight.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _claim(
+        self, job_type: BackgroundJobType, limit: int, lease_seconds: int
+    ) -> list[uuid.UUID]:
+        db = SessionLocal()
+        try:
+            job_ids = job_type.repository.claim_due_batch(
+                db,
+                job_type.model,
+                limit=limit,
+                lease_seconds=lease_seconds,
+                max_attempts=max(1, int(self.settings.background_job_max_attempts)),
+            )
+            db.commit()
+            return job_ids
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _renew_leases(
+        job_type: BackgroundJobType, job_ids: list[uuid.UUID], lease_seconds: int
+    ) -> None:
+        db = SessionLocal()
+        try:
+            job_type.repository.renew_leases(
+                db, job_type.model, job_ids=job_ids, lease_seconds=lease_seconds
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _run_job(job_type: BackgroundJobType, job_id: uuid.UUID) -> None:
+        started = time.monotonic()
+        try:
+            job_type.handler(job_id)
+        except Exception:
+            logger.exception(
+                "background_job_handler_failed",
+                extra={"job_type": job_type.name, "job_id": str(job_id)},
+            )
+        logger.info(
+            "background_job_finished",
+            extra={
+                "job_type": job_type.name,
+                "job_id": str(job_id),
+                "duration_ms": int((time.monotonic() - started) * 1000),
+            },
+        )
+
+    def queue_stats(self) -> dict[str, dict[str, Any]]:
+        """Queue depth per job type, for the internal stats endpoint."""
+        now = datetime.now(timezone.utc)
+        stats: dict[str, dict[str, Any]] = {}
+        db = SessionLocal()
+        try:
+            for name, job_type in self._job_types.items():
+                depth = job_type.repository.queue_stats(db, job_type.model)
+                oldest = depth.pop("oldest_queued_at")
+                stats[name] = {
+                    **depth,
+                    "oldest_queued_age_seconds": (
+                        (now - oldest).total_seconds() if oldest is not None else 0.0
+                    ),
+                    "in_flight_here": len(self._in_flight.get(name, ())),
+                    "concurrency": max(1, int(job_type.concurrency)),
+                }
+        finally:
+            db.close()
+        return stats
+
+
+background_job_runner = BackgroundJobRunner()
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.schemas.callback import AgentCallbackRequest, CallbackResponse
+from app.services.callback_service import CallbackService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingCallback:
+    callback: AgentCallbackRequest
+    future: asyncio.Future
+
+
+class CallbackIngestService:
+    """Single writer per session for executor callbacks.
+
+    Callbacks for a session are queued in arrival order and drained by one task,
+    which applies up to `batch_size` consecutive callbacks in a single transaction.
+    Only the writer holds a DB connection and the session row lock; bursts for the
+    same session wait in memory instead of on `SELECT ... FOR UPDATE`. Replays are
+    dropped by `CallbackService` using the executor's per-run sequence number.
+    """
+
+    def __init__(
+        self,
+        callback_service: CallbackService | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        self._callback_service = callback_service or CallbackService()
+        self.batch_size = max(
+            1,
+            batch_size
+            if batch_size is not None
+            else get_settings().callback_ingest_batch_size,
+        )
+        self._queues: dict[str, list[_PendingCallback]] = {}
+        self._writers: dict[str, asyncio.Task] = {}
+
+    async def submit(self, callback: AgentCallbackRequest) -> CallbackResponse:
+        """Queues a callback behind earlier ones for its session and waits for it."""
+        key = callback.session_id
+        pending = _PendingCallback(
+            callback=callback,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._queues.setdefault(key, []).append(pending)
+        if key not in self._writers:
+            # The writer is its own task so a disconnecting client cannot cancel
+            # work that other requests for the session are waiting on.
+            self._writers[key] = asyncio.create_task(self._drain(key))
+        return await asyncio.shield(pending.future)
+
+    async def _drain(self, key: str) -> None:
+        queue = self._queues[key]
+        try:
+            while queue:
+                batch = queue[: self.batch_size]
+                del queue[: len(batch)]
+                try:
+                    results = await run_in_threadpool(
+                        self._apply_batch, [item.callback for item in batch]
+                    )
+                except Exception as exc:
+                    results = [exc] * len(batch)
+                for item, result in zip(batch, results):
+                    if item.future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        item.future.set_exception(result)
+                    else:
+                        item.future.set_result(result)
+        finally:
+            # Nothing awaits between the empty check and here, so no callback can
+            # be queued without a writer.
+            self._writers.pop(key, None)
+            self._queues.pop(key, None)
+            for item in queue:
+                if not item.future.done():
+                    item.future.set_exception(
+                        RuntimeError("Callback ingest writer stopped")
+                    )
+
+    def _apply_batch(
+        self, callbacks: list[AgentCallbackRequest]
+    ) -> list[CallbackResponse | Exception]:
+        results: list[CallbackResponse | Exception] = []
+        # Oversized payloads go to S3 before a connection is taken, so the
+        # session row lock is never held across object storage calls.
+        prepared = [
+            self._callback_service.prepare_payloads(callback) for callback in callbacks
+        ]
+        committed = False
+        db = SessionLocal()
+        try:
+            for callback, payloads in zip(callbacks, prepared):
+                # A savepoint per callback keeps one bad callback from discarding
+                # the rest of the batch.
+                try:
+                    with db.begin_nested():
+                        results.append(
+                            self._callback_service.apply_agent_callback(
+                                db, callback, payloads
+                            )
+                        )
+                except Exception as exc:
+                    payloads.persisted = False
+                    logger.warning(
+                        "callback_ingest_apply_failed",
+                        extra={
+                            "session_id": callback.session_id,
+                            "run_id": callback.run_id,
+                            "sequence": callback.sequence,
+                        },
+                        exc_info=True,
+                    )
+                    results.append(exc)
+            db.commit()
+            committed = True
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+            for payloads in prepared:
+                if not (committed and payloads.persisted):
+                    self._callback_service.discard_payloads(payloads)
+
+        if len(callbacks) > 1:
+            logger.debug(
+                "callback_ingest_batch_committed",
+                extra={
+                    "session_id": callbacks[0].session_id,
+                    "batch_size": len(callbacks),
+                },
+            )
+        return results
@@ -1,6 +1,7 @@
+import hashlib
 import logging
 import uuid
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -12,7 +13,16 @@ from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.repositories.session_repository import SessionRepository
 from app.repositories.tool_execution_repository import ToolExecutionRepository
+from app.repositories.usage_hourly_rollup_repository import (
+    UsageHourlyRollupRepository,
+)
 from app.repositories.usage_log_repository import UsageLogRepository
+from app.repositories.workspace_export_job_repository import (
+    WorkspaceExportJobRepository,
+)
+from app.repositories.workspace_manifest_repository import (
+    WorkspaceManifestRepository,
+)
 from app.schemas.callback import (
     AgentCallbackRequest,
     CallbackResponse,
@@ -20,7 +30,18 @@ from app.schemas.callback import (
 )
 from app.services.run_lifecycle_service import RunLifecycleService
 from app.services.im import ImEventService
+from app.services.payload_offload_service import (
+    OFFLOAD_REFERENCE_KEY,
+    PayloadOffloadService,
+    is_offloaded,
+)
 from app.services.pending_skill_creation_service import PendingSkillCreationService
+from app.services.session_event_service import (
+    ALL_EVENT_KINDS,
+    EVENT_RUN,
+    EVENT_STATE,
+    session_event_broker,
+)
 from app.services.session_queue_service import SessionQueueService
 from app.services.session_service import SessionService
 from app.utils.usage import normalize_usage_payload
@@ -30,7 +51,29 @@ logger = logging.getLogger(__name__)
 run_lifecycle_service = RunLifecycleService()
 session_queue_service = SessionQueueService()
 session_service = SessionService()
-pending_skill_creation_service = PendingSkillCreationService()
+
+# Stored in an offloaded message's reference so duplicate results can be matched
+# against the full visible text rather than the clipped preview.
+_TEXT_DIGEST_KEY = "text_sha256"
+
+
+@dataclass(slots=True)
+class PreparedPayloads:
+    """Previews of one callback's oversized payloads, uploaded ahead of its write.
+
+    `apply_agent_callback` stores the previews and sets `persisted`; callers
+    discard the uploads when it stays False or the transaction rolls back.
+    """
+
+    message: dict[str, Any] | None = None
+    tool_outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    persisted: bool = False
+
+    def previews(self) -> list[dict[str, Any]]:
+        previews = list(self.tool_outputs.values())
+        if self.message is not None:
+            previews.append(self.message)
+        return previews
 
 
 class CallbackService:
@@ -38,6 +81,7 @@ class CallbackService:
 
     def __init__(self) -> None:
         self._run_lifecycle = RunLifecycleService()
+        self._payload_offload = PayloadOffloadService()
         self._session_queue = SessionQueueService()
         self._session_service = SessionService()
         self._im_events = ImEventService()
@@ -220,11 +264,16 @@ class CallbackService:
         session_id: uuid.UUID,
         run_id: uuid.UUID | None,
         message_id: int,
+        offloaded_outputs: dict[str, dict[str, Any]] | None = None,
     ) -> None:
         content = message.get("content", [])
         if not isinstance(content, list):
             return
 
+        # Collect every block first so a message with many parallel tool calls is
+        # written with one upsert per block kind instead of a lookup per block.
+        tool_uses: dict[str, tuple[str, dict[str, Any] | None]] = {}
+        tool_results: dict[str, tuple[dict[str, Any], bool]] = {}
         for block in content:
             if not isinstance(block, dict):
                 continue
@@ -234,73 +283,39 @@ class CallbackService:
             if "ToolUseBlock" in block_type:
                 tool_use_id = block.get("id")
                 tool_name = block.get("name")
-                tool_input = block.get("input")
-
                 if not tool_use_id or not tool_name:
                     continue
-
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
-                if existing:
-                    existing.tool_name = tool_name
-                    existing.tool_input = tool_input
-                    existing.message_id = message_id
-                    if run_id is not None and existing.run_id is None:
-                        existing.run_id = run_id
-                    continue
-
-                ToolExecutionRepository.create(
-                    session_db=session_db,
-                    session_id=session_id,
-                    message_id=message_id,
-                    run_id=run_id,
-                    tool_use_id=tool_use_id,
-                    tool_name=tool_name,
-                    tool_input=tool_input,
-                )
+                tool_uses[tool_use_id] = (tool_name, block.get("input"))
                 continue
 
             if "ToolResultBlock" not in block_type:
                 continue
 
             tool_use_id = block.get("tool_use_id")
-            result_content = block.get("content")
-            is_error = block.get("is_error", False)
             if not tool_use_id:
                 continue
-
-            tool_output = {"content": result_content}
-            existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                session_db=session_db,
-                session_id=session_id,
-                tool_use_id=tool_use_id,
+            tool_output = (offloaded_outputs or {}).get(tool_use_id)
+            if tool_output is None:
+                tool_output = {"content": block.get("content")}
+            tool_results[tool_use_id] = (
+                tool_output,
+                bool(block.get("is_error", False)),
             )
-            if not existing:
-                ToolExecutionRepository.create(
-                    session_db=session_db,
-                    session_id=session_id,
-                    message_id=message_id,
-                    run_id=run_id,
-                    tool_use_id=tool_use_id,
-                    tool_name="unknown",
-                    tool_output=tool_output,
-                    result_message_id=message_id,
-                    is_error=bool(is_error),
-                )
-                continue
-
-            existing.tool_output = tool_output
-            existing.result_message_id = message_id
-            existing.is_error = bool(is_error)
-            if run_id is not None and existing.run_id is None:
-                existing.run_id = run_id
 
-            if existing.duration_ms is None and existing.created_at is not None:
-                duration = datetime.now(timezone.utc) - existing.created_at
-                existing.duration_ms = int(duration.total_seconds() * 1000)
+        ToolExecutionRepository.upsert_tool_uses(
+            session_db,
+            session_id=session_id,
+            message_id=message_id,
+            run_id=run_id,
+            tool_uses=tool_uses,
+        )
+        ToolExecutionRepository.upsert_tool_results(
+            session_db,
+            session_id=session_id,
+            message_id=message_id,
+            run_id=run_id,
+            tool_results=tool_results,
+        )
 
     def _extract_and_persist_usage(
         self,
@@ -333,6 +348,15 @@ class CallbackService:
             include_in_user_analytics=True,
             usage_json=usage_data,
         )
+        UsageHourlyRollupRepository.add_usage(
+            db,
+            user_id=db_session.user_id,
+            input_tokens=normalized_usage["input_tokens"],
+            output_tokens=normalized_usage["output_tokens"],
+            cache_creation_input_tokens=normalized_usage["cache_creation_input_tokens"],
+            cache_read_input_tokens=normalized_usage["cache_read_input_tokens"],
+            total_tokens=normalized_usage["total_tokens"],
+        )
 
     def _should_skip_duplicate_result_message(
         self,
@@ -356,11 +380,20 @@ class CallbackService:
         if latest_message is None or latest_message.role != "assistant":
             return False
 
-        latest_text = _normalize_visible_message_text(
-            _extract_visible_message_text(latest_message.content)
-        )
-        if not latest_text or latest_text != current_text:
-            return False
+        if is_offloaded(latest_message.content):
+            # The stored content is a clipped preview; match the digest of the
+            # full visible text recorded when the message was offloaded.
+            latest_digest = latest_message.content[OFFLOAD_REFERENCE_KEY].get(
+                _TEXT_DIGEST_KEY
+            )
+            if latest_digest != _visible_text_digest(current_text):
+                return False
+        else:
+            latest_text = _normalize_visible_message_text(
+                _extract_visible_message_text(latest_message.content)
+            )
+            if not latest_text or latest_text != current_text:
+                return False
 
         latest_type = str(latest_message.content.get("_type", "")).strip()
         return "AssistantMessage" in latest_type or "ResultMessage" in latest_type
@@ -371,6 +404,7 @@ class CallbackService:
         session_id: uuid.UUID,
         run_id: uuid.UUID | None,
         message: dict[str, Any],
+        payloads: PreparedPayloads | None = None,
     ) -> AgentMessage:
         role = self._extract_role_from_message(message)
         text_preview = _extract_visible_message_text(message)
@@ -381,16 +415,124 @@ class CallbackService:
             session_db=db,
             session_id=session_id,
             role=role,
-            content=message,
+            content=(
+                payloads.message
+                if payloads is not None and payloads.message is not None
+                else message
+            ),
             text_preview=text_preview,
         )
         db.flush()
-        self._extract_tool_executions(db, message, session_id, run_id, db_message.id)
+        self._extract_tool_executions(
+            db,
+            message,
+            session_id,
+            run_id,
+            db_message.id,
+            offloaded_outputs=payloads.tool_outputs if payloads is not None else None,
+        )
+        if payloads is not None:
+            payloads.persisted = True
         return db_message
 
+    def prepare_payloads(self, callback: AgentCallbackRequest) -> PreparedPayloads:
+        """Uploads the callback's oversized message and tool outputs to S3.
+
+        Call this before taking the session row lock, so the lock is never held
+        across object storage round trips.
+        """
+        payloads = PreparedPayloads()
+        message = callback.new_message
+        if not isinstance(message, dict):
+            return payloads
+
+        content = message.get("content")
+        for block in content if isinstance(content, list) else []:
+            if not isinstance(block, dict):
+                continue
+            if "ToolResultBlock" not in str(block.get("_type", "")):
+                continue
+            tool_use_id = block.get("tool_use_id")
+            if not tool_use_id:
+                continue
+            preview = self._payload_offload.offload(
+                {"content": block.get("content")},
+                session_id=callback.session_id,
+                kind="tool-outputs",
+            )
+            if is_offloaded(preview):
+                payloads.tool_outputs[tool_use_id] = preview
+
+        preview = self._payload_offload.offload(
+            message, session_id=callback.session_id, kind="messages"
+        )
+        if is_offloaded(preview):
+            visible_text = _normalize_visible_message_text(
+                _extract_visible_message_text(message)
+            )
+            if visible_text:
+                preview[OFFLOAD_REFERENCE_KEY][_TEXT_DIGEST_KEY] = _visible_text_digest(
+                    visible_text
+                )
+            payloads.message = preview
+        return payloads
+
+    def discard_payloads(self, payloads: PreparedPayloads) -> None:
+        """Deletes uploads whose rows were not written or were rolled back."""
+        for preview in payloads.previews():
+            self._payload_offload.discard(preview)
+
+    @staticmethod
+    def _enqueue_workspace_export_job(
+        db: Session, db_session: AgentSession, *, new_export: bool = False
+    ) -> None:
+        # Storing the manifest and detecting pending skills read from S3, so they
+        # run in the background instead of under the session row lock.
+        if not PendingSkillCreationService.has_exported_workspace(db_session):
+            return
+        if new_export:
+            # The manifest key is reused by every export of a session. Drop the
+            # stored copy so readers backfill the new manifest from S3 until the
+            # job stores it, instead of serving the previous export's tree.
+            WorkspaceManifestRepository.delete(db, db_session.workspace_manifest_key)
+        WorkspaceExportJobRepository.enqueue(db, session_id=db_session.id)
+
+    def _is_replayed_callback(
+        self, db_run: AgentRun | None, callback: AgentCallbackRequest
+    ) -> bool:
+        if db_run is None or callback.sequence is None:
+            return False
+        last_sequence = db_run.last_callback_sequence
+        if last_sequence is not None and callback.sequence <= last_sequence:
+            return True
+        db_run.last_callback_sequence = callback.sequence
+        return False
+
     def process_agent_callback(
         self, db: Session, callback: AgentCallbackRequest
     ) -> CallbackResponse:
+        payloads = self.prepare_payloads(callback)
+        try:
+            result = self.apply_agent_callback(db, callback, payloads)
+            db.commit()
+        except Exception:
+            self.discard_payloads(payloads)
+            raise
+        if not payloads.persisted:
+            self.discard_payloads(payloads)
+        return result
+
+    def apply_agent_callback(
+        self,
+        db: Session,
+        callback: AgentCallbackRequest,
+        payloads: PreparedPayloads | None = None,
+    ) -> CallbackResponse:
+        """Applies one callback without committing, so callers can batch them.
+
+        `payloads` holds previews from `prepare_payloads`; without it oversized
+        payloads are stored inline.
+        """
         parsed_run_id = self._parse_run_id(callback.run_id)
         db_session, db_run = self._resolve_session_and_run(db, callback, parsed_run_id)
 
@@ -408,6 +550,22 @@ class CallbackService:
                 message="Session not found yet",
             )
 
+        if self._is_replayed_callback(db_run, callback):
+            logger.info(
+                "skip_replayed_callback",
+                extra={
+                    "session_id": str(db_session.id),
+                    "run_id": str(db_run.id) if db_run is not None else None,
+                    "sequence": callback.sequence,
+                },
+            )
+            return CallbackResponse(
+                session_id=str(db_session.id),
+                status=db_session.status,
+                callback_status=callback.status,
+                message="Callback already applied",
+            )
+
         if db_session.status in {"canceling", "canceled"}:
             return CallbackResponse(
                 session_id=str(db_session.id),
@@ -449,6 +607,7 @@ class CallbackService:
                     db_session.id,
                     db_run.id if db_run is not None else None,
                     callback.new_message,
+                    payloads,
                 )
             self._extract_and_persist_usage(
                 db,
@@ -472,6 +631,11 @@ class CallbackService:
             should_apply_workspace_export
             and self._should_preserve_existing_ready_workspace(db_session, callback)
         )
+        workspace_export_ready = (
+            should_apply_workspace_export
+            and not preserve_existing_ready_workspace
+            and (callback.workspace_export_status or "").strip().lower() == "ready"
+        )
         if preserve_existing_ready_workspace:
             logger.info(
                 "preserve_existing_ready_workspace_export",
@@ -593,26 +757,20 @@ class CallbackService:
                         "run_id": str(db_run.id) if db_run is not None else None,
                     },
                 )
-            pending_skill_creation_service.detect_and_create_pending(
-                db,
-                session=db_session,
+            self._enqueue_workspace_export_job(
+                db, db_session, new_export=workspace_export_ready
             )
-        elif (
-            should_apply_workspace_export
-            and not preserve_existing_ready_workspace
-            and callback.workspace_export_status is not None
-            and callback.workspace_export_status.strip().lower() == "ready"
-            and (db_session.status or "").strip().lower() in {"completed", "failed"}
-        ):
+        elif workspace_export_ready:
             # Workspace export may arrive in a separate callback after the initial
-            # COMPLETED callback.  Trigger detection when the export becomes ready for
-            # a session that is already terminal.
-            pending_skill_creation_service.detect_and_create_pending(
-                db,
-                session=db_session,
-            )
+            # COMPLETED callback. The job stores the manifest and, once the session
+            # is terminal, detects pending skills.
+            self._enqueue_workspace_export_job(db, db_session, new_export=True)
 
-        db.commit()
+        session_event_broker.notify(
+            db,
+            db_session.id,
+            ALL_EVENT_KINDS if callback.new_message else {EVENT_STATE, EVENT_RUN},
+        )
         return CallbackResponse(
             session_id=str(db_session.id),
             status=db_session.status,
@@ -650,3 +808,7 @@ def _normalize_visible_message_text(text: str | None) -> str:
     if not text:
         return ""
     return text.replace("\ufffd", "").strip()
+
+
+def _visible_text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from rank_bm25 import BM25Okapi
+
+from app.core.settings import get_settings
+from app.schemas.capability_recommendation import CapabilityRecommendationItem
+
+_MAX_INDEXES = 256
+_MAX_RESULTS = 4096
+
+ResultKey = tuple[str, str, int]
+
+
+class CapabilityRecommendationCache:
+    """Process-wide caches behind `CapabilityRecommendationService`.
+
+    Both caches are keyed by a catalog version, a digest of the documents and
+    install states a user's recommendations are computed from. Installing,
+    removing, toggling or editing a capability changes the version, so entries
+    never need to be invalidated; stale ones age out of the LRU.
+
+    BM25 indexes are kept per catalog version. Reranked results are kept per
+    (catalog version, normalized query, limit) for
+    `CAPABILITY_RECOMMENDATION_CACHE_TTL_SECONDS`.
+    """
+
+    def __init__(self) -> None:
+        self._ttl_seconds = max(
+            0, int(get_settings().capability_recommendation_cache_ttl_seconds)
+        )
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[str, BM25Okapi] = OrderedDict()
+        self._results: OrderedDict[
+            ResultKey, tuple[list[CapabilityRecommendationItem], float]
+        ] = OrderedDict()
+
+    def get_index(
+        self, catalog_version: str, build: Callable[[], BM25Okapi]
+    ) -> BM25Okapi:
+        with self._lock:
+            index = self._indexes.get(catalog_version)
+            if index is not None:
+                self._indexes.move_to_end(catalog_version)
+                return index
+        index = build()
+        with self._lock:
+            self._indexes[catalog_version] = index
+            self._indexes.move_to_end(catalog_version)
+            while len(self._indexes) > _MAX_INDEXES:
+                self._indexes.popitem(last=False)
+        return index
+
+    def get_results(self, key: ResultKey) -> list[CapabilityRecommendationItem] | None:
+        if self._ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            items, deadline = entry
+            if deadline <= time.monotonic():
+                self._results.pop(key, None)
+                return None
+            self._results.move_to_end(key)
+            return list(items)
+
+    def put_results(
+        self, key: ResultKey, items: list[CapabilityRecommendationItem]
+    ) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._results[key] = (list(items), time.monotonic() + self._ttl_seconds)
+            self._results.move_to_end(key)
+            while len(self._results) > _MAX_RESULTS:
+                self._results.popitem(last=False)
+
+
+capability_recommendation_cache = CapabilityRecommendationCache()
@@ -1,7 +1,11 @@
+import hashlib
+import re
 from dataclasses import dataclass
 
 import httpx
+from rank_bm25 import BM25Okapi
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
@@ -15,6 +19,14 @@ from app.schemas.capability_recommendation import (
     CapabilityRecommendationResponse,
     CapabilityRecommendationType,
 )
+from app.services.capability_recommendation_cache import (
+    capability_recommendation_cache,
+)
+
+# Kana and CJK ideographs one character at a time (they are written without
+# spaces), and runs of any other Unicode letters/digits as words.
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(rf"[{_CJK_CHARS}]|[^\W_{_CJK_CHARS}]+")
 
 
 @dataclass(slots=True)
@@ -25,6 +37,7 @@ class _CapabilityCandidate:
     description: str | None
     default_enabled: bool
     document: str
+    search_text: str
 
 
 class CapabilityRecommendationService:
@@ -117,6 +130,9 @@ class CapabilityRecommendationService:
                         description=self._clean_text(server.description),
                         source_text=server.scope,
                     ),
+                    search_text=self._build_search_text(
+                        server.name, self._clean_text(server.description)
+                    ),
                 )
             )
 
@@ -141,11 +157,68 @@ class CapabilityRecommendationService:
                         description=self._clean_text(skill.description),
                         source_text=self._build_skill_source_text(skill.source),
                     ),
+                    search_text=self._build_search_text(
+                        skill.name,
+                        self._clean_text(skill.description),
+                        self._build_skill_source_text(skill.source),
+                    ),
                 )
             )
 
         return candidates
 
+    @staticmethod
+    def _build_search_text(*parts: str | None) -> str:
+        return " ".join(part for part in parts if part)
+
+    @staticmethod
+    def _tokenize(value: str) -> list[str]:
+        return _TOKEN_PATTERN.findall(value.casefold())
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(query.casefold().split())
+
+    @staticmethod
+    def _catalog_version(candidates: list[_CapabilityCandidate]) -> str:
+        """Digest of everything the recommendations for a catalog depend on."""
+        digest = hashlib.sha256()
+        for candidate in candidates:
+            digest.update(
+                f"{candidate.type}\x1f{candidate.id}\x1f{candidate.name}\x1f"
+                f"{candidate.description or ''}\x1f{int(candidate.default_enabled)}\x1f"
+                f"{candidate.document}\x1e".encode()
+            )
+        return digest.hexdigest()
+
+    def _shortlist(
+        self,
+        candidates: list[_CapabilityCandidate],
+        query: str,
+        catalog_version: str,
+    ) -> list[_CapabilityCandidate]:
+        """Keeps the top BM25 matches so the rerank payload does not grow with the catalog.
+
+        Candidates without a lexical match keep their catalog order behind the
+        matching ones, so the reranker still sees a full shortlist when the query
+        shares no words with any document.
+        """
+        top_k = max(1, int(self.settings.capability_recommendation_rerank_candidates))
+        if len(candidates) <= top_k:
+            return candidates
+        index = capability_recommendation_cache.get_index(
+            catalog_version,
+            lambda: BM25Okapi(
+                [
+                    self._tokenize(candidate.search_text) or [""]
+                    for candidate in candidates
+                ]
+            ),
+        )
+        scores = index.get_scores(self._tokenize(query))
+        ranked = sorted(range(len(candidates)), key=lambda i: (-scores[i], i))
+        return [candidates[i] for i in ranked[:top_k]]
+
     @staticmethod
     def _extract_upstream_error_message(response: httpx.Response) -> str:
         try:
@@ -178,10 +251,21 @@ class CapabilityRecommendationService:
         if not clean_query:
             return CapabilityRecommendationResponse(query="", items=[])
 
-        candidates = self._build_candidates(db, user_id)
+        candidates = await run_in_threadpool(self._build_candidates, db, user_id)
         if not candidates:
             return CapabilityRecommendationResponse(query=clean_query, items=[])
 
+        catalog_version = self._catalog_version(candidates)
+        cache_key = (catalog_version, self._normalize_query(clean_query), limit)
+        cached_items = capability_recommendation_cache.get_results(cache_key)
+        if cached_items is not None:
+            return CapabilityRecommendationResponse(
+                query=clean_query, items=cached_items
+            )
+        candidates = await run_in_threadpool(
+            self._shortlist, candidates, clean_query, catalog_version
+        )
+
         api_key = self._resolve_api_key()
         target_url = self._resolve_rerank_url()
 
@@ -270,4 +354,5 @@ class CapabilityRecommendationService:
                 )
             )
 
+        capability_recommendation_cache.put_results(cache_key, items)
         return CapabilityRecommendationResponse(query=clean_query, items=items)
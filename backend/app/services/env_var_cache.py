@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.core.settings import get_settings
+
+ENV_VAR_CHANGES_CHANNEL = "poco_env_var_changes"
+
+_MAX_DECRYPTED_VALUES = 4096
+_MAX_ENV_MAPS = 1024
+
+
+class EnvVarCache:
+    """Process-wide caches behind `EnvVarService`.
+
+    Decrypted values are keyed by their ciphertext, so they never go stale: a
+    changed value has a new ciphertext, and rotating the secret key leaves stored
+    ciphertexts (and their cached plaintext) valid until they are re-encrypted.
+
+    Assembled env maps are cached per owner (a user id, or the system owner for
+    the system map). Writers queue a NOTIFY naming the owner inside their
+    transaction; every replica drops that owner's map on commit, and all maps
+    when the system vars changed or the listener reconnected. Maps also expire
+    after `ENV_VAR_CACHE_TTL_SECONDS`.
+    """
+
+    def __init__(self, system_owner: str) -> None:
+        self._system_owner = system_owner
+        self._ttl_seconds = max(0, int(get_settings().env_var_cache_ttl_seconds))
+        self._lock = threading.Lock()
+        self._values: OrderedDict[str, str] = OrderedDict()
+        self._maps: OrderedDict[str, tuple[dict[str, str], float]] = OrderedDict()
+        # Bumped on every invalidation; a map loaded across one is not stored.
+        self._generation = 0
+
+    def decrypt(self, token: str, decrypt: Callable[[str], str]) -> str:
+        with self._lock:
+            value = self._values.get(token)
+            if value is not None:
+                self._values.move_to_end(token)
+                return value
+        value = decrypt(token)
+        self.remember_value(token, value)
+        return value
+
+    def remember_value(self, token: str, value: str) -> None:
+        with self._lock:
+            self._values[token] = value
+            self._values.move_to_end(token)
+            while len(self._values) > _MAX_DECRYPTED_VALUES:
+                self._values.popitem(last=False)
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get_map(self, owner: str) -> dict[str, str] | None:
+        if self._ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._maps.get(owner)
+            if entry is None:
+                return None
+            env_map, deadline = entry
+            if deadline <= time.monotonic():
+                self._maps.pop(owner, None)
+                return None
+            self._maps.move_to_end(owner)
+            return dict(env_map)
+
+    def put_map(self, owner: str, env_map: dict[str, str], generation: int) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._maps[owner] = (dict(env_map), time.monotonic() + self._ttl_seconds)
+            self._maps.move_to_end(owner)
+            while len(self._maps) > _MAX_ENV_MAPS:
+                self._maps.popitem(last=False)
+
+    def invalidate(self, owner: str | None) -> None:
+        """Drops the map of `owner`; the system owner or `None` drops every map."""
+        with self._lock:
+            self._generation += 1
+            if owner is None or owner == self._system_owner:
+                self._maps.clear()
+            else:
+                self._maps.pop(owner, None)
+
+    def publish_change(self, db: Session, owner: str) -> None:
+        """Queues a change NOTIFY that is delivered when `db` commits."""
+        if engine.dialect.name != "postgresql":
+            return
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": ENV_VAR_CHANGES_CHANNEL, "payload": owner},
+        )
+
+    def handle_notification(self, payload: str | None) -> None:
+        """Listener callback; `None` means notifications may have been lost."""
+        self.invalidate(payload.strip() if payload is not None else None)
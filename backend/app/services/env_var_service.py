@@ -18,7 +18,8 @@ from app.schemas.env_var import (
     SystemEnvVarResponse,
     SystemEnvVarUpdateRequest,
 )
-from app.utils.crypto import decrypt_value, encrypt_value
+from app.services.env_var_cache import EnvVarCache
+from app.utils.crypto import decrypt_value, encrypt_value, needs_rotation
 
 logger = logging.getLogger(__name__)
 
@@ -97,15 +98,34 @@ def _require_regular_user_id(user_id: str) -> None:
         )
 
 
+env_var_cache = EnvVarCache(system_owner=SYSTEM_USER_ID)
+
+
 class EnvVarService:
     def __init__(self) -> None:
         self.settings = get_settings()
+        self._fallback_keys = tuple(
+            key.strip()
+            for key in (self.settings.secret_key_fallbacks or "").split(",")
+            if key.strip()
+        )
 
     def _encrypt(self, value: str) -> str:
-        return encrypt_value(value, self.settings.secret_key)
+        token = encrypt_value(value, self.settings.secret_key, self._fallback_keys)
+        env_var_cache.remember_value(token, value)
+        return token
 
     def _decrypt(self, token: str) -> str:
-        return decrypt_value(token, self.settings.secret_key)
+        return env_var_cache.decrypt(
+            token,
+            lambda t: decrypt_value(t, self.settings.secret_key, self._fallback_keys),
+        )
+
+    @staticmethod
+    def _commit_change(db: Session, owner: str) -> None:
+        env_var_cache.publish_change(db, owner)
+        db.commit()
+        env_var_cache.invalidate(owner)
 
     # ----------------------------
     # Public (UI) APIs: no secrets
@@ -159,7 +179,7 @@ class EnvVarService:
 
         try:
             EnvVarRepository.create(db, env_var)
-            db.commit()
+            self._commit_change(db, user_id)
             db.refresh(env_var)
         except IntegrityError as exc:
             db.rollback()
@@ -188,7 +208,7 @@ class EnvVarService:
         if request.description is not None:
             env_var.description = request.description
 
-        db.commit()
+        self._commit_change(db, user_id)
         db.refresh(env_var)
         return self._to_public_response(env_var, is_set=True)
 
@@ -201,7 +221,7 @@ class EnvVarService:
                 message=f"Env var not found: {env_var_id}",
             )
         EnvVarRepository.delete(db, env_var)
-        db.commit()
+        self._commit_change(db, user_id)
 
     def _to_public_response(
         self, env_var: UserEnvVar, *, is_set: bool
@@ -232,6 +252,11 @@ class EnvVarService:
 
     def get_system_env_map(self, db: Session) -> dict[str, str]:
         """Return env_map containing process env plus system-managed values only."""
+        cached = env_var_cache.get_map(SYSTEM_USER_ID)
+        if cached is not None:
+            return cached
+
+        generation = env_var_cache.generation()
         env_map = self._load_process_env_map()
 
         system_vars = EnvVarRepository.list_by_user_and_scope(
@@ -246,6 +271,7 @@ class EnvVarService:
             if value.strip():
                 env_map[item.key] = value
 
+        env_var_cache.put_map(SYSTEM_USER_ID, env_map, generation)
         return env_map
 
     def get_env_map(self, db: Session, user_id: str) -> dict[str, str]:
@@ -254,6 +280,11 @@ class EnvVarService:
         Empty values are treated as "unset" and excluded from the map so that
         `${env:KEY}` fails loudly when not configured.
         """
+        cached = env_var_cache.get_map(user_id)
+        if cached is not None:
+            return cached
+
+        generation = env_var_cache.generation()
         env_map = self.get_system_env_map(db)
 
         user_vars = EnvVarRepository.list_by_user_and_scope(
@@ -269,8 +300,34 @@ class EnvVarService:
                 continue
             if value.strip():
                 env_map[item.key] = value
+
+        env_var_cache.put_map(user_id, env_map, generation)
         return env_map
 
+    def rotate_ciphertexts(self, db: Session) -> int:
+        """Re-encrypts values still encrypted with a fallback key; caller commits.
+
+        Plaintexts are unchanged, so cached env maps stay valid and the new
+        ciphertexts are primed in this process's decrypt cache.
+        """
+        if not self._fallback_keys:
+            return 0
+        rotated = 0
+        for env_var in EnvVarRepository.list_all(db):
+            token = env_var.value_ciphertext
+            if not needs_rotation(token, self.settings.secret_key):
+                continue
+            try:
+                value = self._decrypt(token)
+            except Exception:
+                logger.exception(
+                    "Failed to decrypt env var for rotation: %s", env_var.key
+                )
+                continue
+            env_var.value_ciphertext = self._encrypt(value)
+            rotated += 1
+        return rotated
+
     def _load_process_env_map(self) -> dict[str, str]:
         env_map: dict[str, str] = {}
         for key in PROCESS_ENV_KEYS:
@@ -328,7 +385,7 @@ class EnvVarService:
 
         try:
             EnvVarRepository.create(db, env_var)
-            db.commit()
+            self._commit_change(db, SYSTEM_USER_ID)
             db.refresh(env_var)
         except IntegrityError as exc:
             db.rollback()
@@ -376,7 +433,7 @@ class EnvVarService:
         if request.description is not None:
             env_var.description = request.description
 
-        db.commit()
+        self._commit_change(db, SYSTEM_USER_ID)
         db.refresh(env_var)
         return SystemEnvVarResponse(
             id=env_var.id,
@@ -401,4 +458,4 @@ class EnvVarService:
                 message=f"System env var not found: {env_var_id}",
             )
         EnvVarRepository.delete(db, env_var)
-        db.commit()
+        self._commit_change(db, SYSTEM_USER_ID)
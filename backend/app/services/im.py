@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from pydantic import ValidationError
+from sqlalchemy import event as sa_event
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -42,7 +43,7 @@ from app.schemas.im import (
 from app.schemas.session import SessionResponse, SessionStateResponse, TaskConfig
 from app.schemas.task import TaskEnqueueRequest, TaskEnqueueResponse
 from app.schemas.user_input_request import UserInputAnswerRequest
-from app.services.im_providers import NotificationGateway
+from app.services.im_providers import NotificationGateway, http_send_slots
 from app.services.session_service import SessionService
 from app.services.session_title_service import SessionTitleService
 from app.services.task_service import TaskService
@@ -208,13 +209,25 @@ class BackendClient:
     def _schedule_title_generation(self, session_id: uuid.UUID, prompt: str) -> None:
         task = asyncio.create_task(
             asyncio.to_thread(
-                self._title_service.generate_and_update,
+                self._enqueue_title_generation_sync,
                 session_id,
                 prompt,
             )
         )
         task.add_done_callback(_log_background_task_exception)
 
+    def _enqueue_title_generation_sync(
+        self, session_id: uuid.UUID, prompt: str
+    ) -> None:
+        db = SessionLocal()
+        try:
+            self._title_service.enqueue(db, session_id, prompt)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
 
 class MessageFormatter:
     def __init__(self) -> None:
@@ -276,6 +289,13 @@ class MessageFormatter:
             return ""
         return f"💬 {clean_text}"
 
+    def format_assistant_text_batch(self, *, session_id: str, texts: list[str]) -> str:
+        rendered = (
+            self.format_assistant_text_update(session_id=session_id, text=text)
+            for text in texts
+        )
+        return "\n\n".join(part for part in rendered if part)
+
     def format_user_input_request(
         self,
         *,
@@ -871,125 +891,164 @@ class InboundMessageService:
         return (stored or "").strip() or channel.destination
 
 
+@dataclass(slots=True)
+class PlannedDelivery:
+    channel_id: int
+    dedup_key: str
+    text: str
+    event_type: str
+    session_id: str
+    message_text: str | None
+    provider: str
+    destination: str
+
+
 class BackendEventService:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.formatter = MessageFormatter()
         self.gateway = NotificationGateway()
 
-    async def process_event(self, db: Session, *, event: ImBackendEvent) -> int:
+    def plan_deliveries(
+        self, db: Session, *, event: ImBackendEvent
+    ) -> list[PlannedDelivery]:
+        """Renders an event for each target channel that has not received it yet.
+
+        Deliveries with empty text only need their dedup key recorded.
+        """
         expected_user_id = (
             self.settings.backend_user_id.strip() or "default"
             if self.settings.backend_user_id
             else "default"
         )
         if event.user_id != expected_user_id:
-            return 0
+            return []
 
         session_id = event.session.id.strip()
         if not session_id:
-            return 0
+            return []
 
         target_channel_ids = self._get_target_channel_ids(db, session_id=session_id)
         if not target_channel_ids:
-            return 0
+            return []
 
+        message_text: str | None = None
         if event.type == "assistant_message.created":
             message = event.message
             if message is None or not message.text.strip():
-                return 0
-            delivered = 0
-            for channel_id in target_channel_ids:
-                key = f"msg:{channel_id}:{session_id}:{message.id}"
-                if DedupRepository.exists(db, key=key):
-                    continue
-                rendered = self.formatter.format_assistant_text_update(
-                    session_id=session_id,
-                    text=message.text,
-                    title=event.session.title,
+                return []
+            message_text = message.text
+
+            def build(channel_id: int) -> tuple[str, str]:
+                return (
+                    f"msg:{channel_id}:{session_id}:{message.id}",
+                    self.formatter.format_assistant_text_update(
+                        session_id=session_id,
+                        text=message.text,
+                        title=event.session.title,
+                    ),
                 )
-                if not rendered:
-                    self._commit_processed_key(db, key=key)
-                    continue
-                if not await self._send_to_channel(
-                    db, channel_id=channel_id, text=rendered
-                ):
-                    raise RuntimeError(
-                        f"failed to deliver assistant message event to channel {channel_id}"
-                    )
-                self._commit_processed_key(db, key=key)
-                delivered += 1
-            return delivered
 
-        if event.type == "run.terminal":
+        elif event.type == "run.terminal":
             run = event.run
             raw_status = run.status if run is not None else event.session.status
             status = (raw_status or "").strip()
             if status not in {"completed", "failed", "canceled"}:
-                return 0
+                return []
             run_ref = (
                 run.id.strip()
                 if run is not None and isinstance(run.id, str) and run.id.strip()
                 else session_id
             )
-            delivered = 0
-            for channel_id in target_channel_ids:
-                key = f"run:{channel_id}:{run_ref}:{status}"
-                if DedupRepository.exists(db, key=key):
-                    continue
-                rendered = self.formatter.format_terminal_notification(
-                    session_id=session_id,
-                    title=event.session.title,
-                    status=status,
-                    run_id=run.id if run is not None else None,
-                    last_error=(run.error_message if run is not None else None),
+
+            def build(channel_id: int) -> tuple[str, str]:
+                return (
+                    f"run:{channel_id}:{run_ref}:{status}",
+                    self.formatter.format_terminal_notification(
+                        session_id=session_id,
+                        title=event.session.title,
+                        status=status,
+                        run_id=run.id if run is not None else None,
+                        last_error=(run.error_message if run is not None else None),
+                    ),
                 )
-                if not await self._send_to_channel(
-                    db, channel_id=channel_id, text=rendered
-                ):
-                    raise RuntimeError(
-                        f"failed to deliver run terminal event to channel {channel_id}"
-                    )
-                self._commit_processed_key(db, key=key)
-                delivered += 1
-            return delivered
 
-        if event.type == "user_input_request.created":
+        elif event.type == "user_input_request.created":
             request = event.user_input_request
             if request is None or request.status != "pending":
-                return 0
-            delivered = 0
-            for channel_id in target_channel_ids:
-                key = f"ui:{channel_id}:{request.id}"
-                if DedupRepository.exists(db, key=key):
-                    continue
-                rendered = self.formatter.format_user_input_request(
-                    request_id=request.id,
+                return []
+
+            def build(channel_id: int) -> tuple[str, str]:
+                return (
+                    f"ui:{channel_id}:{request.id}",
+                    self.formatter.format_user_input_request(
+                        request_id=request.id,
+                        session_id=session_id,
+                        tool_name=request.tool_name,
+                        tool_input=request.tool_input,
+                        expires_at=request.expires_at.isoformat(),
+                        title=event.session.title,
+                    ),
+                )
+
+        else:
+            return []
+
+        deliveries: list[PlannedDelivery] = []
+        for channel_id in sorted(target_channel_ids):
+            key, rendered = build(channel_id)
+            if DedupRepository.exists(db, key=key):
+                continue
+            channel = ChannelRepository.get_by_id(db, channel_id=channel_id)
+            if channel is None or not channel.enabled:
+                rendered = ""
+            deliveries.append(
+                PlannedDelivery(
+                    channel_id=channel_id,
+                    dedup_key=key,
+                    text=rendered,
+                    event_type=event.type,
                     session_id=session_id,
-                    tool_name=request.tool_name,
-                    tool_input=request.tool_input,
-                    expires_at=request.expires_at.isoformat(),
-                    title=event.session.title,
+                    message_text=message_text,
+                    provider=channel.provider if channel is not None else "",
+                    destination=(
+                        self._resolve_destination(db, channel)
+                        if channel is not None
+                        else ""
+                    ),
                 )
-                if not await self._send_to_channel(
-                    db, channel_id=channel_id, text=rendered
-                ):
-                    raise RuntimeError(
-                        f"failed to deliver user input event to channel {channel_id}"
-                    )
-                self._commit_processed_key(db, key=key)
-                delivered += 1
-            return delivered
+            )
+        return deliveries
+
+    def merge_assistant_messages(
+        self, deliveries: list[PlannedDelivery]
+    ) -> PlannedDelivery:
+        """Folds a backlog of assistant messages for one session into one send."""
+        first = deliveries[0]
+        return PlannedDelivery(
+            channel_id=first.channel_id,
+            dedup_key=first.dedup_key,
+            text=self.formatter.format_assistant_text_batch(
+                session_id=first.session_id,
+                texts=[d.message_text or "" for d in deliveries],
+            ),
+            event_type=first.event_type,
+            session_id=first.session_id,
+            message_text=None,
+            provider=first.provider,
+            destination=first.destination,
+        )
 
-        return 0
+    async def send(self, delivery: PlannedDelivery) -> bool:
+        return await self.gateway.send_text(
+            provider=delivery.provider,
+            destination=delivery.destination,
+            text=delivery.text,
+        )
 
-    def _commit_processed_key(self, db: Session, *, key: str) -> None:
-        try:
+    def mark_processed_keys(self, db: Session, *, keys: list[str]) -> None:
+        for key in keys:
             self._mark_processed_key(db, key=key)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
 
     def _mark_processed_key(self, db: Session, *, key: str) -> None:
         if DedupRepository.exists(db, key=key):
@@ -1018,25 +1077,13 @@ class BackendEventService:
 
         return target
 
-    async def _send_to_channel(
-        self, db: Session, *, channel_id: int, text: str
-    ) -> bool:
-        channel = ChannelRepository.get_by_id(db, channel_id=channel_id)
-        if channel is None or not channel.enabled:
-            return True
-
+    @staticmethod
+    def _resolve_destination(db: Session, channel: Channel) -> str:
         if channel.provider == "dingtalk":
-            destination = channel.destination
-        else:
-            destination = (
-                ChannelDeliveryRepository.get_send_address(db, channel_id=channel_id)
-                or channel.destination
-            )
-
-        return await self.gateway.send_text(
-            provider=channel.provider,
-            destination=destination,
-            text=text,
+            return channel.destination
+        return (
+            ChannelDeliveryRepository.get_send_address(db, channel_id=channel.id)
+            or channel.destination
         )
 
 
@@ -1089,6 +1136,7 @@ class ImEventService:
             user_input_request_id=None,
             payload=event.model_dump(mode="json"),
         )
+        db.info[_OUTBOX_PENDING_KEY] = True
 
     def enqueue_run_terminal(
         self,
@@ -1140,6 +1188,7 @@ class ImEventService:
             user_input_request_id=None,
             payload=event.model_dump(mode="json"),
         )
+        db.info[_OUTBOX_PENDING_KEY] = True
 
     def enqueue_user_input_request_created(
         self,
@@ -1176,6 +1225,7 @@ class ImEventService:
             user_input_request_id=request.id,
             payload=event.model_dump(mode="json"),
         )
+        db.info[_OUTBOX_PENDING_KEY] = True
 
 
 @dataclass(slots=True)
@@ -1184,9 +1234,61 @@ class ClaimedEvent:
     event_type: str
     attempt_count: int
     payload: dict
+    created_at: datetime | None = None
+
+
+class _DispatchWakeup:
+    """Wakes the dispatcher loop from the threads that enqueue outbox events."""
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event: asyncio.Event | None = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        self._loop = loop
+        self._event = asyncio.Event()
+        return self._event
+
+    def unbind(self) -> None:
+        self._loop = None
+        self._event = None
+
+    def notify(self) -> None:
+        loop, wake_event = self._loop, self._event
+        if loop is None or wake_event is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(wake_event.set)
+
+
+_dispatch_wakeup = _DispatchWakeup()
+_OUTBOX_PENDING_KEY = "im_event_outbox_pending"
+
+
+@sa_event.listens_for(SessionLocal, "after_commit")
+def _wake_dispatcher_after_commit(session: Session) -> None:
+    if session.info.pop(_OUTBOX_PENDING_KEY, False):
+        _dispatch_wakeup.notify()
+
+
+@sa_event.listens_for(SessionLocal, "after_rollback")
+def _clear_outbox_pending(session: Session) -> None:
+    session.info.pop(_OUTBOX_PENDING_KEY, None)
 
 
 class ImEventDispatcher:
+    """Delivers outbox events to IM channels.
+
+    A claimed batch is fanned out into one ordered queue per target channel.
+    Channels are delivered concurrently (at most `im_event_dispatch_concurrency`
+    provider requests in flight), while each channel receives its events in outbox order;
+    after a failed send the rest of that channel's queue is retried later, and
+    later batches hold a channel's events while an earlier one still awaits its
+    retry. A backlog of assistant messages for one session is sent as a single
+    message. An event whose own sends keep failing is dead-lettered after
+    `im_event_max_attempts`, which bounds how long it can hold its channels;
+    being held back does not count as an attempt.
+    """
+
     def __init__(self) -> None:
         self.settings = get_settings()
         self._backend_event_service = BackendEventService()
@@ -1201,49 +1303,227 @@ class ImEventDispatcher:
             return
 
         interval = max(0.2, float(self.settings.im_event_dispatch_interval_seconds))
-        while True:
-            try:
-                await self._dispatch_once()
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.exception("im_event_dispatcher_iteration_failed")
-            await asyncio.sleep(interval)
+        wakeup = _dispatch_wakeup.bind(asyncio.get_running_loop())
+        try:
+            while True:
+                wakeup.clear()
+                has_more = False
+                try:
+                    has_more = await self._dispatch_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("im_event_dispatcher_iteration_failed")
+                if has_more:
+                    continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=interval)
+                except TimeoutError:
+                    pass
+        finally:
+            _dispatch_wakeup.unbind()
 
-    async def _dispatch_once(self) -> None:
+    async def _dispatch_once(self) -> bool:
+        """Delivers one batch; returns True when the batch was full."""
         batch_size = max(1, int(self.settings.im_event_dispatch_batch_size))
         lease_seconds = max(5, int(self.settings.im_event_dispatch_lease_seconds))
         claimed = await asyncio.to_thread(
             self._claim_due_batch, batch_size, lease_seconds
         )
         if not claimed:
-            return
+            return False
 
+        plans, failures, held = await asyncio.to_thread(self._plan_batch, claimed)
+        queues: dict[int, list[tuple[str, PlannedDelivery]]] = {}
         for event in claimed:
+            for delivery in plans.get(event.id, []):
+                queues.setdefault(delivery.channel_id, []).append((event.id, delivery))
+
+        semaphore = asyncio.Semaphore(
+            max(1, int(self.settings.im_event_dispatch_concurrency))
+        )
+        delivered_keys: list[str] = []
+        await asyncio.gather(
+            *(
+                self._deliver_channel(
+                    channel_id, queue, semaphore, delivered_keys, failures, held
+                )
+                for channel_id, queue in queues.items()
+            )
+        )
+        await asyncio.to_thread(
+            self._finish_batch, claimed, delivered_keys, failures, held
+        )
+        return len(claimed) >= batch_size
+
+    def _plan_batch(
+        self, claimed: list[ClaimedEvent]
+    ) -> tuple[dict[str, list[PlannedDelivery]], dict[str, str], set[str]]:
+        plans: dict[str, list[PlannedDelivery]] = {}
+        failures: dict[str, str] = {}
+        held: set[str] = set()
+        db = SessionLocal()
+        try:
+            for event in claimed:
+                try:
+                    parsed = ImBackendEvent.model_validate(event.payload)
+                    plans[event.id] = self._backend_event_service.plan_deliveries(
+                        db, event=parsed
+                    )
+                except Exception as exc:
+                    db.rollback()
+                    failures[event.id] = str(exc)
+            self._hold_behind_undelivered(db, claimed, plans, failures, held)
+        finally:
+            db.close()
+        return plans, failures, held
+
+    @staticmethod
+    def _hold(
+        failures: dict[str, str], held: set[str], event_id: str, reason: str
+    ) -> None:
+        """Retries an event later without counting it as a failed send."""
+        if event_id not in failures:
+            failures[event_id] = reason
+            held.add(event_id)
+
+    def _hold_behind_undelivered(
+        self,
+        db: Session,
+        claimed: list[ClaimedEvent],
+        plans: dict[str, list[PlannedDelivery]],
+        failures: dict[str, str],
+        held: set[str],
+    ) -> None:
+        """Drops deliveries to channels that an earlier event has yet to reach.
+
+        An earlier event may be in retry backoff or leased by another dispatcher;
+        sending later events to its channels first would reorder them. Held
+        events are retried like failed ones.
+        """
+        created = [event.created_at for event in claimed if event.created_at]
+        if not created:
+            return
+        pending = ImEventOutboxRepository.list_undelivered_before(
+            db,
+            before=max(created),
+            exclude_ids=[uuid.UUID(event.id) for event in claimed],
+            limit=max(1, int(self.settings.im_event_dispatch_batch_size)),
+        )
+        held_since: dict[int, datetime] = {}
+        for row in pending:
             try:
-                await self._deliver(event)
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                delay = min(60.0, float(2 ** min(event.attempt_count, 6)))
-                await asyncio.to_thread(self._mark_retry, event.id, str(exc), delay)
+                parsed = ImBackendEvent.model_validate(row.payload)
+                deliveries = self._backend_event_service.plan_deliveries(
+                    db, event=parsed
+                )
+            except Exception:
+                db.rollback()
+                continue
+            for delivery in deliveries:
+                if delivery.text:
+                    held_since.setdefault(delivery.channel_id, row.created_at)
+
+        for event in claimed:
+            if event.created_at is None or event.id not in plans:
+                continue
+            kept: list[PlannedDelivery] = []
+            for delivery in plans[event.id]:
+                since = held_since.get(delivery.channel_id)
+                if since is not None and since < event.created_at:
+                    self._hold(
+                        failures,
+                        held,
+                        event.id,
+                        "held behind an earlier undelivered event to channel "
+                        f"{delivery.channel_id}",
+                    )
+                    continue
+                kept.append(delivery)
+            plans[event.id] = kept
+
+    async def _deliver_channel(
+        self,
+        channel_id: int,
+        queue: list[tuple[str, PlannedDelivery]],
+        semaphore: asyncio.Semaphore,
+        delivered_keys: list[str],
+        failures: dict[str, str],
+        held: set[str],
+    ) -> None:
+        blocked_by: str | None = None
+        for group in _collapse_assistant_backlog(queue):
+            event_ids = [event_id for event_id, _ in group]
+            if blocked_by is not None:
+                for event_id in event_ids:
+                    self._hold(failures, held, event_id, blocked_by)
+                continue
+
+            deliveries = [delivery for _, delivery in group]
+            delivery = (
+                deliveries[0]
+                if len(deliveries) == 1
+                else self._backend_event_service.merge_assistant_messages(deliveries)
+            )
+            error: str | None = None
+            if delivery.text:
+                try:
+                    # Rate-limit waits happen outside the slot; see http_send_slots.
+                    with http_send_slots(semaphore):
+                        sent = await self._backend_event_service.send(delivery)
+                    if not sent:
+                        error = f"failed to deliver {delivery.event_type} event to channel {channel_id}"
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    error = str(exc) or exc.__class__.__name__
+
+            if error is None:
+                delivered_keys.extend(d.dedup_key for d in deliveries)
+                continue
+            for event_id in event_ids:
+                failures[event_id] = error
+                held.discard(event_id)
+            # Keep per-channel order: later events wait for this one's retry.
+            blocked_by = f"blocked behind failed delivery to channel {channel_id}"
+
+    def _finish_batch(
+        self,
+        claimed: list[ClaimedEvent],
+        delivered_keys: list[str],
+        failures: dict[str, str],
+        held: set[str],
+    ) -> None:
+        max_attempts = max(1, int(self.settings.im_event_max_attempts))
+        db = SessionLocal()
+        try:
+            self._backend_event_service.mark_processed_keys(db, keys=delivered_keys)
+            for event in claimed:
+                error = failures.get(event.id)
+                if error is None:
+                    ImEventOutboxRepository.mark_delivered(db, event_id=event.id)
+                    continue
+                attempted = event.id not in held
+                give_up = attempted and event.attempt_count >= max_attempts
+                ImEventOutboxRepository.mark_retry(
+                    db,
+                    event_id=event.id,
+                    error_message=error,
+                    delay_seconds=min(60.0, float(2 ** min(event.attempt_count, 6))),
+                    give_up=give_up,
+                    attempted=attempted,
+                )
                 logger.warning(
-                    "im_event_delivery_failed",
+                    "im_event_abandoned" if give_up else "im_event_delivery_failed",
                     extra={
                         "event_id": event.id,
                         "event_type": event.event_type,
                         "attempt_count": event.attempt_count,
-                        "error": str(exc),
+                        "held": not attempted,
+                        "error": error,
                     },
                 )
-            else:
-                await asyncio.to_thread(self._mark_delivered, event.id)
-
-    async def _deliver(self, event: ClaimedEvent) -> None:
-        parsed = ImBackendEvent.model_validate(event.payload)
-        db = SessionLocal()
-        try:
-            await self._backend_event_service.process_event(db, event=parsed)
+            db.commit()
         except Exception:
             db.rollback()
             raise
@@ -1269,6 +1549,7 @@ class ImEventDispatcher:
                         event_type=row.event_type,
                         attempt_count=int(row.attempt_count or 0),
                         payload=payload,
+                        created_at=row.created_at,
                     )
                 )
             return claimed
@@ -1278,34 +1559,27 @@ class ImEventDispatcher:
         finally:
             db.close()
 
-    @staticmethod
-    def _mark_delivered(event_id: str) -> None:
-        db = SessionLocal()
-        try:
-            ImEventOutboxRepository.mark_delivered(db, event_id=event_id)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
-    @staticmethod
-    def _mark_retry(event_id: str, error_message: str, delay_seconds: float) -> None:
-        db = SessionLocal()
-        try:
-            ImEventOutboxRepository.mark_retry(
-                db,
-                event_id=event_id,
-                error_message=error_message,
-                delay_seconds=delay_seconds,
-            )
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+def _collapse_assistant_backlog(
+    queue: list[tuple[str, PlannedDelivery]],
+) -> list[list[tuple[str, PlannedDelivery]]]:
+    """Groups consecutive assistant messages of the same session."""
+    groups: list[list[tuple[str, PlannedDelivery]]] = []
+    for item in queue:
+        delivery = item[1]
+        previous = groups[-1][-1][1] if groups else None
+        if (
+            previous is not None
+            and delivery.text
+            and previous.text
+            and delivery.event_type == "assistant_message.created"
+            and previous.event_type == "assistant_message.created"
+            and delivery.session_id == previous.session_id
+        ):
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+    return groups
 
 
 def _parse_uuid(
@@ -2,7 +2,13 @@ import asyncio
 import json
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 import httpx
@@ -21,6 +27,36 @@ _FEISHU_AT_ID_ATTR_RE = re.compile(
 )
 
 
+_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+# Retry-After hints longer than this fail the send instead of stalling the
+# dispatcher; the outbox retries the event later.
+_MAX_RETRY_AFTER_SECONDS = 30.0
+_DEFAULT_RETRY_AFTER_SECONDS = 1.0
+_MAX_THROTTLED_ATTEMPTS = 3
+_MAX_DESTINATION_BUCKETS = 4096
+_FEISHU_RATE_LIMIT_CODE = 99991400
+
+# Caller-wide cap on in-flight provider requests (see `http_send_slots`).
+_http_send_slots: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "im_http_send_slots", default=None
+)
+
+
+@contextmanager
+def http_send_slots(slots: asyncio.Semaphore) -> Iterator[None]:
+    """Bounds provider HTTP requests made in this context by `slots`.
+
+    Only the request itself holds a slot: waiting for a rate-limit token or a
+    Retry-After pause does not, so throttled chats cannot starve other sends.
+    """
+    token = _http_send_slots.set(slots)
+    try:
+        yield
+    finally:
+        _http_send_slots.reset(token)
+
+
 class MessageProvider(Protocol):
     provider: str
     max_text_length: int
@@ -30,12 +66,165 @@ class MessageProvider(Protocol):
 
     async def send_text(self, *, destination: str, text: str) -> bool: ...
 
+    async def aclose(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class SendLimits:
+    """Send rates of one bot, overall and per chat, in messages per second."""
+
+    global_rate: float
+    global_burst: int
+    destination_rate: float
+    destination_burst: int
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = float(max(1, burst))
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def blocked_for(self) -> float:
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def block_for(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so sends to a chat keep their order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                elapsed = now - self._updated
+                self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+class _SendLimiter:
+    """Token buckets for one bot: a global one plus one per destination."""
+
+    def __init__(self, limits: SendLimits) -> None:
+        self._limits = limits
+        self._global = _TokenBucket(limits.global_rate, limits.global_burst)
+        self._destinations: OrderedDict[str, _TokenBucket] = OrderedDict()
+
+    def _bucket(self, destination: str) -> _TokenBucket:
+        bucket = self._destinations.get(destination)
+        if bucket is None:
+            bucket = _TokenBucket(
+                self._limits.destination_rate, self._limits.destination_burst
+            )
+            self._destinations[destination] = bucket
+            while len(self._destinations) > _MAX_DESTINATION_BUCKETS:
+                self._destinations.popitem(last=False)
+        else:
+            self._destinations.move_to_end(destination)
+        return bucket
+
+    async def acquire(self, destination: str) -> bool:
+        """Waits for a send slot; False when the provider asked for a long pause."""
+        bucket = self._bucket(destination)
+        blocked = max(bucket.blocked_for(), self._global.blocked_for())
+        if blocked > _MAX_RETRY_AFTER_SECONDS:
+            return False
+        await bucket.acquire()
+        await self._global.acquire()
+        return True
+
+    def throttled(self, destination: str, retry_after: float) -> None:
+        self._bucket(destination).block_for(retry_after)
+
+
+class _ProviderTransport:
+    """Keep-alive HTTP client, token lock and limiter bound to one event loop."""
+
+    def __init__(self, limits: SendLimits) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.http = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_POOL_LIMITS)
+        self.token_lock = asyncio.Lock()
+        self.limiter = _SendLimiter(limits)
 
-class TelegramClient:
+
+class _PooledProvider:
+    provider: str
+    send_limits: SendLimits
+
+    def __init__(self) -> None:
+        self._transport_state: _ProviderTransport | None = None
+
+    def _transport(self) -> _ProviderTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transport_state
+        if transport is None or transport.loop is not loop or transport.http.is_closed:
+            transport = _ProviderTransport(self.send_limits)
+            self._transport_state = transport
+        return transport
+
+    async def aclose(self) -> None:
+        transport, self._transport_state = self._transport_state, None
+        if transport is not None and not transport.http.is_closed:
+            await transport.http.aclose()
+
+    def _is_throttled(self, resp: httpx.Response) -> bool:
+        return resp.status_code == 429
+
+    async def _post_limited(
+        self, url: str, *, destination: str, **kwargs: Any
+    ) -> httpx.Response | None:
+        """Posts a message within the bot's send limits.
+
+        Throttled responses pause the destination for the provider's Retry-After
+        hint and are retried a few times. Returns None when the pause is too long
+        to wait out.
+        """
+        transport = self._transport()
+        slots = _http_send_slots.get()
+        resp: httpx.Response | None = None
+        for attempt in range(1, _MAX_THROTTLED_ATTEMPTS + 1):
+            if not await transport.limiter.acquire(destination):
+                break
+            if slots is None:
+                resp = await transport.http.post(url, **kwargs)
+            else:
+                async with slots:
+                    resp = await transport.http.post(url, **kwargs)
+            if not self._is_throttled(resp):
+                return resp
+            retry_after = _retry_after_seconds(resp)
+            transport.limiter.throttled(destination, retry_after)
+            logger.warning(
+                "im_provider_rate_limited",
+                extra={
+                    "provider": self.provider,
+                    "retry_after": retry_after,
+                    "attempt": attempt,
+                },
+            )
+        logger.warning("im_provider_send_throttled", extra={"provider": self.provider})
+        return None
+
+
+class TelegramClient(_PooledProvider):
     provider = "telegram"
     max_text_length = 3500
+    # Bot API FAQ: about 30 messages per second overall, one per second per chat.
+    send_limits = SendLimits(
+        global_rate=30.0, global_burst=30, destination_rate=1.0, destination_burst=1
+    )
 
     def __init__(self) -> None:
+        super().__init__()
         settings = get_settings()
         token = (settings.telegram_bot_token or "").strip()
         self._enabled = bool(token)
@@ -54,10 +243,9 @@ class TelegramClient:
             "text": text,
             "disable_web_page_preview": True,
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        resp = await self._post_limited(url, destination=destination, json=payload)
+        if resp is None:
+            return False
         if not resp.is_success:
             logger.warning(
                 "telegram_send_failed",
@@ -67,11 +255,20 @@ class TelegramClient:
         return True
 
 
-class DingTalkClient:
+class DingTalkClient(_PooledProvider):
     provider = "dingtalk"
     max_text_length = 1800
+    # Robot messages are limited to 20 per minute per group; the OpenAPI to
+    # 20 requests per second per app.
+    send_limits = SendLimits(
+        global_rate=20.0,
+        global_burst=20,
+        destination_rate=20 / 60,
+        destination_burst=20,
+    )
 
     def __init__(self) -> None:
+        super().__init__()
         settings = get_settings()
         self._enabled = bool(settings.dingtalk_enabled)
         self._fallback_webhook = (settings.dingtalk_webhook_url or "").strip()
@@ -85,7 +282,6 @@ class DingTalkClient:
             and self._client_secret
             and self._robot_code
         )
-        self._token_lock = asyncio.Lock()
         self._access_token: str | None = None
         self._token_expire_ts = 0.0
 
@@ -102,10 +298,7 @@ class DingTalkClient:
             "appKey": self._client_id,
             "appSecret": self._client_secret,
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        resp = await self._transport().http.post(url, json=payload)
         if not resp.is_success:
             raise RuntimeError(f"DingTalk auth failed: HTTP {resp.status_code}")
 
@@ -129,7 +322,7 @@ class DingTalkClient:
         ):
             return self._access_token
 
-        async with self._token_lock:
+        async with self._transport().token_lock:
             if (
                 self._access_token
                 and self._token_expire_ts > 0
@@ -146,10 +339,9 @@ class DingTalkClient:
             "msgtype": "text",
             "text": {"content": text},
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        resp = await self._post_limited(url, destination=url, json=payload)
+        if resp is None:
+            return False
         if resp.is_success:
             return True
 
@@ -178,18 +370,23 @@ class DingTalkClient:
             "msgParam": msg_param,
         }
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            group_url = f"{self._open_base_url}/v1.0/robot/groupMessages/send"
-            resp = await client.post(group_url, json=payload, headers=headers)
-            if resp.is_success:
-                return True
+        group_url = f"{self._open_base_url}/v1.0/robot/groupMessages/send"
+        resp = await self._post_limited(
+            group_url, destination=conversation_id, json=payload, headers=headers
+        )
+        if resp is None:
+            return False
+        if resp.is_success:
+            return True
 
-            private_url = f"{self._open_base_url}/v1.0/robot/privateChatMessages/send"
-            resp2 = await client.post(private_url, json=payload, headers=headers)
-            if resp2.is_success:
-                return True
+        private_url = f"{self._open_base_url}/v1.0/robot/privateChatMessages/send"
+        resp2 = await self._post_limited(
+            private_url, destination=conversation_id, json=payload, headers=headers
+        )
+        if resp2 is None:
+            return False
+        if resp2.is_success:
+            return True
 
         logger.warning(
             "dingtalk_openapi_send_failed",
@@ -227,17 +424,21 @@ class DingTalkClient:
         return False
 
 
-class FeishuClient:
+class FeishuClient(_PooledProvider):
     provider = "feishu"
     max_text_length = 3000
+    # Message API: 50 requests per second per app, 5 per second per chat.
+    send_limits = SendLimits(
+        global_rate=50.0, global_burst=50, destination_rate=5.0, destination_burst=5
+    )
 
     def __init__(self) -> None:
+        super().__init__()
         settings = get_settings()
         self._enabled = bool(settings.feishu_enabled)
         self._base_url = (settings.feishu_base_url or "").rstrip("/")
         self._app_id = (settings.feishu_app_id or "").strip()
         self._app_secret = (settings.feishu_app_secret or "").strip()
-        self._token_lock = asyncio.Lock()
         self._tenant_access_token: str | None = None
         self._token_expire_ts = 0.0
 
@@ -256,11 +457,7 @@ class FeishuClient:
             "app_id": self._app_id,
             "app_secret": self._app_secret,
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
-
+        resp = await self._transport().http.post(url, json=payload)
         if not resp.is_success:
             raise RuntimeError(f"Feishu auth failed: HTTP {resp.status_code}")
 
@@ -289,7 +486,7 @@ class FeishuClient:
         ):
             return self._tenant_access_token
 
-        async with self._token_lock:
+        async with self._transport().token_lock:
             if (
                 self._tenant_access_token
                 and self._token_expire_ts > 0
@@ -301,6 +498,23 @@ class FeishuClient:
                 raise RuntimeError("Feishu tenant access token is empty")
             return self._tenant_access_token
 
+    async def _invalidate_tenant_access_token(self, stale_token: str) -> None:
+        # Only drop the token the failed send used, so concurrent failures
+        # trigger a single refresh.
+        async with self._transport().token_lock:
+            if self._tenant_access_token == stale_token:
+                self._tenant_access_token = None
+                self._token_expire_ts = 0.0
+
+    def _is_throttled(self, resp: httpx.Response) -> bool:
+        if resp.status_code == 429:
+            return True
+        try:
+            data = resp.json()
+        except ValueError:
+            return False
+        return isinstance(data, dict) and data.get("code") == _FEISHU_RATE_LIMIT_CODE
+
     async def _send_text_once(
         self,
         *,
@@ -317,16 +531,15 @@ class FeishuClient:
         }
         headers = {"Authorization": f"Bearer {tenant_access_token}"}
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(
-                url,
-                params={"receive_id_type": receive_id_type},
-                json=payload,
-                headers=headers,
-            )
-
+        resp = await self._post_limited(
+            url,
+            destination=f"{receive_id_type}:{receive_id}",
+            params={"receive_id_type": receive_id_type},
+            json=payload,
+            headers=headers,
+        )
+        if resp is None:
+            return False
         if not resp.is_success:
             logger.warning(
                 "feishu_send_failed",
@@ -352,7 +565,7 @@ class FeishuClient:
             extra={
                 "receive_id_type": receive_id_type,
                 "code": code,
-                "msg": data.get("msg"),
+                "error_msg": data.get("msg"),
             },
         )
         return False
@@ -380,9 +593,7 @@ class FeishuClient:
             return True
 
         try:
-            async with self._token_lock:
-                self._tenant_access_token = None
-                self._token_expire_ts = 0.0
+            await self._invalidate_tenant_access_token(token)
             token = await self._get_tenant_access_token()
         except Exception:
             logger.exception("feishu_auth_error")
@@ -396,13 +607,39 @@ class FeishuClient:
         )
 
 
+_shared_providers: dict[str, MessageProvider] | None = None
+_shared_providers_lock = threading.Lock()
+
+
+def _get_shared_providers() -> dict[str, MessageProvider]:
+    # One client per bot for the whole process, so every gateway shares its
+    # connections, cached token and send limits.
+    global _shared_providers
+    with _shared_providers_lock:
+        if _shared_providers is None:
+            _shared_providers = {
+                "telegram": TelegramClient(),
+                "dingtalk": DingTalkClient(),
+                "feishu": FeishuClient(),
+            }
+        return _shared_providers
+
+
+async def close_shared_providers() -> None:
+    for client in (_shared_providers or {}).values():
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning(
+                "im_provider_close_failed",
+                extra={"provider": client.provider},
+                exc_info=True,
+            )
+
+
 class NotificationGateway:
     def __init__(self) -> None:
-        self._providers: dict[str, MessageProvider] = {
-            "telegram": TelegramClient(),
-            "dingtalk": DingTalkClient(),
-            "feishu": FeishuClient(),
-        }
+        self._providers = _get_shared_providers()
 
     def get_provider(self, provider: str) -> MessageProvider | None:
         return self._providers.get(provider)
@@ -909,6 +1146,30 @@ def _parse_positive_int(value: object, *, default: int) -> int:
     return default
 
 
+def _retry_after_seconds(resp: httpx.Response) -> float:
+    for header in ("Retry-After", "x-ogw-ratelimit-reset"):
+        raw = resp.headers.get(header)
+        if raw:
+            try:
+                seconds = float(raw)
+            except ValueError:
+                continue
+            if seconds > 0:
+                return seconds
+
+    # Telegram reports the wait in the body as parameters.retry_after.
+    try:
+        data = resp.json()
+    except ValueError:
+        data = None
+    parameters = data.get("parameters") if isinstance(data, dict) else None
+    if isinstance(parameters, dict):
+        retry_after = parameters.get("retry_after")
+        if isinstance(retry_after, (int, float)) and retry_after > 0:
+            return float(retry_after)
+    return _DEFAULT_RETRY_AFTER_SECONDS
+
+
 def _split_text(text: str, max_len: int) -> list[str]:
     if len(text) <= max_len:
         return [text]
@@ -16,6 +16,10 @@ from app.schemas.memory import (
     MemoryCreateJobResponse,
     MemoryCreateRequest,
 )
+from app.services.background_job_runner import (
+    MEMORY_CREATE_JOB,
+    background_job_runner,
+)
 from app.services.memory_service import MemoryService
 
 logger = logging.getLogger(__name__)
@@ -47,6 +51,7 @@ class MemoryCreateJobService:
         )
         db.commit()
         db.refresh(job)
+        background_job_runner.notify(MEMORY_CREATE_JOB)
         return MemoryCreateJobEnqueueResponse(job_id=job.id, status=job.status)
 
     def get_job(
@@ -149,3 +154,8 @@ class MemoryCreateJobService:
             started_at=job.started_at,
             finished_at=job.finished_at,
         )
+
+
+# Shared by the memories router and the background job runner, so jobs run with
+# the config set through /memories/configure.
+memory_create_job_service = MemoryCreateJobService()
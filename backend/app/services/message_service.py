@@ -17,8 +17,11 @@ from app.schemas.message import (
     MessageAttachmentsResponse,
     MessageDeltaResponse,
     MessageResponse,
+    MessageSummaryResponse,
+    MessageWindowResponse,
     MessageWithFilesDeltaResponse,
     MessageWithFilesResponse,
+    MessageWithFilesWindowResponse,
 )
 from app.services.storage_service import S3StorageService
 
@@ -244,6 +247,105 @@ class MessageService:
             has_more=has_more,
         )
 
+    def get_messages_window(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        before_message_id: int | None = None,
+        after_message_id: int | None = None,
+        limit: int = 50,
+        include_content: bool = False,
+    ) -> MessageWindowResponse:
+        """Gets a keyset window of a session's messages.
+
+        Without a cursor the latest messages are returned, so large sessions can
+        be opened at their tail and scrolled back with `next_before_message_id`.
+        """
+        safe_limit = max(1, min(int(limit), 500))
+        fetched = MessageRepository.list_window_by_session(
+            db,
+            session_id,
+            before_id=before_message_id,
+            after_id=after_message_id,
+            limit=safe_limit + 1,
+            include_content=include_content,
+        )
+        if after_message_id is not None:
+            has_more_after = len(fetched) > safe_limit
+            messages = fetched[:safe_limit]
+            first_id = messages[0].id if messages else after_message_id + 1
+            has_more_before = MessageRepository.exists_in_session(
+                db, session_id, before_id=first_id
+            )
+        else:
+            has_more_before = len(fetched) > safe_limit
+            messages = fetched[-safe_limit:]
+            has_more_after = before_message_id is not None and (
+                MessageRepository.exists_in_session(
+                    db,
+                    session_id,
+                    after_id=messages[-1].id if messages else before_message_id - 1,
+                )
+            )
+
+        items = [
+            MessageSummaryResponse(
+                id=message.id,
+                role=message.role,
+                text_preview=message.text_preview,
+                created_at=message.created_at,
+                content=message.content if include_content else None,
+            )
+            for message in messages
+        ]
+        return MessageWindowResponse(
+            items=items,
+            next_before_message_id=items[0].id if items else before_message_id,
+            next_after_message_id=items[-1].id if items else after_message_id,
+            has_more_before=has_more_before,
+            has_more_after=has_more_after,
+        )
+
+    def get_messages_with_files_window(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        user_id: str,
+        before_message_id: int | None = None,
+        limit: int = 50,
+    ) -> MessageWithFilesWindowResponse:
+        """Gets the messages-with-files window ending before `before_message_id`.
+
+        Without a cursor the latest messages are returned; attachments are only
+        resolved for the runs of the messages in the window.
+        """
+        safe_limit = max(1, min(int(limit), 500))
+        fetched = MessageRepository.list_window_by_session(
+            db,
+            session_id,
+            before_id=before_message_id,
+            limit=safe_limit + 1,
+            include_content=True,
+        )
+        has_more_before = len(fetched) > safe_limit
+        messages = fetched[-safe_limit:]
+
+        runs = RunRepository.list_by_session_and_user_message_ids(
+            db, session_id, [message.id for message in messages]
+        )
+        items = self._build_messages_with_files(
+            messages,
+            user_id=user_id,
+            message_id_to_attachments=self._collect_message_attachments(runs),
+        )
+        return MessageWithFilesWindowResponse(
+            items=items,
+            next_before_message_id=items[0].id if items else before_message_id,
+            has_more_before=has_more_before,
+        )
+
     def get_message_attachments(
         self, db: Session, session_id: uuid.UUID, *, user_id: str
     ) -> list[MessageAttachmentsResponse]:
@@ -0,0 +1,127 @@
+import gzip
+import json
+import logging
+import uuid
+from typing import Any
+
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.services.storage_service import S3StorageService
+
+logger = logging.getLogger(__name__)
+
+# Key added to a preview payload that points at the full body in object storage.
+OFFLOAD_REFERENCE_KEY = "_offloaded"
+_PREVIEW_MAX_LIST_ITEMS = 100
+
+
+def build_preview(value: Any, max_chars: int) -> Any:
+    """Returns a copy of a JSON value with long strings and lists clipped."""
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}\n… [truncated {len(value) - max_chars} chars]"
+    if isinstance(value, dict):
+        return {key: build_preview(item, max_chars) for key, item in value.items()}
+    if isinstance(value, list):
+        clipped = [
+            build_preview(item, max_chars) for item in value[:_PREVIEW_MAX_LIST_ITEMS]
+        ]
+        if len(value) > _PREVIEW_MAX_LIST_ITEMS:
+            clipped.append(
+                f"… [truncated {len(value) - _PREVIEW_MAX_LIST_ITEMS} items]"
+            )
+        return clipped
+    return value
+
+
+def is_offloaded(payload: Any) -> bool:
+    return isinstance(payload, dict) and isinstance(
+        payload.get(OFFLOAD_REFERENCE_KEY), dict
+    )
+
+
+class PayloadOffloadService:
+    """Moves oversized JSON payloads (message contents, tool outputs) to S3.
+
+    Rows keep a clipped preview so list endpoints stay cheap; the full body is only
+    read back when a client asks for a single message or tool execution.
+    """
+
+    def __init__(self, storage_service: S3StorageService | None = None) -> None:
+        settings = get_settings()
+        self.threshold_bytes = settings.payload_offload_threshold_bytes
+        self.preview_chars = max(1, settings.payload_preview_chars)
+        self._storage_service = storage_service
+
+    @property
+    def storage_service(self) -> S3StorageService:
+        if self._storage_service is None:
+            self._storage_service = S3StorageService()
+        return self._storage_service
+
+    @staticmethod
+    def _encode(payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def offload(
+        self, payload: dict[str, Any], *, session_id: uuid.UUID | str, kind: str
+    ) -> dict[str, Any]:
+        """Returns `payload` unchanged when small, otherwise a preview with a reference."""
+        if self.threshold_bytes <= 0 or is_offloaded(payload):
+            return payload
+        body = self._encode(payload)
+        if len(body) <= self.threshold_bytes:
+            return payload
+
+        key = f"payloads/{session_id}/{kind}/{uuid.uuid4().hex}.json.gz"
+        try:
+            self.storage_service.put_object(
+                key=key,
+                body=gzip.compress(body),
+                content_type="application/gzip",
+            )
+        except AppException:
+            # Keeping the row intact beats losing the payload; it is just larger.
+            logger.warning(
+                "payload_offload_failed",
+                extra={"session_id": str(session_id), "kind": kind},
+                exc_info=True,
+            )
+            return payload
+
+        preview = build_preview(payload, self.preview_chars)
+        preview[OFFLOAD_REFERENCE_KEY] = {"key": key, "size_bytes": len(body)}
+        return preview
+
+    def discard(self, preview: dict[str, Any]) -> None:
+        """Deletes the stored body of a preview that was never persisted."""
+        if not is_offloaded(preview):
+            return
+        key = preview[OFFLOAD_REFERENCE_KEY].get("key")
+        if not isinstance(key, str) or not key:
+            return
+        try:
+            self.storage_service.delete_object(key=key)
+        except AppException:
+            logger.warning("payload_offload_discard_failed", extra={"key": key})
+
+    def hydrate(self, payload: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Returns the full body for an offloaded payload, or `payload` as-is."""
+        if not is_offloaded(payload):
+            return payload
+        key = payload[OFFLOAD_REFERENCE_KEY].get("key")
+        if not isinstance(key, str) or not key:
+            return payload
+        raw = self.storage_service.get_bytes(key)
+        try:
+            return json.loads(gzip.decompress(raw))
+        except (OSError, ValueError) as exc:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to decode offloaded payload",
+                details={"key": key, "error": str(exc)},
+            ) from exc
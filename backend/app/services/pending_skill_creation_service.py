@@ -19,6 +19,7 @@ from app.schemas.pending_skill_creation import (
 )
 from app.services.skill_workspace_service import SkillWorkspaceService
 from app.services.storage_service import S3StorageService
+from app.services.workspace_manifest_service import workspace_manifest_service
 from app.utils.markdown_front_matter import parse_yaml_front_matter
 from app.utils.workspace_manifest import extract_manifest_files, normalize_manifest_path
 
@@ -34,17 +35,21 @@ class PendingSkillCreationService:
             storage_service=storage_service
         )
 
+    @staticmethod
+    def has_exported_workspace(session: AgentSession) -> bool:
+        return (
+            (session.workspace_export_status or "").strip().lower() == "ready"
+            and bool(session.workspace_manifest_key)
+            and bool(session.workspace_files_prefix)
+        )
+
     def detect_and_create_pending(
         self,
         db: Session,
         *,
         session: AgentSession,
     ) -> list[PendingSkillCreation]:
-        if (
-            (session.workspace_export_status or "").strip().lower() != "ready"
-            or not session.workspace_manifest_key
-            or not session.workspace_files_prefix
-        ):
+        if not self.has_exported_workspace(session):
             return []
 
         skill_tool_executions = ToolExecutionRepository.list_by_session_and_tool_name(
@@ -64,7 +69,9 @@ class PendingSkillCreationService:
             skill.name
             for skill in SkillRepository.list_visible(db, user_id=session.user_id)
         }
-        manifest = self._storage_service().get_manifest(session.workspace_manifest_key)
+        manifest = workspace_manifest_service.get_manifest(
+            db, session.workspace_manifest_key
+        )
         created: list[PendingSkillCreation] = []
 
         for candidate in self._collect_workspace_skill_candidates(
@@ -16,6 +16,10 @@ from app.schemas.plugin_import import (
     PluginImportCommitResponse,
     PluginImportJobResponse,
 )
+from app.services.background_job_runner import (
+    PLUGIN_IMPORT_JOB,
+    background_job_runner,
+)
 from app.services.plugin_import_service import PluginImportService
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,7 @@ class PluginImportJobService:
         )
         db.commit()
         db.refresh(job)
+        background_job_runner.notify(PLUGIN_IMPORT_JOB)
         return PluginImportCommitEnqueueResponse(job_id=job.id, status=job.status)
 
     def get_job(
@@ -29,6 +29,7 @@ from app.schemas.plugin_import import (
     PluginImportDiscoverResponse,
     PluginImportResultItem,
 )
+from app.services.archive_import_uploader import ArchiveImportUploader, ArchiveMember
 from app.services.storage_service import S3StorageService
 
 
@@ -115,6 +116,7 @@ def _extract_manifest_fields(
 class PluginImportService:
     def __init__(self, storage_service: S3StorageService | None = None) -> None:
         self.storage_service = storage_service or S3StorageService()
+        self.uploader = ArchiveImportUploader(self.storage_service, kind="plugins")
 
     def discover(
         self,
@@ -772,7 +774,7 @@ class PluginImportService:
             common_root_names.append(info.filename)
         common_root = _extract_common_root(common_root_names)
 
-        uploaded = 0
+        members: list[ArchiveMember] = []
         total_uncompressed = 0
         manifest_obj: dict[str, Any] | None = None
 
@@ -816,7 +818,6 @@ class PluginImportService:
             if relative_in_plugin.is_absolute() or ".." in relative_in_plugin.parts:
                 continue
 
-            key = f"{destination_prefix}{relative_in_plugin.as_posix()}"
             content_type, _ = mimetypes.guess_type(relative_in_plugin.name)
 
             total_uncompressed += int(getattr(info, "file_size", 0) or 0)
@@ -829,7 +830,7 @@ class PluginImportService:
                         "total_uncompressed_bytes": total_uncompressed,
                     },
                 )
-            if uploaded >= _MAX_FILES_PER_PLUGIN:
+            if len(members) >= _MAX_FILES_PER_PLUGIN:
                 raise AppException(
                     error_code=ErrorCode.BAD_REQUEST,
                     message="Plugin archive contains too many files",
@@ -860,18 +861,26 @@ class PluginImportService:
                 patched = json.dumps(
                     manifest_obj, ensure_ascii=False, indent=2, sort_keys=True
                 ).encode("utf-8")
-                self.storage_service.upload_fileobj(
-                    fileobj=io.BytesIO(patched),
-                    key=key,
-                    content_type=content_type or "application/json",
+                members.append(
+                    ArchiveMember(
+                        path=relative_in_plugin.as_posix(),
+                        content_type=content_type or "application/json",
+                        data=patched,
+                    )
                 )
-                uploaded += 1
                 continue
 
-            with zipf.open(info, "r") as f:
-                self.storage_service.upload_fileobj(
-                    fileobj=f, key=key, content_type=content_type
+            members.append(
+                ArchiveMember(
+                    path=relative_in_plugin.as_posix(),
+                    content_type=content_type,
+                    info=info,
                 )
-            uploaded += 1
+            )
 
+        # Nothing is stored for a selection without a manifest; the caller fails it.
+        if manifest_obj is not None:
+            self.uploader.upload(
+                zipf=zipf, members=members, destination_prefix=destination_prefix
+            )
         return manifest_obj
@@ -6,12 +6,23 @@ from app.models.agent_run import AgentRun
 from app.models.agent_session import AgentSession
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.session_repository import SessionRepository
+from app.services.session_event_service import (
+    EVENT_RUN,
+    EVENT_STATE,
+    session_event_broker,
+)
 from app.services.session_queue_service import SessionQueueService
 
 session_queue_service = SessionQueueService()
 
 
 class RunLifecycleService:
+    """Applies run status transitions and the session status that follows them.
+
+    Each transition queues a session event in the caller's transaction, so open
+    event streams see it once it commits.
+    """
+
     TERMINAL_STATUSES = {"completed", "failed", "canceled"}
 
     def _sync_scheduled_task_last_status(self, db: Session, db_run: AgentRun) -> None:
@@ -54,6 +65,7 @@ class RunLifecycleService:
 
         self._sync_scheduled_task_last_status(db, db_run)
         db.flush()
+        session_event_broker.notify(db, db_session.id, {EVENT_STATE, EVENT_RUN})
         return db_session
 
     def finalize_terminal(
@@ -101,4 +113,5 @@ class RunLifecycleService:
 
         self._sync_scheduled_task_last_status(db, db_run)
         db.flush()
+        session_event_broker.notify(db, db_session.id, {EVENT_STATE, EVENT_RUN})
         return db_session, promoted_run
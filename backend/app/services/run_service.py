@@ -16,6 +16,7 @@ from app.schemas.run import (
     RunStartRequest,
 )
 from app.services.run_lifecycle_service import RunLifecycleService
+from app.services.session_event_service import EVENT_RUN, session_event_broker
 from app.services.usage_service import UsageService
 
 usage_service = UsageService()
@@ -124,6 +125,7 @@ class RunService:
                 message="Unable to extract prompt from message",
             )
 
+        session_event_broker.notify(db, db_session.id, {EVENT_RUN})
         db.commit()
         db.refresh(db_run)
 
@@ -0,0 +1,107 @@
+import asyncio
+import contextlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.services.scheduled_task_service import ScheduledTaskService
+
+logger = logging.getLogger(__name__)
+
+# Keeps the loop from spinning on due tasks another replica has locked.
+_MIN_SLEEP_SECONDS = 0.1
+
+
+class ScheduledTaskDispatcher:
+    """Dispatches scheduled tasks when they fall due.
+
+    The loop sleeps until the earliest `next_run_at` of any enabled task (read
+    from the `(enabled, next_run_at)` index), then drains every due task in
+    batches of `SCHEDULED_TASK_DISPATCH_BATCH_SIZE` before sleeping again.
+    Creating, re-scheduling or enabling a task NOTIFYs every replica to wake up
+    early; the sleep is also capped at `SCHEDULED_TASK_DISPATCH_MAX_SLEEP_SECONDS`
+    in case a notification is missed. Replicas share the work through
+    `SKIP LOCKED` claims.
+
+    Each batch logs `scheduled_tasks_dispatched` with `max_lag_ms`, how long past
+    its `next_run_at` the most overdue task in the batch was dispatched.
+    """
+
+    def __init__(self, service: ScheduledTaskService | None = None) -> None:
+        self.settings = get_settings()
+        self._service = service or ScheduledTaskService()
+        self._wake = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.settings.scheduled_task_dispatcher_enabled)
+
+    def handle_notification(self, payload: str | None) -> None:
+        """Listener callback for schedule changes; wakes the loop to re-read them."""
+        _ = payload
+        self._wake.set()
+
+    async def run_forever(self) -> None:
+        if not self.enabled:
+            logger.info("scheduled_task_dispatcher_disabled")
+            return
+
+        max_sleep = max(
+            1.0, float(self.settings.scheduled_task_dispatch_max_sleep_seconds)
+        )
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scheduled-task-dispatch"
+        )
+        try:
+            while True:
+                self._wake.clear()
+                try:
+                    delay = await loop.run_in_executor(executor, self._drain)
+                except Exception:
+                    logger.exception("scheduled_task_dispatcher_failed")
+                    delay = max_sleep
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wake.wait(),
+                        timeout=min(max(delay, _MIN_SLEEP_SECONDS), max_sleep),
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _drain(self) -> float:
+        """Dispatches every due task; returns seconds until the next one is due."""
+        batch_size = max(1, int(self.settings.scheduled_task_dispatch_batch_size))
+        db = SessionLocal()
+        try:
+            while True:
+                started = time.perf_counter()
+                result = self._service.dispatch_due(db, limit=batch_size)
+                claimed = result.dispatched + result.skipped + result.errors
+                if claimed:
+                    logger.info(
+                        "scheduled_tasks_dispatched",
+                        extra={
+                            "dispatched": result.dispatched,
+                            "skipped": result.skipped,
+                            "errors": result.errors,
+                            "max_lag_ms": result.max_lag_ms,
+                            "duration_ms": int((time.perf_counter() - started) * 1000),
+                        },
+                    )
+                if claimed < batch_size:
+                    break
+            next_due_at = self._service.next_due_at(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if next_due_at is None:
+            return float("inf")
+        return (next_due_at - datetime.now(timezone.utc)).total_seconds()
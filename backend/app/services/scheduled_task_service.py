@@ -4,12 +4,16 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from croniter import croniter
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.database import engine
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.models.agent_message import AgentMessage
 from app.models.agent_run import AgentRun
 from app.models.agent_scheduled_task import AgentScheduledTask
+from app.models.agent_session import AgentSession
 from app.repositories.message_repository import MessageRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.run_repository import RunRepository
@@ -30,6 +34,17 @@ logger = logging.getLogger(__name__)
 
 task_service = TaskService()
 
+SCHEDULED_TASK_CHANGES_CHANNEL = "poco_scheduled_task_changes"
+
+# Run statuses that make a scheduled dispatch skip the task's pinned session.
+_DISPATCH_BLOCKING_RUN_STATUSES = ("queued", "claimed", "running")
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 
 class ScheduledTaskService:
     """Service layer for scheduled task management and dispatch."""
@@ -83,6 +98,16 @@ class ScheduledTaskService:
             )
         return next_local.astimezone(timezone.utc)
 
+    @staticmethod
+    def _publish_schedule_change(db: Session) -> None:
+        """Queues a NOTIFY that wakes every replica's dispatcher when `db` commits."""
+        if engine.dialect.name != "postgresql":
+            return
+        db.execute(
+            text("SELECT pg_notify(:channel, '')"),
+            {"channel": SCHEDULED_TASK_CHANGES_CHANNEL},
+        )
+
     @staticmethod
     def _normalize_name(value: str) -> str:
         name = (value or "").strip()
@@ -174,6 +199,8 @@ class ScheduledTaskService:
             input_files=input_files or None,
             next_run_at=next_run_at,
         )
+        if db_task.enabled:
+            self._publish_schedule_change(db)
 
         db.commit()
         db.refresh(db_task)
@@ -253,6 +280,8 @@ class ScheduledTaskService:
                 timezone_name=db_task.timezone,
                 now_utc=now_utc,
             )
+        if db_task.enabled and (recompute or request.enabled):
+            self._publish_schedule_change(db)
 
         db.commit()
         db.refresh(db_task)
@@ -312,66 +341,175 @@ class ScheduledTaskService:
         *,
         limit: int = 50,
     ) -> ScheduledTaskDispatchResponse:
+        """Claims up to `limit` due tasks and enqueues their runs in one transaction."""
         now_utc = datetime.now(timezone.utc)
         tasks = ScheduledTaskRepository.claim_due_for_update(
             db, limit=limit, now_utc=now_utc
         )
+        if not tasks:
+            db.commit()
+            return ScheduledTaskDispatchResponse(dispatched=0)
 
-        dispatched: list[uuid.UUID] = []
-        skipped = 0
-        errors = 0
+        max_lag_ms = max(
+            int((now_utc - _as_utc(task.next_run_at)).total_seconds() * 1000)
+            for task in tasks
+        )
+        runs, skipped, errors = self._enqueue_due_runs(db, tasks)
 
+        # Missed executions are coalesced: every claimed task, dispatched or not,
+        # moves to its next slot so it is not re-claimed in the same drain.
+        # Tasks sharing a schedule (e.g. hourly) share one croniter evaluation.
+        next_runs: dict[tuple[str, str], datetime] = {}
         for task in tasks:
+            key = (task.cron, task.timezone)
             try:
-                # Only dispatch when no active/queued run is present for this task/session.
-                run = self._enqueue_run_for_task(
-                    db,
-                    task=task,
-                    scheduled_at=task.next_run_at,
-                    force=False,
-                )
-                if not run:
-                    skipped += 1
-                    # Coalesce missed executions when an active run already exists.
-                    # Otherwise the task remains due and will be re-claimed every dispatch cycle.
-                    task.next_run_at = self._compute_next_run_at(
+                if key not in next_runs:
+                    next_runs[key] = self._compute_next_run_at(
                         cron_expr=task.cron,
                         timezone_name=task.timezone,
                         now_utc=now_utc,
                     )
-                    continue
-
-                task.last_run_id = run.id
-                task.last_run_status = run.status
-                task.last_error = None
-                task.next_run_at = self._compute_next_run_at(
-                    cron_expr=task.cron,
-                    timezone_name=task.timezone,
-                    now_utc=now_utc,
-                )
-                dispatched.append(run.id)
             except Exception as e:
                 errors += 1
+                task.enabled = False
                 task.last_error = str(e)
                 logger.exception(
-                    "scheduled_task_dispatch_failed",
+                    "scheduled_task_next_run_failed",
                     extra={"scheduled_task_id": str(task.id)},
                 )
-                # If a pinned session is missing, disable the task to avoid infinite failures.
-                if task.reuse_session and task.session_id is not None:
-                    db_session = SessionRepository.get_by_id(db, task.session_id)
-                    if not db_session:
-                        task.enabled = False
+                continue
+            task.next_run_at = next_runs[key]
 
         db.commit()
 
         return ScheduledTaskDispatchResponse(
-            dispatched=len(dispatched),
-            run_ids=dispatched,
+            dispatched=len(runs),
+            run_ids=[run.id for run in runs],
             skipped=skipped,
             errors=errors,
+            max_lag_ms=max(0, max_lag_ms),
+        )
+
+    def _enqueue_due_runs(
+        self,
+        db: Session,
+        tasks: list[AgentScheduledTask],
+    ) -> tuple[list[AgentRun], int, int]:
+        """Batch counterpart of `_enqueue_run_for_task` for claimed due tasks.
+
+        Pinned sessions and their active runs/queue items are loaded with one
+        query each, and sessions, messages and runs are inserted with one flush
+        each instead of a round trip per task.
+
+        Returns:
+            (runs, skipped, errors)
+        """
+        pinned_ids = list(
+            {
+                task.session_id
+                for task in tasks
+                if task.reuse_session and task.session_id
+            }
+        )
+        sessions = {s.id: s for s in SessionRepository.list_by_ids(db, pinned_ids)}
+        busy = SessionQueueItemRepository.list_session_ids_with_active_items(
+            db, pinned_ids
+        ) | RunRepository.list_session_ids_with_status(
+            db, pinned_ids, _DISPATCH_BLOCKING_RUN_STATUSES
         )
 
+        pending: list[tuple[AgentScheduledTask, AgentSession, str]] = []
+        skipped = 0
+        errors = 0
+        for task in tasks:
+            try:
+                prompt = self._normalize_prompt(task.prompt)
+                if task.reuse_session:
+                    if not task.session_id:
+                        raise AppException(
+                            error_code=ErrorCode.BAD_REQUEST,
+                            message="reuse_session=true but session_id is missing",
+                        )
+                    db_session = sessions.get(task.session_id)
+                    if db_session is None:
+                        # Disable the task to avoid failing on every slot.
+                        task.enabled = False
+                        raise AppException(
+                            error_code=ErrorCode.NOT_FOUND,
+                            message=f"Session not found: {task.session_id}",
+                        )
+                    # Only dispatch when no active/queued run is present for the session.
+                    if db_session.status == "canceling" or db_session.id in busy:
+                        skipped += 1
+                        continue
+                    busy.add(db_session.id)
+                else:
+                    # Create a fresh session/workspace for this run.
+                    db_session = SessionRepository.create(
+                        session_db=db,
+                        user_id=task.user_id,
+                        config=task.config_snapshot or {},
+                        project_id=None,
+                        kind="scheduled",
+                    )
+                pending.append((task, db_session, prompt))
+            except Exception as e:
+                errors += 1
+                task.last_error = str(e)
+                logger.exception(
+                    "scheduled_task_dispatch_failed",
+                    extra={"scheduled_task_id": str(task.id)},
+                )
+        if not pending:
+            return [], skipped, errors
+        db.flush()
+
+        messages: list[AgentMessage] = []
+        for _, db_session, prompt in pending:
+            # Clear previous execution state so the UI doesn't show stale file changes.
+            SessionQueueService.clear_cancellation_state(db_session)
+            db_session.state_patch = {}
+            db_session.status = "pending"
+            messages.append(
+                MessageRepository.create(
+                    session_db=db,
+                    session_id=db_session.id,
+                    role="user",
+                    content=self._build_user_message_content(prompt),
+                    text_preview=prompt[:500],
+                )
+            )
+        db.flush()
+
+        runs: list[AgentRun] = []
+        for (task, db_session, _), db_message in zip(pending, messages, strict=True):
+            run_snapshot = dict(task.config_snapshot or {})
+            if task.input_files:
+                run_snapshot["input_files"] = list(task.input_files)
+            db_run = RunRepository.create(
+                session_db=db,
+                session_id=db_session.id,
+                user_message_id=db_message.id,
+                permission_mode="default",
+                schedule_mode="scheduled",
+                scheduled_at=_as_utc(task.next_run_at),
+                config_snapshot=run_snapshot or None,
+            )
+            db_run.scheduled_task_id = task.id
+            runs.append(db_run)
+        db.flush()
+
+        for (task, _, _), db_run in zip(pending, runs, strict=True):
+            task.last_run_id = db_run.id
+            task.last_run_status = db_run.status
+            task.last_error = None
+        return runs, skipped, errors
+
+    def next_due_at(self, db: Session) -> datetime | None:
+        """Returns the earliest `next_run_at` of any enabled task, if there is one."""
+        next_run_at = ScheduledTaskRepository.get_next_run_at(db)
+        return _as_utc(next_run_at) if next_run_at is not None else None
+
     def _enqueue_run_for_task(
         self,
         db: Session,
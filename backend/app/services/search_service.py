@@ -1,3 +1,4 @@
+import re
 import uuid
 
 from sqlalchemy.orm import Session
@@ -5,14 +6,54 @@ from sqlalchemy.orm import Session
 from app.repositories.search_repository import SearchRepository
 from app.schemas.search import (
     GlobalSearchResponse,
+    SearchHighlight,
     SearchMessageResult,
     SearchProjectResult,
     SearchTaskResult,
 )
 
+_SNIPPET_CHARS = 160
+_SNIPPET_LEADING_CHARS = 40
+_ELLIPSIS = "…"
+# pg_trgm only prunes with the GIN index once the pattern holds a whole trigram;
+# shorter queries would scan and rank every message preview.
+_MIN_MESSAGE_QUERY_CHARS = 3
+
+
+def find_highlights(text: str, query: str) -> list[SearchHighlight]:
+    """Returns case-insensitive, non-overlapping matches of `query` in `text`."""
+    if not text or not query:
+        return []
+    return [
+        SearchHighlight(start=match.start(), end=match.end())
+        for match in re.finditer(re.escape(query), text, flags=re.IGNORECASE)
+    ]
+
+
+def build_snippet(text: str, query: str) -> tuple[str, list[SearchHighlight]]:
+    """Cuts a window of `text` around the first match and re-bases highlights."""
+    highlights = find_highlights(text, query)
+    if len(text) <= _SNIPPET_CHARS:
+        return text, highlights
+
+    first = highlights[0].start if highlights else 0
+    start = max(0, min(first - _SNIPPET_LEADING_CHARS, len(text) - _SNIPPET_CHARS))
+    end = start + _SNIPPET_CHARS
+    prefix = _ELLIPSIS if start > 0 else ""
+    suffix = _ELLIPSIS if end < len(text) else ""
+    shift = len(prefix) - start
+    return (
+        f"{prefix}{text[start:end]}{suffix}",
+        [
+            SearchHighlight(start=h.start + shift, end=h.end + shift)
+            for h in highlights
+            if h.start >= start and h.end <= end
+        ],
+    )
+
 
 class SearchService:
-    """Service layer for lightweight global search."""
+    """Service layer for global search."""
 
     _MAX_LIMIT = 20
 
@@ -29,6 +70,7 @@ class SearchService:
         limit_tasks: int = 10,
         limit_projects: int = 5,
         limit_messages: int = 10,
+        offset_messages: int = 0,
         project_id: uuid.UUID | None = None,
     ) -> GlobalSearchResponse:
         clean_query = (query or "").strip()
@@ -61,18 +103,38 @@ class SearchService:
             if projects_limit > 0
             else []
         )
+        # Fetch one extra row to tell whether another page exists.
         messages = (
             SearchRepository.search_messages_by_preview(
                 db,
                 user_id=user_id,
                 query=clean_query,
-                limit=messages_limit,
+                limit=messages_limit + 1,
+                offset=max(0, int(offset_messages)),
                 project_id=project_id,
                 kind="chat",
             )
-            if messages_limit > 0
+            if messages_limit > 0 and len(clean_query) >= _MIN_MESSAGE_QUERY_CHARS
             else []
         )
+        messages_has_more = len(messages) > messages_limit
+        messages = messages[:messages_limit]
+
+        message_results: list[SearchMessageResult] = []
+        for m in messages:
+            if not m.text_preview:
+                continue
+            snippet, highlights = build_snippet(m.text_preview, clean_query)
+            message_results.append(
+                SearchMessageResult(
+                    message_id=m.id,
+                    session_id=m.session_id,
+                    text_preview=m.text_preview,
+                    timestamp=m.created_at,
+                    snippet=snippet,
+                    highlights=highlights,
+                )
+            )
 
         return GlobalSearchResponse(
             query=clean_query,
@@ -82,6 +144,7 @@ class SearchService:
                     title=s.title,
                     status=s.status,
                     timestamp=s.updated_at,
+                    highlights=find_highlights(s.title or "", clean_query),
                 )
                 for s in sessions
             ],
@@ -92,14 +155,6 @@ class SearchService:
                 )
                 for p in projects
             ],
-            messages=[
-                SearchMessageResult(
-                    message_id=m.id,
-                    session_id=m.session_id,
-                    text_preview=m.text_preview or "",
-                    timestamp=m.created_at,
-                )
-                for m in messages
-                if m.text_preview
-            ],
+            messages=message_results,
+            messages_has_more=messages_has_more,
         )
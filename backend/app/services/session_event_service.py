@@ -0,0 +1,388 @@
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal, engine
+from app.repositories.message_repository import MessageRepository
+from app.repositories.run_repository import RunRepository
+from app.repositories.session_repository import SessionRepository
+from app.repositories.tool_execution_repository import ToolExecutionRepository
+
+logger = logging.getLogger(__name__)
+
+SESSION_EVENTS_CHANNEL = "poco_session_events"
+
+EVENT_MESSAGES = "messages"
+EVENT_TOOL_EXECUTIONS = "tool_executions"
+EVENT_STATE = "state"
+EVENT_RUN = "run"
+ALL_EVENT_KINDS = frozenset(
+    {EVENT_MESSAGES, EVENT_TOOL_EXECUTIONS, EVENT_STATE, EVENT_RUN}
+)
+
+HEARTBEAT_SECONDS = 15.0
+# A dropped NOTIFY (listener reconnect, another replica without a listener) must not
+# stall a stream forever, so idle streams re-read their cursors at this interval.
+RESYNC_SECONDS = 60.0
+LISTEN_RECONNECT_SECONDS = 2.0
+CLIENT_RETRY_MS = 3000
+
+
+class SessionEventSubscription:
+    """Pending change kinds for one stream, filled from any thread."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self._kinds: set[str] = set()
+
+    def push(self, kinds: Iterable[str]) -> None:
+        self._loop.call_soon_threadsafe(self._push, frozenset(kinds))
+
+    def _push(self, kinds: frozenset[str]) -> None:
+        self._kinds.update(kinds)
+        self._event.set()
+
+    async def wait(self, timeout: float) -> set[str]:
+        """Returns the kinds changed since the last call, or an empty set on timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except TimeoutError:
+            return set()
+        self._event.clear()
+        kinds, self._kinds = self._kinds, set()
+        return kinds
+
+
+class SessionEventBroker:
+    """Fans committed session changes out to event-stream subscribers.
+
+    Writers queue a Postgres NOTIFY inside their transaction, so it is only delivered
+    once the change is committed. Every replica LISTENs on the channel and wakes its
+    local subscribers for the session. Other process-wide channels can share the
+    LISTEN connection through `register_channel`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[SessionEventSubscription]] = {}
+        self._channel_handlers: dict[str, Callable[[str | None], None]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return engine.dialect.name == "postgresql"
+
+    @contextlib.contextmanager
+    def subscribe(self, session_id: str) -> Iterator[SessionEventSubscription]:
+        subscription = SessionEventSubscription()
+        with self._lock:
+            self._subscribers.setdefault(session_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(session_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        self._subscribers.pop(session_id, None)
+
+    def register_channel(
+        self, channel: str, handler: Callable[[str | None], None]
+    ) -> None:
+        """Delivers NOTIFY payloads of `channel` to `handler` on the listener loop.
+
+        The handler is called with `None` whenever the listener (re)connects, since
+        notifications sent while it was disconnected are lost.
+        """
+        self._channel_handlers[channel] = handler
+
+    def publish_local(self, session_id: str, kinds: Iterable[str]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(session_id, ()))
+        for subscription in subscribers:
+            subscription.push(kinds)
+
+    def _publish_all_local(self) -> None:
+        with self._lock:
+            subscribers = [s for group in self._subscribers.values() for s in group]
+        for subscription in subscribers:
+            subscription.push(ALL_EVENT_KINDS)
+
+    def notify(self, db: Session, session_id: uuid.UUID, kinds: Iterable[str]) -> None:
+        """Queues a change notification that is delivered when `db` commits."""
+        if not self.enabled:
+            self.publish_local(str(session_id), kinds)
+            return
+        payload = json.dumps({"session_id": str(session_id), "kinds": sorted(kinds)})
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": SESSION_EVENTS_CHANNEL, "payload": payload},
+        )
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            session_id = str(data["session_id"])
+            kinds = [k for k in data.get("kinds", []) if k in ALL_EVENT_KINDS]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("session_event_payload_invalid", extra={"payload": payload})
+            return
+        self.publish_local(session_id, kinds or ALL_EVENT_KINDS)
+
+    def _dispatch_channel(self, channel: str, payload: str | None) -> None:
+        handler = self._channel_handlers.get(channel)
+        if handler is None:
+            return
+        try:
+            handler(payload)
+        except Exception:
+            logger.exception("session_event_channel_handler_failed")
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("session_event_listener_failed")
+            await asyncio.sleep(LISTEN_RECONNECT_SECONDS)
+
+    async def _listen(self) -> None:
+        raw = await run_in_threadpool(engine.raw_connection)
+        # The LISTEN connection lives for the process lifetime; keep it out of the pool.
+        raw.detach()
+        conn = raw.driver_connection
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {SESSION_EVENTS_CHANNEL}")
+                for channel in self._channel_handlers:
+                    cursor.execute(f"LISTEN {channel}")
+            loop.add_reader(conn.fileno(), readable.set)
+            logger.info("session_event_listener_started")
+            # Notifications sent while disconnected are lost; let streams resync.
+            self._publish_all_local()
+            for channel in self._channel_handlers:
+                self._dispatch_channel(channel, None)
+            while True:
+                await readable.wait()
+                readable.clear()
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    if notify.channel == SESSION_EVENTS_CHANNEL:
+                        self._dispatch(notify.payload)
+                    else:
+                        self._dispatch_channel(notify.channel, notify.payload)
+        finally:
+            with contextlib.suppress(Exception):
+                loop.remove_reader(conn.fileno())
+            conn.close()
+
+
+session_event_broker = SessionEventBroker()
+
+
+@dataclass
+class SessionEventCursor:
+    """Change watermarks of a stream, round-tripped through the SSE event id.
+
+    Streams only announce that something changed; clients read the data through
+    their own delta endpoints. The watermarks let a reconnecting stream tell
+    which kinds changed while it was away.
+    """
+
+    message_id: int = 0
+    tool_updated_at: datetime | None = None
+    tool_id: uuid.UUID | None = None
+
+    def encode(self) -> str:
+        return "|".join(
+            [
+                str(self.message_id),
+                self.tool_updated_at.isoformat() if self.tool_updated_at else "",
+                str(self.tool_id) if self.tool_id else "",
+            ]
+        )
+
+    @classmethod
+    def decode(cls, raw: str | None) -> "SessionEventCursor | None":
+        """Returns None when there is no usable cursor, to seed from the tail."""
+        if not raw:
+            return None
+        parts = raw.strip().split("|")
+        try:
+            message_id = max(0, int(parts[0] or 0))
+            tool_updated_at = (
+                datetime.fromisoformat(parts[1])
+                if len(parts) > 1 and parts[1]
+                else None
+            )
+            tool_id = uuid.UUID(parts[2]) if len(parts) > 2 and parts[2] else None
+        except ValueError:
+            return None
+        if tool_id is not None and tool_updated_at is None:
+            tool_id = None
+        return cls(
+            message_id=message_id,
+            tool_updated_at=tool_updated_at,
+            tool_id=tool_id,
+        )
+
+
+def format_sse(event: str, data: str, event_id: str | None = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+class SessionEventStreamService:
+    """Builds the server-sent event stream for a single session.
+
+    Events are change notifications with a small JSON body; the frontend
+    re-reads messages, tool executions and session state through its delta
+    endpoints, so the stream never builds those payloads itself.
+    """
+
+    def _collect(
+        self,
+        session_id: uuid.UUID,
+        *,
+        cursor: SessionEventCursor,
+        kinds: set[str],
+        last_sent: dict[str, str],
+        emit: bool = True,
+    ) -> list[tuple[str, str]]:
+        """Compares the watermarks of `kinds` with `cursor` and `last_sent`.
+
+        Returns the (event, json) notifications for kinds that moved and advances
+        the cursor in place. With `emit=False` only the watermarks are recorded.
+        """
+        events: list[tuple[str, str]] = []
+        db = SessionLocal()
+        try:
+            if EVENT_MESSAGES in kinds:
+                latest_id = MessageRepository.get_latest_id(db, session_id) or 0
+                if latest_id > cursor.message_id:
+                    events.append(
+                        (
+                            EVENT_MESSAGES,
+                            json.dumps(
+                                {
+                                    "after_message_id": cursor.message_id,
+                                    "latest_message_id": latest_id,
+                                }
+                            ),
+                        )
+                    )
+                    cursor.message_id = latest_id
+
+            if EVENT_TOOL_EXECUTIONS in kinds:
+                latest = ToolExecutionRepository.get_latest_cursor(db, session_id)
+                if latest is not None and latest != (
+                    cursor.tool_updated_at,
+                    cursor.tool_id,
+                ):
+                    cursor.tool_updated_at, cursor.tool_id = latest
+                    events.append(
+                        (
+                            EVENT_TOOL_EXECUTIONS,
+                            json.dumps({"updated_at": latest[0].isoformat()}),
+                        )
+                    )
+
+            if EVENT_STATE in kinds:
+                db_session = SessionRepository.get_by_id(db, session_id)
+                if db_session is not None:
+                    payload = json.dumps(
+                        {
+                            "status": db_session.status,
+                            "updated_at": db_session.updated_at.isoformat()
+                            if db_session.updated_at
+                            else None,
+                        }
+                    )
+                    if last_sent.get(EVENT_STATE) != payload:
+                        last_sent[EVENT_STATE] = payload
+                        events.append((EVENT_STATE, payload))
+
+            if EVENT_RUN in kinds:
+                db_run = RunRepository.get_latest_by_session(db, session_id)
+                if db_run is not None:
+                    payload = json.dumps(
+                        {
+                            "run_id": str(db_run.id),
+                            "status": db_run.status,
+                            "updated_at": db_run.updated_at.isoformat()
+                            if db_run.updated_at
+                            else None,
+                        }
+                    )
+                    if last_sent.get(EVENT_RUN) != payload:
+                        last_sent[EVENT_RUN] = payload
+                        events.append((EVENT_RUN, payload))
+        finally:
+            db.close()
+        return events if emit else []
+
+    async def stream(
+        self,
+        session_id: uuid.UUID,
+        *,
+        cursor: SessionEventCursor | None,
+    ) -> AsyncIterator[str]:
+        """Streams change notifications for a session.
+
+        Without a cursor the stream starts at the current tail: the client has
+        just loaded the session, so nothing is replayed. A resumed stream
+        announces the kinds that moved past its cursor, plus state and run once.
+        """
+        last_sent: dict[str, str] = {}
+        # Subscribe before the first read so a commit in between is not missed.
+        with session_event_broker.subscribe(str(session_id)) as subscription:
+            yield f"retry: {CLIENT_RETRY_MS}\n\n"
+            emit = cursor is not None
+            cursor = cursor or SessionEventCursor()
+            pending: set[str] = set(ALL_EVENT_KINDS)
+            idle_seconds = 0.0
+            while True:
+                if pending:
+                    events = await run_in_threadpool(
+                        self._collect,
+                        session_id,
+                        cursor=cursor,
+                        kinds=pending,
+                        last_sent=last_sent,
+                        emit=emit,
+                    )
+                    emit = True
+                    event_id = cursor.encode()
+                    for event, data in events:
+                        yield format_sse(event, data, event_id)
+
+                pending = await subscription.wait(HEARTBEAT_SECONDS)
+                if pending:
+                    idle_seconds = 0.0
+                    continue
+                yield ": keepalive\n\n"
+                idle_seconds += HEARTBEAT_SECONDS
+                if idle_seconds >= RESYNC_SECONDS:
+                    idle_seconds = 0.0
+                    pending = set(ALL_EVENT_KINDS)
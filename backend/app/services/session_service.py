@@ -29,9 +29,16 @@ from app.schemas.internal_session import (
 from app.schemas.session import (
     SessionCancelResponse,
     SessionCreateRequest,
+    SessionPageResponse,
+    SessionResponse,
     SessionUpdateRequest,
 )
 from app.schemas.task import TaskEnqueueResponse
+from app.services.session_event_service import (
+    EVENT_RUN,
+    EVENT_STATE,
+    session_event_broker,
+)
 from app.services.session_queue_service import SessionQueueService
 from app.services.task_service import TaskService
 
@@ -336,6 +343,66 @@ class SessionService:
             )
         return SessionRepository.list_all(db, limit, offset, project_id, kind=kind)
 
+    def list_sessions_page(
+        self,
+        db: Session,
+        user_id: str,
+        *,
+        limit: int = 50,
+        project_id: uuid.UUID | None = None,
+        kind: str | None = None,
+        before: tuple[datetime, uuid.UUID] | None = None,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> SessionPageResponse:
+        """Lists a user's sessions by (created_at, id) cursor, newest first.
+
+        `before` pages towards older sessions, `after` towards newer ones.
+        """
+        if before is not None and after is not None:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="Only one of before and after cursors can be provided",
+            )
+        safe_limit = max(1, min(int(limit), 200))
+        fetched = SessionRepository.list_page_by_user(
+            db,
+            user_id,
+            limit=safe_limit + 1,
+            project_id=project_id,
+            kind=kind,
+            older_than=before,
+            newer_than=after,
+        )
+        if after is not None:
+            has_more_after = len(fetched) > safe_limit
+            sessions = fetched[-safe_limit:]
+            oldest = (sessions[-1].created_at, sessions[-1].id) if sessions else after
+            has_more_before = SessionRepository.exists_by_user(
+                db, user_id, project_id=project_id, kind=kind, older_than=oldest
+            )
+        else:
+            has_more_before = len(fetched) > safe_limit
+            sessions = fetched[:safe_limit]
+            has_more_after = before is not None and SessionRepository.exists_by_user(
+                db,
+                user_id,
+                project_id=project_id,
+                kind=kind,
+                newer_than=(
+                    (sessions[0].created_at, sessions[0].id) if sessions else before
+                ),
+            )
+
+        return SessionPageResponse(
+            items=[SessionResponse.model_validate(s) for s in sessions],
+            next_before_created_at=sessions[-1].created_at if sessions else None,
+            next_before_id=sessions[-1].id if sessions else None,
+            next_after_created_at=sessions[0].created_at if sessions else None,
+            next_after_id=sessions[0].id if sessions else None,
+            has_more_before=has_more_before,
+            has_more_after=has_more_after,
+        )
+
     def find_session_by_sdk_id_or_uuid(
         self, db: Session, session_id: str
     ) -> AgentSession | None:
@@ -459,6 +526,7 @@ class SessionService:
             SessionQueueService.clear_cancellation_state(db_session)
             db_session.status = "canceled"
 
+        session_event_broker.notify(db, db_session.id, {EVENT_STATE, EVENT_RUN})
         db.commit()
         db.refresh(db_session)
 
@@ -600,6 +668,7 @@ class SessionService:
         db_session.cancellation_lease_expires_at = None
         db_session.cancellation_error = None
 
+        session_event_broker.notify(db, db_session.id, {EVENT_STATE, EVENT_RUN})
         db.commit()
         db.refresh(db_session)
 
@@ -1,12 +1,19 @@
 import logging
 import unicodedata
 import uuid
+from datetime import datetime, timezone
 
 from anthropic import Anthropic
+from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal
 from app.core.settings import get_settings
 from app.repositories.session_repository import SessionRepository
+from app.repositories.session_title_job_repository import SessionTitleJobRepository
+from app.services.background_job_runner import (
+    SESSION_TITLE_JOB,
+    background_job_runner,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +51,40 @@ class SessionTitleService:
                 max_retries=2,
             )
 
+    def enqueue(self, db: Session, session_id: uuid.UUID, prompt: str) -> None:
+        """Queues title generation for a new session."""
+        if not self._enabled or not prompt or not prompt.strip():
+            return
+        SessionTitleJobRepository.create(db, session_id=session_id, prompt=prompt)
+        db.commit()
+        background_job_runner.notify(SESSION_TITLE_JOB)
+
+    def process_title_job(self, job_id: uuid.UUID) -> None:
+        db = SessionLocal()
+        try:
+            job = SessionTitleJobRepository.get_by_id(db, job_id)
+            if job is None or job.status not in {"queued", "running"}:
+                return
+            job.status = "running"
+            db.commit()
+
+            self.generate_and_update(job.session_id, job.prompt)
+
+            job.status = "success"
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+        except Exception as exc:
+            logger.exception("session_title_job_failed", extra={"job_id": str(job_id)})
+            db.rollback()
+            job = SessionTitleJobRepository.get_by_id(db, job_id)
+            if job is not None:
+                job.status = "failed"
+                job.error = str(exc)
+                job.finished_at = datetime.now(timezone.utc)
+                db.commit()
+        finally:
+            db.close()
+
     def generate_and_update(self, session_id: uuid.UUID, prompt: str) -> None:
         if not prompt or not prompt.strip():
             return
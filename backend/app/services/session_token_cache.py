@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.core.settings import get_settings
+
+SESSION_REVOCATIONS_CHANNEL = "poco_session_revocations"
+
+
+class SessionTokenCache:
+    """Bounded LRU of session token hash -> user id for authenticated requests.
+
+    Entries live for `AUTH_SESSION_CACHE_TTL_SECONDS` at most and never past the
+    session's expiry. Logout drops the entry here and NOTIFYs the other replicas,
+    which drop it too; a revoked hash is kept as a tombstone for one TTL so a
+    lookup racing the logout cannot cache it again. When the listener reconnects
+    (notifications may have been missed) the whole cache is cleared.
+    """
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self._ttl_seconds = max(0, int(settings.auth_session_cache_ttl_seconds))
+        self._max_entries = max(0, int(settings.auth_session_cache_max_entries))
+        self._lock = threading.Lock()
+        # token hash -> (user id, or None for a revoked token; monotonic deadline)
+        self._entries: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def get(self, token_hash: str) -> str | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            user_id, deadline = entry
+            if deadline <= time.monotonic():
+                self._entries.pop(token_hash, None)
+                return None
+            self._entries.move_to_end(token_hash)
+            return user_id
+
+    def put(self, token_hash: str, user_id: str, expires_at: datetime) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        remaining = (_as_utc(expires_at) - datetime.now(timezone.utc)).total_seconds()
+        deadline = now + min(float(self._ttl_seconds), remaining)
+        if deadline <= now:
+            return
+        with self._lock:
+            current = self._entries.get(token_hash)
+            if current is not None and current[0] is None and current[1] > now:
+                return
+            self._store(token_hash, (user_id, deadline))
+
+    def invalidate(self, token_hash: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._store(token_hash, (None, time.monotonic() + self._ttl_seconds))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, token_hash: str, entry: tuple[str | None, float]) -> None:
+        self._entries[token_hash] = entry
+        self._entries.move_to_end(token_hash)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def publish_revocation(self, db: Session, token_hash: str) -> None:
+        """Queues a revocation NOTIFY that is delivered when `db` commits."""
+        if engine.dialect.name != "postgresql":
+            return
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": SESSION_REVOCATIONS_CHANNEL, "payload": token_hash},
+        )
+
+    def handle_notification(self, payload: str | None) -> None:
+        """Listener callback; `None` means notifications may have been lost."""
+        if payload is None:
+            self.clear()
+            return
+        self.invalidate(payload.strip())
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+session_token_cache = SessionTokenCache()
@@ -16,6 +16,10 @@ from app.schemas.skill_import import (
     SkillImportCommitResponse,
     SkillImportJobResponse,
 )
+from app.services.background_job_runner import (
+    SKILL_IMPORT_JOB,
+    background_job_runner,
+)
 from app.services.skill_import_service import SkillImportService
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,7 @@ class SkillImportJobService:
         )
         db.commit()
         db.refresh(job)
+        background_job_runner.notify(SKILL_IMPORT_JOB)
         return SkillImportCommitEnqueueResponse(job_id=job.id, status=job.status)
 
     def get_job(
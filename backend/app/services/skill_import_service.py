@@ -11,6 +11,7 @@ import uuid
 import zipfile
 import base64
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
 from typing import Any, IO, Iterable
 
@@ -31,6 +32,7 @@ from app.schemas.skill_import import (
     SkillImportDiscoverResponse,
     SkillImportResultItem,
 )
+from app.services.archive_import_uploader import ArchiveImportUploader, ArchiveMember
 from app.services.storage_service import S3StorageService
 from app.utils.markdown_front_matter import parse_yaml_front_matter
 
@@ -103,6 +105,7 @@ def _strip_common_root(path: PurePosixPath, common_root: str | None) -> PurePosi
 class SkillImportService:
     def __init__(self, storage_service: S3StorageService | None = None) -> None:
         self.storage_service = storage_service or S3StorageService()
+        self.uploader = ArchiveImportUploader(self.storage_service, kind="skills")
 
     def discover(
         self,
@@ -621,51 +624,20 @@ class SkillImportService:
         )
 
     @classmethod
-    def _materialize_github_contents(
+    def _collect_github_content_files(
         cls,
         *,
         owner: str,
         repo: str,
         ref: str,
         payload: Any,
-        target_root: Path,
-    ) -> None:
-        if isinstance(payload, list):
-            for item in payload:
-                if not isinstance(item, dict):
-                    continue
-                item_type = item.get("type")
-                item_name = item.get("name")
-                item_path = item.get("path")
-                if not isinstance(item_name, str) or not item_name.strip():
-                    continue
-
-                if item_type == "dir" and isinstance(item_path, str):
-                    nested_payload = cls._fetch_json_request(
-                        url=cls._github_contents_api_url(
-                            owner=owner,
-                            repo=repo,
-                            ref=ref,
-                            path=item_path,
-                        )
-                    )
-                    cls._materialize_github_contents(
-                        owner=owner,
-                        repo=repo,
-                        ref=ref,
-                        payload=nested_payload,
-                        target_root=target_root / item_name,
-                    )
-                    continue
-
-                if item_type != "file":
-                    continue
-
-                file_bytes = cls._download_github_file_bytes(item)
-                target_root.mkdir(parents=True, exist_ok=True)
-                (target_root / item_name).write_bytes(file_bytes)
-            return
+        target_root: PurePosixPath,
+        pool: ThreadPoolExecutor,
+    ) -> list[tuple[PurePosixPath, dict[str, Any]]]:
+        """Walks a contents API payload, listing each level's directories concurrently.
 
+        Returns (archive path, file metadata) pairs for every file below `payload`.
+        """
         if isinstance(payload, dict) and payload.get("type") == "file":
             file_name = payload.get("name")
             if not isinstance(file_name, str) or not file_name.strip():
@@ -673,27 +645,90 @@ class SkillImportService:
                     error_code=ErrorCode.BAD_REQUEST,
                     message="GitHub file payload is missing a filename",
                 )
-            target_root.mkdir(parents=True, exist_ok=True)
-            (target_root / file_name).write_bytes(
-                cls._download_github_file_bytes(payload)
+            return [(target_root / file_name, payload)]
+        if not isinstance(payload, list):
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="Unsupported GitHub contents payload",
             )
-            return
 
-        raise AppException(
-            error_code=ErrorCode.BAD_REQUEST,
-            message="Unsupported GitHub contents payload",
-        )
+        files: list[tuple[PurePosixPath, dict[str, Any]]] = []
+        level: list[tuple[PurePosixPath, list[Any]]] = [(target_root, payload)]
+        while level:
+            directories: list[tuple[PurePosixPath, str]] = []
+            for root, items in level:
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    item_type = item.get("type")
+                    item_name = item.get("name")
+                    item_path = item.get("path")
+                    if not isinstance(item_name, str) or not item_name.strip():
+                        continue
+                    if item_type == "dir" and isinstance(item_path, str):
+                        directories.append((root / item_name, item_path))
+                    elif item_type == "file":
+                        files.append((root / item_name, item))
+
+            listings = pool.map(
+                lambda directory: cls._fetch_json_request(
+                    url=cls._github_contents_api_url(
+                        owner=owner, repo=repo, ref=ref, path=directory[1]
+                    )
+                ),
+                directories,
+            )
+            level = []
+            for (root, _), listing in zip(directories, listings, strict=True):
+                if not isinstance(listing, list):
+                    raise AppException(
+                        error_code=ErrorCode.BAD_REQUEST,
+                        message="Unsupported GitHub contents payload",
+                    )
+                level.append((root, listing))
+        return files
 
-    @staticmethod
-    def _zip_directory(*, source_dir: Path, destination: Path) -> None:
+    @classmethod
+    def _write_github_contents_zip(
+        cls,
+        *,
+        owner: str,
+        repo: str,
+        ref: str,
+        payload: Any,
+        target_root: PurePosixPath,
+        destination: Path,
+    ) -> None:
+        """Downloads a contents API tree straight into a zip archive.
+
+        Files are fetched `GITHUB_CONTENTS_FETCH_CONCURRENCY` at a time and written
+        into the archive as each window completes, so at most one window of file
+        bodies is held in memory.
+        """
+        concurrency = max(1, int(get_settings().github_contents_fetch_concurrency))
         destination.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(
-            destination, "w", compression=zipfile.ZIP_DEFLATED
-        ) as zipf:
-            for file_path in sorted(source_dir.rglob("*")):
-                if not file_path.is_file():
-                    continue
-                zipf.write(file_path, file_path.relative_to(source_dir))
+        with (
+            ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="github-contents"
+            ) as pool,
+            zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as zipf,
+        ):
+            files = cls._collect_github_content_files(
+                owner=owner,
+                repo=repo,
+                ref=ref,
+                payload=payload,
+                target_root=target_root,
+                pool=pool,
+            )
+            files.sort(key=lambda entry: entry[0].as_posix())
+            for start in range(0, len(files), concurrency):
+                window = files[start : start + concurrency]
+                bodies = pool.map(
+                    lambda entry: cls._download_github_file_bytes(entry[1]), window
+                )
+                for (archive_path, _), body in zip(window, bodies, strict=True):
+                    zipf.writestr(archive_path.as_posix(), body)
 
     @classmethod
     def _download_github_contents_zip(
@@ -707,21 +742,17 @@ class SkillImportService:
         destination: Path,
     ) -> dict[str, Any]:
         root_label = cls._github_export_root_label(target_path=target_path, repo=repo)
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            export_base = Path(tmp_dir) / "export" / "__poco_export__"
-            export_root = (
+        export_base = PurePosixPath("__poco_export__")
+        cls._write_github_contents_zip(
+            owner=owner,
+            repo=repo,
+            ref=ref,
+            payload=payload,
+            target_root=(
                 export_base / root_label if isinstance(payload, list) else export_base
-            )
-            cls._materialize_github_contents(
-                owner=owner,
-                repo=repo,
-                ref=ref,
-                payload=payload,
-                target_root=export_root,
-            )
-            cls._zip_directory(
-                source_dir=Path(tmp_dir) / "export", destination=destination
-            )
+            ),
+            destination=destination,
+        )
 
         archive_source: dict[str, Any] = {
             "kind": "github",
@@ -1054,7 +1085,7 @@ class SkillImportService:
             common_root_names.append(info.filename)
         common_root = _extract_common_root(common_root_names)
 
-        uploaded = 0
+        members: list[ArchiveMember] = []
         total_uncompressed = 0
         for info in infos:
             raw_path = PurePosixPath(info.filename)
@@ -1099,7 +1130,6 @@ class SkillImportService:
             if relative_in_skill.is_absolute() or ".." in relative_in_skill.parts:
                 continue
 
-            key = f"{destination_prefix}{relative_in_skill.as_posix()}"
             content_type, _ = mimetypes.guess_type(relative_in_skill.name)
 
             total_uncompressed += int(getattr(info, "file_size", 0) or 0)
@@ -1112,20 +1142,25 @@ class SkillImportService:
                         "total_uncompressed_bytes": total_uncompressed,
                     },
                 )
-            if uploaded >= _MAX_FILES_PER_SKILL:
+            if len(members) >= _MAX_FILES_PER_SKILL:
                 raise AppException(
                     error_code=ErrorCode.BAD_REQUEST,
                     message="Skill archive contains too many files",
                     details={"max_files": _MAX_FILES_PER_SKILL},
                 )
 
-            with zipf.open(info, "r") as f:
-                self.storage_service.upload_fileobj(
-                    fileobj=f, key=key, content_type=content_type
+            members.append(
+                ArchiveMember(
+                    path=relative_in_skill.as_posix(),
+                    content_type=content_type,
+                    info=info,
                 )
-            uploaded += 1
+            )
 
-        return uploaded
+        self.uploader.upload(
+            zipf=zipf, members=members, destination_prefix=destination_prefix
+        )
+        return len(members)
 
     @staticmethod
     def _extract_skill_description(
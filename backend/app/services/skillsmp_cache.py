@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+
+from app.core.settings import get_settings
+from app.schemas.skill_marketplace import SkillsMpSearchResponse
+
+logger = logging.getLogger(__name__)
+
+_MAX_ENTRIES = 1024
+
+# (endpoint, normalized query, page, page size, sort)
+CacheKey = tuple[str, str, int, int, str]
+
+
+@dataclass(slots=True)
+class CachedSkillsMpResponse:
+    value: SkillsMpSearchResponse
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+
+# Called with the current entry (for conditional request validators); returns
+# None when upstream answered 304 Not Modified.
+Fetcher = Callable[
+    [CachedSkillsMpResponse | None], Awaitable[CachedSkillsMpResponse | None]
+]
+
+
+class SkillsMpResponseCache:
+    """Process-wide cache of SkillsMP search pages with stale-while-revalidate.
+
+    An entry is served as-is for `SKILLSMP_CACHE_TTL_SECONDS`. For the following
+    `SKILLSMP_CACHE_STALE_SECONDS` it is still served immediately while one
+    background refresh revalidates it, with `If-None-Match`/`If-Modified-Since`
+    when upstream sent validators. Older entries are refreshed in the foreground
+    and only served if that refresh fails. Concurrent requests for the same key
+    share one upstream request.
+    """
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self._ttl_seconds = max(0.0, float(settings.skillsmp_cache_ttl_seconds))
+        self._stale_seconds = max(0.0, float(settings.skillsmp_cache_stale_seconds))
+        self._entries: OrderedDict[CacheKey, CachedSkillsMpResponse] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[CachedSkillsMpResponse]] = {}
+
+    async def get(self, key: CacheKey, fetch: Fetcher) -> SkillsMpSearchResponse:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            age = time.monotonic() - entry.fetched_at
+            if age < self._ttl_seconds:
+                return entry.value
+            if age < self._ttl_seconds + self._stale_seconds:
+                if key not in self._inflight:
+                    self._start_refresh(key, fetch, entry).add_done_callback(
+                        _log_background_failure
+                    )
+                return entry.value
+
+        try:
+            refreshed = await asyncio.shield(self._refresh_once(key, fetch, entry))
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning(
+                "skillsmp_serving_stale_after_error", extra={"key": key}, exc_info=True
+            )
+            return entry.value
+        return refreshed.value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _refresh_once(
+        self, key: CacheKey, fetch: Fetcher, entry: CachedSkillsMpResponse | None
+    ) -> asyncio.Task[CachedSkillsMpResponse]:
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_refresh(key, fetch, entry)
+        return task
+
+    def _start_refresh(
+        self, key: CacheKey, fetch: Fetcher, entry: CachedSkillsMpResponse | None
+    ) -> asyncio.Task[CachedSkillsMpResponse]:
+        task = asyncio.ensure_future(self._refresh(key, fetch, entry))
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task[CachedSkillsMpResponse]) -> None:
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _refresh(
+        self, key: CacheKey, fetch: Fetcher, entry: CachedSkillsMpResponse | None
+    ) -> CachedSkillsMpResponse:
+        fetched = await fetch(entry)
+        if fetched is None:
+            if entry is None:
+                raise RuntimeError("SkillsMP answered 304 without a cached entry")
+            fetched = replace(entry)
+        fetched.fetched_at = time.monotonic()
+        if self._ttl_seconds + self._stale_seconds > 0:
+            self._entries[key] = fetched
+            self._entries.move_to_end(key)
+            while len(self._entries) > _MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return fetched
+
+
+def _log_background_failure(task: asyncio.Task[CachedSkillsMpResponse]) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("skillsmp_background_refresh_failed", exc_info=exc)
+
+
+skillsmp_response_cache = SkillsMpResponseCache()
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from pathlib import PurePosixPath
 from typing import Any
@@ -6,6 +7,7 @@ from urllib.parse import quote, urlparse
 import httpx
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionLocal
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.core.settings import get_settings
@@ -18,8 +20,40 @@ from app.schemas.skill_marketplace import (
     SkillsMpSkillItem,
 )
 from app.services.env_var_service import EnvVarService
+from app.services.skillsmp_cache import (
+    CachedSkillsMpResponse,
+    skillsmp_response_cache,
+)
 
 _DEFAULT_RECOMMENDATION_QUERY = "agent"
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+class _SharedHttpClient:
+    """Keep-alive client for SkillsMP requests, rebuilt per event loop."""
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=_HTTP_POOL_LIMITS)
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+_shared_http_client = _SharedHttpClient()
+
+
+async def close_skillsmp_http_client() -> None:
+    await _shared_http_client.aclose()
 
 
 class SkillsMpService:
@@ -388,7 +422,6 @@ class SkillsMpService:
     async def _request_skills(
         self,
         *,
-        db: Session,
         user_id: str,
         page: int,
         page_size: int,
@@ -403,24 +436,64 @@ class SkillsMpService:
                 message="SkillsMP query cannot be empty",
             )
 
+        # Upstream gets the same whitespace-collapsed query the cache is keyed
+        # on; case is left alone so upstream matching is unchanged.
+        normalized_query = " ".join(clean_query.split())
         params: dict[str, Any] = {
             "page": page,
             "limit": page_size,
             "sortBy": sort_by,
-            "q": clean_query,
+            "q": normalized_query,
         }
         endpoint = "/api/v1/skills/ai-search" if semantic else "/api/v1/skills/search"
         url = f"{self._resolve_base_url()}{endpoint}"
+        cache_key = (endpoint, normalized_query, page, page_size, sort_by)
+
+        async def fetch(
+            cached: CachedSkillsMpResponse | None,
+        ) -> CachedSkillsMpResponse | None:
+            # Cache hits skip the key lookup. Revalidation can outlive the
+            # request, so the lookup uses a session of its own.
+            with SessionLocal() as db:
+                api_key = self._resolve_api_key(db, user_id)
+            headers = {
+                "Authorization": f"Bearer {api_key}",
+                "Accept": "application/json",
+                "User-Agent": "poco-agent-skillsmp/1.0",
+            }
+            return await self._fetch_skills(
+                url=url,
+                params=params,
+                headers=headers,
+                page=page,
+                page_size=page_size,
+                cached=cached,
+            )
+
+        return await skillsmp_response_cache.get(cache_key, fetch)
+
+    async def _fetch_skills(
+        self,
+        *,
+        url: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        page: int,
+        page_size: int,
+        cached: CachedSkillsMpResponse | None,
+    ) -> CachedSkillsMpResponse | None:
+        """Requests one page from SkillsMP; returns None on 304 Not Modified."""
+        request_headers = dict(headers)
+        if cached is not None and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
         timeout = httpx.Timeout(self.settings.skillsmp_timeout_seconds, connect=5.0)
-        headers = {
-            "Authorization": f"Bearer {self._resolve_api_key(db, user_id)}",
-            "Accept": "application/json",
-            "User-Agent": "poco-agent-skillsmp/1.0",
-        }
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, params=params, headers=headers)
+            response = await _shared_http_client.get().get(
+                url, params=params, headers=request_headers, timeout=timeout
+            )
         except httpx.TimeoutException as exc:
             raise AppException(
                 error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
@@ -434,6 +507,9 @@ class SkillsMpService:
                 details={"provider": "skillsmp", "error": str(exc)},
             ) from exc
 
+        if response.status_code == 304 and cached is not None:
+            return None
+
         if response.status_code >= 400:
             raise AppException(
                 error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
@@ -460,12 +536,15 @@ class SkillsMpService:
                 details={"provider": "skillsmp"},
             )
 
-        return self._build_search_response(payload, page=page, page_size=page_size)
+        return CachedSkillsMpResponse(
+            value=self._build_search_response(payload, page=page, page_size=page_size),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
     async def search(
         self,
         *,
-        db: Session,
         user_id: str,
         query: str,
         page: int = 1,
@@ -484,7 +563,6 @@ class SkillsMpService:
             )
 
         return await self._request_skills(
-            db=db,
             user_id=user_id,
             page=page,
             page_size=page_size,
@@ -496,25 +574,24 @@ class SkillsMpService:
     async def list_recommendations(
         self,
         *,
-        db: Session,
         user_id: str,
         limit: int = 9,
     ) -> SkillsMpRecommendationsResponse:
-        popular = await self._request_skills(
-            db=db,
-            user_id=user_id,
-            page=1,
-            page_size=limit,
-            sort_by="stars",
-            query=_DEFAULT_RECOMMENDATION_QUERY,
-        )
-        recent = await self._request_skills(
-            db=db,
-            user_id=user_id,
-            page=1,
-            page_size=limit,
-            sort_by="recent",
-            query=_DEFAULT_RECOMMENDATION_QUERY,
+        popular, recent = await asyncio.gather(
+            self._request_skills(
+                user_id=user_id,
+                page=1,
+                page_size=limit,
+                sort_by="stars",
+                query=_DEFAULT_RECOMMENDATION_QUERY,
+            ),
+            self._request_skills(
+                user_id=user_id,
+                page=1,
+                page_size=limit,
+                sort_by="recent",
+                query=_DEFAULT_RECOMMENDATION_QUERY,
+            ),
         )
         return SkillsMpRecommendationsResponse(
             sections=[
@@ -1,6 +1,9 @@
 import json
 import logging
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from pathlib import PurePosixPath
 from urllib.parse import quote, urlsplit, urlunsplit
@@ -12,47 +15,51 @@ from botocore.exceptions import BotoCoreError, ClientError
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.core.settings import get_settings
+from app.core.settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
-
-class S3StorageService:
-    def __init__(self) -> None:
-        settings = get_settings()
-        if not settings.s3_bucket:
-            raise AppException(
-                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
-                message="S3 bucket is not configured",
-            )
-        if not settings.s3_endpoint:
-            raise AppException(
-                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
-                message="S3 endpoint is not configured",
-            )
-        if not settings.s3_access_key or not settings.s3_secret_key:
-            raise AppException(
-                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
-                message="S3 credentials are not configured",
-            )
-
-        self.bucket = settings.s3_bucket
-        self.presign_expires = settings.s3_presign_expires
-        self.key_prefix = self._normalize_prefix(settings.s3_key_prefix)
-        self.public_read = settings.s3_public_read
-        self.public_endpoint_bucket_bound = settings.s3_public_endpoint_bucket_bound
-
-        endpoint = settings.s3_endpoint.rstrip("/")
-        public_endpoint = (settings.s3_public_endpoint or "").strip()
-        if public_endpoint:
-            public_endpoint = public_endpoint.rstrip("/")
-        else:
-            public_endpoint = endpoint
+# Presigned URLs are reused until less than this share of their lifetime is left.
+_PRESIGN_REUSE_MIN_REMAINING = 0.25
+_PRESIGN_CACHE_MAX_ENTRIES = 10_000
+
+_clients_lock = threading.Lock()
+_clients: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+
+
+def _get_s3_clients(settings: Settings) -> tuple[Any, Any]:
+    """Returns the process-wide (client, presign_client) pair for `settings`.
+
+    boto3 clients are thread-safe but expensive to build, and their connection
+    pools only help when they are shared, so every S3StorageService reuses them.
+    """
+    endpoint = (settings.s3_endpoint or "").rstrip("/")
+    public_endpoint = (settings.s3_public_endpoint or "").strip().rstrip("/")
+    if not public_endpoint:
+        public_endpoint = endpoint
+    cache_key = (
+        endpoint,
+        public_endpoint,
+        settings.s3_access_key,
+        settings.s3_secret_key,
+        settings.s3_region,
+        settings.s3_signature_version,
+        settings.s3_connect_timeout_seconds,
+        settings.s3_read_timeout_seconds,
+        settings.s3_max_attempts,
+        settings.s3_max_pool_connections,
+        settings.s3_force_path_style,
+    )
+    with _clients_lock:
+        cached = _clients.get(cache_key)
+        if cached is not None:
+            return cached
 
         config_kwargs: dict[str, Any] = {
             "signature_version": settings.s3_signature_version or "s3v4",
             "connect_timeout": settings.s3_connect_timeout_seconds,
             "read_timeout": settings.s3_read_timeout_seconds,
+            "max_pool_connections": settings.s3_max_pool_connections,
             "retries": {
                 "max_attempts": settings.s3_max_attempts,
                 "mode": "standard",
@@ -65,7 +72,7 @@ class S3StorageService:
 
         config = Config(**config_kwargs) if config_kwargs else None
 
-        self.client = boto3.client(
+        client = boto3.client(
             "s3",
             endpoint_url=endpoint,
             aws_access_key_id=settings.s3_access_key,
@@ -73,8 +80,8 @@ class S3StorageService:
             region_name=settings.s3_region,
             config=config,
         )
-        self.presign_client = (
-            self.client
+        presign_client = (
+            client
             if public_endpoint == endpoint
             else boto3.client(
                 "s3",
@@ -85,6 +92,73 @@ class S3StorageService:
                 config=config,
             )
         )
+        _clients[cache_key] = (client, presign_client)
+        return client, presign_client
+
+
+class _PresignedUrlCache:
+    """Thread-safe LRU of presigned URLs with their expiry (monotonic clock)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], tuple[str, float, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: tuple[Any, ...]) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, expires_at, lifetime = entry
+            if expires_at - time.monotonic() < lifetime * _PRESIGN_REUSE_MIN_REMAINING:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+
+    def put(self, key: tuple[Any, ...], url: str, lifetime: float) -> None:
+        with self._lock:
+            self._entries[key] = (url, time.monotonic() + lifetime, lifetime)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_presigned_url_cache = _PresignedUrlCache(_PRESIGN_CACHE_MAX_ENTRIES)
+
+
+class S3StorageService:
+    def __init__(self) -> None:
+        settings = get_settings()
+        if not settings.s3_bucket:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="S3 bucket is not configured",
+            )
+        if not settings.s3_endpoint:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="S3 endpoint is not configured",
+            )
+        if not settings.s3_access_key or not settings.s3_secret_key:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="S3 credentials are not configured",
+            )
+
+        self.bucket = settings.s3_bucket
+        self.presign_expires = settings.s3_presign_expires
+        self.key_prefix = self._normalize_prefix(settings.s3_key_prefix)
+        self.public_read = settings.s3_public_read
+        self.public_endpoint_bucket_bound = settings.s3_public_endpoint_bucket_bound
+
+        self.client, self.presign_client = _get_s3_clients(settings)
 
     def get_manifest(self, key: str) -> dict[str, Any]:
         normalized_key = self._apply_key_prefix(key)
@@ -114,6 +188,19 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def get_bytes(self, key: str) -> bytes:
+        normalized_key = self._apply_key_prefix(key)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=normalized_key)
+            return response["Body"].read()
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to fetch object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to fetch object",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
     def presign_get(
         self,
         key: str,
@@ -126,6 +213,19 @@ class S3StorageService:
         if self.public_read:
             return self._build_public_url(normalized_key)
 
+        expires = expires_in or self.presign_expires
+        cache_key = (
+            id(self.presign_client),
+            self.bucket,
+            normalized_key,
+            response_content_disposition,
+            response_content_type,
+            expires,
+        )
+        cached_url = _presigned_url_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
+
         params: dict[str, Any] = {
             "Bucket": self.bucket,
             "Key": normalized_key,
@@ -135,10 +235,10 @@ class S3StorageService:
         if response_content_type:
             params["ResponseContentType"] = response_content_type
         try:
-            return self.presign_client.generate_presigned_url(
+            url = self.presign_client.generate_presigned_url(
                 "get_object",
                 Params=params,
-                ExpiresIn=expires_in or self.presign_expires,
+                ExpiresIn=expires,
             )
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to presign object {key}: {exc}")
@@ -147,6 +247,8 @@ class S3StorageService:
                 message="Failed to sign workspace object",
                 details={"key": key, "error": str(exc)},
             ) from exc
+        _presigned_url_cache.put(cache_key, url, expires)
+        return url
 
     def exists(self, key: str) -> bool:
         """Return whether the object exists in storage."""
@@ -245,6 +347,26 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def copy_object(self, *, source_key: str, destination_key: str) -> None:
+        """Server-side copy of one object within the bucket."""
+        try:
+            self.client.copy(
+                {"Bucket": self.bucket, "Key": self._apply_key_prefix(source_key)},
+                self.bucket,
+                self._apply_key_prefix(destination_key),
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to copy object {source_key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to copy file",
+                details={
+                    "source_key": source_key,
+                    "destination_key": destination_key,
+                    "error": str(exc),
+                },
+            ) from exc
+
     def list_objects(self, prefix: str) -> Iterable[str]:
         normalized_prefix = self._apply_prefix(prefix)
         try:
@@ -23,6 +23,11 @@ from app.services.model_config_service import (
     get_allowed_model_ids,
     infer_provider_id,
 )
+from app.services.session_event_service import (
+    EVENT_RUN,
+    EVENT_STATE,
+    session_event_broker,
+)
 from app.services.session_queue_service import SessionQueueService
 
 
@@ -421,6 +426,7 @@ class TaskService:
                 run_config_snapshot=run_config_snapshot,
                 client_request_id=request.client_request_id,
             )
+            session_event_broker.notify(db, db_session.id, {EVENT_STATE})
             db.commit()
             return TaskEnqueueResponse(
                 session_id=db_session.id,
@@ -448,6 +454,7 @@ class TaskService:
             scheduled_at=scheduled_at,
         )
 
+        session_event_broker.notify(db, db_session.id, {EVENT_STATE, EVENT_RUN})
         db.commit()
         db.refresh(db_session)
         db.refresh(db_run)
@@ -7,8 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.models.agent_session import AgentSession
-from app.models.usage_log import UsageLog
+from app.models.usage_hourly_rollup import UsageHourlyRollup
 from app.schemas.usage_analytics import (
     UsageAnalyticsBucket,
     UsageAnalyticsDayView,
@@ -20,7 +19,13 @@ from app.schemas.usage_analytics import (
 
 
 class UsageAnalyticsService:
-    """Service layer for user-level usage analytics."""
+    """Service layer for user-level usage analytics.
+
+    Reads only `usage_hourly_rollups`, so cost depends on the number of hours in
+    the requested range rather than on log volume. Local-time buckets are built
+    from UTC hours: in zones with a non-whole-hour offset an hour is attributed to
+    the local day/hour in which it starts.
+    """
 
     @staticmethod
     def _get_timezone(timezone_name: str) -> ZoneInfo:
@@ -63,24 +68,23 @@ class UsageAnalyticsService:
         )
 
     def _build_summary_query(self, db: Session, user_id: str):
-        return (
-            db.query(
-                func.coalesce(func.sum(UsageLog.input_tokens), 0).label("input_tokens"),
-                func.coalesce(func.sum(UsageLog.output_tokens), 0).label(
-                    "output_tokens"
-                ),
-                func.coalesce(func.sum(UsageLog.cache_creation_input_tokens), 0).label(
-                    "cache_creation_input_tokens"
-                ),
-                func.coalesce(func.sum(UsageLog.cache_read_input_tokens), 0).label(
-                    "cache_read_input_tokens"
-                ),
-                func.coalesce(func.sum(UsageLog.total_tokens), 0).label("total_tokens"),
-            )
-            .join(AgentSession, AgentSession.id == UsageLog.session_id)
-            .filter(AgentSession.user_id == user_id)
-            .filter(UsageLog.include_in_user_analytics.is_(True))
-        )
+        return db.query(
+            func.coalesce(func.sum(UsageHourlyRollup.input_tokens), 0).label(
+                "input_tokens"
+            ),
+            func.coalesce(func.sum(UsageHourlyRollup.output_tokens), 0).label(
+                "output_tokens"
+            ),
+            func.coalesce(
+                func.sum(UsageHourlyRollup.cache_creation_input_tokens), 0
+            ).label("cache_creation_input_tokens"),
+            func.coalesce(func.sum(UsageHourlyRollup.cache_read_input_tokens), 0).label(
+                "cache_read_input_tokens"
+            ),
+            func.coalesce(func.sum(UsageHourlyRollup.total_tokens), 0).label(
+                "total_tokens"
+            ),
+        ).filter(UsageHourlyRollup.user_id == user_id)
 
     def _get_summary(
         self,
@@ -92,9 +96,9 @@ class UsageAnalyticsService:
     ) -> UsageMetricSummary:
         query = self._build_summary_query(db, user_id)
         if start_utc is not None:
-            query = query.filter(UsageLog.created_at >= start_utc)
+            query = query.filter(UsageHourlyRollup.bucket_start >= start_utc)
         if end_utc is not None:
-            query = query.filter(UsageLog.created_at < end_utc)
+            query = query.filter(UsageHourlyRollup.bucket_start < end_utc)
         return self._to_summary(query.one())
 
     def _get_month_buckets(
@@ -107,13 +111,15 @@ class UsageAnalyticsService:
         start_utc: datetime,
         end_utc: datetime,
     ) -> list[UsageAnalyticsBucket]:
-        local_created_at = func.timezone(timezone_name, UsageLog.created_at)
-        bucket_day_expr = func.date(local_created_at)
+        local_bucket_start = func.timezone(
+            timezone_name, UsageHourlyRollup.bucket_start
+        )
+        bucket_day_expr = func.date(local_bucket_start)
         rows = (
             self._build_summary_query(db, user_id)
             .add_columns(bucket_day_expr.label("bucket_day"))
-            .filter(UsageLog.created_at >= start_utc)
-            .filter(UsageLog.created_at < end_utc)
+            .filter(UsageHourlyRollup.bucket_start >= start_utc)
+            .filter(UsageHourlyRollup.bucket_start < end_utc)
             .group_by(bucket_day_expr)
             .order_by(bucket_day_expr)
             .all()
@@ -154,13 +160,15 @@ class UsageAnalyticsService:
         start_utc: datetime,
         end_utc: datetime,
     ) -> list[UsageAnalyticsBucket]:
-        local_created_at = func.timezone(timezone_name, UsageLog.created_at)
-        bucket_hour_expr = func.extract("hour", local_created_at)
+        local_bucket_start = func.timezone(
+            timezone_name, UsageHourlyRollup.bucket_start
+        )
+        bucket_hour_expr = func.extract("hour", local_bucket_start)
         rows = (
             self._build_summary_query(db, user_id)
             .add_columns(bucket_hour_expr.label("bucket_hour"))
-            .filter(UsageLog.created_at >= start_utc)
-            .filter(UsageLog.created_at < end_utc)
+            .filter(UsageHourlyRollup.bucket_start >= start_utc)
+            .filter(UsageHourlyRollup.bucket_start < end_utc)
             .group_by(bucket_hour_expr)
             .order_by(bucket_hour_expr)
             .all()
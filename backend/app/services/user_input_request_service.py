@@ -1,7 +1,12 @@
+import asyncio
+import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
@@ -16,6 +21,44 @@ from app.schemas.user_input_request import (
 )
 
 DEFAULT_EXPIRES_SECONDS = 60
+MAX_WAIT_SECONDS = 60
+# Answers committed on another replica never reach this process' notifier, so
+# parked waiters still re-read the row at this interval.
+WAIT_RECHECK_SECONDS = 5.0
+
+
+class UserInputAnswerNotifier:
+    """Process-local wake-ups for callers long-polling a user input request."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[
+            str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = {}
+
+    @contextmanager
+    def subscribe(self, request_id: str) -> Iterator[asyncio.Event]:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(request_id, set()).add(waiter)
+        try:
+            yield waiter[1]
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(request_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        self._waiters.pop(request_id, None)
+
+    def notify(self, request_id: str) -> None:
+        with self._lock:
+            waiters = list(self._waiters.get(request_id, ()))
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+
+answer_notifier = UserInputAnswerNotifier()
 
 
 class UserInputRequestService:
@@ -82,6 +125,38 @@ class UserInputRequestService:
 
         return UserInputRequestResponse.model_validate(entry)
 
+    async def wait_for_answer(
+        self, db: Session, request_id: str, timeout_seconds: float
+    ) -> UserInputRequestResponse:
+        """Block until the request leaves `pending`, expires or the timeout elapses.
+
+        The caller gets the latest state either way and decides whether to wait again.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, min(timeout_seconds, MAX_WAIT_SECONDS))
+        # Subscribe before the first read so an answer committed in between still wakes us.
+        with answer_notifier.subscribe(request_id) as answered:
+            result = await run_in_threadpool(self.get_request, db, request_id)
+            while result.status == "pending":
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                expires_in = (
+                    result.expires_at - datetime.now(timezone.utc)
+                ).total_seconds()
+                wait_seconds = max(
+                    0.0, min(remaining, expires_in, WAIT_RECHECK_SECONDS)
+                )
+                # Release the pooled connection while parked.
+                await run_in_threadpool(db.rollback)
+                try:
+                    await asyncio.wait_for(answered.wait(), timeout=wait_seconds)
+                except TimeoutError:
+                    pass
+                answered.clear()
+                result = await run_in_threadpool(self.get_request, db, request_id)
+        return result
+
     def list_pending_for_user(
         self, db: Session, user_id: str, session_id: uuid.UUID | None = None
     ) -> list[UserInputRequestResponse]:
@@ -131,5 +206,6 @@ class UserInputRequestService:
         entry.status = "answered"
         entry.answered_at = now
         db.commit()
+        answer_notifier.notify(str(entry.id))
         db.refresh(entry)
         return UserInputRequestResponse.model_validate(entry)
@@ -3,12 +3,15 @@ import tempfile
 import zipfile
 from pathlib import Path, PurePosixPath
 
+from sqlalchemy.orm import Session
+
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.models.agent_run import AgentRun
 from app.models.agent_session import AgentSession
 from app.schemas.workspace import WorkspaceArchiveResponse
 from app.services.storage_service import S3StorageService
+from app.services.workspace_manifest_service import workspace_manifest_service
 from app.utils.workspace_manifest import (
     extract_manifest_files,
     normalize_manifest_path,
@@ -23,6 +26,7 @@ class WorkspaceArchiveService:
 
     def get_folder_archive(
         self,
+        db: Session,
         *,
         session: AgentSession,
         folder_path: str,
@@ -39,7 +43,7 @@ class WorkspaceArchiveService:
                 message="Workspace manifest is not available",
             )
 
-        manifest = self._storage_service().get_manifest(manifest_key)
+        manifest = workspace_manifest_service.get_manifest(db, manifest_key)
         workspace_prefix = self._require_workspace_files_prefix(
             session.workspace_files_prefix
         )
@@ -74,6 +78,7 @@ class WorkspaceArchiveService:
 
     def get_folder_archive_for_run(
         self,
+        db: Session,
         *,
         session: AgentSession,
         run: AgentRun,
@@ -91,7 +96,7 @@ class WorkspaceArchiveService:
                 message="Workspace manifest is not available",
             )
 
-        manifest = self._storage_service().get_manifest(manifest_key)
+        manifest = workspace_manifest_service.get_manifest(db, manifest_key)
         workspace_prefix = self._require_workspace_files_prefix(
             run.workspace_files_prefix
         )
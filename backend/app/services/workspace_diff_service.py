@@ -0,0 +1,86 @@
+import json
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.observability.request_context import get_request_id, get_trace_id
+from app.core.settings import get_settings
+
+# Executor Manager error code for "no running executor for this session".
+_MANAGER_CONTAINER_NOT_FOUND = 31002
+
+
+class WorkspaceDiffService:
+    """Fetches full file diffs that the workspace state only carries truncated.
+
+    The diff is computed by the session's executor and proxied through the
+    Executor Manager, so it is only available while the executor is running.
+    """
+
+    def get_file_diff(
+        self,
+        *,
+        session_id: str,
+        path: str,
+        staged: bool = False,
+        repo_dir: str | None = None,
+    ) -> dict:
+        settings = get_settings()
+        params: dict[str, str] = {"path": path, "staged": str(staged).lower()}
+        if repo_dir:
+            params["repo_dir"] = repo_dir
+        url = (
+            f"{settings.executor_manager_url}/api/v1/workspace/diff/"
+            f"{quote(session_id, safe='')}?{urlencode(params)}"
+        )
+
+        headers = {"accept": "application/json"}
+        request_id = get_request_id()
+        if request_id:
+            headers["X-Request-ID"] = request_id
+        trace_id = get_trace_id()
+        if trace_id:
+            headers["X-Trace-ID"] = trace_id
+        try:
+            with urlopen(Request(url, headers=headers), timeout=30) as resp:  # noqa: S310
+                payload = json.loads(resp.read().decode("utf-8"))
+        except HTTPError as e:
+            raise self._manager_error(e) from e
+        except URLError as e:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message=f"Executor Manager unavailable: {e.reason}",
+            ) from e
+
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, dict):
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Invalid Executor Manager diff response",
+            )
+        return data
+
+    @staticmethod
+    def _manager_error(error: HTTPError) -> AppException:
+        try:
+            body = json.loads(error.read().decode("utf-8"))
+        except (ValueError, OSError):
+            body = None
+        code = body.get("code") if isinstance(body, dict) else None
+        message = body.get("message") if isinstance(body, dict) else None
+        if error.code == 400 and code == _MANAGER_CONTAINER_NOT_FOUND:
+            return AppException(
+                error_code=ErrorCode.NOT_FOUND,
+                message="Full diff is only available while the session is running",
+            )
+        if error.code == 400:
+            return AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message=str(message or "Invalid diff request"),
+            )
+        return AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor Manager diff request failed: {error.code}",
+        )
@@ -0,0 +1,108 @@
+import logging
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.models.agent_session import AgentSession
+from app.repositories.workspace_export_job_repository import (
+    WorkspaceExportJobRepository,
+)
+from app.services.pending_skill_creation_service import PendingSkillCreationService
+from app.services.workspace_manifest_service import workspace_manifest_service
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspaceExportJobService:
+    """Runs post-export work queued by executor callbacks.
+
+    Storing the manifest and detecting pending skills read the manifest and one
+    SKILL.md per candidate from S3. The callback only queues a job; the
+    background job runner claims it under a renewed lease and calls
+    `process_job` on its own thread pool rather than the API threadpool.
+    """
+
+    def __init__(
+        self,
+        pending_skill_creation_service: PendingSkillCreationService | None = None,
+    ) -> None:
+        self.settings = get_settings()
+        self._pending_skill_creation_service = (
+            pending_skill_creation_service or PendingSkillCreationService()
+        )
+
+    def process_job(self, job_id: uuid.UUID) -> None:
+        db = SessionLocal()
+        try:
+            job = WorkspaceExportJobRepository.get_by_id(db, job_id)
+            if job is None or job.status != "running":
+                return
+            # Read before the work: a callback may bump the generation meanwhile,
+            # and `mark_done` then requeues the job instead of finishing it.
+            generation = int(job.generation)
+            attempt_count = int(job.attempt_count or 0)
+            session_id = job.session_id
+            try:
+                session = db.get(AgentSession, session_id)
+                if (
+                    session is not None
+                    and not session.is_deleted
+                    and PendingSkillCreationService.has_exported_workspace(session)
+                ):
+                    workspace_manifest_service.refresh(
+                        db, session.workspace_manifest_key
+                    )
+                    if (session.status or "").strip().lower() in {
+                        "completed",
+                        "failed",
+                    }:
+                        self._pending_skill_creation_service.detect_and_create_pending(
+                            db, session=session
+                        )
+                WorkspaceExportJobRepository.mark_done(
+                    db, job_id=job_id, generation=generation
+                )
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                self._mark_retry(db, job_id, session_id, attempt_count, exc)
+        finally:
+            db.close()
+
+    def _mark_retry(
+        self,
+        db: Session,
+        job_id: uuid.UUID,
+        session_id: uuid.UUID,
+        attempt_count: int,
+        exc: Exception,
+    ) -> None:
+        max_attempts = max(1, int(self.settings.background_job_max_attempts))
+        give_up = attempt_count >= max_attempts
+        logger.warning(
+            "workspace_export_job_failed",
+            extra={
+                "job_id": str(job_id),
+                "session_id": str(session_id),
+                "attempt_count": attempt_count,
+                "give_up": give_up,
+            },
+            exc_info=exc,
+        )
+        try:
+            WorkspaceExportJobRepository.mark_retry(
+                db,
+                job_id=job_id,
+                error_message=str(exc),
+                delay_seconds=min(300.0, float(2 ** min(attempt_count, 8))),
+                give_up=give_up,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception(
+                "workspace_export_job_mark_retry_failed",
+                extra={"job_id": str(job_id)},
+            )
@@ -0,0 +1,173 @@
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.repositories.workspace_manifest_repository import (
+    WorkspaceManifestRepository,
+)
+from app.schemas.workspace import FileNode
+from app.services.storage_service import S3StorageService
+from app.utils.workspace import build_workspace_file_nodes
+from app.utils.workspace_manifest import (
+    build_nodes_from_manifest,
+    extract_manifest_files,
+    list_folder_nodes,
+    normalize_manifest_path,
+)
+
+logger = logging.getLogger(__name__)
+
+_CACHE_MAX_ENTRIES = 256
+
+
+class WorkspaceManifestService:
+    """Serves workspace export manifests from the database instead of S3.
+
+    The workspace export job stores each manifest once (`refresh`). Readers
+    check the row version with a primary-key lookup and reuse the parsed content
+    from a small in-process cache while the version is unchanged. Manifests not
+    stored yet are copied from S3 on first read; a new export of a session drops
+    its stored row, so readers take that path until the job stores the new copy.
+    """
+
+    def __init__(self, storage_service: S3StorageService | None = None) -> None:
+        self._storage_service = storage_service
+        self._cache_lock = threading.Lock()
+        self._cache: OrderedDict[str, tuple[datetime, Any]] = OrderedDict()
+
+    @property
+    def storage_service(self) -> S3StorageService:
+        if self._storage_service is None:
+            self._storage_service = S3StorageService()
+        return self._storage_service
+
+    def refresh(self, db: Session, manifest_key: str) -> Any:
+        """Re-reads a manifest from S3 and stores it in the caller's transaction."""
+        manifest = self.storage_service.get_manifest(manifest_key)
+        WorkspaceManifestRepository.upsert(
+            db,
+            manifest_key=manifest_key,
+            content=manifest,
+            file_count=len(extract_manifest_files(manifest)),
+        )
+        return manifest
+
+    def get_manifest(self, db: Session, manifest_key: str) -> Any:
+        version = WorkspaceManifestRepository.get_version(db, manifest_key)
+        if version is None:
+            return self._backfill(manifest_key)
+
+        with self._cache_lock:
+            cached = self._cache.get(manifest_key)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(manifest_key)
+                return cached[1]
+
+        row = WorkspaceManifestRepository.get_by_key(db, manifest_key)
+        if row is None:
+            return self._backfill(manifest_key)
+        self._remember(manifest_key, row.updated_at, row.content)
+        return row.content
+
+    def _backfill(self, manifest_key: str) -> Any:
+        manifest = self.storage_service.get_manifest(manifest_key)
+        # Separate transaction: readers must not commit the request session, and
+        # a concurrent export callback's newer copy must win.
+        db = SessionLocal()
+        try:
+            WorkspaceManifestRepository.upsert(
+                db,
+                manifest_key=manifest_key,
+                content=manifest,
+                file_count=len(extract_manifest_files(manifest)),
+                overwrite=False,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.warning(
+                "workspace_manifest_backfill_failed",
+                extra={"manifest_key": manifest_key},
+                exc_info=True,
+            )
+        finally:
+            db.close()
+        return manifest
+
+    def _remember(self, manifest_key: str, version: datetime, content: Any) -> None:
+        with self._cache_lock:
+            self._cache[manifest_key] = (version, content)
+            self._cache.move_to_end(manifest_key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def build_file_nodes(
+        self,
+        db: Session,
+        *,
+        manifest_key: str | None,
+        workspace_files_prefix: str | None,
+        folder_path: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[FileNode]:
+        """Builds UI file nodes for an export, with presigned preview URLs.
+
+        Without `folder_path` the whole tree is returned. With it, only that
+        folder's direct children (sliced by `offset`/`limit`) are built and signed.
+        """
+        if not manifest_key:
+            return []
+
+        manifest = self.get_manifest(db, manifest_key)
+        if folder_path is None:
+            raw_nodes = build_nodes_from_manifest(manifest)
+        else:
+            raw_nodes = list_folder_nodes(manifest, folder_path)
+            end = None if limit is None else offset + limit
+            raw_nodes = raw_nodes[offset:end]
+
+        wanted_paths = (
+            None
+            if folder_path is None
+            else {node["path"] for node in raw_nodes if node.get("type") == "file"}
+        )
+        prefix = (workspace_files_prefix or "").rstrip("/")
+        file_url_map: dict[str, str] = {}
+
+        for file_entry in extract_manifest_files(manifest):
+            file_path = normalize_manifest_path(file_entry.get("path"))
+            if not file_path:
+                continue
+            if wanted_paths is not None and file_path not in wanted_paths:
+                continue
+            object_key = (
+                file_entry.get("key")
+                or file_entry.get("object_key")
+                or file_entry.get("oss_key")
+                or file_entry.get("s3_key")
+            )
+            if not object_key and prefix:
+                object_key = f"{prefix}/{file_path.lstrip('/')}"
+            if not object_key:
+                continue
+            mime_type = file_entry.get("mimeType") or file_entry.get("mime_type")
+            file_url_map[file_path] = self.storage_service.presign_get(
+                object_key,
+                response_content_disposition="inline",
+                response_content_type=mime_type,
+            )
+
+        def build_file_url(file_path: str) -> str | None:
+            normalized = normalize_manifest_path(file_path) or file_path
+            return file_url_map.get(normalized)
+
+        return build_workspace_file_nodes(raw_nodes, file_url_builder=build_file_url)
+
+
+workspace_manifest_service = WorkspaceManifestService()
@@ -1,7 +1,9 @@
 import base64
 import hashlib
+from collections.abc import Sequence
+from functools import lru_cache
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 
 
 def _derive_key(secret_key: str) -> bytes:
@@ -9,11 +11,36 @@ def _derive_key(secret_key: str) -> bytes:
     return base64.urlsafe_b64encode(digest)
 
 
-def encrypt_value(value: str, secret_key: str) -> str:
-    fernet = Fernet(_derive_key(secret_key))
-    return fernet.encrypt(value.encode("utf-8")).decode("utf-8")
+@lru_cache(maxsize=16)
+def _get_cipher(secret_key: str, fallback_keys: tuple[str, ...]) -> MultiFernet:
+    """Encrypts with `secret_key`; decrypts with it or any of `fallback_keys`."""
+    keys = [secret_key, *(key for key in fallback_keys if key != secret_key)]
+    return MultiFernet([Fernet(_derive_key(key)) for key in keys])
 
 
-def decrypt_value(token: str, secret_key: str) -> str:
-    fernet = Fernet(_derive_key(secret_key))
-    return fernet.decrypt(token.encode("utf-8")).decode("utf-8")
+@lru_cache(maxsize=16)
+def _get_primary_cipher(secret_key: str) -> Fernet:
+    return Fernet(_derive_key(secret_key))
+
+
+def encrypt_value(
+    value: str, secret_key: str, fallback_keys: Sequence[str] = ()
+) -> str:
+    cipher = _get_cipher(secret_key, tuple(fallback_keys))
+    return cipher.encrypt(value.encode("utf-8")).decode("utf-8")
+
+
+def decrypt_value(
+    token: str, secret_key: str, fallback_keys: Sequence[str] = ()
+) -> str:
+    cipher = _get_cipher(secret_key, tuple(fallback_keys))
+    return cipher.decrypt(token.encode("utf-8")).decode("utf-8")
+
+
+def needs_rotation(token: str, secret_key: str) -> bool:
+    """Whether `token` was encrypted with a key other than `secret_key`."""
+    try:
+        _get_primary_cipher(secret_key).decrypt(token.encode("utf-8"))
+    except InvalidToken:
+        return True
+    return False
@@ -158,3 +158,42 @@ def find_manifest_file(manifest: Any, path: str) -> dict[str, Any] | None:
         if item_path == normalized:
             return item
     return None
+
+
+def list_folder_nodes(manifest: Any, folder_path: str) -> list[dict[str, Any]]:
+    """Build the direct children of one folder, sorted like the full tree.
+
+    Sub-folders are returned without `children` so clients can load them lazily.
+    """
+    normalized_folder = normalize_manifest_path(folder_path) or "/"
+    prefix = "/" if normalized_folder == "/" else f"{normalized_folder}/"
+    tree: dict[str, dict[str, Any]] = {}
+
+    for item in extract_manifest_files(manifest):
+        normalized = normalize_manifest_path(item.get("path"))
+        if not normalized or not normalized.startswith(prefix):
+            continue
+        name, _, rest = normalized[len(prefix) :].partition("/")
+        if not name:
+            continue
+        if rest:
+            if name not in tree or tree[name].get("type") != "folder":
+                tree[name] = {
+                    "type": "folder",
+                    "name": name,
+                    "path": f"{prefix}{name}",
+                }
+        elif name not in tree:
+            tree[name] = {
+                "type": "file",
+                "name": name,
+                "path": normalized,
+                "mimeType": item.get("mimeType") or item.get("mime_type"),
+                "oss_status": item.get("status") or item.get("oss_status"),
+                "oss_meta": _build_oss_meta(item),
+            }
+
+    return [
+        {key: value for key, value in node.items() if key != "children"}
+        for node in _tree_to_nodes(tree)
+    ]
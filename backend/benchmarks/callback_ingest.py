@@ -0,0 +1,138 @@
+"""Callback ingest benchmark for message and tool execution persistence.
+
+Replays agent messages through ``CallbackService._persist_message_and_tools`` against a
+real database and reports wall time and SQL round trips per message. Everything runs
+inside one transaction that is rolled back at the end, so no rows are left behind.
+
+Replay recorded executor callbacks (one JSON callback body per line):
+
+    uv run python benchmarks/callback_ingest.py --callbacks callbacks.jsonl
+
+or generate turns with many parallel tool calls:
+
+    uv run python benchmarks/callback_ingest.py --tool-calls 32 --turns 50
+
+Run it on the same database before and after a change to compare ingest cost.
+"""
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.models.agent_session import AgentSession
+from app.services.callback_service import CallbackService
+
+
+def _load_recorded(path: Path) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        payload = json.loads(line)
+        message = payload.get("new_message", payload)
+        if isinstance(message, dict):
+            messages.append(message)
+    return messages
+
+
+def _synthetic(tool_calls: int, turns: int) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+    for turn in range(turns):
+        ids = [f"toolu_{turn}_{i}_{uuid.uuid4().hex[:8]}" for i in range(tool_calls)]
+        messages.append(
+            {
+                "_type": "AssistantMessage",
+                "content": [
+                    {
+                        "_type": "ToolUseBlock",
+                        "id": tool_use_id,
+                        "name": "Read",
+                        "input": {"file_path": f"/workspace/file_{i}.py"},
+                    }
+                    for i, tool_use_id in enumerate(ids)
+                ],
+            }
+        )
+        messages.append(
+            {
+                "_type": "UserMessage",
+                "content": [
+                    {
+                        "_type": "ToolResultBlock",
+                        "tool_use_id": tool_use_id,
+                        "content": "x" * 512,
+                        "is_error": False,
+                    }
+                    for tool_use_id in ids
+                ],
+            }
+        )
+    return messages
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.callbacks:
+        messages = _load_recorded(Path(args.callbacks))
+    else:
+        messages = _synthetic(args.tool_calls, args.turns)
+    if not messages:
+        raise SystemExit("no messages to replay")
+
+    statements = 0
+
+    def _count(*_args: Any, **_kwargs: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    service = CallbackService()
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection)
+    try:
+        db_session = AgentSession(user_id="benchmark-callback-ingest")
+        db.add(db_session)
+        db.flush()
+
+        event.listen(connection, "before_cursor_execute", _count)
+        per_message_ms: list[float] = []
+        started = time.perf_counter()
+        for message in messages:
+            message_started = time.perf_counter()
+            service._persist_message_and_tools(db, db_session.id, None, message)
+            db.flush()
+            per_message_ms.append((time.perf_counter() - message_started) * 1000)
+        total_ms = (time.perf_counter() - started) * 1000
+        event.remove(connection, "before_cursor_execute", _count)
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+    ordered = sorted(per_message_ms)
+    print(f"messages:            {len(messages)}")
+    print(f"total:               {total_ms:.1f} ms")
+    print(f"per message p50:     {statistics.median(ordered):.2f} ms")
+    print(f"per message p95:     {ordered[int(0.95 * (len(ordered) - 1))]:.2f} ms")
+    print(f"statements:          {statements}")
+    print(f"statements/message:  {statements / len(messages):.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callbacks", help="JSONL file of recorded callback bodies")
+    parser.add_argument("--tool-calls", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=50)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
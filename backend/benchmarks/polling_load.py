@@ -0,0 +1,113 @@
+"""Concurrent polling load benchmark for the backend API.
+
+Simulates many browser tabs polling a session the way the chat UI does and reports
+latency percentiles per endpoint. Run it against a live backend, e.g.:
+
+    uv run python benchmarks/polling_load.py \
+        --base-url http://localhost:8000 --token "$POCO_SESSION_TOKEN" \
+        --session-id <uuid> --concurrency 64 --duration 30
+
+Compare p99 before/after a change with the same concurrency and DB_POOL_SIZE.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+DEFAULT_PATHS = (
+    "/api/v1/sessions/{session_id}/state",
+    "/api/v1/sessions/{session_id}/messages-with-files/delta?after_message_id=0",
+    "/api/v1/sessions/{session_id}/tool-executions/delta",
+    "/api/v1/sessions?limit=20",
+)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    paths: list[str],
+    deadline: float,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+    interval: float,
+) -> None:
+    while time.perf_counter() < deadline:
+        for path in paths:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors[path] += 1
+            except httpx.HTTPError:
+                errors[path] += 1
+            latencies[path].append((time.perf_counter() - started) * 1000)
+        if interval > 0:
+            await asyncio.sleep(interval)
+
+
+async def run(args: argparse.Namespace) -> None:
+    paths = [
+        path.format(session_id=args.session_id) for path in (args.path or DEFAULT_PATHS)
+    ]
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=headers, limits=limits, timeout=60.0
+    ) as client:
+        deadline = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(
+                _worker(client, paths, deadline, latencies, errors, args.interval)
+                for _ in range(args.concurrency)
+            )
+        )
+
+    print(
+        f"{'endpoint':<70} {'n':>7} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'mean':>8}"
+    )
+    for path in paths:
+        samples = latencies[path]
+        print(
+            f"{path[:70]:<70} {len(samples):>7} {errors[path]:>5} "
+            f"{_percentile(samples, 50):>8.1f} {_percentile(samples, 95):>8.1f} "
+            f"{_percentile(samples, 99):>8.1f} "
+            f"{(statistics.fmean(samples) if samples else 0.0):>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", default="", help="Session token (Bearer)")
+    parser.add_argument("--session-id", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Seconds each simulated tab waits between polling rounds",
+    )
+    parser.add_argument(
+        "--path",
+        action="append",
+        help="Endpoint path to poll; may repeat. {session_id} is substituted.",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import io
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path, PurePosixPath
+from unittest.mock import MagicMock, patch
+
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.services.archive_import_uploader import ArchiveImportUploader, ArchiveMember
+from app.services.skill_import_service import SkillImportService
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: list[str] = []
+        self._lock = threading.Lock()
+
+    def exists(self, key: str) -> bool:
+        return key in self.objects
+
+    def get_text(self, key: str) -> str:
+        return self.objects[key].decode("utf-8")
+
+    def put_object(self, *, key: str, body: bytes, content_type=None) -> None:
+        self.objects[key] = body
+
+    def upload_fileobj(self, *, fileobj, key: str, content_type=None) -> None:
+        with self._lock:
+            self.objects[key] = fileobj.read()
+            self.uploads.append(key)
+
+    def copy_object(self, *, source_key: str, destination_key: str) -> None:
+        with self._lock:
+            if source_key not in self.objects:
+                raise AppException(
+                    error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                    message="Failed to copy object",
+                )
+            self.objects[destination_key] = self.objects[source_key]
+
+    def delete_prefix(self, *, prefix: str) -> None:
+        for key in [k for k in self.objects if k.startswith(prefix)]:
+            del self.objects[key]
+
+
+def _zip(files: dict[str, bytes]) -> zipfile.ZipFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zipf:
+        for name, body in files.items():
+            zipf.writestr(name, body)
+    buffer.seek(0)
+    return zipfile.ZipFile(buffer)
+
+
+def _members(zipf: zipfile.ZipFile) -> list[ArchiveMember]:
+    return [
+        ArchiveMember(path=info.filename, content_type=None, info=info)
+        for info in zipf.infolist()
+    ]
+
+
+class ArchiveImportUploaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = FakeStorage()
+        with patch(
+            "app.services.archive_import_uploader.get_settings",
+            return_value=MagicMock(import_upload_concurrency=4),
+        ):
+            self.uploader = ArchiveImportUploader(self.storage, kind="skills")
+
+    def test_reimporting_same_content_is_a_server_side_copy(self) -> None:
+        files = {"SKILL.md": b"# pdf", "scripts/run.py": b"print(1)"}
+        with _zip(files) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/a/pdf/1/"
+            )
+        first_uploads = len(self.storage.uploads)
+        with _zip(files) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/b/pdf/2/"
+            )
+
+        self.assertEqual(first_uploads, 2)
+        self.assertEqual(len(self.storage.uploads), 2)
+        for prefix in ("skills/a/pdf/1/", "skills/b/pdf/2/"):
+            self.assertEqual(self.storage.objects[f"{prefix}SKILL.md"], b"# pdf")
+            self.assertEqual(
+                self.storage.objects[f"{prefix}scripts/run.py"], b"print(1)"
+            )
+        # Only the version prefixes and one index entry are stored.
+        index_keys = [k for k in self.storage.objects if k.startswith("import-index/")]
+        self.assertEqual(len(index_keys), 1)
+        self.assertEqual(len(self.storage.objects), 5)
+        self.assertEqual(self.storage.objects[index_keys[0]], b"skills/a/pdf/1/")
+
+    def test_deleted_source_version_is_uploaded_again(self) -> None:
+        files = {"SKILL.md": b"# pdf"}
+        with _zip(files) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/a/pdf/1/"
+            )
+        self.storage.delete_prefix(prefix="skills/a/pdf/1/")
+        with _zip(files) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/b/pdf/2/"
+            )
+
+        self.assertEqual(len(self.storage.uploads), 2)
+        self.assertEqual(self.storage.objects["skills/b/pdf/2/SKILL.md"], b"# pdf")
+        index_keys = [k for k in self.storage.objects if k.startswith("import-index/")]
+        self.assertEqual(self.storage.objects[index_keys[0]], b"skills/b/pdf/2/")
+
+    def test_changed_content_is_uploaded_again(self) -> None:
+        with _zip({"SKILL.md": b"v1"}) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/a/x/1/"
+            )
+        with _zip({"SKILL.md": b"v2"}) as zipf:
+            self.uploader.upload(
+                zipf=zipf, members=_members(zipf), destination_prefix="skills/a/x/2/"
+            )
+
+        self.assertEqual(len(self.storage.uploads), 2)
+        self.assertEqual(self.storage.objects["skills/a/x/2/SKILL.md"], b"v2")
+
+    def test_replacement_bytes_are_part_of_the_digest(self) -> None:
+        with _zip({"plugin.json": b"{}"}) as zipf:
+            members = _members(zipf)
+            members[0].data = b'{"name": "renamed"}'
+            self.uploader.upload(
+                zipf=zipf, members=members, destination_prefix="plugins/a/p/1/"
+            )
+
+        self.assertEqual(
+            self.storage.objects["plugins/a/p/1/plugin.json"], b'{"name": "renamed"}'
+        )
+
+
+class GithubContentsZipTests(unittest.TestCase):
+    def test_tree_is_fetched_into_archive(self) -> None:
+        listings = {
+            "skills/pdf/scripts": [
+                {"type": "file", "name": "run.py", "path": "skills/pdf/scripts/run.py"}
+            ],
+        }
+        root_listing = [
+            {"type": "file", "name": "SKILL.md", "path": "skills/pdf/SKILL.md"},
+            {"type": "dir", "name": "scripts", "path": "skills/pdf/scripts"},
+        ]
+
+        def fetch_json(*, url: str, allow_not_found: bool = False):
+            path = url.split("/contents/", 1)[1].split("?", 1)[0]
+            return listings[path]
+
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            patch.object(
+                SkillImportService, "_fetch_json_request", side_effect=fetch_json
+            ),
+            patch.object(
+                SkillImportService,
+                "_download_github_file_bytes",
+                side_effect=lambda item: item["path"].encode(),
+            ),
+            patch(
+                "app.services.skill_import_service.get_settings",
+                return_value=MagicMock(github_contents_fetch_concurrency=2),
+            ),
+        ):
+            destination = Path(tmp_dir) / "github.zip"
+            SkillImportService._write_github_contents_zip(
+                owner="o",
+                repo="r",
+                ref="main",
+                payload=root_listing,
+                target_root=PurePosixPath("__poco_export__/pdf"),
+                destination=destination,
+            )
+            with zipfile.ZipFile(destination) as zipf:
+                contents = {name: zipf.read(name) for name in zipf.namelist()}
+
+        self.assertEqual(
+            contents,
+            {
+                "__poco_export__/pdf/SKILL.md": b"skills/pdf/SKILL.md",
+                "__poco_export__/pdf/scripts/run.py": b"skills/pdf/scripts/run.py",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+from app.services.background_job_runner import BackgroundJobRunner, BackgroundJobType
+
+
+class BackgroundJobRunnerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.runner = BackgroundJobRunner()
+        self.runner.settings = MagicMock(
+            background_jobs_enabled=True,
+            background_job_poll_interval_seconds=30,
+            background_job_lease_seconds=60,
+            background_job_max_attempts=3,
+        )
+        self.release = threading.Event()
+        self.handled: list[uuid.UUID] = []
+        self.addCleanup(self.release.set)
+
+        def handler(job_id: uuid.UUID) -> None:
+            self.release.wait(2)
+            self.handled.append(job_id)
+
+        self.runner.register(
+            BackgroundJobType(
+                name="demo", model=MagicMock(), handler=handler, concurrency=2
+            )
+        )
+        self.queue = [uuid.uuid4() for _ in range(3)]
+        self.claim_limits: list[int] = []
+
+        def claim(_job_type, limit: int, _lease_seconds: int) -> list[uuid.UUID]:
+            self.claim_limits.append(limit)
+            claimed, self.queue[:limit] = self.queue[:limit], []
+            return claimed
+
+        patcher = patch.object(self.runner, "_claim", side_effect=claim)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.task = asyncio.create_task(self.runner.run_forever())
+        self.addAsyncCleanup(self._stop)
+
+    async def _stop(self) -> None:
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+    async def _until(self, predicate) -> None:
+        for _ in range(200):
+            if predicate():
+                return
+            await asyncio.sleep(0.01)
+        self.fail("condition not reached")
+
+    async def test_claims_no_more_than_free_workers(self) -> None:
+        await self._until(lambda: len(self.runner._in_flight.get("demo", ())) == 2)
+        self.assertEqual(self.claim_limits, [2])
+
+        self.release.set()
+        await self._until(lambda: len(self.handled) == 3)
+        self.assertTrue(all(1 <= limit <= 2 for limit in self.claim_limits))
+
+    async def test_notify_skips_poll_wait(self) -> None:
+        self.release.set()
+        await self._until(lambda: len(self.handled) == 3)
+        late = uuid.uuid4()
+        self.queue.append(late)
+
+        self.runner.notify("demo")
+
+        await self._until(lambda: late in self.handled)
+
+
+class BackgroundJobRunnerRepositoryTests(unittest.TestCase):
+    def test_job_type_repository_handles_claims_and_leases(self) -> None:
+        runner = BackgroundJobRunner()
+        runner.settings = MagicMock(background_job_max_attempts=4)
+        repository = MagicMock()
+        repository.claim_due_batch.return_value = ["job-1"]
+        model = MagicMock()
+        job_type = BackgroundJobType(
+            name="export",
+            model=model,
+            handler=MagicMock(),
+            concurrency=1,
+            repository=repository,
+        )
+
+        with patch("app.services.background_job_runner.SessionLocal") as session_local:
+            db = session_local.return_value
+            claimed = runner._claim(job_type, 2, 60)
+            runner._renew_leases(job_type, ["job-1"], 60)
+
+        self.assertEqual(claimed, ["job-1"])
+        repository.claim_due_batch.assert_called_once_with(
+            db, model, limit=2, lease_seconds=60, max_attempts=4
+        )
+        repository.renew_leases.assert_called_once_with(
+            db, model, job_ids=["job-1"], lease_seconds=60
+        )
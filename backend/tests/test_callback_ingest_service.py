@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from app.schemas.callback import (
+    AgentCallbackRequest,
+    CallbackResponse,
+    CallbackStatus,
+)
+from app.services.callback_ingest_service import CallbackIngestService
+from app.services.callback_service import CallbackService, PreparedPayloads
+
+
+def _callback(session_id: str, sequence: int) -> AgentCallbackRequest:
+    return AgentCallbackRequest(
+        session_id=session_id,
+        time=datetime.now(UTC),
+        status=CallbackStatus.RUNNING,
+        progress=0,
+        sequence=sequence,
+    )
+
+
+class CallbackIngestServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.db = MagicMock()
+        patcher = patch(
+            "app.services.callback_ingest_service.SessionLocal",
+            return_value=self.db,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.applied: list[int] = []
+        self.release = threading.Event()
+        self.callback_service = MagicMock()
+
+        def apply(_db, callback, payloads):
+            self.release.wait(2)
+            payloads.persisted = True
+            if callback.sequence == 3:
+                raise ValueError("bad callback")
+            self.applied.append(callback.sequence)
+            return CallbackResponse(session_id=callback.session_id, status="running")
+
+        self.callback_service.prepare_payloads.side_effect = lambda _: (
+            PreparedPayloads()
+        )
+        self.callback_service.apply_agent_callback.side_effect = apply
+        self.service = CallbackIngestService(
+            callback_service=self.callback_service, batch_size=10
+        )
+
+    async def test_queued_callbacks_share_one_transaction_in_order(self) -> None:
+        first = asyncio.ensure_future(self.service.submit(_callback("s1", 1)))
+        await asyncio.sleep(0.05)
+        rest = [
+            asyncio.ensure_future(self.service.submit(_callback("s1", seq)))
+            for seq in (2, 3, 4)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        await first
+        results = await asyncio.gather(*rest, return_exceptions=True)
+
+        self.assertEqual(self.applied, [1, 2, 4])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2].status, "running")
+        # The first callback commits alone; the three queued behind it share one.
+        self.assertEqual(self.db.commit.call_count, 2)
+        self.assertEqual(self.service._writers, {})
+
+    async def test_sessions_are_written_independently(self) -> None:
+        self.release.set()
+
+        await asyncio.gather(
+            self.service.submit(_callback("s1", 1)),
+            self.service.submit(_callback("s2", 1)),
+        )
+
+        self.assertEqual(sorted(self.applied), [1, 1])
+        self.assertEqual(self.service._queues, {})
+
+    async def test_uploads_of_rolled_back_callbacks_are_discarded(self) -> None:
+        self.release.set()
+
+        results = await asyncio.gather(
+            *(self.service.submit(_callback("s1", seq)) for seq in (2, 3)),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[1], ValueError)
+        discarded = self.callback_service.discard_payloads.call_args_list
+        self.assertEqual(len(discarded), 1)
+        self.assertFalse(discarded[0].args[0].persisted)
+
+    async def test_failed_commit_discards_every_upload(self) -> None:
+        self.release.set()
+        self.db.commit.side_effect = RuntimeError("connection lost")
+
+        with self.assertRaises(RuntimeError):
+            await self.service.submit(_callback("s1", 1))
+
+        self.callback_service.discard_payloads.assert_called_once()
+
+
+class CallbackReplayTests(unittest.TestCase):
+    def test_sequence_at_or_below_last_applied_is_replay(self) -> None:
+        service = CallbackService()
+        db_run = MagicMock(last_callback_sequence=None)
+
+        self.assertFalse(service._is_replayed_callback(db_run, _callback("s1", 4)))
+        self.assertEqual(db_run.last_callback_sequence, 4)
+        self.assertTrue(service._is_replayed_callback(db_run, _callback("s1", 4)))
+        self.assertTrue(service._is_replayed_callback(db_run, _callback("s1", 2)))
+        self.assertFalse(service._is_replayed_callback(db_run, _callback("s1", 5)))
+        self.assertFalse(service._is_replayed_callback(None, _callback("s1", 1)))
+
+
+class WorkspaceExportEnqueueTests(unittest.TestCase):
+    def _enqueue(self, *, new_export: bool) -> tuple[MagicMock, MagicMock]:
+        db_session = MagicMock(
+            workspace_export_status="ready",
+            workspace_manifest_key="workspaces/u/s/manifest.json",
+            workspace_files_prefix="workspaces/u/s/files",
+        )
+        with (
+            patch(
+                "app.services.callback_service.WorkspaceManifestRepository.delete"
+            ) as delete,
+            patch(
+                "app.services.callback_service.WorkspaceExportJobRepository.enqueue"
+            ) as enqueue,
+        ):
+            CallbackService._enqueue_workspace_export_job(
+                MagicMock(), db_session, new_export=new_export
+            )
+        enqueue.assert_called_once()
+        return delete, db_session
+
+    def test_new_export_drops_the_stored_manifest_of_the_previous_one(self) -> None:
+        delete, db_session = self._enqueue(new_export=True)
+        delete.assert_called_once()
+        self.assertEqual(delete.call_args.args[1], db_session.workspace_manifest_key)
+
+    def test_terminal_callback_without_new_export_keeps_it(self) -> None:
+        delete, _ = self._enqueue(new_export=False)
+        delete.assert_not_called()
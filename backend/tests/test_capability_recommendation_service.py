@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from app.services.capability_recommendation_cache import (
+    CapabilityRecommendationCache,
+)
+from app.services.capability_recommendation_service import (
+    CapabilityRecommendationService,
+    _CapabilityCandidate,
+)
+
+_FILLER = ["calendar", "weather", "translate", "spreadsheet", "email", "slides"]
+
+
+def _candidate(index: int, name: str, description: str) -> _CapabilityCandidate:
+    return _CapabilityCandidate(
+        type="skill",
+        id=index,
+        name=name,
+        description=description,
+        default_enabled=True,
+        document=f"Type: Skill\nName: {name}\nDescription: {description}",
+        search_text=f"{name} {description}",
+    )
+
+
+def _catalog() -> list[_CapabilityCandidate]:
+    catalog = [
+        _candidate(i, f"{word}-{i}", f"Work with {word} data")
+        for i, word in enumerate(_FILLER * 5)
+    ]
+    catalog.append(_candidate(100, "pdf-tools", "Extract text and tables from PDF"))
+    return catalog
+
+
+class CapabilityRecommendationServiceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        settings = MagicMock(
+            siliconflow_api_key="key",
+            siliconflow_base_url="https://rerank.test/v1",
+            siliconflow_rerank_model="model",
+            siliconflow_timeout_seconds=5,
+            capability_recommendation_rerank_candidates=4,
+            capability_recommendation_cache_ttl_seconds=600,
+        )
+        with patch(
+            "app.services.capability_recommendation_cache.get_settings",
+            return_value=settings,
+        ):
+            cache = CapabilityRecommendationCache()
+        patcher = patch(
+            "app.services.capability_recommendation_service.capability_recommendation_cache",
+            cache,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with patch(
+            "app.services.capability_recommendation_service.get_settings",
+            return_value=settings,
+        ):
+            self.service = CapabilityRecommendationService()
+        self.catalog = _catalog()
+        self.service._build_candidates = lambda db, user_id: list(self.catalog)
+
+        self.client = MagicMock()
+        self.client.post = AsyncMock(
+            return_value=httpx.Response(
+                200, json={"results": [{"index": 0, "relevance_score": 0.9}]}
+            )
+        )
+        self.client.__aenter__ = AsyncMock(return_value=self.client)
+        self.client.__aexit__ = AsyncMock(return_value=None)
+        client_patcher = patch(
+            "app.services.capability_recommendation_service.httpx.AsyncClient",
+            return_value=self.client,
+        )
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+
+    async def _recommend(self, query: str):
+        return await self.service.recommend(
+            MagicMock(), user_id="user-1", query=query, limit=3
+        )
+
+    async def test_only_the_bm25_shortlist_is_reranked(self) -> None:
+        result = await self._recommend("extract tables from a pdf")
+
+        documents = self.client.post.call_args.kwargs["json"]["documents"]
+        self.assertEqual(len(documents), 4)
+        self.assertIn("pdf-tools", documents[0])
+        self.assertEqual(result.items[0].name, "pdf-tools")
+
+    async def test_repeated_query_is_served_from_cache(self) -> None:
+        await self._recommend("Extract tables from a PDF")
+        cached = await self._recommend("  extract tables   from a pdf ")
+
+        self.client.post.assert_awaited_once()
+        self.assertEqual(cached.query, "extract tables   from a pdf")
+        self.assertEqual(cached.items[0].name, "pdf-tools")
+
+    async def test_catalog_change_invalidates_cached_results(self) -> None:
+        await self._recommend("extract tables from a pdf")
+        self.catalog[-1].default_enabled = False
+        await self._recommend("extract tables from a pdf")
+
+        self.assertEqual(self.client.post.await_count, 2)
+
+    async def test_non_latin_and_accented_queries_reach_the_shortlist(self) -> None:
+        self.catalog.extend(
+            [
+                _candidate(101, "поиск-файлов", "Поиск файлов в рабочей папке"),
+                _candidate(102, "ブラウザ操作", "ブラウザでウェブページを検索する"),
+                _candidate(103, "présentations", "Créer des présentations"),
+            ]
+        )
+
+        for query, expected in (
+            ("поиск файлов", "поиск-файлов"),
+            ("ウェブページを検索", "ブラウザ操作"),
+            ("créer une présentation", "présentations"),
+        ):
+            with self.subTest(query=query):
+                await self._recommend(query)
+                documents = self.client.post.call_args.kwargs["json"]["documents"]
+                self.assertIn(expected, documents[0])
+
+    def test_tokenize_splits_kana_and_ideographs_into_characters(self) -> None:
+        self.assertEqual(
+            CapabilityRecommendationService._tokenize("Größe ändern, 网页 file_search"),
+            ["grösse", "ändern", "网", "页", "file", "search"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.services import env_var_service as env_var_module
+from app.services.env_var_cache import EnvVarCache
+from app.services.env_var_service import SYSTEM_USER_ID, EnvVarService
+from app.utils.crypto import decrypt_value, encrypt_value, needs_rotation
+
+
+def _env_var(key: str, ciphertext: str, *, user_id: str, scope: str) -> MagicMock:
+    return MagicMock(key=key, value_ciphertext=ciphertext, user_id=user_id, scope=scope)
+
+
+class CryptoRotationTests(unittest.TestCase):
+    def test_values_from_previous_key_decrypt_and_rotate(self) -> None:
+        old_token = encrypt_value("secret", "old-key")
+
+        self.assertEqual(decrypt_value(old_token, "new-key", ["old-key"]), "secret")
+        self.assertTrue(needs_rotation(old_token, "new-key"))
+        new_token = encrypt_value("secret", "new-key", ["old-key"])
+        self.assertFalse(needs_rotation(new_token, "new-key"))
+        self.assertEqual(decrypt_value(new_token, "new-key"), "secret")
+
+
+class EnvVarServiceCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        settings = MagicMock(
+            secret_key="new-key",
+            secret_key_fallbacks="old-key",
+            env_var_cache_ttl_seconds=300,
+        )
+        with patch("app.services.env_var_cache.get_settings", return_value=settings):
+            self.cache = EnvVarCache(system_owner=SYSTEM_USER_ID)
+        for target, value in (
+            ("app.services.env_var_service.env_var_cache", self.cache),
+            ("app.services.env_var_service.get_settings", lambda: settings),
+            ("app.services.env_var_service.PROCESS_ENV_KEYS", ()),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.service = EnvVarService()
+        self.db = MagicMock()
+        self.rows = {
+            SYSTEM_USER_ID: [
+                _env_var(
+                    "SYSTEM_TOKEN",
+                    encrypt_value("sys", "old-key"),
+                    user_id=SYSTEM_USER_ID,
+                    scope="system",
+                )
+            ],
+            "user-1": [
+                _env_var(
+                    "USER_TOKEN",
+                    encrypt_value("mine", "new-key"),
+                    user_id="user-1",
+                    scope="user",
+                )
+            ],
+        }
+
+    def _list(self, db, *, user_id: str, scope: str):
+        return self.rows.get(user_id, [])
+
+    def test_env_map_is_decrypted_once_until_invalidated(self) -> None:
+        with (
+            patch.object(
+                env_var_module.EnvVarRepository,
+                "list_by_user_and_scope",
+                side_effect=self._list,
+            ) as list_rows,
+            patch(
+                "app.services.env_var_service.decrypt_value", wraps=decrypt_value
+            ) as decrypt,
+        ):
+            first = self.service.get_env_map(self.db, "user-1")
+            second = self.service.get_env_map(self.db, "user-1")
+            self.assertEqual(first, {"SYSTEM_TOKEN": "sys", "USER_TOKEN": "mine"})
+            self.assertEqual(second, first)
+            self.assertEqual(list_rows.call_count, 2)
+            self.assertEqual(decrypt.call_count, 2)
+
+            self.cache.handle_notification("user-1")
+            self.service.get_env_map(self.db, "user-1")
+            # Only the user's map was dropped; ciphertexts stay cached.
+            self.assertEqual(list_rows.call_count, 3)
+            self.assertEqual(decrypt.call_count, 2)
+
+    def test_system_change_drops_every_map(self) -> None:
+        self.cache.put_map("user-1", {"A": "1"}, self.cache.generation())
+        self.cache.put_map("user-2", {"B": "2"}, self.cache.generation())
+
+        self.cache.handle_notification(SYSTEM_USER_ID)
+
+        self.assertIsNone(self.cache.get_map("user-1"))
+        self.assertIsNone(self.cache.get_map("user-2"))
+
+    def test_map_loaded_across_an_invalidation_is_not_cached(self) -> None:
+        generation = self.cache.generation()
+        self.cache.invalidate("user-1")
+        self.cache.put_map("user-1", {"STALE": "1"}, generation)
+
+        self.assertIsNone(self.cache.get_map("user-1"))
+
+    def test_delete_publishes_change_and_evicts_map(self) -> None:
+        self.cache.put_map("user-1", {"USER_TOKEN": "mine"}, self.cache.generation())
+        row = self.rows["user-1"][0]
+        with (
+            patch.object(
+                env_var_module.EnvVarRepository, "get_by_id", return_value=row
+            ),
+            patch.object(env_var_module.EnvVarRepository, "delete"),
+            patch.object(self.cache, "publish_change") as publish,
+        ):
+            self.service.delete_user_env_var(self.db, "user-1", 1)
+
+        publish.assert_called_once_with(self.db, "user-1")
+        self.assertIsNone(self.cache.get_map("user-1"))
+
+    def test_rotation_reencrypts_values_from_fallback_keys(self) -> None:
+        all_rows = [*self.rows[SYSTEM_USER_ID], *self.rows["user-1"]]
+        untouched = self.rows["user-1"][0].value_ciphertext
+        with patch.object(
+            env_var_module.EnvVarRepository, "list_all", return_value=all_rows
+        ):
+            rotated = self.service.rotate_ciphertexts(self.db)
+
+        self.assertEqual(rotated, 1)
+        system_token = self.rows[SYSTEM_USER_ID][0].value_ciphertext
+        self.assertFalse(needs_rotation(system_token, "new-key"))
+        self.assertEqual(decrypt_value(system_token, "new-key"), "sys")
+        self.assertEqual(self.rows["user-1"][0].value_ciphertext, untouched)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import asyncio
+import unittest
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.services.im import ClaimedEvent, ImEventDispatcher, PlannedDelivery
+
+
+def _delivery(
+    channel_id: int, key: str, event_type: str, text: str = "", session_id: str = "s1"
+) -> PlannedDelivery:
+    return PlannedDelivery(
+        channel_id=channel_id,
+        dedup_key=key,
+        text=f"💬 {text}" if text else key,
+        event_type=event_type,
+        session_id=session_id,
+        message_text=text or None,
+        provider="telegram",
+        destination=f"chat-{channel_id}",
+    )
+
+
+def _claimed(event_id: str) -> ClaimedEvent:
+    return ClaimedEvent(id=event_id, event_type="x", attempt_count=1, payload={})
+
+
+class ImEventDispatcherTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        with patch("app.services.im.NotificationGateway"):
+            self.dispatcher = ImEventDispatcher()
+        self.dispatcher.settings = MagicMock(
+            im_event_dispatch_batch_size=20,
+            im_event_dispatch_lease_seconds=30,
+            im_event_dispatch_concurrency=4,
+        )
+        self.sent: list[tuple[int, str]] = []
+        self.finished: dict = {}
+
+        def finish(claimed, delivered_keys, failures, held):
+            self.finished = {
+                "keys": list(delivered_keys),
+                "failures": dict(failures),
+                "held": set(held),
+            }
+
+        self.dispatcher._finish_batch = finish
+
+    async def _dispatch(
+        self, plans: dict[str, list[PlannedDelivery]]
+    ) -> list[ClaimedEvent]:
+        claimed = [_claimed(event_id) for event_id in plans]
+        self.dispatcher._claim_due_batch = lambda *_: claimed
+        self.dispatcher._plan_batch = lambda _claimed: (plans, {}, set())
+        await self.dispatcher._dispatch_once()
+        return claimed
+
+    async def test_failed_send_blocks_only_its_channel(self) -> None:
+        async def send(delivery: PlannedDelivery) -> bool:
+            self.sent.append((delivery.channel_id, delivery.dedup_key))
+            return delivery.dedup_key != "e1@1"
+
+        self.dispatcher._backend_event_service.send = send
+
+        await self._dispatch(
+            {
+                "e1": [_delivery(1, "e1@1", "run.terminal")],
+                "e2": [
+                    _delivery(1, "e2@1", "run.terminal"),
+                    _delivery(2, "e2@2", "run.terminal"),
+                ],
+            }
+        )
+
+        self.assertIn((2, "e2@2"), self.sent)
+        self.assertNotIn((1, "e2@1"), self.sent)
+        self.assertEqual(self.finished["keys"], ["e2@2"])
+        self.assertEqual(set(self.finished["failures"]), {"e1", "e2"})
+        self.assertEqual(self.finished["held"], {"e2"})
+
+    async def test_assistant_backlog_is_sent_once(self) -> None:
+        texts: list[str] = []
+
+        async def send(delivery: PlannedDelivery) -> bool:
+            texts.append(delivery.text)
+            return True
+
+        self.dispatcher._backend_event_service.send = send
+
+        await self._dispatch(
+            {
+                f"m{i}": [
+                    _delivery(1, f"m{i}", "assistant_message.created", f"part {i}")
+                ]
+                for i in range(3)
+            }
+        )
+
+        self.assertEqual(texts, ["💬 part 0\n\n💬 part 1\n\n💬 part 2"])
+        self.assertEqual(self.finished["keys"], ["m0", "m1", "m2"])
+        self.assertEqual(self.finished["failures"], {})
+
+    async def test_channels_are_delivered_concurrently(self) -> None:
+        second_started = asyncio.Event()
+
+        async def send(delivery: PlannedDelivery) -> bool:
+            if delivery.channel_id == 2:
+                second_started.set()
+                return True
+            # Channel 1 only finishes once channel 2 has started.
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+            return True
+
+        self.dispatcher._backend_event_service.send = send
+
+        await self._dispatch(
+            {
+                "e1": [_delivery(1, "e1@1", "run.terminal")],
+                "e2": [_delivery(2, "e2@2", "run.terminal")],
+            }
+        )
+
+        self.assertEqual(self.finished["failures"], {})
+
+    def test_channels_with_an_earlier_event_in_backoff_are_held(self) -> None:
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        backoff_row = MagicMock(
+            created_at=start, payload={"backoff": True}, id=uuid.uuid4()
+        )
+        later = _claimed(str(uuid.uuid4()))
+        later.created_at = start + timedelta(seconds=1)
+        plans = {
+            later.id: [
+                _delivery(1, "later@1", "run.terminal"),
+                _delivery(2, "later@2", "run.terminal"),
+            ]
+        }
+        failures: dict[str, str] = {}
+        held: set[str] = set()
+        service = self.dispatcher._backend_event_service
+        service.plan_deliveries = MagicMock(
+            return_value=[_delivery(1, "backoff@1", "run.terminal")]
+        )
+
+        with (
+            patch("app.services.im.ImBackendEvent.model_validate"),
+            patch(
+                "app.services.im.ImEventOutboxRepository.list_undelivered_before",
+                return_value=[backoff_row],
+            ),
+        ):
+            self.dispatcher._hold_behind_undelivered(
+                MagicMock(), [later], plans, failures, held
+            )
+
+        self.assertEqual([d.dedup_key for d in plans[later.id]], ["later@2"])
+        self.assertIn(later.id, failures)
+        self.assertEqual(held, {later.id})
+
+    def test_poison_event_is_dead_lettered_and_held_events_are_not(self) -> None:
+        self.dispatcher.settings.im_event_max_attempts = 3
+        poison = ClaimedEvent(id="poison", event_type="x", attempt_count=3, payload={})
+        waiting = ClaimedEvent(id="later", event_type="x", attempt_count=5, payload={})
+        retried = ClaimedEvent(id="flaky", event_type="x", attempt_count=2, payload={})
+
+        with (
+            patch("app.services.im.SessionLocal"),
+            patch("app.services.im.ImEventOutboxRepository") as repository,
+        ):
+            ImEventDispatcher._finish_batch(
+                self.dispatcher,
+                [poison, waiting, retried],
+                [],
+                {"poison": "403", "later": "blocked", "flaky": "timeout"},
+                {"later"},
+            )
+
+        calls = {
+            call.kwargs["event_id"]: call.kwargs
+            for call in repository.mark_retry.call_args_list
+        }
+        self.assertTrue(calls["poison"]["give_up"])
+        self.assertFalse(calls["later"]["give_up"])
+        self.assertFalse(calls["later"]["attempted"])
+        self.assertFalse(calls["flaky"]["give_up"])
+        self.assertTrue(calls["flaky"]["attempted"])
+
+    def test_events_behind_a_dead_letter_flow(self) -> None:
+        later = _claimed(str(uuid.uuid4()))
+        later.created_at = datetime(2026, 1, 1, tzinfo=UTC)
+        plans = {later.id: [_delivery(1, "later@1", "run.terminal")]}
+        failures: dict[str, str] = {}
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+
+        self.dispatcher._hold_behind_undelivered(db, [later], plans, failures, set())
+
+        # The dead-lettered event is excluded from the undelivered lookup.
+        query = str(
+            db.execute.call_args.args[0].compile(compile_kwargs={"literal_binds": True})
+        )
+        self.assertIn("im_event_outbox.status NOT IN ('delivered', 'failed')", query)
+        self.assertEqual([d.dedup_key for d in plans[later.id]], ["later@1"])
+        self.assertEqual(failures, {})
@@ -0,0 +1,181 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from app.services.im_providers import (
+    FeishuClient,
+    SendLimits,
+    TelegramClient,
+    http_send_slots,
+)
+
+
+def _telegram_client() -> TelegramClient:
+    with patch(
+        "app.services.im_providers.get_settings",
+        return_value=MagicMock(telegram_bot_token="token"),
+    ):
+        return TelegramClient()
+
+
+def _feishu_client() -> FeishuClient:
+    with patch(
+        "app.services.im_providers.get_settings",
+        return_value=MagicMock(
+            feishu_enabled=True,
+            feishu_base_url="https://feishu.test",
+            feishu_app_id="app",
+            feishu_app_secret="secret",
+        ),
+    ):
+        return FeishuClient()
+
+
+def _mock_http(client, handler) -> None:
+    client._transport().http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class ImProviderClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retry_after_is_honored_before_resending(self) -> None:
+        client = _telegram_client()
+        sent_at: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_at.append(time.monotonic())
+            if len(sent_at) == 1:
+                return httpx.Response(
+                    429, json={"ok": False, "parameters": {"retry_after": 0.2}}
+                )
+            return httpx.Response(200, json={"ok": True})
+
+        _mock_http(client, handler)
+
+        self.assertTrue(await client.send_text(destination="42", text="hi"))
+        self.assertEqual(len(sent_at), 2)
+        self.assertGreaterEqual(sent_at[1] - sent_at[0], 0.2)
+        await client.aclose()
+
+    async def test_long_retry_after_fails_without_waiting(self) -> None:
+        client = _telegram_client()
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(429, headers={"Retry-After": "120"})
+
+        _mock_http(client, handler)
+
+        started = time.monotonic()
+        self.assertFalse(await client.send_text(destination="42", text="hi"))
+        self.assertFalse(await client.send_text(destination="42", text="again"))
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(calls, 1)
+        await client.aclose()
+
+    async def test_destination_rate_spaces_sends_per_chat_only(self) -> None:
+        client = _telegram_client()
+        client.send_limits = SendLimits(
+            global_rate=100.0,
+            global_burst=100,
+            destination_rate=10.0,
+            destination_burst=1,
+        )
+        sent: list[tuple[str, float]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = request.read().decode()
+            sent.append((body, time.monotonic()))
+            return httpx.Response(200, json={"ok": True})
+
+        _mock_http(client, handler)
+
+        started = time.monotonic()
+        await asyncio.gather(
+            client.send_text(destination="a", text="1"),
+            client.send_text(destination="a", text="2"),
+            client.send_text(destination="a", text="3"),
+            client.send_text(destination="b", text="1"),
+        )
+        times_a = [at for body, at in sent if '"chat_id":"a"' in body]
+        times_b = [at for body, at in sent if '"chat_id":"b"' in body]
+        self.assertGreaterEqual(times_a[-1] - started, 0.18)
+        self.assertLess(times_b[0] - started, 0.05)
+        await client.aclose()
+
+    async def test_rate_limit_wait_does_not_hold_a_send_slot(self) -> None:
+        client = _telegram_client()
+        client.send_limits = SendLimits(
+            global_rate=100.0,
+            global_burst=100,
+            destination_rate=2.0,
+            destination_burst=1,
+        )
+        sent: list[tuple[str, float]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append((request.read().decode(), time.monotonic()))
+            return httpx.Response(200, json={"ok": True})
+
+        _mock_http(client, handler)
+        slots = asyncio.Semaphore(1)
+
+        async def send(destination: str, text: str) -> bool:
+            with http_send_slots(slots):
+                return await client.send_text(destination=destination, text=text)
+
+        started = time.monotonic()
+        # The second send to "a" waits about 0.5s for the chat's token.
+        first = asyncio.create_task(send("a", "1"))
+        await asyncio.sleep(0)
+        throttled = asyncio.create_task(send("a", "2"))
+        await asyncio.sleep(0.05)
+        self.assertTrue(await send("b", "1"))
+
+        times_b = [at for body, at in sent if '"chat_id":"b"' in body]
+        self.assertLess(times_b[0] - started, 0.2)
+        self.assertTrue(all(await asyncio.gather(first, throttled)))
+        await client.aclose()
+
+    async def test_concurrent_token_failures_refresh_once(self) -> None:
+        client = _feishu_client()
+        token_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal token_requests
+            if request.url.path.endswith("/tenant_access_token/internal"):
+                token_requests += 1
+                return httpx.Response(
+                    200,
+                    json={
+                        "code": 0,
+                        "tenant_access_token": f"t{token_requests}",
+                        "expire": 7200,
+                    },
+                )
+            if request.headers["Authorization"] == "Bearer t1":
+                return httpx.Response(200, json={"code": 99991663, "msg": "expired"})
+            return httpx.Response(200, json={"code": 0})
+
+        _mock_http(client, handler)
+        client._tenant_access_token = "t1"
+        client._token_expire_ts = time.time() + 3600
+        token_requests = 1
+
+        results = await asyncio.gather(
+            *(
+                client.send_text(destination=f"chat-{index}", text="hi")
+                for index in range(5)
+            )
+        )
+
+        self.assertEqual(results, [True] * 5)
+        self.assertEqual(token_requests, 2)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.services.message_service import MessageService
+from app.services.session_service import SessionService
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _message(message_id: int) -> MagicMock:
+    return MagicMock(
+        id=message_id,
+        role="assistant",
+        text_preview=f"m{message_id}",
+        created_at=_BASE + timedelta(seconds=message_id),
+        content={"text": f"m{message_id}"},
+    )
+
+
+class FakeMessageRepository:
+    """In-memory stand-in for the keyset queries of MessageRepository."""
+
+    def __init__(self, ids: list[int]) -> None:
+        self.ids = ids
+
+    def list_window_by_session(
+        self, db, session_id, *, before_id, after_id, limit, include_content
+    ):
+        if after_id is not None:
+            return [_message(i) for i in self.ids if i > after_id][:limit]
+        ids = [i for i in self.ids if before_id is None or i < before_id]
+        return [_message(i) for i in ids[-limit:]]
+
+    def exists_in_session(self, db, session_id, *, before_id=None, after_id=None):
+        return any(
+            (before_id is None or i < before_id) and (after_id is None or i > after_id)
+            for i in self.ids
+        )
+
+
+class MessageWindowTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = FakeMessageRepository(list(range(1, 11)))
+        for name in ("list_window_by_session", "exists_in_session"):
+            patcher = patch(
+                f"app.services.message_service.MessageRepository.{name}",
+                side_effect=getattr(self.repo, name),
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.service = MessageService()
+        self.session_id = uuid.uuid4()
+
+    def test_opens_at_the_tail_and_pages_backwards(self) -> None:
+        tail = self.service.get_messages_window(MagicMock(), self.session_id, limit=4)
+        self.assertEqual([m.id for m in tail.items], [7, 8, 9, 10])
+        self.assertTrue(tail.has_more_before)
+        self.assertFalse(tail.has_more_after)
+        self.assertIsNone(tail.items[0].content)
+
+        older = self.service.get_messages_window(
+            MagicMock(),
+            self.session_id,
+            before_message_id=tail.next_before_message_id,
+            limit=4,
+        )
+        self.assertEqual([m.id for m in older.items], [3, 4, 5, 6])
+        self.assertTrue(older.has_more_before)
+        self.assertTrue(older.has_more_after)
+
+    def test_pages_forward_with_content(self) -> None:
+        window = self.service.get_messages_window(
+            MagicMock(),
+            self.session_id,
+            after_message_id=7,
+            limit=5,
+            include_content=True,
+        )
+        self.assertEqual([m.id for m in window.items], [8, 9, 10])
+        self.assertFalse(window.has_more_after)
+        self.assertTrue(window.has_more_before)
+        self.assertEqual(window.items[0].content, {"text": "m8"})
+        self.assertEqual(window.next_after_message_id, 10)
+
+    def test_files_window_attaches_uploads_of_the_window_only(self) -> None:
+        run = SimpleNamespace(
+            user_message_id=9,
+            config_snapshot={"input_files": [{"name": "a.txt", "source": "x"}]},
+        )
+        messages = [
+            SimpleNamespace(
+                id=i,
+                role="user",
+                content={"text": f"m{i}"},
+                text_preview=f"m{i}",
+                created_at=_BASE,
+                updated_at=_BASE,
+            )
+            for i in range(7, 11)
+        ]
+        with (
+            patch(
+                "app.services.message_service.MessageRepository.list_window_by_session",
+                return_value=messages,
+            ) as list_window,
+            patch(
+                "app.services.message_service.RunRepository.list_by_session_and_user_message_ids",
+                return_value=[run],
+            ) as list_runs,
+            patch("app.services.message_service.S3StorageService"),
+        ):
+            window = self.service.get_messages_with_files_window(
+                MagicMock(),
+                self.session_id,
+                user_id="user-1",
+                before_message_id=11,
+                limit=3,
+            )
+
+        self.assertEqual(list_window.call_args.kwargs["limit"], 4)
+        self.assertTrue(list_window.call_args.kwargs["include_content"])
+        self.assertEqual(list_runs.call_args.args[2], [8, 9, 10])
+        self.assertEqual([m.id for m in window.items], [8, 9, 10])
+        self.assertTrue(window.has_more_before)
+        self.assertEqual(window.next_before_message_id, 8)
+        self.assertEqual([f.name for f in window.items[1].attachments], ["a.txt"])
+        self.assertEqual(window.items[0].attachments, [])
+
+
+def _session(index: int) -> SimpleNamespace:
+    created_at = _BASE + timedelta(minutes=index)
+    return SimpleNamespace(
+        id=uuid.UUID(int=index),
+        user_id="user-1",
+        project_id=None,
+        sdk_session_id=None,
+        config_snapshot=None,
+        workspace_archive_url=None,
+        status="completed",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+class SessionPageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Newest first, as the repository returns them.
+        self.sessions = [_session(i) for i in range(10, 0, -1)]
+        for name, fake in (
+            ("list_page_by_user", self._list_page),
+            ("exists_by_user", self._exists),
+        ):
+            patcher = patch(
+                f"app.services.session_service.SessionRepository.{name}",
+                side_effect=fake,
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.service = SessionService()
+
+    @staticmethod
+    def _key(session) -> tuple:
+        return (session.created_at, session.id)
+
+    def _list_page(
+        self, db, user_id, *, limit, project_id, kind, older_than, newer_than
+    ):
+        if newer_than is not None:
+            newer = [s for s in self.sessions if self._key(s) > newer_than]
+            return newer[-limit:]
+        return [
+            s for s in self.sessions if older_than is None or self._key(s) < older_than
+        ][:limit]
+
+    def _exists(
+        self, db, user_id, *, project_id, kind, older_than=None, newer_than=None
+    ):
+        return any(
+            (older_than is None or self._key(s) < older_than)
+            and (newer_than is None or self._key(s) > newer_than)
+            for s in self.sessions
+        )
+
+    def test_pages_older_then_newer(self) -> None:
+        first = self.service.list_sessions_page(MagicMock(), "user-1", limit=4)
+        self.assertEqual([s.session_id.int for s in first.items], [10, 9, 8, 7])
+        self.assertTrue(first.has_more_before)
+        self.assertFalse(first.has_more_after)
+
+        older = self.service.list_sessions_page(
+            MagicMock(),
+            "user-1",
+            limit=4,
+            before=(first.next_before_created_at, first.next_before_id),
+        )
+        self.assertEqual([s.session_id.int for s in older.items], [6, 5, 4, 3])
+        self.assertTrue(older.has_more_after)
+
+        newer = self.service.list_sessions_page(
+            MagicMock(),
+            "user-1",
+            limit=2,
+            after=(older.next_after_created_at, older.next_after_id),
+        )
+        self.assertEqual([s.session_id.int for s in newer.items], [8, 7])
+        self.assertTrue(newer.has_more_after)
+        self.assertTrue(newer.has_more_before)
+
+
+if __name__ == "__main__":
+    unittest.main()
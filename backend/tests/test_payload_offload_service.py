@@ -0,0 +1,196 @@
+import gzip
+import json
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.schemas.callback import AgentCallbackRequest, CallbackStatus
+from app.services.callback_service import CallbackService, PreparedPayloads
+from app.services.payload_offload_service import (
+    OFFLOAD_REFERENCE_KEY,
+    PayloadOffloadService,
+    build_preview,
+)
+
+
+class PayloadOffloadServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = MagicMock()
+        self.service = PayloadOffloadService(storage_service=self.storage)
+        self.service.threshold_bytes = 1024
+        self.service.preview_chars = 20
+        self.session_id = uuid.uuid4()
+
+    def test_small_payload_is_kept_inline(self) -> None:
+        payload = {"content": "short"}
+
+        result = self.service.offload(
+            payload, session_id=self.session_id, kind="tool-outputs"
+        )
+
+        self.assertIs(result, payload)
+        self.storage.put_object.assert_not_called()
+
+    def test_large_payload_is_uploaded_and_replaced_by_preview(self) -> None:
+        payload = {"_type": "UserMessage", "content": "x" * 4096}
+
+        result = self.service.offload(
+            payload, session_id=self.session_id, kind="messages"
+        )
+
+        kwargs = self.storage.put_object.call_args.kwargs
+        self.assertTrue(
+            kwargs["key"].startswith(f"payloads/{self.session_id}/messages/")
+        )
+        self.assertEqual(json.loads(gzip.decompress(kwargs["body"])), payload)
+        self.assertEqual(result["_type"], "UserMessage")
+        self.assertTrue(result["content"].startswith("x" * 20))
+        self.assertLess(len(result["content"]), 100)
+        self.assertEqual(result[OFFLOAD_REFERENCE_KEY]["key"], kwargs["key"])
+
+        self.storage.get_bytes.return_value = kwargs["body"]
+        self.assertEqual(self.service.hydrate(result), payload)
+
+    def test_upload_failure_keeps_full_payload(self) -> None:
+        self.storage.put_object.side_effect = AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR, message="down"
+        )
+        payload = {"content": "x" * 4096}
+
+        result = self.service.offload(
+            payload, session_id=self.session_id, kind="tool-outputs"
+        )
+
+        self.assertIs(result, payload)
+
+    def test_build_preview_clips_long_lists(self) -> None:
+        preview = build_preview(list(range(150)), 10)
+
+        self.assertEqual(len(preview), 101)
+        self.assertEqual(preview[-1], "… [truncated 50 items]")
+
+
+class CallbackPayloadOffloadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = MagicMock()
+        self.service = CallbackService()
+        offload = PayloadOffloadService(storage_service=self.storage)
+        offload.threshold_bytes = 1024
+        offload.preview_chars = 20
+        self.service._payload_offload = offload
+        self.db = MagicMock()
+        self.session_id = uuid.uuid4()
+
+    def _callback(self, message: dict) -> AgentCallbackRequest:
+        return AgentCallbackRequest(
+            session_id=str(self.session_id),
+            time=datetime.now(UTC),
+            status=CallbackStatus.RUNNING,
+            progress=0,
+            new_message=message,
+        )
+
+    def _persist(
+        self, message: dict, payloads: PreparedPayloads
+    ) -> tuple[MagicMock, MagicMock]:
+        with (
+            patch("app.services.callback_service.MessageRepository") as messages,
+            patch("app.services.callback_service.ToolExecutionRepository") as tools,
+        ):
+            messages.create.return_value = MagicMock(id=7)
+            self.service._persist_message_and_tools(
+                self.db, self.session_id, None, message, payloads
+            )
+        return messages, tools
+
+    def test_preview_is_uploaded_before_the_row_is_written(self) -> None:
+        text = "x" * 4096
+        message = {
+            "_type": "UserMessage",
+            "content": [
+                {"_type": "TextBlock", "text": text},
+                {
+                    "_type": "ToolResultBlock",
+                    "tool_use_id": "tool-1",
+                    "content": "y" * 4096,
+                },
+            ],
+        }
+
+        payloads = self.service.prepare_payloads(self._callback(message))
+
+        self.assertEqual(self.storage.put_object.call_count, 2)
+        messages, tools = self._persist(message, payloads)
+        kwargs = messages.create.call_args.kwargs
+        self.assertIs(kwargs["content"], payloads.message)
+        self.assertIn(OFFLOAD_REFERENCE_KEY, kwargs["content"])
+        self.assertEqual(kwargs["text_preview"], text[:500])
+        tool_results = tools.upsert_tool_results.call_args.kwargs["tool_results"]
+        self.assertIs(tool_results["tool-1"][0], payloads.tool_outputs["tool-1"])
+        self.assertTrue(payloads.persisted)
+
+    def test_small_payloads_are_not_uploaded(self) -> None:
+        message = {"_type": "AssistantMessage", "content": "short"}
+
+        payloads = self.service.prepare_payloads(self._callback(message))
+
+        self.storage.put_object.assert_not_called()
+        messages, _ = self._persist(message, payloads)
+        self.assertIs(messages.create.call_args.kwargs["content"], message)
+
+    def test_discard_deletes_every_upload(self) -> None:
+        message = {
+            "_type": "AssistantMessage",
+            "content": [
+                {
+                    "_type": "ToolResultBlock",
+                    "tool_use_id": "tool-1",
+                    "content": "y" * 4096,
+                }
+            ],
+        }
+        payloads = self.service.prepare_payloads(self._callback(message))
+
+        self.service.discard_payloads(payloads)
+
+        uploaded = {
+            call.kwargs["key"] for call in self.storage.put_object.call_args_list
+        }
+        deleted = {
+            call.kwargs["key"] for call in self.storage.delete_object.call_args_list
+        }
+        self.assertEqual(len(uploaded), 2)
+        self.assertEqual(deleted, uploaded)
+
+    def _skip_after_offloaded(self, previous_text: str, result_text: str) -> bool:
+        payloads = self.service.prepare_payloads(
+            self._callback(
+                {
+                    "_type": "AssistantMessage",
+                    "content": [{"_type": "TextBlock", "text": previous_text}],
+                }
+            )
+        )
+        latest = MagicMock(role="assistant", content=payloads.message)
+        with patch(
+            "app.services.callback_service.MessageRepository.get_latest_by_session",
+            return_value=latest,
+        ):
+            return self.service._should_skip_duplicate_result_message(
+                self.db,
+                self.session_id,
+                {"_type": "ResultMessage", "result": result_text},
+            )
+
+    def test_duplicate_result_is_detected_against_offloaded_message(self) -> None:
+        text = "y" * 2000
+
+        self.assertTrue(self._skip_after_offloaded(text, text))
+
+    def test_result_sharing_only_a_prefix_is_not_a_duplicate(self) -> None:
+        text = "y" * 2000
+
+        self.assertFalse(self._skip_after_offloaded(text, text + " and more"))
@@ -0,0 +1,54 @@
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+from app.services.run_lifecycle_service import RunLifecycleService
+from app.services.session_event_service import EVENT_RUN, EVENT_STATE
+
+
+class RunLifecycleNotifyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.db_session = MagicMock(id=uuid.uuid4(), status="pending")
+        self.db_run = MagicMock(
+            session_id=self.db_session.id,
+            status="claimed",
+            started_at=None,
+            finished_at=None,
+            scheduled_task_id=None,
+        )
+        for target, kwargs in (
+            (
+                "app.services.run_lifecycle_service.SessionRepository.get_by_id_for_update",
+                {"return_value": self.db_session},
+            ),
+            ("app.services.run_lifecycle_service.session_queue_service", {}),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch("app.services.run_lifecycle_service.session_event_broker")
+        self.broker = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_start_notifies_session_streams(self) -> None:
+        RunLifecycleService().mark_running(self.db, self.db_run)
+
+        self.assertEqual(self.db_session.status, "running")
+        self.broker.notify.assert_called_once_with(
+            self.db, self.db_session.id, {EVENT_STATE, EVENT_RUN}
+        )
+
+    def test_failure_notifies_session_streams(self) -> None:
+        RunLifecycleService().finalize_terminal(
+            self.db, self.db_run, status="failed", error_message="boom"
+        )
+
+        self.assertEqual(self.db_session.status, "failed")
+        self.broker.notify.assert_called_once_with(
+            self.db, self.db_session.id, {EVENT_STATE, EVENT_RUN}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
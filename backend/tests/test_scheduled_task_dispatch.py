@@ -0,0 +1,168 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.schemas.scheduled_task import ScheduledTaskDispatchResponse
+from app.services.scheduled_task_dispatcher import ScheduledTaskDispatcher
+from app.services.scheduled_task_service import ScheduledTaskService
+
+_DUE = datetime.now(timezone.utc) - timedelta(seconds=2)
+
+
+def _task(*, session_id: uuid.UUID | None, reuse_session: bool = True):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id="user-1",
+        prompt="run the report",
+        reuse_session=reuse_session,
+        session_id=session_id,
+        config_snapshot={},
+        input_files=None,
+        cron="0 * * * *",
+        timezone="UTC",
+        next_run_at=_DUE,
+        enabled=True,
+        last_run_id=None,
+        last_run_status=None,
+        last_error=None,
+    )
+
+
+def _session(session_id: uuid.UUID | None = None, status: str = "completed"):
+    return SimpleNamespace(id=session_id or uuid.uuid4(), status=status)
+
+
+class DispatchDueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = ScheduledTaskService()
+        self.db = MagicMock()
+        self.pinned = _session()
+        self.busy = _session()
+        self.tasks = [
+            _task(session_id=self.pinned.id),
+            # Same pinned session in the same batch: only one run is queued.
+            _task(session_id=self.pinned.id),
+            _task(session_id=self.busy.id),
+            _task(session_id=uuid.uuid4()),
+            _task(session_id=None, reuse_session=False),
+        ]
+        prefix = "app.services.scheduled_task_service"
+        for target, patch_kwargs in (
+            (
+                f"{prefix}.ScheduledTaskRepository.claim_due_for_update",
+                {"return_value": self.tasks},
+            ),
+            (
+                f"{prefix}.SessionRepository.list_by_ids",
+                {"return_value": [self.pinned, self.busy]},
+            ),
+            (
+                f"{prefix}.SessionRepository.create",
+                {"side_effect": lambda **_: _session()},
+            ),
+            (
+                f"{prefix}.SessionQueueItemRepository.list_session_ids_with_active_items",
+                {"return_value": set()},
+            ),
+            (
+                f"{prefix}.RunRepository.list_session_ids_with_status",
+                {"return_value": {self.busy.id}},
+            ),
+            (
+                f"{prefix}.MessageRepository.create",
+                {"side_effect": lambda **_: SimpleNamespace(id=1)},
+            ),
+            (
+                f"{prefix}.RunRepository.create",
+                {
+                    "side_effect": lambda **kwargs: SimpleNamespace(
+                        id=uuid.uuid4(), status="queued", **kwargs
+                    )
+                },
+            ),
+        ):
+            patcher = patch(target, **patch_kwargs)
+            self.addCleanup(patcher.stop)
+            setattr(self, target.rsplit(".", 1)[-1], patcher.start())
+
+    def test_enqueues_batch_with_one_query_per_lookup(self) -> None:
+        with patch.object(
+            self.service,
+            "_compute_next_run_at",
+            wraps=self.service._compute_next_run_at,
+        ) as compute:
+            result = self.service.dispatch_due(self.db, limit=50)
+
+        self.assertEqual((result.dispatched, result.skipped, result.errors), (2, 2, 1))
+        self.assertGreaterEqual(result.max_lag_ms, 2000)
+        self.list_by_ids.assert_called_once()
+        self.list_session_ids_with_status.assert_called_once()
+        self.assertEqual(self.db.flush.call_count, 3)
+        self.db.commit.assert_called_once()
+        # Every task shares one schedule, so croniter runs once for the batch.
+        compute.assert_called_once()
+
+        dispatched, skipped_same, skipped_busy, missing, fresh = self.tasks
+        self.assertEqual(dispatched.last_run_status, "queued")
+        self.assertIsNone(skipped_same.last_run_id)
+        self.assertIsNone(skipped_busy.last_run_id)
+        self.assertFalse(missing.enabled)
+        self.assertIn("Session not found", missing.last_error)
+        self.assertIsNotNone(fresh.last_run_id)
+        for task in self.tasks:
+            self.assertGreater(task.next_run_at, _DUE)
+
+    def test_runs_keep_their_scheduled_slot(self) -> None:
+        self.service.dispatch_due(self.db, limit=50)
+
+        scheduled_at = {
+            call.kwargs["scheduled_at"] for call in self.create.call_args_list
+        }
+        self.assertEqual(scheduled_at, {_DUE})
+
+
+class DispatcherDrainTests(unittest.TestCase):
+    def _dispatcher(self, service: MagicMock) -> ScheduledTaskDispatcher:
+        settings = MagicMock(
+            scheduled_task_dispatcher_enabled=True,
+            scheduled_task_dispatch_batch_size=2,
+            scheduled_task_dispatch_max_sleep_seconds=30,
+        )
+        with patch(
+            "app.services.scheduled_task_dispatcher.get_settings",
+            return_value=settings,
+        ):
+            return ScheduledTaskDispatcher(service=service)
+
+    def test_drains_full_batches_then_sleeps_until_next_due(self) -> None:
+        service = MagicMock()
+        service.dispatch_due.side_effect = [
+            ScheduledTaskDispatchResponse(dispatched=2),
+            ScheduledTaskDispatchResponse(dispatched=1, skipped=1),
+            ScheduledTaskDispatchResponse(dispatched=1),
+        ]
+        service.next_due_at.return_value = datetime.now(timezone.utc) + timedelta(
+            seconds=60
+        )
+        dispatcher = self._dispatcher(service)
+
+        with patch("app.services.scheduled_task_dispatcher.SessionLocal"):
+            delay = dispatcher._drain()
+
+        self.assertEqual(service.dispatch_due.call_count, 3)
+        self.assertAlmostEqual(delay, 60, delta=1)
+
+    def test_sleeps_indefinitely_without_enabled_tasks(self) -> None:
+        service = MagicMock()
+        service.dispatch_due.return_value = ScheduledTaskDispatchResponse(dispatched=0)
+        service.next_due_at.return_value = None
+        dispatcher = self._dispatcher(service)
+
+        with patch("app.services.scheduled_task_dispatcher.SessionLocal"):
+            self.assertEqual(dispatcher._drain(), float("inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
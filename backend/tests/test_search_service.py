@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.services.search_service import (
+    SearchService,
+    build_snippet,
+    find_highlights,
+)
+
+
+class SearchHighlightTests(unittest.TestCase):
+    def test_find_highlights_is_case_insensitive(self) -> None:
+        highlights = find_highlights("Deploy the deploy script", "deploy")
+
+        self.assertEqual([(h.start, h.end) for h in highlights], [(0, 6), (11, 17)])
+
+    def test_query_is_matched_literally(self) -> None:
+        self.assertEqual(find_highlights("a.b axb", "a.b")[0].end, 3)
+        self.assertEqual(len(find_highlights("a.b axb", "a.b")), 1)
+
+    def test_short_text_is_returned_whole(self) -> None:
+        snippet, highlights = build_snippet("fix the bug", "bug")
+
+        self.assertEqual(snippet, "fix the bug")
+        self.assertEqual((highlights[0].start, highlights[0].end), (8, 11))
+
+    def test_snippet_windows_around_first_match(self) -> None:
+        text = "x" * 300 + "needle" + "y" * 300
+
+        snippet, highlights = build_snippet(text, "NEEDLE")
+
+        self.assertTrue(snippet.startswith("…"))
+        self.assertTrue(snippet.endswith("…"))
+        self.assertEqual(len(highlights), 1)
+        start, end = highlights[0].start, highlights[0].end
+        self.assertEqual(snippet[start:end], "needle")
+
+
+class SearchServiceTests(unittest.TestCase):
+    def test_short_queries_skip_message_search(self) -> None:
+        with patch("app.services.search_service.SearchRepository") as repo:
+            repo.search_sessions_by_title.return_value = []
+            repo.search_projects_by_name.return_value = []
+            repo.search_messages_by_preview.return_value = []
+
+            SearchService().search(MagicMock(), user_id="u-1", query=" ab ")
+            repo.search_messages_by_preview.assert_not_called()
+            repo.search_sessions_by_title.assert_called_once()
+
+            SearchService().search(MagicMock(), user_id="u-1", query="abc")
+            repo.search_messages_by_preview.assert_called_once()
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import unittest
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from app.services.session_event_service import (
+    ALL_EVENT_KINDS,
+    EVENT_MESSAGES,
+    EVENT_STATE,
+    SessionEventBroker,
+    SessionEventCursor,
+    SessionEventStreamService,
+    format_sse,
+)
+
+
+class SessionEventCursorTests(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        cursor = SessionEventCursor(
+            message_id=42,
+            tool_updated_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+            tool_id=uuid.uuid4(),
+        )
+
+        self.assertEqual(SessionEventCursor.decode(cursor.encode()), cursor)
+
+    def test_missing_or_invalid_cursor_starts_at_the_tail(self) -> None:
+        self.assertIsNone(SessionEventCursor.decode("abc|x|y"))
+        self.assertIsNone(SessionEventCursor.decode(None))
+
+    def test_format_sse_splits_multiline_data(self) -> None:
+        self.assertEqual(
+            format_sse("state", "a\nb", "7||"),
+            "id: 7||\nevent: state\ndata: a\ndata: b\n\n",
+        )
+
+
+class SessionEventBrokerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_dispatch_wakes_only_matching_session(self) -> None:
+        broker = SessionEventBroker()
+        with (
+            broker.subscribe("s1") as first,
+            broker.subscribe("s2") as second,
+        ):
+            broker._dispatch(json.dumps({"session_id": "s1", "kinds": ["state"]}))
+
+            self.assertEqual(await first.wait(1), {EVENT_STATE})
+            self.assertEqual(await second.wait(0.05), set())
+
+    async def test_invalid_payload_is_ignored(self) -> None:
+        broker = SessionEventBroker()
+        with broker.subscribe("s1") as subscription:
+            broker._dispatch("not json")
+
+            self.assertEqual(await subscription.wait(0.05), set())
+
+
+class SessionEventStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def _run(self, cursor: SessionEventCursor | None):
+        service = SessionEventStreamService()
+        session_id = uuid.uuid4()
+        calls: list[tuple[set[str], bool]] = []
+
+        def fake_collect(_session_id, *, cursor, kinds, last_sent, emit=True):
+            calls.append((set(kinds), emit))
+            cursor.message_id += 1
+            return [(EVENT_MESSAGES, "{}")] if emit else []
+
+        broker = SessionEventBroker()
+        with (
+            patch.object(service, "_collect", side_effect=fake_collect),
+            patch("app.services.session_event_service.session_event_broker", broker),
+        ):
+            stream = service.stream(session_id, cursor=cursor)
+            self.assertTrue((await anext(stream)).startswith("retry:"))
+            sent: list[str] = []
+            if cursor is not None:
+                sent.append(await anext(stream))
+
+            next_event = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.05)
+            broker.publish_local(str(session_id), {EVENT_MESSAGES})
+            sent.append(await asyncio.wait_for(next_event, 2))
+            await stream.aclose()
+        return calls, sent
+
+    async def test_resumed_stream_announces_changes_then_pushed_ones(self) -> None:
+        calls, sent = await self._run(SessionEventCursor(message_id=5))
+
+        self.assertIn("id: 6||", sent[0])
+        self.assertIn("id: 7||", sent[1])
+        self.assertEqual(
+            calls, [(set(ALL_EVENT_KINDS), True), ({EVENT_MESSAGES}, True)]
+        )
+
+    async def test_first_connection_starts_at_the_tail(self) -> None:
+        calls, sent = await self._run(None)
+
+        self.assertEqual(len(sent), 1)
+        self.assertIn("id: 2||", sent[0])
+        self.assertEqual(
+            calls, [(set(ALL_EVENT_KINDS), False), ({EVENT_MESSAGES}, True)]
+        )
@@ -0,0 +1,107 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from app.services.auth_service import AuthService
+from app.services.session_token_cache import SessionTokenCache
+
+
+def _cache(ttl_seconds: int = 60, max_entries: int = 100) -> SessionTokenCache:
+    with patch(
+        "app.services.session_token_cache.get_settings",
+        return_value=MagicMock(
+            auth_session_cache_ttl_seconds=ttl_seconds,
+            auth_session_cache_max_entries=max_entries,
+        ),
+    ):
+        return SessionTokenCache()
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+class SessionTokenCacheTests(unittest.TestCase):
+    def test_entries_expire_with_the_session(self) -> None:
+        cache = _cache()
+        cache.put("live", "user-1", _in(3600))
+        cache.put("expired", "user-2", _in(-1))
+
+        self.assertEqual(cache.get("live"), "user-1")
+        self.assertIsNone(cache.get("expired"))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = _cache(max_entries=2)
+        cache.put("a", "user-a", _in(3600))
+        cache.put("b", "user-b", _in(3600))
+        cache.get("a")
+        cache.put("c", "user-c", _in(3600))
+
+        self.assertEqual(cache.get("a"), "user-a")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "user-c")
+
+    def test_revoked_token_is_not_cached_again(self) -> None:
+        cache = _cache()
+        cache.put("token", "user-1", _in(3600))
+        cache.handle_notification("token")
+        # A lookup that read the session before the logout committed.
+        cache.put("token", "user-1", _in(3600))
+
+        self.assertIsNone(cache.get("token"))
+
+    def test_listener_reconnect_clears_cache(self) -> None:
+        cache = _cache()
+        cache.put("token", "user-1", _in(3600))
+        cache.handle_notification(None)
+
+        self.assertIsNone(cache.get("token"))
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        cache = _cache(ttl_seconds=0)
+        cache.put("token", "user-1", _in(3600))
+
+        self.assertIsNone(cache.get("token"))
+
+
+class AuthenticateSessionUserIdTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = _cache()
+        patcher = patch("app.services.auth_service.session_token_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = AuthService()
+        self.db = MagicMock()
+
+    def test_repeated_requests_hit_the_database_once(self) -> None:
+        user_session = MagicMock(user_id="user-1", expires_at=_in(3600))
+        with patch(
+            "app.services.auth_service.UserSessionRepository.get_active_by_token_hash",
+            return_value=user_session,
+        ) as lookup:
+            first = self.service.authenticate_session_user_id(self.db, "token")
+            second = self.service.authenticate_session_user_id(self.db, "token")
+
+        self.assertEqual((first, second), ("user-1", "user-1"))
+        lookup.assert_called_once()
+
+    def test_logout_evicts_cached_token(self) -> None:
+        user_session = MagicMock(user_id="user-1", expires_at=_in(3600))
+        with (
+            patch(
+                "app.services.auth_service.UserSessionRepository.get_active_by_token_hash",
+                side_effect=[user_session, None],
+            ),
+            patch(
+                "app.services.auth_service.UserSessionRepository.revoke_by_token_hash"
+            ),
+        ):
+            self.service.authenticate_session_user_id(self.db, "token")
+            self.service.logout(self.db, "token")
+            after_logout = self.service.authenticate_session_user_id(self.db, "token")
+
+        self.assertIsNone(after_logout)
+
+
+if __name__ == "__main__":
+    unittest.main()
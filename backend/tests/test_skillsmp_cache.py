@@ -0,0 +1,155 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from app.schemas.skill_marketplace import SkillsMpSearchResponse
+from app.services import skillsmp_service as skillsmp_module
+from app.services.skillsmp_cache import CachedSkillsMpResponse, SkillsMpResponseCache
+from app.services.skillsmp_service import SkillsMpService
+
+_KEY = ("/api/v1/skills/search", "pdf", 1, 12, "stars")
+
+
+def _page(total: int) -> SkillsMpSearchResponse:
+    return SkillsMpSearchResponse(
+        items=[], page=1, page_size=12, total=total, total_pages=1, has_next=False
+    )
+
+
+def _cache(ttl: float = 60, stale: float = 600) -> SkillsMpResponseCache:
+    with patch(
+        "app.services.skillsmp_cache.get_settings",
+        return_value=MagicMock(
+            skillsmp_cache_ttl_seconds=ttl, skillsmp_cache_stale_seconds=stale
+        ),
+    ):
+        return SkillsMpResponseCache()
+
+
+class SkillsMpResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_identical_queries_share_one_request(self) -> None:
+        cache = _cache()
+        calls = 0
+
+        async def fetch(cached):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return CachedSkillsMpResponse(value=_page(calls))
+
+        results = await asyncio.gather(*(cache.get(_KEY, fetch) for _ in range(5)))
+
+        self.assertEqual(calls, 1)
+        self.assertEqual({r.total for r in results}, {1})
+        await cache.get(_KEY, fetch)
+        self.assertEqual(calls, 1)
+
+    async def test_stale_entry_is_served_while_revalidating(self) -> None:
+        cache = _cache()
+        seen: list[CachedSkillsMpResponse | None] = []
+
+        async def fetch(cached):
+            seen.append(cached)
+            if cached is None:
+                return CachedSkillsMpResponse(value=_page(7), etag='"v1"')
+            return None
+
+        with patch("app.services.skillsmp_cache.time.monotonic", return_value=0):
+            await cache.get(_KEY, fetch)
+        with patch("app.services.skillsmp_cache.time.monotonic", return_value=120):
+            stale = await cache.get(_KEY, fetch)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            fresh = await cache.get(_KEY, fetch)
+
+        self.assertEqual((stale.total, fresh.total), (7, 7))
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(seen[1].etag, '"v1"')
+
+    async def test_expired_entry_is_served_when_upstream_fails(self) -> None:
+        cache = _cache()
+
+        async def first(cached):
+            return CachedSkillsMpResponse(value=_page(3))
+
+        async def failing(cached):
+            raise RuntimeError("upstream down")
+
+        with patch("app.services.skillsmp_cache.time.monotonic", return_value=0):
+            await cache.get(_KEY, first)
+        with patch("app.services.skillsmp_cache.time.monotonic", return_value=10_000):
+            result = await cache.get(_KEY, failing)
+
+        self.assertEqual(result.total, 3)
+
+
+class SkillsMpConditionalRequestTests(unittest.IsolatedAsyncioTestCase):
+    async def test_validators_are_sent_and_304_keeps_the_entry(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"data": {"skills": [], "pagination": {"total": 0}}},
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 19 Oct 2026"},
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(client.aclose)
+        service = SkillsMpService()
+        with patch.object(
+            skillsmp_module._shared_http_client, "get", return_value=client
+        ):
+            kwargs = {
+                "url": "https://skillsmp.test/api/v1/skills/search",
+                "params": {"q": "pdf"},
+                "headers": {},
+                "page": 1,
+                "page_size": 12,
+            }
+            first = await service._fetch_skills(cached=None, **kwargs)
+            second = await service._fetch_skills(cached=first, **kwargs)
+
+        self.assertEqual(first.etag, '"v1"')
+        self.assertIsNone(second)
+        self.assertEqual(requests[1].headers["If-Modified-Since"], "Mon, 19 Oct 2026")
+
+    async def test_cache_hit_skips_key_lookup_and_whitespace_is_collapsed(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, json={"data": {"skills": [], "pagination": {"total": 0}}}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(client.aclose)
+        service = SkillsMpService()
+        service._resolve_base_url = lambda: "https://skillsmp.test"
+        service._resolve_api_key = MagicMock(return_value="key")
+        with (
+            patch.object(
+                skillsmp_module._shared_http_client, "get", return_value=client
+            ),
+            patch.object(skillsmp_module, "SessionLocal"),
+            patch.object(skillsmp_module, "skillsmp_response_cache", _cache()),
+        ):
+            await service.search(user_id="u-1", query="  PDF   Tools ")
+            await service.search(user_id="u-1", query="PDF Tools")
+            await service.search(user_id="u-1", query="pdf tools")
+
+        # Case is passed through, so differently-cased queries are separate entries.
+        self.assertEqual(
+            [r.url.params["q"] for r in requests], ["PDF Tools", "pdf tools"]
+        )
+        self.assertEqual(service._resolve_api_key.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.services import storage_service
+from app.services.storage_service import S3StorageService
+
+
+class S3StorageServiceClientReuseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        storage_service._clients.clear()
+        storage_service._presigned_url_cache.clear()
+        self.addCleanup(storage_service._clients.clear)
+        self.addCleanup(storage_service._presigned_url_cache.clear)
+
+        settings_patcher = patch(
+            "app.services.storage_service.get_settings",
+            return_value=MagicMock(
+                s3_bucket="bucket",
+                s3_endpoint="http://s3.test",
+                s3_public_endpoint=None,
+                s3_access_key="key",
+                s3_secret_key="secret",
+                s3_region="us-east-1",
+                s3_signature_version="s3v4",
+                s3_connect_timeout_seconds=5,
+                s3_read_timeout_seconds=30,
+                s3_max_attempts=3,
+                s3_max_pool_connections=10,
+                s3_force_path_style=True,
+                s3_key_prefix="",
+                s3_presign_expires=300,
+                s3_public_read=False,
+                s3_public_endpoint_bucket_bound=False,
+            ),
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+
+        patcher = patch("app.services.storage_service.boto3.client")
+        self.boto_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = MagicMock()
+        self.client.generate_presigned_url.side_effect = lambda *_args, **kwargs: (
+            f"https://s3/{kwargs['Params']['Key']}?sig=1"
+        )
+        self.boto_client.return_value = self.client
+
+    def test_services_share_one_client(self) -> None:
+        first = S3StorageService()
+        second = S3StorageService()
+
+        self.assertIs(first.client, second.client)
+        self.assertEqual(self.boto_client.call_count, 1)
+
+    def test_presigned_url_is_reused_until_near_expiry(self) -> None:
+        service = S3StorageService()
+        service.public_read = False
+
+        with patch("app.services.storage_service.time.monotonic", return_value=0):
+            url = service.presign_get("a.txt", expires_in=300)
+            self.assertEqual(service.presign_get("a.txt", expires_in=300), url)
+            service.presign_get(
+                "a.txt", expires_in=300, response_content_disposition="attachment"
+            )
+        self.assertEqual(self.client.generate_presigned_url.call_count, 2)
+
+        with patch("app.services.storage_service.time.monotonic", return_value=250):
+            service.presign_get("a.txt", expires_in=300)
+        self.assertEqual(self.client.generate_presigned_url.call_count, 3)
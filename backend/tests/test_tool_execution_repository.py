@@ -0,0 +1,107 @@
+import re
+import unittest
+import uuid
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.tool_execution_repository import ToolExecutionRepository
+
+
+def _compiled_sql(db: MagicMock) -> str:
+    stmt = db.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _conflict_target(sql: str) -> str:
+    match = re.search(r"ON CONFLICT \(([^)]*)\) DO UPDATE SET", sql)
+    assert match is not None, sql
+    return match.group(1)
+
+
+def _update_assignments(sql: str) -> dict[str, str]:
+    set_clause = sql.split("DO UPDATE SET", 1)[1]
+    return {
+        column: expression.strip()
+        for column, expression in re.findall(
+            r"(\w+) = (.+?)(?=, \w+ = |$)", set_clause.strip()
+        )
+    }
+
+
+class UpsertToolUsesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        ToolExecutionRepository.upsert_tool_uses(
+            self.db,
+            uuid.uuid4(),
+            7,
+            uuid.uuid4(),
+            {
+                "toolu_1": ("Bash", {"command": "ls"}),
+                "toolu_2": ("Read", {"path": "a.txt"}),
+            },
+        )
+        self.sql = _compiled_sql(self.db)
+
+    def test_batch_is_a_single_statement_on_session_and_tool_use_id(self) -> None:
+        self.db.execute.assert_called_once()
+        self.assertEqual(_conflict_target(self.sql), "session_id, tool_use_id")
+        self.assertIn("tool_use_id_m1", self.sql)
+
+    def test_repeated_use_keeps_recorded_result(self) -> None:
+        # A result that arrived first already filled these columns.
+        assignments = _update_assignments(self.sql)
+        for column in ("tool_output", "duration_ms", "is_error", "result_message_id"):
+            self.assertNotIn(column, assignments)
+        self.assertEqual(assignments["tool_name"], "excluded.tool_name")
+        self.assertEqual(assignments["tool_input"], "excluded.tool_input")
+        self.assertEqual(
+            assignments["run_id"],
+            "coalesce(tool_executions.run_id, excluded.run_id)",
+        )
+
+    def test_empty_batch_skips_the_database(self) -> None:
+        db = MagicMock()
+        ToolExecutionRepository.upsert_tool_uses(db, uuid.uuid4(), 7, None, {})
+        db.execute.assert_not_called()
+
+
+class UpsertToolResultsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        ToolExecutionRepository.upsert_tool_results(
+            self.db,
+            uuid.uuid4(),
+            8,
+            None,
+            {"toolu_1": ({"content": "ok"}, False)},
+        )
+        self.sql = _compiled_sql(self.db)
+
+    def test_conflict_target_is_session_and_tool_use_id(self) -> None:
+        self.db.execute.assert_called_once()
+        self.assertEqual(_conflict_target(self.sql), "session_id, tool_use_id")
+
+    def test_result_keeps_call_details_and_first_duration(self) -> None:
+        assignments = _update_assignments(self.sql)
+        # The placeholder name inserted for unseen calls must not replace a real one.
+        self.assertNotIn("tool_name", assignments)
+        self.assertNotIn("tool_input", assignments)
+        self.assertNotIn("message_id", assignments)
+        self.assertEqual(assignments["tool_output"], "excluded.tool_output")
+        self.assertEqual(assignments["result_message_id"], "excluded.result_message_id")
+        self.assertTrue(
+            assignments["duration_ms"].startswith(
+                "coalesce(tool_executions.duration_ms, "
+            )
+        )
+
+    def test_empty_batch_skips_the_database(self) -> None:
+        db = MagicMock()
+        ToolExecutionRepository.upsert_tool_results(db, uuid.uuid4(), 8, None, {})
+        db.execute.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
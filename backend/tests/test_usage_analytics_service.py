@@ -0,0 +1,186 @@
+import unittest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.errors.exceptions import AppException
+from app.services.usage_analytics_service import UsageAnalyticsService
+
+
+def _row(total: int, **extra: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        input_tokens=total - 10,
+        output_tokens=10,
+        cache_creation_input_tokens=0,
+        cache_read_input_tokens=0,
+        total_tokens=total,
+        **extra,
+    )
+
+
+class _FakeQuery:
+    """Chainable stand-in for a rollup query; answers by the bucket column added."""
+
+    def __init__(self, db: "_FakeDb") -> None:
+        self._db = db
+        self.bucket_label: str | None = None
+        self.bucket_sql: str | None = None
+        self.bounds: list[datetime] = []
+
+    def add_columns(self, column: Any) -> "_FakeQuery":
+        self.bucket_label = column.name
+        self.bucket_sql = str(
+            column.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        return self
+
+    def filter(self, criterion: Any) -> "_FakeQuery":
+        value = getattr(getattr(criterion, "right", None), "value", None)
+        if isinstance(value, datetime):
+            self.bounds.append(value)
+        return self
+
+    def group_by(self, *_: Any) -> "_FakeQuery":
+        return self
+
+    def order_by(self, *_: Any) -> "_FakeQuery":
+        return self
+
+    def all(self) -> list[SimpleNamespace]:
+        return self._db.rows_by_label[self.bucket_label]
+
+    def one(self) -> SimpleNamespace:
+        return self._db.summary_row
+
+
+class _FakeDb:
+    def __init__(
+        self,
+        *,
+        day_rows: list[SimpleNamespace],
+        hour_rows: list[SimpleNamespace],
+        summary_row: SimpleNamespace,
+    ) -> None:
+        self.rows_by_label = {"bucket_day": day_rows, "bucket_hour": hour_rows}
+        self.summary_row = summary_row
+        self.queries: list[_FakeQuery] = []
+
+    def query(self, *_: Any) -> _FakeQuery:
+        query = _FakeQuery(self)
+        self.queries.append(query)
+        return query
+
+    def bucket_query(self, label: str) -> _FakeQuery:
+        return next(q for q in self.queries if q.bucket_label == label)
+
+
+class UsageAnalyticsServiceTests(unittest.TestCase):
+    def test_month_and_day_buckets_use_local_time_of_hourly_rows(self) -> None:
+        db = _FakeDb(
+            day_rows=[
+                _row(100, bucket_day=date(2026, 3, 1)),
+                _row(250, bucket_day=datetime(2026, 3, 14)),
+            ],
+            hour_rows=[_row(250, bucket_hour=0), _row(0, bucket_hour=9.0)],
+            summary_row=_row(350),
+        )
+
+        result = UsageAnalyticsService().get_user_usage_analytics(
+            db,  # type: ignore[arg-type]
+            "user-1",
+            target_month=date(2026, 3, 20),
+            target_day=None,
+            timezone_name="Asia/Shanghai",
+        )
+
+        month_query = db.bucket_query("bucket_day")
+        self.assertEqual(
+            month_query.bounds,
+            [
+                datetime(2026, 2, 28, 16, tzinfo=timezone.utc),
+                datetime(2026, 3, 31, 16, tzinfo=timezone.utc),
+            ],
+        )
+        self.assertIn(
+            "timezone('Asia/Shanghai', usage_hourly_rollups.bucket_start)",
+            month_query.bucket_sql,
+        )
+        self.assertEqual(result.month, "2026-03")
+        self.assertEqual(len(result.month_view.buckets), 31)
+        by_day = {b.bucket_id: b.total_tokens for b in result.month_view.buckets}
+        self.assertEqual(by_day["2026-03-01"], 100)
+        self.assertEqual(by_day["2026-03-14"], 250)
+        self.assertEqual(by_day["2026-03-02"], 0)
+
+        # Without an explicit day, the latest day with usage is shown.
+        self.assertEqual(result.day, "2026-03-14")
+        day_query = db.bucket_query("bucket_hour")
+        self.assertEqual(
+            day_query.bounds,
+            [
+                datetime(2026, 3, 13, 16, tzinfo=timezone.utc),
+                datetime(2026, 3, 14, 16, tzinfo=timezone.utc),
+            ],
+        )
+        self.assertEqual(len(result.day_view.buckets), 24)
+        self.assertEqual(result.day_view.buckets[0].bucket_id, "2026-03-14T00:00")
+        self.assertEqual(result.day_view.buckets[0].total_tokens, 250)
+        self.assertEqual(result.day_view.buckets[1].total_tokens, 0)
+        self.assertEqual(result.summary.all_time.total_tokens, 350)
+
+    def test_summaries_bound_month_and_day_but_not_all_time(self) -> None:
+        db = _FakeDb(day_rows=[], hour_rows=[], summary_row=_row(42))
+
+        result = UsageAnalyticsService().get_user_usage_analytics(
+            db,  # type: ignore[arg-type]
+            "user-1",
+            target_month=date(2026, 1, 1),
+            target_day=date(2026, 1, 5),
+            timezone_name="America/New_York",
+        )
+
+        summary_queries = [q for q in db.queries if q.bucket_label is None]
+        self.assertEqual(
+            [q.bounds for q in summary_queries],
+            [
+                [
+                    datetime(2026, 1, 1, 5, tzinfo=timezone.utc),
+                    datetime(2026, 2, 1, 5, tzinfo=timezone.utc),
+                ],
+                [
+                    datetime(2026, 1, 5, 5, tzinfo=timezone.utc),
+                    datetime(2026, 1, 6, 5, tzinfo=timezone.utc),
+                ],
+                [],
+            ],
+        )
+        self.assertEqual(result.summary.month.total_tokens, 42)
+        self.assertEqual(result.day, "2026-01-05")
+
+    def test_day_outside_month_is_rejected(self) -> None:
+        with self.assertRaises(AppException):
+            UsageAnalyticsService().get_user_usage_analytics(
+                _FakeDb(day_rows=[], hour_rows=[], summary_row=_row(0)),  # type: ignore[arg-type]
+                "user-1",
+                target_month=date(2026, 3, 1),
+                target_day=date(2026, 4, 1),
+                timezone_name="UTC",
+            )
+
+    def test_unknown_timezone_is_rejected(self) -> None:
+        with self.assertRaises(AppException):
+            UsageAnalyticsService().get_user_usage_analytics(
+                _FakeDb(day_rows=[], hour_rows=[], summary_row=_row(0)),  # type: ignore[arg-type]
+                "user-1",
+                target_month=None,
+                target_day=None,
+                timezone_name="Mars/Olympus_Mons",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.usage_hourly_rollup_repository import (
+    UsageHourlyRollupRepository,
+)
+
+_TOKEN_COLUMNS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "total_tokens",
+)
+
+
+class AddUsageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        UsageHourlyRollupRepository.add_usage(
+            self.db,
+            user_id="user-1",
+            input_tokens=120,
+            output_tokens=30,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=5,
+            total_tokens=155,
+        )
+        self.db.execute.assert_called_once()
+        self.compiled = self.db.execute.call_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+        # Newer SQLAlchemy versions render explicit casts on bound parameters.
+        self.sql = re.sub(r"::\w+", "", str(self.compiled))
+
+    def _assignments(self) -> dict[str, str]:
+        set_clause = self.sql.split("DO UPDATE SET", 1)[1].strip()
+        return {
+            column: (
+                expression[1:-1]
+                if expression.startswith("(") and expression.endswith(")")
+                else expression
+            )
+            for column, expression in re.findall(
+                r"(\w+) = (.+?)(?=, \w+ = | RETURNING |$)", set_clause
+            )
+        }
+
+    def test_conflicts_on_user_and_hour_bucket(self) -> None:
+        self.assertIn("ON CONFLICT (user_id, bucket_start) DO UPDATE SET", self.sql)
+        # The bucket is the UTC hour of the transaction clock.
+        self.assertIn(
+            "timezone(%(timezone_1)s, date_trunc(%(date_trunc_1)s, "
+            "timezone(%(timezone_2)s, now())))",
+            self.sql,
+        )
+        self.assertEqual(self.compiled.params["date_trunc_1"], "hour")
+
+    def test_inserts_one_log_with_missing_counts_as_zero(self) -> None:
+        params = self.compiled.params
+        self.assertEqual(params["user_id"], "user-1")
+        self.assertEqual(params["log_count"], 1)
+        self.assertEqual(params["input_tokens"], 120)
+        self.assertEqual(params["cache_creation_input_tokens"], 0)
+        self.assertEqual(params["total_tokens"], 155)
+
+    def test_conflict_adds_to_existing_totals(self) -> None:
+        assignments = self._assignments()
+        for column in _TOKEN_COLUMNS:
+            self.assertEqual(
+                assignments[column],
+                f"usage_hourly_rollups.{column} + excluded.{column}",
+            )
+        self.assertEqual(
+            assignments["log_count"], "usage_hourly_rollups.log_count + %(log_count_1)s"
+        )
+        self.assertEqual(self.compiled.params["log_count_1"], 1)
+        self.assertEqual(assignments["updated_at"], "now()")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.schemas.user_input_request import UserInputRequestResponse
+from app.services.user_input_request_service import (
+    UserInputRequestService,
+    answer_notifier,
+)
+
+
+def _response(request_id, status: str) -> UserInputRequestResponse:
+    now = datetime.now(UTC)
+    return UserInputRequestResponse(
+        id=request_id,
+        session_id=uuid4(),
+        tool_name="AskUserQuestion",
+        tool_input={},
+        status=status,
+        answers={"q": "a"} if status == "answered" else None,
+        expires_at=now + timedelta(seconds=60),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class UserInputRequestWaitTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.service = UserInputRequestService()
+        self.db = MagicMock()
+        self.request_id = uuid4()
+
+    async def test_wait_returns_immediately_when_already_answered(self) -> None:
+        with patch.object(
+            UserInputRequestService,
+            "get_request",
+            return_value=_response(self.request_id, "answered"),
+        ) as get_request:
+            result = await self.service.wait_for_answer(
+                self.db, str(self.request_id), timeout_seconds=5
+            )
+
+        self.assertEqual(result.status, "answered")
+        get_request.assert_called_once()
+        self.db.rollback.assert_not_called()
+
+    async def test_wait_wakes_on_answer_notification(self) -> None:
+        states = [
+            _response(self.request_id, "pending"),
+            _response(self.request_id, "answered"),
+        ]
+        with patch.object(UserInputRequestService, "get_request", side_effect=states):
+            waiter = asyncio.create_task(
+                self.service.wait_for_answer(
+                    self.db, str(self.request_id), timeout_seconds=30
+                )
+            )
+            await asyncio.sleep(0.05)
+            started = asyncio.get_running_loop().time()
+            answer_notifier.notify(str(self.request_id))
+            result = await asyncio.wait_for(waiter, timeout=2)
+
+        self.assertEqual(result.status, "answered")
+        self.assertLess(asyncio.get_running_loop().time() - started, 1)
+        self.db.rollback.assert_called_once()
+
+    async def test_wait_gives_up_after_timeout(self) -> None:
+        with patch.object(
+            UserInputRequestService,
+            "get_request",
+            return_value=_response(self.request_id, "pending"),
+        ):
+            result = await self.service.wait_for_answer(
+                self.db, str(self.request_id), timeout_seconds=0.05
+            )
+
+        self.assertEqual(result.status, "pending")
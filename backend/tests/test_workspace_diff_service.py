@@ -0,0 +1,61 @@
+import io
+import json
+import unittest
+from urllib.error import HTTPError
+from unittest.mock import MagicMock, patch
+
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.services.workspace_diff_service import WorkspaceDiffService
+
+
+def _http_error(status: int, body: dict) -> HTTPError:
+    return HTTPError(
+        "http://manager.test",
+        status,
+        "error",
+        {},
+        io.BytesIO(json.dumps(body).encode("utf-8")),
+    )
+
+
+class WorkspaceDiffServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch(
+            "app.services.workspace_diff_service.get_settings",
+            return_value=MagicMock(executor_manager_url="http://manager.test"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = WorkspaceDiffService()
+
+    def test_returns_manager_payload(self) -> None:
+        response = MagicMock()
+        response.read.return_value = json.dumps(
+            {"code": 0, "data": {"path": "a.py", "staged": True, "diff": "+x"}}
+        ).encode("utf-8")
+        response.__enter__.return_value = response
+        with patch(
+            "app.services.workspace_diff_service.urlopen", return_value=response
+        ) as urlopen:
+            result = self.service.get_file_diff(
+                session_id="s-1", path="src/a b.py", staged=True
+            )
+
+        self.assertEqual(result["diff"], "+x")
+        url = urlopen.call_args.args[0].full_url
+        self.assertIn("/api/v1/workspace/diff/s-1?", url)
+        self.assertIn("path=src%2Fa+b.py", url)
+        self.assertIn("staged=true", url)
+
+    def test_stopped_executor_maps_to_not_found(self) -> None:
+        error = _http_error(400, {"code": 31002, "message": "No running executor"})
+        with patch("app.services.workspace_diff_service.urlopen", side_effect=error):
+            with self.assertRaises(AppException) as ctx:
+                self.service.get_file_diff(session_id="s-1", path="a.py")
+
+        self.assertEqual(ctx.exception.error_code, ErrorCode.NOT_FOUND)
+
+
+if __name__ == "__main__":
+    unittest.main()
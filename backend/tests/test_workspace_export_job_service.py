@@ -0,0 +1,92 @@
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+from app.services.workspace_export_job_service import WorkspaceExportJobService
+
+MODULE = "app.services.workspace_export_job_service"
+
+
+class WorkspaceExportJobServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.session = MagicMock(
+            is_deleted=False,
+            status="completed",
+            workspace_export_status="ready",
+            workspace_manifest_key="ws/manifest.json",
+            workspace_files_prefix="ws/files",
+        )
+        self.db.get.return_value = self.session
+        self.pending_service = MagicMock()
+        self.service = WorkspaceExportJobService(
+            pending_skill_creation_service=self.pending_service
+        )
+        self.service.settings = MagicMock(background_job_max_attempts=3)
+        self.job = MagicMock(
+            id=uuid.uuid4(),
+            session_id=uuid.uuid4(),
+            status="running",
+            generation=3,
+            attempt_count=1,
+        )
+        for target, attr in (
+            ("SessionLocal", "session_local"),
+            ("WorkspaceExportJobRepository", "repository"),
+            ("workspace_manifest_service", "manifest_service"),
+        ):
+            patcher = patch(f"{MODULE}.{target}")
+            setattr(self, attr, patcher.start())
+            self.addCleanup(patcher.stop)
+        self.session_local.return_value = self.db
+        self.repository.get_by_id.return_value = self.job
+
+    def test_terminal_session_stores_manifest_and_detects_skills(self) -> None:
+        self.service.process_job(self.job.id)
+
+        self.manifest_service.refresh.assert_called_once_with(
+            self.db, "ws/manifest.json"
+        )
+        self.pending_service.detect_and_create_pending.assert_called_once_with(
+            self.db, session=self.session
+        )
+        self.repository.mark_done.assert_called_once_with(
+            self.db, job_id=self.job.id, generation=3
+        )
+        self.db.commit.assert_called_once()
+
+    def test_running_session_only_stores_manifest(self) -> None:
+        self.session.status = "running"
+
+        self.service.process_job(self.job.id)
+
+        self.manifest_service.refresh.assert_called_once()
+        self.pending_service.detect_and_create_pending.assert_not_called()
+        self.repository.mark_done.assert_called_once()
+
+    def test_failure_is_rolled_back_and_retried(self) -> None:
+        self.manifest_service.refresh.side_effect = RuntimeError("s3 down")
+
+        self.service.process_job(self.job.id)
+
+        self.db.rollback.assert_called_once()
+        self.repository.mark_done.assert_not_called()
+        kwargs = self.repository.mark_retry.call_args.kwargs
+        self.assertEqual(kwargs["error_message"], "s3 down")
+        self.assertFalse(kwargs["give_up"])
+
+    def test_last_attempt_gives_up(self) -> None:
+        self.job.attempt_count = 3
+        self.manifest_service.refresh.side_effect = RuntimeError("s3 down")
+
+        self.service.process_job(self.job.id)
+
+        self.assertTrue(self.repository.mark_retry.call_args.kwargs["give_up"])
+
+    def test_job_no_longer_running_is_skipped(self) -> None:
+        self.job.status = "done"
+
+        self.service.process_job(self.job.id)
+
+        self.manifest_service.refresh.assert_not_called()
+        self.repository.mark_done.assert_not_called()
@@ -0,0 +1,86 @@
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from app.services.workspace_manifest_service import WorkspaceManifestService
+from app.utils.workspace_manifest import list_folder_nodes
+
+MANIFEST = {
+    "files": [
+        {"path": "README.md", "key": "ws/files/README.md"},
+        {"path": "src/app.py", "key": "ws/files/src/app.py"},
+        {"path": "src/lib/util.py", "key": "ws/files/src/lib/util.py"},
+        {"path": "docs/guide.md", "key": "ws/files/docs/guide.md"},
+    ]
+}
+
+REPOSITORY = "app.services.workspace_manifest_service.WorkspaceManifestRepository"
+
+
+class ListFolderNodesTests(unittest.TestCase):
+    def test_root_lists_folders_first_without_children(self) -> None:
+        nodes = list_folder_nodes(MANIFEST, "/")
+
+        self.assertEqual(
+            [(n["type"], n["path"]) for n in nodes],
+            [("folder", "/docs"), ("folder", "/src"), ("file", "/README.md")],
+        )
+        self.assertNotIn("children", nodes[0])
+
+    def test_nested_folder(self) -> None:
+        nodes = list_folder_nodes(MANIFEST, "src")
+
+        self.assertEqual([n["path"] for n in nodes], ["/src/lib", "/src/app.py"])
+
+
+class WorkspaceManifestServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = MagicMock()
+        self.storage.presign_get.side_effect = lambda key, **_: f"https://s3/{key}"
+        self.service = WorkspaceManifestService(storage_service=self.storage)
+        self.db = MagicMock()
+
+    def test_content_is_reused_while_version_is_unchanged(self) -> None:
+        version = datetime(2026, 1, 1, tzinfo=UTC)
+        row = MagicMock(updated_at=version, content=MANIFEST)
+        with patch(REPOSITORY) as repository:
+            repository.get_version.return_value = version
+            repository.get_by_key.return_value = row
+
+            self.service.get_manifest(self.db, "ws/manifest.json")
+            self.service.get_manifest(self.db, "ws/manifest.json")
+            self.assertEqual(repository.get_by_key.call_count, 1)
+
+            repository.get_version.return_value = datetime(2026, 1, 2, tzinfo=UTC)
+            self.service.get_manifest(self.db, "ws/manifest.json")
+            self.assertEqual(repository.get_by_key.call_count, 2)
+
+        self.storage.get_manifest.assert_not_called()
+
+    def test_missing_row_is_backfilled_from_storage(self) -> None:
+        self.storage.get_manifest.return_value = MANIFEST
+        with (
+            patch(REPOSITORY) as repository,
+            patch("app.services.workspace_manifest_service.SessionLocal"),
+        ):
+            repository.get_version.return_value = None
+
+            self.assertEqual(
+                self.service.get_manifest(self.db, "ws/manifest.json"), MANIFEST
+            )
+            self.assertFalse(repository.upsert.call_args.kwargs["overwrite"])
+
+    def test_folder_page_only_signs_listed_files(self) -> None:
+        with patch.object(self.service, "get_manifest", return_value=MANIFEST):
+            nodes = self.service.build_file_nodes(
+                self.db,
+                manifest_key="ws/manifest.json",
+                workspace_files_prefix="ws/files",
+                folder_path="/src",
+                limit=1,
+                offset=1,
+            )
+
+        self.assertEqual([n.path for n in nodes], ["/src/app.py"])
+        self.assertEqual(nodes[0].url, "https://s3/ws/files/src/app.py")
+        self.assertEqual(self.storage.presign_get.call_count, 1)
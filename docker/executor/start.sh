@@ -54,6 +54,42 @@ else
   fi
 fi
 
+start_playwright_mcp() {
+  local enabled="${POCO_BROWSER_ENABLED:-false}"
+  if [ "${enabled}" != "1" ] && [ "${enabled}" != "true" ] && [ "${enabled}" != "yes" ]; then
+    return 0
+  fi
+  if [ -z "${PLAYWRIGHT_MCP_BIN:-}" ] || [ ! -x "${PLAYWRIGHT_MCP_BIN}" ]; then
+    echo "Playwright MCP not pre-installed; browser runs will launch it on demand"
+    return 0
+  fi
+
+  local port="${POCO_PLAYWRIGHT_MCP_PORT:-8931}"
+  local cdp_endpoint="${POCO_BROWSER_CDP_ENDPOINT:-http://127.0.0.1:9222}"
+  local output_mode="${PLAYWRIGHT_MCP_OUTPUT_MODE:-file}"
+  local image_responses="${PLAYWRIGHT_MCP_IMAGE_RESPONSES:-omit}"
+  local cmd
+  # The server attaches to Chrome over CDP lazily on the first browser tool call,
+  # so it can start before Chrome is ready.
+  cmd="$(printf '%q ' "${PLAYWRIGHT_MCP_BIN}" \
+    --host 127.0.0.1 --port "${port}" \
+    --cdp-endpoint "${cdp_endpoint}" \
+    --caps vision \
+    --viewport-size "${POCO_BROWSER_VIEWPORT_SIZE:-1366x768}" \
+    --output-mode "${output_mode}" \
+    --image-responses "${image_responses}")"
+
+  echo "Starting Playwright MCP on 127.0.0.1:${port}..."
+  if command -v su >/dev/null 2>&1; then
+    su ubuntu -c "${cmd}" &
+  else
+    bash -c "${cmd}" &
+  fi
+  export POCO_PLAYWRIGHT_MCP_URL="http://127.0.0.1:${port}/mcp"
+}
+
+start_playwright_mcp
+
 echo "Starting Executor API server on port 8000..."
 cd /app
 if command -v su >/dev/null 2>&1; then
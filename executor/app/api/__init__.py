@@ -1 +1,2 @@
+from app.api.v1.diagnostics import router as diagnostics_router  # noqa: F401
 from app.api.v1.task import router as task_router  # noqa: F401
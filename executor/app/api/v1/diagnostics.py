@@ -0,0 +1,88 @@
+import os
+import resource
+import tracemalloc
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.core.workspace import get_active_work_path
+from app.utils.git.operations import GitError, diff
+
+router = APIRouter(prefix="/v1")
+
+
+def _current_rss_bytes() -> int | None:
+    # /proc is only available on Linux, which is what executor containers run.
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@router.get("/diagnostics/memory")
+async def memory_report(
+    top: int = Query(default=20, ge=1, le=200),
+    start_tracing: bool = Query(default=False),
+) -> dict:
+    """Report process memory and, when tracemalloc is tracing, the top allocation sites.
+
+    Tracing is off by default because it slows allocation; enable it with
+    PYTHONTRACEMALLOC or by calling this endpoint once with `start_tracing=true`.
+    """
+    if start_tracing and not tracemalloc.is_tracing():
+        tracemalloc.start(10)
+
+    report: dict = {
+        "rss_bytes": _current_rss_bytes(),
+        # ru_maxrss is reported in KiB on Linux.
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "tracing": tracemalloc.is_tracing(),
+    }
+    if not tracemalloc.is_tracing():
+        return report
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    report["traced_current_bytes"] = current
+    report["traced_peak_bytes"] = peak
+    report["top_allocations"] = [
+        {
+            "location": str(stat.traceback[0]),
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return report
+
+
+@router.get("/workspace/diff")
+async def workspace_file_diff(
+    path: str = Query(..., min_length=1),
+    staged: bool = Query(default=False),
+    repo_dir: str | None = Query(default=None),
+) -> dict:
+    """Return the full diff of one file when the state only carries a truncated copy.
+
+    Paths are relative to the current run's repository unless `repo_dir` (relative
+    to the workspace root) is given.
+    """
+    root = Path(os.environ.get("WORKSPACE_PATH", "/workspace")).resolve()
+    if repo_dir:
+        cwd = (root / repo_dir).resolve()
+    else:
+        cwd = (get_active_work_path() or root).resolve()
+    if cwd != root and root not in cwd.parents:
+        raise HTTPException(status_code=400, detail="repo_dir must be inside workspace")
+    try:
+        content = diff(file=path, cwd=cwd, cached=staged)
+    except GitError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"path": path, "staged": staged, "diff": content}
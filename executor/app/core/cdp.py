@@ -0,0 +1,147 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+import httpx  # pyrefly: ignore[missing-import]
+import websockets  # pyrefly: ignore[missing-import]
+
+logger = logging.getLogger(__name__)
+
+
+class CdpPageSession:
+    """Long-lived Chrome DevTools Protocol connection to the active page target.
+
+    The websocket is kept open between calls and only re-established when the active
+    page changes or the connection drops. Calls are serialized by an internal lock.
+    """
+
+    def __init__(self, cdp_endpoint: str, *, call_timeout: float = 8.0) -> None:
+        self._cdp_endpoint = cdp_endpoint.rstrip("/")
+        self._call_timeout = call_timeout
+        self._http: httpx.AsyncClient | None = None
+        self._ws: Any = None
+        self._ws_url: str | None = None
+        self.target_id: str | None = None
+        self._next_id = 0
+        self._lock = asyncio.Lock()
+
+    async def _list_pages(self) -> list[dict[str, Any]]:
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=5.0)
+        resp = await self._http.get(f"{self._cdp_endpoint}/json/list")
+        resp.raise_for_status()
+        targets = resp.json()
+        if not isinstance(targets, list):
+            return []
+
+        pages: list[dict[str, Any]] = []
+        for item in targets:
+            if not isinstance(item, dict):
+                continue
+            if item.get("type") != "page":
+                continue
+            ws_url = item.get("webSocketDebuggerUrl")
+            if isinstance(ws_url, str) and ws_url.strip():
+                pages.append(item)
+        return pages
+
+    async def _resolve_page(self) -> tuple[str, str | None] | None:
+        # Prefer /json/list to get a page target (Page.captureScreenshot works on page sessions).
+        try:
+            pages = await self._list_pages()
+        except Exception:
+            return None
+        if not pages:
+            return None
+
+        def _score(page: dict[str, Any]) -> int:
+            raw_url = str(page.get("url") or "").strip()
+            if not raw_url:
+                return 0
+            if raw_url in {"about:blank", "chrome://newtab/"}:
+                return 0
+            return 1
+
+        pages.sort(key=_score, reverse=True)
+        picked = pages[0]
+        ws_url = str(picked.get("webSocketDebuggerUrl") or "").strip()
+        target_id = picked.get("id")
+        target_id = (
+            target_id.strip()
+            if isinstance(target_id, str) and target_id.strip()
+            else None
+        )
+        if not ws_url:
+            return None
+        return ws_url, target_id
+
+    async def ensure_connected(self) -> bool:
+        """Attach to the current active page, reusing the open socket when unchanged.
+
+        Returns True when a new connection was opened.
+        """
+        resolved = await self._resolve_page()
+        if not resolved:
+            await self._close_ws()
+            return False
+        ws_url, target_id = resolved
+        if self._ws is not None and ws_url == self._ws_url:
+            return False
+
+        await self._close_ws()
+        self._ws = await websockets.connect(ws_url, max_size=50 * 1024 * 1024)
+        self._ws_url = ws_url
+        self.target_id = target_id
+        return True
+
+    async def call(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        async with self._lock:
+            if self._ws is None:
+                return None
+            self._next_id += 1
+            call_id = self._next_id
+            payload: dict[str, Any] = {"id": call_id, "method": method}
+            if params is not None:
+                payload["params"] = params
+            try:
+                await self._ws.send(json.dumps(payload))
+                while True:
+                    raw = await asyncio.wait_for(
+                        self._ws.recv(), timeout=self._call_timeout
+                    )
+                    message = json.loads(raw)
+                    # Events and stale responses share the socket; skip them.
+                    if not isinstance(message, dict):
+                        continue
+                    if message.get("id") != call_id:
+                        continue
+                    if message.get("error"):
+                        return None
+                    result = message.get("result")
+                    if result is None:
+                        return {}
+                    return result if isinstance(result, dict) else {}
+            except Exception:
+                # Drop the socket so the next call reconnects from a clean state.
+                await self._close_ws()
+                return None
+
+    async def _close_ws(self) -> None:
+        ws = self._ws
+        self._ws = None
+        self._ws_url = None
+        self.target_id = None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                logger.debug("cdp_socket_close_failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        await self._close_ws()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
@@ -0,0 +1,431 @@
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from claude_agent_sdk import ClaudeAgentOptions
+from claude_agent_sdk.client import ClaudeSDKClient
+from claude_agent_sdk.types import (
+    CanUseTool,
+    HookCallback,
+    HookMatcher,
+    PermissionResultDeny,
+)
+
+logger = logging.getLogger(__name__)
+
+# Settings files the CLI only reads at startup; a change means the process must be recycled.
+_STARTUP_SETTING_FILES = ("CLAUDE.md", "settings.json", "settings.local.json")
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = (os.environ.get(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in {"1", "true", "yes", "y", "on"}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+def build_options_fingerprint(
+    options: ClaudeAgentOptions,
+    *,
+    env_overrides: dict[str, str],
+    setting_dirs: list[Path],
+    sdk_server_bindings: dict[str, str] | None = None,
+) -> str:
+    """Hash everything that is baked into the CLI process when it starts.
+
+    Permission mode and model are deliberately excluded: they can be switched on a live
+    client through the control protocol. `can_use_tool` and hook callbacks are routed
+    to the current run by `PooledClient`, so only the hook layout is hashed.
+
+    In-process (SDK) MCP servers are live objects that a reused client keeps. They are
+    identified by `sdk_server_bindings[name]`, which must describe everything the
+    server instance is bound to, and otherwise by object identity, which recycles the
+    client whenever a new instance is passed.
+    """
+    bindings = sdk_server_bindings or {}
+    mcp_servers: dict[str, Any] = {}
+    if isinstance(options.mcp_servers, dict):
+        for name, config in options.mcp_servers.items():
+            if isinstance(config, dict) and config.get("type") == "sdk":
+                mcp_servers[name] = {
+                    "type": "sdk",
+                    "name": config.get("name"),
+                    "binding": bindings.get(name)
+                    or f"instance:{id(config.get('instance'))}",
+                }
+            else:
+                mcp_servers[name] = config
+
+    hooks = {
+        event: [
+            {
+                "matcher": matcher.matcher,
+                "hooks": len(matcher.hooks),
+                "timeout": matcher.timeout,
+            }
+            for matcher in matchers
+        ]
+        for event, matchers in (options.hooks or {}).items()
+    }
+
+    setting_mtimes: dict[str, int] = {}
+    for directory in setting_dirs:
+        for filename in _STARTUP_SETTING_FILES:
+            path = directory / filename
+            with contextlib.suppress(OSError):
+                setting_mtimes[str(path)] = path.stat().st_mtime_ns
+
+    payload = {
+        "cwd": str(options.cwd or ""),
+        "add_dirs": [str(d) for d in options.add_dirs],
+        "setting_sources": options.setting_sources,
+        "allowed_tools": options.allowed_tools,
+        "mcp_servers": mcp_servers,
+        "hooks": hooks,
+        "agents": {
+            name: dataclasses.asdict(agent)
+            for name, agent in (options.agents or {}).items()
+        },
+        "plugins": [dict(plugin) for plugin in options.plugins],
+        "env_overrides": env_overrides,
+        "setting_mtimes": setting_mtimes,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PooledClient:
+    """A connected SDK client owned by a dedicated task.
+
+    The SDK enters an anyio task group on connect that must be exited from the same
+    task, so connect/disconnect happen in `_owner` while runs only use the streams.
+    """
+
+    def __init__(
+        self, session_id: str, options: ClaudeAgentOptions, fingerprint: str
+    ) -> None:
+        self.session_id = session_id
+        self.fingerprint = fingerprint
+        self.sdk_session_id: str | None = options.resume
+        self.runs_served = 0
+        self.last_used = time.monotonic()
+        self.busy = False
+        self._run_can_use_tool: CanUseTool | None = None
+        self._run_hooks: dict[str, list[HookMatcher]] = {}
+        self.client = ClaudeSDKClient(
+            options=dataclasses.replace(
+                options,
+                can_use_tool=self._can_use_tool,
+                hooks=self._bind_hooks(options.hooks),
+            )
+        )
+        self._ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._owner: asyncio.Task[None] | None = None
+
+    async def _can_use_tool(self, tool_name, input_data, context):
+        # Permission callbacks are bound once at connect time; route them to the
+        # handler of whichever run currently holds the lease.
+        handler = self._run_can_use_tool
+        if handler is None:
+            return PermissionResultDeny(message="No active run for this session")
+        return await handler(tool_name, input_data, context)
+
+    def _bind_hooks(
+        self, hooks: dict[str, list[HookMatcher]] | None
+    ) -> dict[str, list[HookMatcher]] | None:
+        # Same as `_can_use_tool`: the CLI keeps the callbacks registered at connect,
+        # so each one forwards to the hook at the same position of the current run.
+        # The layout is part of the fingerprint, so positions line up across runs.
+        if not hooks:
+            return hooks
+        return {
+            event: [
+                dataclasses.replace(
+                    matcher,
+                    hooks=[
+                        self._route_hook(event, matcher_index, hook_index)
+                        for hook_index in range(len(matcher.hooks))
+                    ],
+                )
+                for matcher_index, matcher in enumerate(matchers)
+            ]
+            for event, matchers in hooks.items()
+        }
+
+    def _route_hook(
+        self, event: str, matcher_index: int, hook_index: int
+    ) -> HookCallback:
+        async def _hook(input_data, tool_use_id, context):
+            try:
+                hook = self._run_hooks[event][matcher_index].hooks[hook_index]
+            except (KeyError, IndexError):
+                return {"continue_": True}
+            return await hook(input_data, tool_use_id, context)
+
+        return _hook
+
+    async def start(self) -> None:
+        self._owner = asyncio.create_task(self._own())
+        await asyncio.shield(self._ready)
+
+    async def _own(self) -> None:
+        try:
+            await self.client.connect()
+        except BaseException as exc:
+            if not self._ready.done():
+                self._ready.set_exception(exc)
+            return
+        self._ready.set_result(None)
+        try:
+            await self._closing.wait()
+        finally:
+            try:
+                await self.client.disconnect()
+            except Exception:
+                logger.warning(
+                    "sdk_client_disconnect_failed",
+                    extra={"session_id": self.session_id},
+                    exc_info=True,
+                )
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._owner is not None:
+            await asyncio.gather(self._owner, return_exceptions=True)
+
+    async def prepare_run(
+        self,
+        *,
+        can_use_tool: CanUseTool | None,
+        hooks: dict[str, list[HookMatcher]] | None,
+        permission_mode: str | None,
+        model: str | None,
+    ) -> None:
+        self._run_can_use_tool = can_use_tool
+        self._run_hooks = hooks or {}
+        if self.runs_served == 0:
+            return
+        # The CLI may have moved on by itself (e.g. plan -> default after ExitPlanMode),
+        # so always re-assert the run's mode and model on a reused process.
+        if permission_mode:
+            await self.client.set_permission_mode(permission_mode)
+        if model:
+            await self.client.set_model(model)
+
+    def finish_run(self) -> None:
+        self._run_can_use_tool = None
+        self._run_hooks = {}
+        self.runs_served += 1
+        self.last_used = time.monotonic()
+
+
+@dataclasses.dataclass
+class ClientLease:
+    client: ClaudeSDKClient
+    reused: bool
+    ready_ms: int
+    pooled: PooledClient
+    # Set once the turn reached its ResultMessage; anything else (errors, cancellation)
+    # may leave unread output in the stream, so the process is dropped.
+    completed: bool = False
+
+    def mark_completed(self, sdk_session_id: str | None) -> None:
+        self.completed = True
+        if sdk_session_id:
+            self.pooled.sdk_session_id = sdk_session_id
+
+
+class SdkClientPool:
+    """Session-scoped pool that keeps the CLI process and its MCP servers alive between runs.
+
+    A pooled client is reused only when the run resumes the conversation the client is
+    already in and the options fingerprint is unchanged; otherwise it is recycled. A
+    reaper task closes clients that stay idle longer than `idle_ttl_seconds`; it runs
+    only while the pool holds clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        idle_ttl_seconds: float = 900.0,
+        max_clients: int = 4,
+    ) -> None:
+        self.enabled = enabled
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_clients = max(1, max_clients)
+        self._clients: dict[str, PooledClient] = {}
+        self._lock = asyncio.Lock()
+        self._reaper: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_env(cls) -> "SdkClientPool":
+        return cls(
+            enabled=_env_flag("SDK_CLIENT_POOL_ENABLED", True),
+            idle_ttl_seconds=_env_float("SDK_CLIENT_IDLE_TTL_SECONDS", 900.0),
+            max_clients=int(_env_float("SDK_CLIENT_POOL_MAX_SIZE", 4)),
+        )
+
+    @contextlib.asynccontextmanager
+    async def lease(
+        self,
+        session_id: str,
+        options: ClaudeAgentOptions,
+        *,
+        fingerprint: str,
+    ) -> AsyncIterator[ClientLease]:
+        started = time.perf_counter()
+        pooled, reused = await self._checkout(session_id, options, fingerprint)
+        lease = ClientLease(
+            client=pooled.client,
+            reused=reused,
+            ready_ms=int((time.perf_counter() - started) * 1000),
+            pooled=pooled,
+        )
+        keep = False
+        try:
+            await pooled.prepare_run(
+                can_use_tool=options.can_use_tool,
+                hooks=options.hooks,
+                permission_mode=options.permission_mode,
+                model=options.model,
+            )
+            yield lease
+            keep = lease.completed
+        finally:
+            pooled.finish_run()
+            await self._checkin(pooled, keep=keep)
+
+    async def _checkout(
+        self, session_id: str, options: ClaudeAgentOptions, fingerprint: str
+    ) -> tuple[PooledClient, bool]:
+        stale: list[PooledClient] = []
+        async with self._lock:
+            stale.extend(self._evict_idle_locked())
+            current = self._clients.get(session_id)
+            if current is not None and not current.busy:
+                if (
+                    self.enabled
+                    and current.fingerprint == fingerprint
+                    and current.sdk_session_id
+                    and current.sdk_session_id == options.resume
+                ):
+                    current.busy = True
+                    logger.info(
+                        "sdk_client_reused",
+                        extra={
+                            "session_id": session_id,
+                            "runs_served": current.runs_served,
+                        },
+                    )
+                    return current, True
+                self._clients.pop(session_id, None)
+                stale.append(current)
+                logger.info(
+                    "sdk_client_recycled",
+                    extra={
+                        "session_id": session_id,
+                        "fingerprint_changed": current.fingerprint != fingerprint,
+                    },
+                )
+
+        for entry in stale:
+            await entry.close()
+
+        pooled = PooledClient(session_id, options, fingerprint)
+        pooled.busy = True
+        await pooled.start()
+        return pooled, False
+
+    async def _checkin(self, pooled: PooledClient, *, keep: bool) -> None:
+        pooled.busy = False
+        to_close: list[PooledClient] = []
+        async with self._lock:
+            current = self._clients.get(pooled.session_id)
+            if (
+                not keep
+                or not self.enabled
+                or (current is not None and current is not pooled)
+            ):
+                if current is pooled:
+                    self._clients.pop(pooled.session_id, None)
+                to_close.append(pooled)
+            else:
+                self._clients[pooled.session_id] = pooled
+                to_close.extend(self._evict_overflow_locked())
+                self._ensure_reaper_locked()
+        for entry in to_close:
+            await entry.close()
+
+    def _ensure_reaper_locked(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        interval = min(max(self.idle_ttl_seconds / 4, 1.0), 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            async with self._lock:
+                expired = self._evict_idle_locked()
+                empty = not self._clients
+                if empty:
+                    self._reaper = None
+            for entry in expired:
+                logger.info(
+                    "sdk_client_idle_closed", extra={"session_id": entry.session_id}
+                )
+                await entry.close()
+            if empty:
+                return
+
+    def _evict_idle_locked(self) -> list[PooledClient]:
+        now = time.monotonic()
+        expired = [
+            session_id
+            for session_id, entry in self._clients.items()
+            if not entry.busy and now - entry.last_used > self.idle_ttl_seconds
+        ]
+        return [self._clients.pop(session_id) for session_id in expired]
+
+    def _evict_overflow_locked(self) -> list[PooledClient]:
+        evicted: list[PooledClient] = []
+        idle = sorted(
+            (entry for entry in self._clients.values() if not entry.busy),
+            key=lambda entry: entry.last_used,
+        )
+        while len(self._clients) > self.max_clients and idle:
+            entry = idle.pop(0)
+            self._clients.pop(entry.session_id, None)
+            evicted.append(entry)
+        return evicted
+
+    async def close_all(self) -> None:
+        async with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.cancel()
+            await asyncio.gather(reaper, return_exceptions=True)
+        await asyncio.gather(
+            *(entry.close() for entry in entries), return_exceptions=True
+        )
+
+
+sdk_client_pool = SdkClientPool.from_env()
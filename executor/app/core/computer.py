@@ -18,6 +18,21 @@ class ComputerClient:
     def __init__(self, base_url: str, timeout: float = 10.0) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._http: httpx.AsyncClient | None = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        # One keep-alive client per run instead of a new connection per screenshot.
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def upload_browser_screenshot(
         self,
@@ -28,32 +43,31 @@ class ComputerClient:
         png_bytes: bytes,
     ) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/computer/screenshots",
-                    data={
+            response = await self._get_http().post(
+                f"{self.base_url}/api/v1/computer/screenshots",
+                data={
+                    "session_id": session_id,
+                    "run_id": run_id or "",
+                    "tool_use_id": tool_use_id,
+                },
+                files={
+                    "file": ("screenshot.png", png_bytes, "image/png"),
+                },
+                headers={
+                    "X-Request-ID": get_request_id() or generate_request_id(),
+                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                },
+            )
+            if not response.is_success:
+                logger.warning(
+                    "computer_screenshot_upload_failed",
+                    extra={
                         "session_id": session_id,
-                        "run_id": run_id or "",
                         "tool_use_id": tool_use_id,
-                    },
-                    files={
-                        "file": ("screenshot.png", png_bytes, "image/png"),
-                    },
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                        "status_code": response.status_code,
+                        "response_text": response.text[:300],
                     },
                 )
-                if not response.is_success:
-                    logger.warning(
-                        "computer_screenshot_upload_failed",
-                        extra={
-                            "session_id": session_id,
-                            "tool_use_id": tool_use_id,
-                            "status_code": response.status_code,
-                            "response_text": response.text[:300],
-                        },
-                    )
-                return response.is_success
+            return response.is_success
         except httpx.RequestError:
             return False
@@ -17,11 +17,13 @@ from claude_agent_sdk.types import (
     HookMatcher,
     PermissionResultAllow,
     PermissionResultDeny,
+    ResultMessage,
     SdkPluginConfig,
     SyncHookJSONOutput,
 )
 from dotenv import load_dotenv
 
+from app.core.client_pool import build_options_fingerprint, sdk_client_pool
 from app.core.memory import (
     MEMORY_MCP_SERVER_KEY,
     MemoryClient,
@@ -41,14 +43,22 @@ from app.hooks.base import ExecutionContext
 from app.hooks.manager import HookManager
 from app.prompts import build_prompt_appendix
 from app.schemas.request import TaskConfig
-from app.schemas.state import BrowserState
-from app.utils.browser import format_viewport_size, parse_viewport_size
+from app.schemas.state import BrowserState, McpStatus
+from app.utils.browser import (
+    format_viewport_size,
+    parse_viewport_size,
+    wait_for_tcp_endpoint,
+)
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 _SUBAGENT_NAME_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
 _LOCAL_MOUNT_ROOT = "/workspace/.poco-local"
+PLAYWRIGHT_MCP_SERVER_KEY = "__poco_playwright"
+# Fallback package spec when the image has no pre-installed server; keep in sync with
+# PLAYWRIGHT_MCP_VERSION in docker/executor/Dockerfile.
+_DEFAULT_PLAYWRIGHT_MCP_PACKAGE = "@playwright/mcp@0.0.41"
 
 
 @contextmanager
@@ -113,6 +123,9 @@ class AgentExecutor:
 
         started = time.perf_counter()
         status = "completed"
+        client_reused = False
+        client_ready_ms: int | None = None
+        first_message_ms: int | None = None
         logger.info(
             "task_started",
             extra={
@@ -281,7 +294,10 @@ class AgentExecutor:
             mcp_servers = dict(config.mcp_config or {})
             mcp_servers = self._inject_memory_mcp(mcp_servers)
             if config.browser_enabled:
-                mcp_servers = self._inject_playwright_mcp(mcp_servers)
+                mcp_servers = self._inject_playwright_mcp(
+                    mcp_servers,
+                    prewarmed_url=await self._resolve_prewarmed_playwright_mcp(),
+                )
 
             agents: dict[str, SdkAgentDefinition] | None = None
             if config.agents:
@@ -356,10 +372,31 @@ class AgentExecutor:
                     plugins=plugins,
                 )
 
-                async with ClaudeSDKClient(options=options) as client:
-                    await client.query(prompt)
-                    async for msg in client.receive_response():
+                fingerprint = build_options_fingerprint(
+                    options,
+                    env_overrides=env_overrides,
+                    setting_dirs=[
+                        self.workspace.persistent_claude_data,
+                        Path(ctx.cwd) / ".claude",
+                    ],
+                    sdk_server_bindings=self._sdk_server_bindings(),
+                )
+                async with sdk_client_pool.lease(
+                    self.session_id, options, fingerprint=fingerprint
+                ) as lease:
+                    client_reused = lease.reused
+                    client_ready_ms = lease.ready_ms
+                    await self._refresh_mcp_status(ctx, lease.client)
+                    query_started = time.perf_counter()
+                    await lease.client.query(prompt)
+                    async for msg in lease.client.receive_response():
+                        if first_message_ms is None:
+                            first_message_ms = int(
+                                (time.perf_counter() - query_started) * 1000
+                            )
                         await self.hooks.run_on_response(ctx, msg)
+                        if isinstance(msg, ResultMessage):
+                            lease.mark_completed(msg.session_id)
 
         except Exception as e:
             status = "failed"
@@ -382,6 +419,9 @@ class AgentExecutor:
                     "sdk_session_id": self.sdk_session_id,
                     "status": status,
                     "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "sdk_client_reused": client_reused,
+                    "sdk_client_ready_ms": client_ready_ms,
+                    "first_message_ms": first_message_ms,
                 },
             )
             reset_request_id(request_id_token)
@@ -509,17 +549,62 @@ class AgentExecutor:
 
         return configs
 
-    def _inject_playwright_mcp(self, mcp_servers: dict) -> dict:
+    @staticmethod
+    async def _resolve_prewarmed_playwright_mcp() -> str | None:
+        """Return the URL of the container-level Playwright MCP server when it is up.
+
+        The browser image starts a pinned server alongside Chrome (see
+        docker/executor/start.sh) and exports POCO_PLAYWRIGHT_MCP_URL.
+        """
+        url = (os.environ.get("POCO_PLAYWRIGHT_MCP_URL") or "").strip()
+        if not url:
+            return None
+        try:
+            wait_seconds = float(
+                os.environ.get("POCO_PLAYWRIGHT_MCP_WAIT_SECONDS") or 5.0
+            )
+        except ValueError:
+            wait_seconds = 5.0
+        if await wait_for_tcp_endpoint(url, wait_seconds):
+            return url
+        logger.warning("playwright_mcp_prewarmed_unavailable", extra={"url": url})
+        return None
+
+    @staticmethod
+    async def _refresh_mcp_status(
+        ctx: ExecutionContext, client: ClaudeSDKClient
+    ) -> None:
+        try:
+            response = await client.get_mcp_status()
+        except Exception:
+            logger.debug("mcp_status_unavailable", exc_info=True)
+            return
+        ctx.current_state.mcp_status = [
+            McpStatus(server_name=server["name"], status=server["status"])
+            for server in response.get("mcpServers") or []
+            if server.get("name")
+        ]
+
+    def _inject_playwright_mcp(
+        self, mcp_servers: dict, *, prewarmed_url: str | None = None
+    ) -> dict:
         """Inject built-in Playwright MCP (CDP mode) for browser-enabled tasks.
 
         This keeps the Playwright MCP concept/config hidden from end users: they only toggle `browser_enabled`, and the executor wires the MCP server internally.
+        When the container already runs a pre-warmed server, connect to it over HTTP;
+        otherwise fall back to launching a pinned server over stdio.
         """
 
         # TODO: Refactor this injection path to use a structured MCP config builder.
-        key = "__poco_playwright"
+        key = PLAYWRIGHT_MCP_SERVER_KEY
         if key in mcp_servers:
             return mcp_servers
 
+        if prewarmed_url:
+            injected = dict(mcp_servers)
+            injected[key] = {"type": "http", "url": prewarmed_url}
+            return injected
+
         cdp_endpoint = (
             os.environ.get("POCO_BROWSER_CDP_ENDPOINT", "http://127.0.0.1:9222").strip()
             or "http://127.0.0.1:9222"
@@ -538,8 +623,16 @@ class AgentExecutor:
         )
         if image_responses not in {"allow", "omit"}:
             image_responses = "omit"
+        playwright_bin = (os.environ.get("PLAYWRIGHT_MCP_BIN") or "").strip()
+        if playwright_bin and Path(playwright_bin).is_file():
+            playwright_exec = f"exec {playwright_bin!r}"
+        else:
+            package = (
+                os.environ.get("PLAYWRIGHT_MCP_PACKAGE") or ""
+            ).strip() or _DEFAULT_PLAYWRIGHT_MCP_PACKAGE
+            playwright_exec = f"exec npx -y {package!r}"
         playwright_launch_command = (
-            "exec npx -y @playwright/mcp@latest "
+            f"{playwright_exec} "
             f"--cdp-endpoint {cdp_endpoint!r} "
             "--caps vision "
             f"--viewport-size {viewport_size!r} "
@@ -572,6 +665,17 @@ PY
         injected[key] = {"command": "bash", "args": ["-lc", wait_then_start]}
         return injected
 
+    def _sdk_server_bindings(self) -> dict[str, str]:
+        # The memory server only closes over its MemoryClient, so a pooled client may
+        # keep an earlier run's instance while the client targets the same endpoint.
+        if not self.memory_client:
+            return {}
+        return {
+            MEMORY_MCP_SERVER_KEY: (
+                f"{self.memory_client.base_url}|{self.memory_client.session_id}"
+            )
+        }
+
     def _inject_memory_mcp(self, mcp_servers: dict) -> dict:
         """Inject built-in memory MCP server for user-level memory tools."""
         if not self.memory_mcp_server:
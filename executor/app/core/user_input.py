@@ -18,10 +18,12 @@ class UserInputClient:
         base_url: str,
         timeout: float = 10.0,
         poll_interval: float = 0.5,
+        long_poll_seconds: float = 25.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.poll_interval = poll_interval
+        self.long_poll_seconds = long_poll_seconds
 
     @staticmethod
     def resolve_base_url(callback_url: str, callback_base_url: str | None) -> str:
@@ -62,6 +64,41 @@ class UserInputClient:
         self, request_id: str, timeout_seconds: float = 60
     ) -> dict[str, Any] | None:
         deadline = datetime.now(timezone.utc).timestamp() + timeout_seconds
+        # One keep-alive client for the whole wait; each call parks server-side
+        # until the answer is committed instead of returning immediately.
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout, read=self.long_poll_seconds + 15.0)
+        ) as client:
+            while True:
+                remaining = deadline - datetime.now(timezone.utc).timestamp()
+                if remaining <= 0:
+                    return None
+                response = await client.get(
+                    f"{self.base_url}/api/v1/user-input-requests/{request_id}/wait",
+                    params={
+                        "timeout_seconds": round(
+                            min(remaining, self.long_poll_seconds), 3
+                        )
+                    },
+                    headers={
+                        "X-Request-ID": get_request_id() or generate_request_id(),
+                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                    },
+                )
+                if response.status_code in {404, 405}:
+                    # Older manager without the long-poll route.
+                    return await self._poll_for_answer(request_id, deadline)
+                response.raise_for_status()
+                payload = response.json().get("data", {})
+                status = payload.get("status")
+                if status == "answered":
+                    return payload
+                if status == "expired":
+                    return None
+
+    async def _poll_for_answer(
+        self, request_id: str, deadline: float
+    ) -> dict[str, Any] | None:
         while datetime.now(timezone.utc).timestamp() < deadline:
             payload = await self.get_request(request_id)
             status = payload.get("status")
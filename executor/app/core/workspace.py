@@ -44,6 +44,14 @@ DEFAULT_GIT_EXCLUDES = [
     "inputs/",
 ]
 
+# Repository the current run works in; the on-demand diff endpoint resolves file
+# paths from the workspace state against it.
+_active_work_path: Path | None = None
+
+
+def get_active_work_path() -> Path | None:
+    return _active_work_path
+
 
 class WorkspaceManager:
     def __init__(self, mount_path: str = "/workspace"):
@@ -62,6 +70,8 @@ class WorkspaceManager:
 
         await self._setup_session_persistence()
         self.work_path = self._prepare_repository(config)
+        global _active_work_path
+        _active_work_path = self.work_path
         self._ensure_inputs_dir(self.work_path)
         self._ensure_git_excludes(self.work_path)
 
@@ -14,6 +14,7 @@ class CallbackHook(AgentHook):
         self.client = client
         self.execution_error: Optional[Exception] = None
         self.sdk_session_id: Optional[str] = None
+        self._sequence = 0
 
     def _build_report(
         self,
@@ -23,6 +24,8 @@ class CallbackHook(AgentHook):
         new_message: Optional[Any] = None,
         error_message: str | None = None,
     ) -> AgentCallbackRequest:
+        # Lets the backend drop replayed callbacks and keep per-run ordering.
+        self._sequence += 1
         return AgentCallbackRequest(
             session_id=context.session_id,
             run_id=context.run_id,
@@ -32,6 +35,7 @@ class CallbackHook(AgentHook):
             new_message=serialize_message(new_message),
             state_patch=context.current_state,
             sdk_session_id=self.sdk_session_id,
+            sequence=self._sequence,
         )
 
     def _calculate_progress(self, todos) -> int:
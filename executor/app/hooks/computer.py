@@ -1,21 +1,50 @@
 import asyncio
 import base64
-import json
+import binascii
 import logging
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
-import httpx  # pyrefly: ignore[missing-import]
-import websockets  # pyrefly: ignore[missing-import]
-
+from app.core.cdp import CdpPageSession
 from app.core.computer import ComputerClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.utils.browser import parse_viewport_size
+from app.utils.lru import LruDict, LruSet
 from app.utils.serializer import serialize_message
 
 POCO_PLAYWRIGHT_MCP_PREFIX = "mcp____poco_playwright__"
 logger = logging.getLogger(__name__)
 
+# Tool ids only need to outlive the gap between a ToolUseBlock and its ToolResultBlock.
+_TOOL_ID_CACHE_SIZE = 512
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# base64 of the PNG signature; lets us reject a non-PNG inline image without decoding it.
+_PNG_B64_PREFIX = base64.b64encode(_PNG_SIGNATURE).decode("ascii")
+# Base64 decoding of multi-megabyte frames is CPU work; keep it off the event loop.
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+
+
+def _decode_png(data: str) -> bytes | None:
+    try:
+        png = base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return png if png.startswith(_PNG_SIGNATURE) else None
+
+
+@dataclass
+class _CaptureJob:
+    session_id: str
+    run_id: str | None
+    tool_use_id: str
+    tool_name: str
+    image_b64: str | None
+    # CDP frame taken when the tool result arrived, for results without an inline image.
+    capture: asyncio.Task[str | None] | None = None
+
 
 class BrowserScreenshotHook(AgentHook):
     """Capture a screenshot after each browser tool call and upload it to the manager.
@@ -29,6 +58,8 @@ class BrowserScreenshotHook(AgentHook):
         client: ComputerClient,
         cdp_endpoint: str | None = None,
         viewport_size: str | None = None,
+        max_pending: int | None = None,
+        max_concurrent_uploads: int = 2,
     ) -> None:
         self._client = client
         self._cdp_endpoint = (
@@ -39,26 +70,52 @@ class BrowserScreenshotHook(AgentHook):
             viewport_size or os.environ.get("POCO_BROWSER_VIEWPORT_SIZE") or ""
         ).strip()
         self._viewport = parse_viewport_size(viewport_raw) or (1366, 768)
-        self._viewport_applied: set[str] = set()
-        self._tool_name_by_use_id: dict[str, str] = {}
-        self._scheduled: set[str] = set()
-        self._tasks: set[asyncio.Task[None]] = set()
+        self._cdp = CdpPageSession(self._cdp_endpoint)
+        self._tool_name_by_use_id: LruDict[str, str] = LruDict(_TOOL_ID_CACHE_SIZE)
+        # Tool calls whose frame has already left `_pending` for decode/upload.
+        self._scheduled: LruSet[str] = LruSet(_TOOL_ID_CACHE_SIZE)
+        # Frames waiting for the pipeline worker, oldest first and keyed by
+        # tool_use_id so a repeated result only keeps its latest frame. When full,
+        # new tool calls wait for space instead of evicting other calls' frames.
+        self._pending: OrderedDict[str, _CaptureJob] = OrderedDict()
+        self._pending_space = asyncio.Condition()
+        if max_pending is None:
+            try:
+                max_pending = int(os.environ.get("POCO_SCREENSHOT_MAX_PENDING") or 8)
+            except ValueError:
+                max_pending = 8
+        self._max_pending = max(1, max_pending)
+        self._worker: asyncio.Task[None] | None = None
+        self._upload_slots = asyncio.Semaphore(max(1, max_concurrent_uploads))
+        self._uploads: set[asyncio.Task[None]] = set()
 
     async def on_teardown(self, context: ExecutionContext) -> None:
-        # Best-effort flush pending screenshot tasks.
-        if not self._tasks:
-            return
-
-        pending = list(self._tasks)
-        self._tasks.clear()
+        # Best-effort flush of queued captures and in-flight uploads.
         try:
-            done, still_pending = await asyncio.wait(pending, timeout=15.0)
-            # Avoid leaking tasks beyond teardown; cancellation is best-effort.
-            for task in still_pending:
-                task.cancel()
-            _ = done
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 15.0
+            worker = self._worker
+            if worker is not None and not worker.done():
+                await asyncio.wait([worker], timeout=15.0)
+                if not worker.done():
+                    worker.cancel()
+            for job in self._pending.values():
+                if job.capture is not None:
+                    job.capture.cancel()
+            self._pending.clear()
+            uploads = list(self._uploads)
+            if uploads:
+                _, still_pending = await asyncio.wait(
+                    uploads, timeout=max(0.0, deadline - loop.time())
+                )
+                # Avoid leaking tasks beyond teardown; cancellation is best-effort.
+                for task in still_pending:
+                    task.cancel()
         except Exception:
-            return
+            pass
+        finally:
+            await self._cdp.aclose()
+            await self._client.aclose()
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
         payload = serialize_message(message)
@@ -95,65 +152,107 @@ class BrowserScreenshotHook(AgentHook):
 
             if tool_use_id in self._scheduled:
                 continue
-            self._scheduled.add(tool_use_id)
-
-            task = asyncio.create_task(
-                self._capture_and_upload_best_effort(
-                    session_id=context.session_id,
-                    run_id=context.run_id,
-                    tool_use_id=tool_use_id,
-                    tool_name=tool_name,
-                    tool_result_content=block.get("content"),
-                )
+
+            image_b64 = self._extract_image_data(block.get("content"))
+            job = _CaptureJob(
+                session_id=context.session_id,
+                run_id=context.run_id,
+                tool_use_id=tool_use_id,
+                tool_name=tool_name,
+                image_b64=image_b64,
             )
-            self._tasks.add(task)
-            task.add_done_callback(lambda t: self._tasks.discard(t))
+            if not image_b64 or not image_b64.startswith(_PNG_B64_PREFIX):
+                # Grab the page now: by the time the worker reaches this job the
+                # browser may already show the result of later actions.
+                job.capture = asyncio.create_task(self._capture_frame_with_retry())
+            await self._enqueue(job)
+
+    async def _enqueue(self, job: _CaptureJob) -> None:
+        previous = self._pending.get(job.tool_use_id)
+        if previous is not None:
+            # Same tool call reported again: keep its place in line, latest frame.
+            if previous.capture is not None:
+                previous.capture.cancel()
+            self._pending[job.tool_use_id] = job
+            return
 
-    async def _capture_and_upload_best_effort(
-        self,
-        *,
-        session_id: str,
-        run_id: str | None,
-        tool_use_id: str,
-        tool_name: str,
-        tool_result_content: Any,
-    ) -> None:
-        try:
-            png_bytes = self._extract_png_from_tool_result(tool_result_content)
-            if not png_bytes:
-                png_bytes = await self._capture_png_with_retry()
+        async with self._pending_space:
+            await self._pending_space.wait_for(
+                lambda: len(self._pending) < self._max_pending
+            )
+            self._pending[job.tool_use_id] = job
+        # The worker exits as soon as the queue is empty, so a done worker can
+        # never miss a job enqueued here.
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run_pipeline())
+
+    async def _run_pipeline(self) -> None:
+        while self._pending:
+            _, job = self._pending.popitem(last=False)
+            self._scheduled.add(job.tool_use_id)
+            async with self._pending_space:
+                self._pending_space.notify()
+            try:
+                png_bytes = await self._produce_png(job)
+            except Exception:
+                png_bytes = None
             if not png_bytes:
                 logger.debug(
                     "browser_screenshot_capture_skipped",
                     extra={
-                        "session_id": session_id,
-                        "tool_use_id": tool_use_id,
-                        "tool_name": tool_name,
+                        "session_id": job.session_id,
+                        "tool_use_id": job.tool_use_id,
+                        "tool_name": job.tool_name,
                     },
                 )
-                return
+                continue
 
+            # Bound in-flight uploads; while we wait here new frames queue up in
+            # _pending and, once it is full, hold back the producer.
+            await self._upload_slots.acquire()
+            task = asyncio.create_task(self._upload_best_effort(job, png_bytes))
+            self._uploads.add(task)
+            task.add_done_callback(self._on_upload_done)
+
+    def _on_upload_done(self, task: asyncio.Task[None]) -> None:
+        self._uploads.discard(task)
+        self._upload_slots.release()
+
+    async def _produce_png(self, job: _CaptureJob) -> bytes | None:
+        data = job.image_b64
+        if job.capture is not None:
+            data = await job.capture
+        if not data:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_IMAGE_POOL, _decode_png, data)
+
+    async def _upload_best_effort(self, job: _CaptureJob, png_bytes: bytes) -> None:
+        try:
             ok = await self._client.upload_browser_screenshot(
-                session_id=session_id,
-                run_id=run_id,
-                tool_use_id=tool_use_id,
+                session_id=job.session_id,
+                run_id=job.run_id,
+                tool_use_id=job.tool_use_id,
                 png_bytes=png_bytes,
             )
             if not ok:
                 logger.warning(
                     "browser_screenshot_upload_failed",
                     extra={
-                        "session_id": session_id,
-                        "tool_use_id": tool_use_id,
-                        "tool_name": tool_name,
+                        "session_id": job.session_id,
+                        "tool_use_id": job.tool_use_id,
+                        "tool_name": job.tool_name,
                     },
                 )
         except Exception:
             return
 
     @staticmethod
-    def _extract_png_from_tool_result(tool_result_content: Any) -> bytes | None:
-        """Try to extract PNG bytes from a tool result payload (Playwright MCP screenshot tools)."""
+    def _extract_image_data(tool_result_content: Any) -> str | None:
+        """Find base64 image data in a tool result payload (Playwright MCP screenshot tools).
+
+        Decoding happens later on the image worker pool, not on the event loop.
+        """
 
         if not tool_result_content:
             return None
@@ -176,22 +275,20 @@ class BrowserScreenshotHook(AgentHook):
             if not isinstance(source, dict):
                 continue
             data = source.get("data")
-            if not isinstance(data, str) or not data:
-                continue
-
-            try:
-                return base64.b64decode(data, validate=True)
-            except Exception:
-                return None
+            if isinstance(data, str) and data:
+                return data
 
         return None
 
-    async def _capture_png_with_retry(self) -> bytes | None:
+    async def _capture_frame_with_retry(self) -> str | None:
         # CDP calls can be flaky on cold starts; retry once with a small delay.
         for attempt in range(2):
-            png = await self._capture_png()
-            if png:
-                return png
+            try:
+                data = await self._capture_frame()
+            except Exception:
+                data = None
+            if data:
+                return data
             if attempt == 0:
                 try:
                     await asyncio.sleep(0.2)
@@ -199,161 +296,54 @@ class BrowserScreenshotHook(AgentHook):
                     return None
         return None
 
-    async def _capture_png(self) -> bytes | None:
-        target = await self._resolve_page_ws_url()
-        if not target:
-            return None
-        ws_url, target_id = target
+    async def _capture_frame(self) -> str | None:
+        """Take a base64 PNG frame of the active page; decoding is left to the pipeline."""
+        if await self._cdp.ensure_connected():
+            await self._apply_viewport()
 
-        payload = await self._cdp_capture_screenshot(ws_url, target_id)
-        if not payload:
+        result = await self._cdp.call("Page.captureScreenshot", {"format": "png"})
+        if not isinstance(result, dict):
             return None
-
-        try:
-            return base64.b64decode(payload, validate=True)
-        except Exception:
-            return None
-
-    async def _resolve_page_ws_url(self) -> tuple[str, str | None] | None:
-        # Prefer /json/list to get a page target (Page.captureScreenshot works on page sessions).
-        url = f"{self._cdp_endpoint}/json/list"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                targets = resp.json()
-        except Exception:
-            return None
-
-        if not isinstance(targets, list):
-            return None
-
-        pages: list[dict[str, Any]] = []
-        for item in targets:
-            if not isinstance(item, dict):
-                continue
-            if item.get("type") != "page":
-                continue
-            ws_url = item.get("webSocketDebuggerUrl")
-            if isinstance(ws_url, str) and ws_url.strip():
-                pages.append(item)
-
-        if not pages:
+        data = result.get("data")
+        if not isinstance(data, str) or not data:
             return None
+        return data
+
+    async def _apply_viewport(self) -> None:
+        # Ensure Page domain is enabled for consistent screenshots.
+        await self._cdp.call("Page.enable")
+
+        # Best-effort: lock viewport to a desktop size so responsive pages don't render
+        # as mobile when the underlying display/window is small. The override lives as
+        # long as the CDP session, so it is applied once per connection.
+        width, height = self._viewport
+        await self._cdp.call(
+            "Emulation.setDeviceMetricsOverride",
+            {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 1,
+                "mobile": False,
+            },
+        )
 
-        def _score(page: dict[str, Any]) -> int:
-            raw_url = str(page.get("url") or "").strip()
-            if not raw_url:
-                return 0
-            if raw_url in {"about:blank", "chrome://newtab/"}:
-                return 0
-            return 1
-
-        pages.sort(key=_score, reverse=True)
-        picked = pages[0]
-        ws_url = picked.get("webSocketDebuggerUrl")
-        target_id = picked.get("id")
-        ws_url = ws_url.strip() if isinstance(ws_url, str) and ws_url.strip() else None
-        target_id = (
-            target_id.strip()
-            if isinstance(target_id, str) and target_id.strip()
+        # If the browser is headful, also try to resize the window for noVNC.
+        target_id = self._cdp.target_id
+        if not target_id:
+            return
+        win = await self._cdp.call(
+            "Browser.getWindowForTarget", {"targetId": target_id}
+        )
+        window_id = (
+            int(win["windowId"])
+            if isinstance(win, dict) and isinstance(win.get("windowId"), int)
             else None
         )
-        if not ws_url:
-            return None
-        return ws_url, target_id
-
-    async def _cdp_call(
-        self,
-        ws: Any,
-        *,
-        call_id: int,
-        method: str,
-        params: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | None:
-        payload: dict[str, Any] = {"id": call_id, "method": method}
-        if params is not None:
-            payload["params"] = params
-        await ws.send(json.dumps(payload))
-
-        while True:
-            raw = await asyncio.wait_for(ws.recv(), timeout=8.0)
-            message = json.loads(raw)
-            if not isinstance(message, dict):
-                continue
-            if message.get("id") != call_id:
-                continue
-            if message.get("error"):
-                return None
-            result = message.get("result")
-            if result is None:
-                return {}
-            return result if isinstance(result, dict) else {}
-
-    async def _cdp_capture_screenshot(
-        self, ws_url: str, target_id: str | None
-    ) -> str | None:
-        try:
-            async with websockets.connect(ws_url, max_size=50 * 1024 * 1024) as ws:
-                # Ensure Page domain is enabled for consistent screenshots.
-                await self._cdp_call(ws, call_id=1, method="Page.enable")
-
-                # Best-effort: lock viewport to a desktop size so responsive pages don't render
-                # as mobile when the underlying display/window is small.
-                apply_key = target_id or ws_url
-                if apply_key not in self._viewport_applied:
-                    width, height = self._viewport
-                    _ = await self._cdp_call(
-                        ws,
-                        call_id=2,
-                        method="Emulation.setDeviceMetricsOverride",
-                        params={
-                            "width": width,
-                            "height": height,
-                            "deviceScaleFactor": 1,
-                            "mobile": False,
-                        },
-                    )
-
-                    # If the browser is headful, also try to resize the window for noVNC.
-                    if target_id:
-                        win = await self._cdp_call(
-                            ws,
-                            call_id=3,
-                            method="Browser.getWindowForTarget",
-                            params={"targetId": target_id},
-                        )
-                        window_id = (
-                            int(win["windowId"])
-                            if isinstance(win, dict)
-                            and isinstance(win.get("windowId"), int)
-                            else None
-                        )
-                        if window_id is not None:
-                            _ = await self._cdp_call(
-                                ws,
-                                call_id=4,
-                                method="Browser.setWindowBounds",
-                                params={
-                                    "windowId": window_id,
-                                    "bounds": {
-                                        "width": width,
-                                        "height": height,
-                                    },
-                                },
-                            )
-
-                    self._viewport_applied.add(apply_key)
-
-                result = await self._cdp_call(
-                    ws,
-                    call_id=5,
-                    method="Page.captureScreenshot",
-                    params={"format": "png"},
-                )
-                if not isinstance(result, dict):
-                    return None
-                data = result.get("data")
-                return data if isinstance(data, str) and data else None
-        except Exception:
-            return None
+        if window_id is not None:
+            await self._cdp.call(
+                "Browser.setWindowBounds",
+                {
+                    "windowId": window_id,
+                    "bounds": {"width": width, "height": height},
+                },
+            )
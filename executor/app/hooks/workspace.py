@@ -1,3 +1,4 @@
+import os
 from datetime import datetime, timezone
 from typing import Any
 
@@ -15,10 +16,42 @@ from app.utils.git.operations import (
 )
 
 _LOCAL_MOUNT_ROOT = ".poco-local/"
+_DEFAULT_DIFF_MAX_BYTES = 64 * 1024
+_DEFAULT_DIFF_TOTAL_MAX_BYTES = 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name) or default)
+    except ValueError:
+        return default
 
 
 class WorkspaceHook(AgentHook):
-    """Hook that monitors workspace file changes and updates state."""
+    """Hook that monitors workspace file changes and updates state.
+
+    Diffs are kept within a per-file and per-state byte budget; truncated entries are
+    flagged so clients can fetch the full diff on demand from the executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        diff_max_bytes: int | None = None,
+        diff_total_max_bytes: int | None = None,
+    ) -> None:
+        self.diff_max_bytes = (
+            diff_max_bytes
+            if diff_max_bytes is not None
+            else _env_int("WORKSPACE_DIFF_MAX_BYTES", _DEFAULT_DIFF_MAX_BYTES)
+        )
+        self.diff_total_max_bytes = (
+            diff_total_max_bytes
+            if diff_total_max_bytes is not None
+            else _env_int(
+                "WORKSPACE_DIFF_TOTAL_MAX_BYTES", _DEFAULT_DIFF_TOTAL_MAX_BYTES
+            )
+        )
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
         """Capture Git-tracked file changes after each agent response.
@@ -63,6 +96,22 @@ class WorkspaceHook(AgentHook):
             List of FileChange objects.
         """
         file_changes = []
+        budget = self.diff_total_max_bytes
+
+        def bounded_diff(file: str, cached: bool) -> tuple[str | None, bool]:
+            nonlocal budget
+            content = diff(file=file, cwd=cwd, cached=cached)
+            if not content:
+                return None, False
+            limit = min(self.diff_max_bytes, max(budget, 0))
+            encoded = content.encode("utf-8", errors="replace")
+            if len(encoded) <= limit:
+                budget -= len(encoded)
+                return content, False
+            budget -= limit
+            if limit <= 0:
+                return None, True
+            return encoded[:limit].decode("utf-8", errors="ignore"), True
 
         unstaged_numstat = get_numstat(cwd, cached=False)
         staged_numstat = get_numstat(cwd, cached=True)
@@ -71,14 +120,15 @@ class WorkspaceHook(AgentHook):
             if self._should_skip_path(file):
                 continue
             added, deleted = unstaged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=False)
+            diff_content, truncated = bounded_diff(file, cached=False)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.MODIFIED,
                     added_lines=added,
                     deleted_lines=deleted,
-                    diff=diff_content or None,
+                    diff=diff_content,
+                    diff_truncated=truncated,
                 )
             )
 
@@ -86,14 +136,15 @@ class WorkspaceHook(AgentHook):
             if self._should_skip_path(file):
                 continue
             added, deleted = staged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=True)
+            diff_content, truncated = bounded_diff(file, cached=True)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.STAGED,
                     added_lines=added,
                     deleted_lines=deleted,
-                    diff=diff_content or None,
+                    diff=diff_content,
+                    diff_truncated=truncated,
                 )
             )
 
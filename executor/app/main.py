@@ -1,9 +1,11 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
-from app.api import task_router
+from app.api import diagnostics_router, task_router
+from app.core.client_pool import sdk_client_pool
 from app.core.middleware import setup_middleware
 from app.core.observability.logging import configure_logging
 
@@ -12,10 +14,22 @@ configure_logging(
     service_name="executor",
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _ = app
+    try:
+        yield
+    finally:
+        # Pooled SDK clients own CLI subprocesses and stdio MCP servers.
+        await sdk_client_pool.close_all()
+
+
+app = FastAPI(lifespan=lifespan)
 
 setup_middleware(app)
 app.include_router(task_router)
+app.include_router(diagnostics_router)
 
 
 @app.get("/health")
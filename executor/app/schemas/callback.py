@@ -19,3 +19,4 @@ class AgentCallbackRequest(BaseModel):
     new_message: Optional[Any] = None
     state_patch: Optional[AgentCurrentState] = None
     sdk_session_id: Optional[str] = None
+    sequence: int | None = None
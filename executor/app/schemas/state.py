@@ -30,6 +30,8 @@ class FileChange(BaseModel):
     added_lines: int = 0
     deleted_lines: int = 0
     diff: str | None = None
+    # True when `diff` was cut to the memory budget; fetch the full diff on demand.
+    diff_truncated: bool = False
     old_path: str | None = None
 
 
@@ -1,4 +1,7 @@
+import asyncio
 import re
+import time
+from urllib.parse import urlsplit
 
 
 _VIEWPORT_RE = re.compile(r"^\s*(\d{2,5})\s*[xX]\s*(\d{2,5})\s*$")
@@ -32,3 +35,31 @@ def parse_viewport_size(value: str) -> tuple[int, int] | None:
 
 def format_viewport_size(width: int, height: int) -> str:
     return f"{int(width)}x{int(height)}"
+
+
+async def wait_for_tcp_endpoint(url: str, timeout_seconds: float) -> bool:
+    """Wait until the host:port of `url` accepts TCP connections."""
+
+    parts = urlsplit(url)
+    host = parts.hostname
+    if not host:
+        return False
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+
+    deadline = time.monotonic() + max(0.0, timeout_seconds)
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout=0.5
+            )
+        except (OSError, TimeoutError):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
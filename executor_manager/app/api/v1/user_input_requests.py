@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse
 
 from app.schemas.response import Response, ResponseSchema
@@ -25,3 +25,14 @@ async def create_user_input_request(
 async def get_user_input_request(request_id: str) -> JSONResponse:
     result = await backend_client.get_user_input_request(request_id)
     return Response.success(data=result, message="User input request retrieved")
+
+
+@router.get(
+    "/{request_id}/wait", response_model=ResponseSchema[UserInputRequestResponse]
+)
+async def wait_user_input_request(
+    request_id: str,
+    timeout_seconds: float = Query(default=25.0, ge=0, le=60),
+) -> JSONResponse:
+    result = await backend_client.wait_user_input_request(request_id, timeout_seconds)
+    return Response.success(data=result, message="User input request retrieved")
@@ -1,3 +1,4 @@
+import httpx
 from fastapi import APIRouter, Query
 from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
@@ -6,10 +7,13 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.workspace import FileNode
+from app.scheduler.task_dispatcher import TaskDispatcher
+from app.services.executor_client import ExecutorClient
 from app.services.workspace_manager import WorkspaceManager
 
 router = APIRouter(prefix="/workspace", tags=["workspace"])
 workspace_manager = WorkspaceManager()
+executor_client = ExecutorClient()
 
 
 @router.get("/stats", response_model=ResponseSchema[dict])
@@ -100,3 +104,45 @@ async def get_workspace_file(
         filename=file_path.name,
         content_disposition_type="inline",
     )
+
+
+@router.get("/diff/{session_id}", response_model=ResponseSchema[dict])
+async def get_workspace_file_diff(
+    session_id: str,
+    path: str = Query(..., min_length=1, description="File path within the repo"),
+    staged: bool = Query(default=False),
+    repo_dir: str | None = Query(default=None),
+) -> JSONResponse:
+    """Fetch the full diff of a file whose workspace state copy was truncated.
+
+    The diff is computed by the session's executor, so it is only available while
+    that executor container is running.
+    """
+    executor_url = TaskDispatcher.get_container_pool().get_executor_url(session_id)
+    if not executor_url:
+        raise AppException(
+            error_code=ErrorCode.CONTAINER_NOT_FOUND,
+            message="No running executor for this session",
+        )
+    try:
+        result = await executor_client.get_workspace_file_diff(
+            executor_url, path=path, staged=staged, repo_dir=repo_dir
+        )
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 400:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message=str(
+                    exc.response.json().get("detail") or "Invalid diff request"
+                ),
+            ) from exc
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor diff request failed: {exc.response.status_code}",
+        ) from exc
+    except httpx.HTTPError as exc:
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor unavailable: {exc}",
+        ) from exc
+    return Response.success(data=result)
@@ -31,6 +31,7 @@ class FileChange(BaseModel):
     added_lines: int = 0
     deleted_lines: int = 0
     diff: str | None = None
+    diff_truncated: bool = False
     old_path: str | None = None
 
 
@@ -65,6 +66,9 @@ class AgentCallbackRequest(BaseModel):
     new_message: object | None = None
     state_patch: AgentCurrentState | None = None
     sdk_session_id: str | None = None
+    # Monotonic per-run counter assigned by the executor; None for callbacks
+    # synthesized elsewhere (e.g. workspace export).
+    sequence: int | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
     workspace_archive_key: str | None = None
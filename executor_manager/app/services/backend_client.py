@@ -13,6 +13,8 @@ from app.core.observability.request_context import (
     get_trace_id,
 )
 
+_USER_INPUT_POLL_INTERVAL_SECONDS = 0.5
+
 
 class BackendClient:
     """Client for communicating with the Backend service."""
@@ -396,6 +398,45 @@ class BackendClient:
             data = response.json()
             return data["data"]
 
+    async def wait_user_input_request(
+        self, request_id: str, timeout_seconds: float
+    ) -> dict:
+        """Long-poll the backend until the request is answered, expired or timed out."""
+        try:
+            response = await self._request(
+                "GET",
+                f"/api/v1/internal/user-input-requests/{request_id}/wait",
+                params={"timeout_seconds": timeout_seconds},
+                headers={
+                    "X-Internal-Token": self.settings.internal_api_token,
+                    **self._trace_headers(),
+                },
+                timeout=httpx.Timeout(
+                    connect=15.0, read=timeout_seconds + 15.0, write=30.0, pool=15.0
+                ),
+            )
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in {404, 405}:
+                raise
+            # Older backend without the long-poll route: poll it on the
+            # executor's behalf so the wait contract stays the same.
+            return await self._poll_user_input_request(request_id, timeout_seconds)
+        data = response.json()
+        return data["data"]
+
+    async def _poll_user_input_request(
+        self, request_id: str, timeout_seconds: float
+    ) -> dict:
+        deadline = asyncio.get_running_loop().time() + timeout_seconds
+        while True:
+            result = await self.get_user_input_request(request_id)
+            if result.get("status") in {"answered", "expired"}:
+                return result
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return result
+            await asyncio.sleep(min(_USER_INPUT_POLL_INTERVAL_SECONDS, remaining))
+
     async def create_memory(self, session_id: str, payload: dict[str, Any]) -> Any:
         """Create memories via backend internal API."""
         async with httpx.AsyncClient() as client:
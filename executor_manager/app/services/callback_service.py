@@ -12,6 +12,10 @@ from app.services.workspace_export_service import (
 logger = logging.getLogger(__name__)
 
 
+# The executor's built-in browser MCP; its status is the browser readiness the UI
+# shows, so it is forwarded even though other internal servers are hidden.
+_BROWSER_MCP_SERVER_NAME = "__poco_playwright"
+
 backend_client = BackendClient()
 workspace_export_service = WorkspaceExportService()
 
@@ -22,7 +26,7 @@ class CallbackService:
     @staticmethod
     def _is_internal_mcp_server(name: str) -> bool:
         clean = (name or "").strip()
-        return clean.startswith("__poco_")
+        return clean.startswith("__poco_") and clean != _BROWSER_MCP_SERVER_NAME
 
     @staticmethod
     def _is_ignored_workspace_path(path: str) -> bool:
@@ -68,7 +72,7 @@ class CallbackService:
         updated_state = state
 
         # Hide built-in/internal MCP servers from the UI. End users should only see
-        # explicitly configured MCP servers.
+        # explicitly configured MCP servers, plus the browser server's readiness.
         if state.mcp_status:
             filtered_mcp = [
                 m
@@ -202,6 +202,7 @@ class ContainerPool:
         if anthropic_api_key:
             environment["ANTHROPIC_API_KEY"] = anthropic_api_key
         if browser_enabled:
+            environment["POCO_BROWSER_ENABLED"] = "true"
             environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
                 self.settings.poco_browser_viewport_size
             )
@@ -564,6 +565,20 @@ class ContainerPool:
             message=f"Executor service at {executor_url} not ready within {timeout}s",
         )
 
+    def get_executor_url(self, session_id: str) -> str | None:
+        """Return the URL of the executor currently serving a session, if any."""
+        container_id = self.session_to_container.get(session_id)
+        container = self.containers.get(container_id) if container_id else None
+        if container is None:
+            return None
+        host_port = self._extract_host_port(container)
+        if not host_port:
+            return None
+        published_host = (
+            self.settings.executor_published_host or ""
+        ).strip() or "localhost"
+        return f"http://{published_host}:{host_port}"
+
     async def on_task_complete(self, session_id: str) -> None:
         """Handle task completion. Ephemeral containers are stopped."""
         container_id = self.session_to_container.pop(session_id, None)
@@ -67,3 +67,25 @@ class ExecutorClient:
             response.raise_for_status()
             data = response.json()
             return data["session_id"]
+
+    async def get_workspace_file_diff(
+        self,
+        executor_url: str,
+        *,
+        path: str,
+        staged: bool = False,
+        repo_dir: str | None = None,
+    ) -> dict:
+        """Fetch the untruncated diff of one workspace file from an executor."""
+        params: dict[str, str | bool] = {"path": path, "staged": staged}
+        if repo_dir:
+            params["repo_dir"] = repo_dir
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{executor_url}/v1/workspace/diff",
+                params=params,
+                headers=self._trace_headers(),
+                timeout=httpx.Timeout(30.0, connect=10.0),
+            )
+            response.raise_for_status()
+            return response.json()
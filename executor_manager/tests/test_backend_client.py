@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from app.services.backend_client import BackendClient
+
+
+class WaitUserInputRequestTests(unittest.IsolatedAsyncioTestCase):
+    async def test_backend_without_wait_route_falls_back_to_polling(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"detail": "Not Found"})
+
+        client = BackendClient()
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url="http://backend.test", transport=httpx.MockTransport(handler)
+        )
+        self.addAsyncCleanup(client._client.aclose)
+        client.get_user_input_request = AsyncMock(
+            side_effect=[
+                {"id": "req-1", "status": "pending"},
+                {"id": "req-1", "status": "answered", "answers": {"q": "yes"}},
+            ]
+        )
+
+        with patch("app.services.backend_client._USER_INPUT_POLL_INTERVAL_SECONDS", 0):
+            result = await client.wait_user_input_request("req-1", 5)
+
+        self.assertEqual(result["status"], "answered")
+        self.assertEqual(client.get_user_input_request.await_count, 2)
+
+    async def test_other_backend_errors_are_raised(self) -> None:
+        client = BackendClient()
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url="http://backend.test",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+        self.addAsyncCleanup(client._client.aclose)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.wait_user_input_request("req-1", 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.schemas.callback import AgentCallbackRequest
+from app.services import callback_service as callback_module
+from app.services.callback_service import CallbackService
+
+
+def _callback(state_patch: dict) -> AgentCallbackRequest:
+    return AgentCallbackRequest.model_validate(
+        {
+            "session_id": "session-1",
+            "run_id": "run-1",
+            "status": "running",
+            "progress": 50,
+            "state_patch": state_patch,
+        }
+    )
+
+
+class ProcessCallbackTests(unittest.IsolatedAsyncioTestCase):
+    async def _forwarded_state(self, state_patch: dict) -> dict:
+        with patch.object(
+            callback_module.backend_client,
+            "forward_callback",
+            AsyncMock(return_value={"status": "running"}),
+        ) as forward:
+            await CallbackService().process_callback(_callback(state_patch))
+        forward.assert_awaited_once()
+        return forward.await_args.args[0]["state_patch"]
+
+    async def test_truncated_diff_flag_is_forwarded(self) -> None:
+        state = await self._forwarded_state(
+            {
+                "workspace_state": {
+                    "file_changes": [
+                        {
+                            "path": "big.txt",
+                            "status": "modified",
+                            "diff": "@@ -1 +1 @@",
+                            "diff_truncated": True,
+                        },
+                        {"path": "small.txt", "status": "added"},
+                    ],
+                    "last_change": "2026-10-19T00:00:00Z",
+                }
+            }
+        )
+
+        changes = state["workspace_state"]["file_changes"]
+        self.assertEqual(
+            [(c["path"], c["diff_truncated"]) for c in changes],
+            [("big.txt", True), ("small.txt", False)],
+        )
+
+    async def test_only_the_browser_mcp_is_kept_among_internal_servers(self) -> None:
+        state = await self._forwarded_state(
+            {
+                "mcp_status": [
+                    {"server_name": "__poco_playwright", "status": "connected"},
+                    {"server_name": "__poco_internal", "status": "connected"},
+                    {"server_name": "github", "status": "failed"},
+                ]
+            }
+        )
+
+        self.assertEqual(
+            [(m["server_name"], m["status"]) for m in state["mcp_status"]],
+            [("__poco_playwright", "connected"), ("github", "failed")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
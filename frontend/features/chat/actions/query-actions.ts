@@ -26,6 +26,13 @@ const getMessagesDeltaRawSchema = sessionIdSchema.extend({
   afterMessageId: z.number().int().min(0).optional(),
   limit: z.number().int().positive().max(1000).optional(),
 });
+const getMessagesWindowRawSchema = sessionIdSchema.extend({
+  beforeMessageId: z.number().int().positive().optional(),
+  limit: z.number().int().positive().max(500).optional(),
+});
+const messageIdSchema = z.object({
+  messageId: z.number().int().positive(),
+});
 const getMessageAttachmentsDeltaRawSchema = sessionIdSchema.extend({
   afterMessageId: z.number().int().min(0).optional(),
   limit: z.number().int().positive().max(1000).optional(),
@@ -39,6 +46,10 @@ const toolExecutionsSchema = sessionIdSchema.extend({
   limit: z.number().int().positive().optional(),
   offset: z.number().int().min(0).optional(),
 });
+const toolExecutionIdSchema = z.object({
+  executionId: z.string().trim().min(1, "validation.missingToolExecutionId"),
+});
+
 const runIdSchema = z.object({
   runId: z.string().trim().min(1, "validation.missingRunId"),
 });
@@ -82,6 +93,10 @@ export type GetMessagesRawInput = z.infer<typeof getMessagesRawSchema>;
 export type GetMessagesDeltaRawInput = z.infer<
   typeof getMessagesDeltaRawSchema
 >;
+export type GetMessagesWindowRawInput = z.infer<
+  typeof getMessagesWindowRawSchema
+>;
+export type GetMessageInput = z.infer<typeof messageIdSchema>;
 export type GetMessageAttachmentsDeltaRawInput = z.infer<
   typeof getMessageAttachmentsDeltaRawSchema
 >;
@@ -93,6 +108,7 @@ export type GetToolExecutionsInput = z.infer<typeof toolExecutionsSchema>;
 export type GetToolExecutionsDeltaInput = z.infer<
   typeof toolExecutionsDeltaSchema
 >;
+export type GetToolExecutionInput = z.infer<typeof toolExecutionIdSchema>;
 export type GetRunToolExecutionsInput = z.infer<typeof runToolExecutionsSchema>;
 export type GetRunToolExecutionsDeltaInput = z.infer<
   typeof runToolExecutionsDeltaSchema
@@ -135,6 +151,17 @@ export async function getMessagesDeltaRawAction(
   });
 }
 
+export async function getMessagesWindowRawAction(
+  input: GetMessagesWindowRawInput,
+) {
+  const { sessionId, beforeMessageId, limit } =
+    getMessagesWindowRawSchema.parse(input);
+  return chatService.getMessagesWindowRaw(sessionId, {
+    before_message_id: beforeMessageId,
+    limit,
+  });
+}
+
 export async function getMessagesBaseDeltaRawAction(
   input: GetMessagesDeltaRawInput,
 ) {
@@ -151,6 +178,11 @@ export async function getMessagesBaseAction(input: GetMessagesInput) {
   return chatService.getMessagesBase(sessionId, { realUserMessageIds });
 }
 
+export async function getMessageAction(input: GetMessageInput) {
+  const { messageId } = messageIdSchema.parse(input);
+  return chatService.getMessage(messageId);
+}
+
 export async function getMessageAttachmentsAction(
   input: GetMessageAttachmentsInput,
 ) {
@@ -201,6 +233,11 @@ export async function getToolExecutionsDeltaAction(
   });
 }
 
+export async function getToolExecutionAction(input: GetToolExecutionInput) {
+  const { executionId } = toolExecutionIdSchema.parse(input);
+  return chatService.getToolExecution(executionId);
+}
+
 export async function getRunToolExecutionsAction(
   input: GetRunToolExecutionsInput,
 ) {
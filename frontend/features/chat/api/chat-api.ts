@@ -19,6 +19,7 @@ import type {
   MessageAttachmentsResponse,
   MessageDeltaResponse,
   MessageResponse,
+  MessageWindowResponse,
   RunResponse,
   SessionBranchRequest,
   SessionBranchResponse,
@@ -37,6 +38,7 @@ import type {
   ToolExecutionDeltaResponse,
   ToolExecutionResponse,
   WorkspaceArchiveResponse,
+  WorkspaceFileDiffResponse,
 } from "@/features/chat/types";
 
 import {
@@ -311,6 +313,14 @@ export const chatService = {
     );
   },
 
+  getToolExecution: async (
+    executionId: string,
+  ): Promise<ToolExecutionResponse> => {
+    return apiClient.get<ToolExecutionResponse>(
+      API_ENDPOINTS.toolExecution(executionId),
+    );
+  },
+
   getBrowserScreenshot: async (
     sessionId: string,
     toolUseId: string,
@@ -403,6 +413,16 @@ export const chatService = {
     );
   },
 
+  getMessagesWindowRaw: async (
+    sessionId: string,
+    params?: { before_message_id?: number; limit?: number },
+  ): Promise<MessageWindowResponse> => {
+    const query = buildQuery(params);
+    return apiClient.get<MessageWindowResponse>(
+      `${API_ENDPOINTS.sessionMessagesWithFilesWindow(sessionId)}${query}`,
+    );
+  },
+
   getMessagesBaseDeltaRaw: async (
     sessionId: string,
     params?: { after_message_id?: number; limit?: number },
@@ -435,6 +455,10 @@ export const chatService = {
     }
   },
 
+  getMessage: async (messageId: number): Promise<MessageResponse> => {
+    return apiClient.get<MessageResponse>(API_ENDPOINTS.message(messageId));
+  },
+
   getMessageAttachments: async (
     sessionId: string,
   ): Promise<Record<number, InputFile[]>> => {
@@ -515,6 +539,19 @@ export const chatService = {
     }
   },
 
+  getWorkspaceFileDiff: async (
+    sessionId: string,
+    params: { path: string; staged?: boolean },
+  ): Promise<WorkspaceFileDiffResponse> => {
+    const query = new URLSearchParams({
+      path: params.path,
+      staged: String(Boolean(params.staged)),
+    });
+    return apiClient.get<WorkspaceFileDiffResponse>(
+      `${API_ENDPOINTS.sessionWorkspaceDiff(sessionId)}?${query.toString()}`,
+    );
+  },
+
   submitSkill: async (
     sessionId: string,
     body: { folder_path: string; skill_name?: string },
@@ -1,7 +1,7 @@
 "use client";
 
 import * as React from "react";
-import { ArrowDown } from "lucide-react";
+import { ArrowDown, Loader2 } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { ScrollArea } from "@/components/ui/scroll-area";
 import {
@@ -23,6 +23,9 @@ import { cn } from "@/lib/utils";
 export interface ChatMessageListProps {
   messages: ChatMessage[];
   isTyping?: boolean;
+  hasOlderMessages?: boolean;
+  isLoadingOlderMessages?: boolean;
+  onLoadOlderMessages?: () => void;
   sessionStatus?: string;
   repoUrl?: string | null;
   gitBranch?: string | null;
@@ -31,6 +34,7 @@ export interface ChatMessageListProps {
     messageId: string;
     content: string;
   }) => Promise<void>;
+  onLoadFullMessage?: (message: ChatMessage) => Promise<ChatMessage | null>;
   onRegenerateMessage?: (args: {
     userMessageId: string;
     assistantMessageId: string;
@@ -86,11 +90,15 @@ function isEditableElement(element: Element | null): boolean {
 export function ChatMessageList({
   messages,
   isTyping,
+  hasOlderMessages = false,
+  isLoadingOlderMessages = false,
+  onLoadOlderMessages,
   sessionStatus,
   repoUrl,
   gitBranch,
   runUsageByUserMessageId,
   onEditMessage,
+  onLoadFullMessage,
   onRegenerateMessage,
   onCreateBranch,
   branchingAssistantMessageId = null,
@@ -110,6 +118,12 @@ export function ChatMessageList({
     string | null
   >(null);
   const lastMessageCountRef = React.useRef(messages.length);
+  const lastMessageIdRef = React.useRef(messages.at(-1)?.id);
+  const prependAnchorRef = React.useRef<{
+    firstMessageId: string | undefined;
+    scrollHeight: number;
+    scrollTop: number;
+  } | null>(null);
   const hasInitializedRef = React.useRef(false);
 
   const firstUserMessageId = React.useMemo(() => {
@@ -285,6 +299,29 @@ export function ChatMessageList({
 
   const prevIsTypingRef = React.useRef(isTyping);
 
+  const handleLoadOlderMessages = React.useCallback(() => {
+    const viewport = getScrollViewport();
+    if (viewport) {
+      prependAnchorRef.current = {
+        firstMessageId: messages[0]?.id,
+        scrollHeight: viewport.scrollHeight,
+        scrollTop: viewport.scrollTop,
+      };
+    }
+    onLoadOlderMessages?.();
+  }, [getScrollViewport, messages, onLoadOlderMessages]);
+
+  // Keep the viewport on the same message when older ones are prepended
+  React.useLayoutEffect(() => {
+    const anchor = prependAnchorRef.current;
+    if (!anchor || messages[0]?.id === anchor.firstMessageId) return;
+    prependAnchorRef.current = null;
+    const viewport = getScrollViewport();
+    if (!viewport) return;
+    viewport.scrollTop =
+      anchor.scrollTop + viewport.scrollHeight - anchor.scrollHeight;
+  }, [getScrollViewport, messages]);
+
   // Initial scroll to bottom when component mounts with existing messages
   React.useEffect(() => {
     if (
@@ -299,10 +336,15 @@ export function ChatMessageList({
 
   // Auto-scroll to bottom when new messages arrive (only if user is not scrolling)
   React.useEffect(() => {
-    const hasNewMessages = messages.length > lastMessageCountRef.current;
+    // Prepended history grows the list without a new latest message.
+    const lastMessageId = messages.at(-1)?.id;
+    const hasNewMessages =
+      messages.length > lastMessageCountRef.current &&
+      lastMessageId !== lastMessageIdRef.current;
     const isTypingStarted = isTyping && !prevIsTypingRef.current;
 
     lastMessageCountRef.current = messages.length;
+    lastMessageIdRef.current = lastMessageId;
     prevIsTypingRef.current = isTyping;
 
     if (!isUserScrolling && (hasNewMessages || isTyping)) {
@@ -471,7 +513,27 @@ export function ChatMessageList({
             contentPaddingClassName ?? "px-6",
           )}
         >
+          {hasOlderMessages && onLoadOlderMessages ? (
+            <div className="flex justify-center" data-chat-export-skip>
+              <Button
+                variant="ghost"
+                size="sm"
+                onClick={handleLoadOlderMessages}
+                disabled={isLoadingOlderMessages}
+                className="text-muted-foreground"
+              >
+                {isLoadingOlderMessages ? (
+                  <Loader2 className="size-4 animate-spin" />
+                ) : null}
+                {t("chat.loadOlderMessages")}
+              </Button>
+            </div>
+          ) : null}
           {messages.map((message, index) => {
+            const loadFullMessage =
+              onLoadFullMessage && message.offloadedMessageIds?.length
+                ? () => onLoadFullMessage(message)
+                : undefined;
             if (message.role === "user") {
               return (
                 <div
@@ -495,6 +557,7 @@ export function ChatMessageList({
                       message.id === firstUserMessageId ? gitBranch : null
                     }
                     onEdit={onEditMessage}
+                    onLoadFullMessage={loadFullMessage}
                   />
                 </div>
               );
@@ -515,6 +578,7 @@ export function ChatMessageList({
                   message={message}
                   runUsage={runUsage}
                   sessionStatus={sessionStatus}
+                  onLoadFullMessage={loadFullMessage}
                   isCreatingBranch={branchingAssistantMessageId === message.id}
                   disableBranchAction={
                     branchingAssistantMessageId !== null &&
@@ -6,6 +6,7 @@ import {
   ArrowUp,
   Bot,
   Check,
+  ChevronDown,
   Clock3,
   Copy,
   GitBranch,
@@ -27,6 +28,8 @@ interface AssistantMessageProps {
   message: ChatMessage;
   runUsage?: UsageResponse | null;
   sessionStatus?: string;
+  // Set when the content is a clipped preview of an offloaded message.
+  onLoadFullMessage?: () => Promise<ChatMessage | null>;
   onRegenerate?: () => void;
   onCreateBranch?: () => void;
   isCreatingBranch?: boolean;
@@ -50,6 +53,7 @@ export function AssistantMessage({
   message,
   runUsage,
   sessionStatus,
+  onLoadFullMessage,
   onRegenerate,
   onCreateBranch,
   isCreatingBranch = false,
@@ -58,6 +62,7 @@ export function AssistantMessage({
   const { t } = useT("translation");
   const [isCopied, setIsCopied] = React.useState(false);
   const [isLiked, setIsLiked] = React.useState(false);
+  const [isLoadingFull, setIsLoadingFull] = React.useState(false);
   const isStreaming = message.status === "streaming";
 
   // Helper function to extract text content from message
@@ -81,9 +86,28 @@ export function AssistantMessage({
     return String(content);
   };
 
+  const loadFullContent = async (): Promise<string | MessageBlock[]> => {
+    if (!onLoadFullMessage) return message.content;
+    setIsLoadingFull(true);
+    try {
+      const fullMessage = await onLoadFullMessage();
+      return fullMessage?.content ?? message.content;
+    } finally {
+      setIsLoadingFull(false);
+    }
+  };
+
+  const onShowFullMessage = async () => {
+    try {
+      await loadFullContent();
+    } catch (err) {
+      console.error("Failed to load full message", err);
+    }
+  };
+
   const onCopy = async () => {
     try {
-      const textContent = getTextContent(message.content);
+      const textContent = getTextContent(await loadFullContent());
       await navigator.clipboard.writeText(textContent);
       setIsCopied(true);
       setTimeout(() => setIsCopied(false), 2000);
@@ -160,6 +184,20 @@ export function AssistantMessage({
           sessionStatus={sessionStatus}
         />
         {isStreaming && <TypingIndicator />}
+        {onLoadFullMessage ? (
+          <button
+            onClick={onShowFullMessage}
+            disabled={isLoadingFull}
+            className="mt-1 flex items-center gap-1 text-sm text-muted-foreground hover:text-foreground transition-colors cursor-pointer disabled:opacity-60"
+          >
+            {isLoadingFull ? (
+              <Loader2 className="h-4 w-4 animate-spin" />
+            ) : (
+              <ChevronDown className="h-4 w-4" />
+            )}
+            {t("chat.showFullMessage")}
+          </button>
+        ) : null}
       </div>
 
       <div className="mt-2 flex min-w-0 items-center gap-2 pt-2">
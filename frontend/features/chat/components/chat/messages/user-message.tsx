@@ -1,12 +1,23 @@
 "use client";
 
 import * as React from "react";
-import { ChevronDown, ChevronUp, Copy, Check, Pencil } from "lucide-react";
+import {
+  ChevronDown,
+  ChevronUp,
+  Copy,
+  Check,
+  Loader2,
+  Pencil,
+} from "lucide-react";
 import { FileCard } from "@/components/shared/file-card";
 import { RepoCard } from "@/components/shared/repo-card";
 import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
-import type { MessageBlock, InputFile } from "@/features/chat/types";
+import type {
+  ChatMessage,
+  MessageBlock,
+  InputFile,
+} from "@/features/chat/types";
 import { useT } from "@/lib/i18n/client";
 import { cn } from "@/lib/utils";
 
@@ -19,6 +30,7 @@ export function UserMessage({
   repoUrl,
   gitBranch,
   onEdit,
+  onLoadFullMessage,
 }: {
   messageId: string;
   content: string | MessageBlock[];
@@ -26,6 +38,8 @@ export function UserMessage({
   repoUrl?: string | null;
   gitBranch?: string | null;
   onEdit?: (args: { messageId: string; content: string }) => Promise<void>;
+  // Set when the content is a clipped preview of an offloaded message.
+  onLoadFullMessage?: () => Promise<ChatMessage | null>;
 }) {
   const { t } = useT("translation");
   const [isExpanded, setIsExpanded] = React.useState(false);
@@ -33,6 +47,7 @@ export function UserMessage({
   const [isCopied, setIsCopied] = React.useState(false);
   const [isEditing, setIsEditing] = React.useState(false);
   const [isSubmittingEdit, setIsSubmittingEdit] = React.useState(false);
+  const [isLoadingFull, setIsLoadingFull] = React.useState(false);
   const [draftContent, setDraftContent] = React.useState("");
   const observerRef = React.useRef<HTMLParagraphElement>(null);
   const editTextareaRef = React.useRef<HTMLTextAreaElement>(null);
@@ -59,10 +74,30 @@ export function UserMessage({
   const hasRepo = trimmedRepoUrl.length > 0;
   const hasAttachments = Boolean(attachments && attachments.length > 0);
 
+  const loadFullText = async (): Promise<string> => {
+    if (!onLoadFullMessage) return textContent;
+    setIsLoadingFull(true);
+    try {
+      const fullMessage = await onLoadFullMessage();
+      return fullMessage ? parseContent(fullMessage.content) : textContent;
+    } finally {
+      setIsLoadingFull(false);
+    }
+  };
+
+  const onShowFullMessage = async () => {
+    try {
+      await loadFullText();
+      setIsExpanded(true);
+    } catch (err) {
+      console.error("Failed to load full message", err);
+    }
+  };
+
   // Copy handler
   const onCopy = async () => {
     try {
-      await navigator.clipboard.writeText(textContent);
+      await navigator.clipboard.writeText(await loadFullText());
       setIsCopied(true);
       setTimeout(() => setIsCopied(false), 2000);
     } catch (err) {
@@ -71,9 +106,14 @@ export function UserMessage({
   };
 
   // Edit handler
-  const handleEdit = () => {
-    setDraftContent(textContent);
-    setIsEditing(true);
+  const handleEdit = async () => {
+    try {
+      // Editing the clipped preview would resend a truncated prompt.
+      setDraftContent(await loadFullText());
+      setIsEditing(true);
+    } catch (err) {
+      console.error("Failed to load full message", err);
+    }
   };
 
   const handleCancelEdit = () => {
@@ -209,7 +249,21 @@ export function UserMessage({
                 </p>
               </div>
               <div className="flex items-center justify-between w-full gap-1 opacity-100 md:opacity-0 md:group-hover:opacity-100 transition-opacity">
-                {shouldCollapse && (
+                {onLoadFullMessage ? (
+                  <button
+                    onClick={onShowFullMessage}
+                    disabled={isLoadingFull}
+                    className="flex items-center gap-1 text-sm text-muted-foreground hover:text-foreground transition-colors cursor-pointer disabled:opacity-60"
+                  >
+                    {isLoadingFull ? (
+                      <Loader2 className="h-4 w-4 animate-spin" />
+                    ) : (
+                      <ChevronDown className="h-4 w-4" />
+                    )}
+                    {t("chat.showFullMessage")}
+                  </button>
+                ) : null}
+                {!onLoadFullMessage && shouldCollapse && (
                   <button
                     onClick={() => setIsExpanded(!isExpanded)}
                     className="flex items-center gap-1 text-sm text-muted-foreground hover:text-foreground transition-colors cursor-pointer"
@@ -215,6 +215,9 @@ export function ChatPanel({
     messages,
     displayMessages,
     isLoadingHistory,
+    hasOlderMessages,
+    isLoadingOlderMessages,
+    loadOlderMessages,
     showTypingIndicator,
     sendMessage,
     beginOptimisticRegenerate,
@@ -222,6 +225,7 @@ export function ChatPanel({
     commitOptimisticHistoryMutation,
     rollbackOptimisticHistoryMutation,
     reloadMessagesSnapshot,
+    loadFullMessage,
     runUsageByUserMessageId,
   } = useChatMessages({ session });
 
@@ -1230,11 +1234,15 @@ export function ChatPanel({
           <ChatMessageList
             messages={displayMessages}
             isTyping={showTypingIndicator}
+            hasOlderMessages={hasOlderMessages}
+            isLoadingOlderMessages={isLoadingOlderMessages}
+            onLoadOlderMessages={() => void loadOlderMessages()}
             sessionStatus={session?.status}
             repoUrl={session?.config_snapshot?.repo_url ?? null}
             gitBranch={session?.config_snapshot?.git_branch ?? null}
             runUsageByUserMessageId={runUsageByUserMessageId}
             onEditMessage={handleEditMessage}
+            onLoadFullMessage={loadFullMessage}
             onRegenerateMessage={handleRegenerateMessage}
             onCreateBranch={handleCreateBranch}
             branchingAssistantMessageId={branchingMessageId}
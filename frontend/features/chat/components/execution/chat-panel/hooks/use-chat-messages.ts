@@ -4,9 +4,10 @@ import {
   type TaskEnqueueActionResult,
 } from "@/features/chat/actions/session-actions";
 import {
+  getMessageAction,
   getMessageAttachmentsDeltaRawAction,
   getMessagesBaseDeltaRawAction,
-  getMessagesRawAction,
+  getMessagesWindowRawAction,
   getRunsBySessionAction,
 } from "@/features/chat/actions/query-actions";
 import type {
@@ -20,6 +21,10 @@ import {
   type RawApiMessage,
 } from "@/features/chat/services/message-parser";
 import type { ModelSelection } from "@/features/chat/lib/model-catalog";
+import {
+  isSessionEventStreamOpen,
+  subscribeSessionEvents,
+} from "@/features/chat/lib/session-events";
 
 interface UseChatMessagesOptions {
   session: ExecutionSession | null;
@@ -30,6 +35,9 @@ interface UseChatMessagesReturn {
   messages: ChatMessage[];
   displayMessages: ChatMessage[];
   isLoadingHistory: boolean;
+  hasOlderMessages: boolean;
+  isLoadingOlderMessages: boolean;
+  loadOlderMessages: () => Promise<void>;
   isTyping: boolean;
   showTypingIndicator: boolean;
   sendMessage: (
@@ -46,6 +54,7 @@ interface UseChatMessagesReturn {
   commitOptimisticHistoryMutation: (mutationToken: string) => void;
   rollbackOptimisticHistoryMutation: (mutationToken: string) => void;
   reloadMessagesSnapshot: () => Promise<void>;
+  loadFullMessage: (message: ChatMessage) => Promise<ChatMessage | null>;
   runUsageByUserMessageId: Record<string, UsageResponse | null>;
 }
 
@@ -130,6 +139,8 @@ function compareMessagesForRenderOrder(a: ChatMessage, b: ChatMessage): number {
 
 const DELTA_PAGE_SIZE = 500;
 const MAX_DELTA_PAGES_PER_CYCLE = 5;
+// History opens at its tail; older messages are paged in on demand.
+const HISTORY_PAGE_SIZE = 100;
 
 function mergeRawMessagesById(
   current: RawApiMessage[],
@@ -158,6 +169,18 @@ function mergeRawMessagesById(
   return Array.from(byId.values()).sort((a, b) => a.id - b.id);
 }
 
+function collectAttachmentsByMessageId(
+  messages: RawApiMessage[],
+  into: Record<number, InputFile[]> = {},
+): Record<number, InputFile[]> {
+  messages.forEach((message) => {
+    if ((message.attachments?.length ?? 0) > 0) {
+      into[message.id] = message.attachments ?? [];
+    }
+  });
+  return into;
+}
+
 function buildAttachmentSignature(attachments?: InputFile[] | null): string {
   if (!attachments || attachments.length === 0) {
     return "";
@@ -243,6 +266,8 @@ export function useChatMessages({
 }: UseChatMessagesOptions): UseChatMessagesReturn {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [isLoadingHistory, setIsLoadingHistory] = useState(false);
+  const [hasOlderMessages, setHasOlderMessages] = useState(false);
+  const [isLoadingOlderMessages, setIsLoadingOlderMessages] = useState(false);
   const [isTyping, setIsTyping] = useState(false);
   const [runUsageByUserMessageId, setRunUsageByUserMessageId] = useState<
     Record<string, UsageResponse | null>
@@ -251,12 +276,20 @@ export function useChatMessages({
   const lastLoadedSessionIdRef = useRef<string | null>(null);
   const realUserMessageIdsRef = useRef<number[] | null>(null);
   const rawMessagesRef = useRef<RawApiMessage[]>([]);
+  // Full bodies of offloaded messages, fetched on expand or copy. Message rows
+  // are never rewritten, so an id always maps to the same content.
+  const fullContentByIdRef = useRef<Map<number, Record<string, unknown>>>(
+    new Map(),
+  );
   const [activeHistoryMutation, setActiveHistoryMutation] =
     useState<HistoryMutation | null>(null);
   const mutationRollbackMessagesRef = useRef<ChatMessage[] | null>(null);
   const activeMutationTokenRef = useRef<string | null>(null);
   const mutationSequenceRef = useRef(0);
   const messageCursorRef = useRef(0);
+  const hasLoadedTailRef = useRef(false);
+  const olderCursorRef = useRef<number | null>(null);
+  const olderInFlightRef = useRef(false);
   const attachmentCursorRef = useRef(0);
   const attachmentsByMessageIdRef = useRef<Record<number, InputFile[]>>({});
   const messageDeltaInFlightRef = useRef<{
@@ -270,7 +303,41 @@ export function useChatMessages({
 
   const buildParsedMessages = useCallback(() => {
     const realUserMessageIds = realUserMessageIdsRef.current ?? undefined;
-    return parseMessages(rawMessagesRef.current, realUserMessageIds).messages;
+    const fullContentById = fullContentByIdRef.current;
+    const rawMessages =
+      fullContentById.size === 0
+        ? rawMessagesRef.current
+        : rawMessagesRef.current.map((message) => {
+            const content = fullContentById.get(message.id);
+            return content ? { ...message, content } : message;
+          });
+    return parseMessages(rawMessages, realUserMessageIds).messages;
+  }, []);
+
+  // Replaces the loaded history with the latest window; the delta and
+  // attachment cursors continue after its last message.
+  const loadLatestWindow = useCallback(async (sessionId: string) => {
+    const page = await getMessagesWindowRawAction({
+      sessionId,
+      limit: HISTORY_PAGE_SIZE,
+    });
+    if (lastLoadedSessionIdRef.current !== sessionId) {
+      return false;
+    }
+
+    const lastId = page.items.at(-1)?.id ?? 0;
+    rawMessagesRef.current = page.items;
+    messageCursorRef.current = lastId;
+    attachmentCursorRef.current = lastId;
+    attachmentsByMessageIdRef.current = collectAttachmentsByMessageId(
+      page.items,
+    );
+    olderCursorRef.current = page.has_more_before
+      ? page.next_before_message_id
+      : null;
+    hasLoadedTailRef.current = true;
+    setHasOlderMessages(page.has_more_before);
+    return true;
   }, []);
 
   const fetchMessagesDelta = useCallback(
@@ -289,6 +356,13 @@ export function useChatMessages({
         if (lastLoadedSessionIdRef.current !== sessionId) {
           return { changed: false, hasMore: false };
         }
+        let changed = false;
+        if (!hasLoadedTailRef.current) {
+          if (!(await loadLatestWindow(sessionId))) {
+            return { changed: false, hasMore: false };
+          }
+          changed = rawMessagesRef.current.length > 0;
+        }
 
         const knownIds = new Set(
           rawMessagesRef.current.map((message) => message.id),
@@ -339,7 +413,7 @@ export function useChatMessages({
           );
         }
 
-        return { changed: appended.length > 0, hasMore };
+        return { changed: changed || appended.length > 0, hasMore };
       })();
 
       messageDeltaInFlightRef.current = { sessionId, promise: request };
@@ -351,7 +425,7 @@ export function useChatMessages({
         }
       }
     },
-    [],
+    [loadLatestWindow],
   );
 
   const fetchMessageAttachmentsDelta = useCallback(
@@ -584,33 +658,93 @@ export function useChatMessages({
     try {
       await refreshRealUserMessageIds();
 
-      const rawMessages = await getMessagesRawAction({ sessionId });
-      if (lastLoadedSessionIdRef.current !== sessionId) {
+      if (!(await loadLatestWindow(sessionId))) {
         return;
       }
 
-      rawMessagesRef.current = rawMessages;
-      messageCursorRef.current = rawMessages.at(-1)?.id ?? 0;
-      attachmentCursorRef.current = rawMessages.at(-1)?.id ?? 0;
-      attachmentsByMessageIdRef.current = rawMessages.reduce<
-        Record<number, InputFile[]>
-      >((acc, message) => {
-        if ((message.attachments?.length ?? 0) > 0) {
-          acc[message.id] = message.attachments ?? [];
-        }
-        return acc;
-      }, {});
-
       syncMessagesFromServerState();
     } catch (error) {
       console.error("[Chat] Failed to reload message snapshot:", error);
     }
   }, [
+    loadLatestWindow,
     refreshRealUserMessageIds,
     session?.session_id,
     syncMessagesFromServerState,
   ]);
 
+  // Fetches the full bodies behind a message's clipped previews and returns
+  // the message re-parsed from them.
+  const loadFullMessage = useCallback(
+    async (message: ChatMessage): Promise<ChatMessage | null> => {
+      const sessionId = session?.session_id;
+      const fullContentById = fullContentByIdRef.current;
+      const missingIds = (message.offloadedMessageIds ?? []).filter(
+        (id) => !fullContentById.has(id),
+      );
+      if (missingIds.length > 0) {
+        const fullMessages = await Promise.all(
+          missingIds.map((messageId) => getMessageAction({ messageId })),
+        );
+        if (lastLoadedSessionIdRef.current !== sessionId) {
+          return null;
+        }
+        for (const full of fullMessages) {
+          fullContentById.set(full.id, full.content);
+        }
+        syncMessagesFromServerState();
+      }
+      return (
+        buildParsedMessages().find((parsed) => parsed.id === message.id) ??
+        null
+      );
+    },
+    [buildParsedMessages, session?.session_id, syncMessagesFromServerState],
+  );
+
+  const loadOlderMessages = useCallback(async (): Promise<void> => {
+    const sessionId = session?.session_id;
+    const beforeMessageId = olderCursorRef.current;
+    if (!sessionId || beforeMessageId === null || olderInFlightRef.current) {
+      return;
+    }
+
+    olderInFlightRef.current = true;
+    setIsLoadingOlderMessages(true);
+    try {
+      const page = await getMessagesWindowRawAction({
+        sessionId,
+        beforeMessageId,
+        limit: HISTORY_PAGE_SIZE,
+      });
+      if (
+        lastLoadedSessionIdRef.current !== sessionId ||
+        olderCursorRef.current !== beforeMessageId
+      ) {
+        return;
+      }
+
+      rawMessagesRef.current = mergeRawMessagesById(
+        rawMessagesRef.current,
+        page.items,
+      );
+      collectAttachmentsByMessageId(
+        page.items,
+        attachmentsByMessageIdRef.current,
+      );
+      olderCursorRef.current = page.has_more_before
+        ? page.next_before_message_id
+        : null;
+      setHasOlderMessages(page.has_more_before);
+      syncMessagesFromServerState();
+    } catch (error) {
+      console.error("[Chat] Failed to load older messages:", error);
+    } finally {
+      olderInFlightRef.current = false;
+      setIsLoadingOlderMessages(false);
+    }
+  }, [session?.session_id, syncMessagesFromServerState]);
+
   // Load and poll for messages
   useEffect(() => {
     if (!session?.session_id) return;
@@ -622,7 +756,13 @@ export function useChatMessages({
       setIsTyping(false);
       realUserMessageIdsRef.current = null;
       rawMessagesRef.current = [];
+      fullContentByIdRef.current = new Map();
       messageCursorRef.current = 0;
+      hasLoadedTailRef.current = false;
+      olderCursorRef.current = null;
+      olderInFlightRef.current = false;
+      setHasOlderMessages(false);
+      setIsLoadingOlderMessages(false);
       attachmentCursorRef.current = 0;
       attachmentsByMessageIdRef.current = {};
       messageDeltaInFlightRef.current = null;
@@ -684,15 +824,26 @@ export function useChatMessages({
     void refreshRealUserMessageIds();
     void fetchMessages(true);
 
-    // Setup polling
+    // Setup polling; pushed message events replace it while the stream is open.
+    // Events only announce changes, so both they and (re)connects trigger a
+    // delta fetch from our own cursor; that also covers commits made between
+    // the initial load and the stream starting.
     let interval: NodeJS.Timeout;
+    let unsubscribe: (() => void) | undefined;
 
     const isTerminal = ["completed", "failed", "canceled"].includes(
       session.status,
     );
 
     if (session.session_id && !isTerminal) {
+      const sessionId = session.session_id;
+      unsubscribe = subscribeSessionEvents(sessionId, (event) => {
+        if (event.type === "messages" || event.type === "open") {
+          void fetchMessages(false);
+        }
+      });
       interval = setInterval(() => {
+        if (isSessionEventStreamOpen(sessionId)) return;
         void fetchMessages(false);
       }, pollingInterval);
     } else if (session.session_id && isTerminal) {
@@ -702,6 +853,7 @@ export function useChatMessages({
 
     return () => {
       isCancelled = true;
+      unsubscribe?.();
       if (interval) clearInterval(interval);
     };
   }, [
@@ -818,6 +970,9 @@ export function useChatMessages({
     messages,
     displayMessages,
     isLoadingHistory,
+    hasOlderMessages,
+    isLoadingOlderMessages,
+    loadOlderMessages,
     isTyping,
     showTypingIndicator,
     sendMessage,
@@ -826,6 +981,7 @@ export function useChatMessages({
     commitOptimisticHistoryMutation,
     rollbackOptimisticHistoryMutation,
     reloadMessagesSnapshot,
+    loadFullMessage,
     runUsageByUserMessageId,
   };
 }
@@ -42,6 +42,8 @@ import { useT } from "@/lib/i18n/client";
 import { useIsMobile } from "@/hooks/use-mobile";
 import { cn } from "@/lib/utils";
 
+const BROWSER_MCP_SERVER_NAME = "__poco_playwright";
+
 interface StatusBarProps {
   // Runtime execution data (deprecated, now using configSnapshot)
   skills?: SkillUse[];
@@ -160,6 +162,15 @@ export function StatusBar({
     });
   }, [mcpStatuses]);
 
+  // Readiness of the executor's built-in browser MCP server.
+  const browserMcpStatus = React.useMemo(
+    () =>
+      (mcpStatuses ?? []).find(
+        (mcp) => (mcp?.server_name || "").trim() === BROWSER_MCP_SERVER_NAME,
+      )?.status ?? null,
+    [mcpStatuses],
+  );
+
   // Prefer config snapshot data, fallback to runtime data
   const hasSkills = configuredSkills.length > 0 || skills.length > 0;
   const hasMcp =
@@ -292,6 +303,11 @@ export function StatusBar({
             >
               {t("common.enabled")}
             </Badge>
+            {browserMcpStatus ? (
+              <span title={browserMcpStatus}>
+                {getMcpStatusIcon(browserMcpStatus)}
+              </span>
+            ) : null}
           </div>
         )}
 
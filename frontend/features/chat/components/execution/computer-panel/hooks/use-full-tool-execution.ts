@@ -0,0 +1,50 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import { getToolExecutionAction } from "@/features/chat/actions/query-actions";
+import type { ToolExecutionResponse } from "@/features/chat/types";
+
+// Large outputs are stored as a clipped preview plus this reference; the full
+// body is only returned by the single tool execution endpoint.
+const OFFLOAD_REFERENCE_KEY = "_offloaded";
+
+function isOffloaded(execution: ToolExecutionResponse): boolean {
+  return Boolean(
+    execution.tool_output && OFFLOAD_REFERENCE_KEY in execution.tool_output,
+  );
+}
+
+/**
+ * Returns the execution with its full tool output, loading it on demand when
+ * the list payload only carried a preview.
+ */
+export function useFullToolExecution(
+  execution: ToolExecutionResponse | null,
+): ToolExecutionResponse | null {
+  const [loaded, setLoaded] = useState<Record<string, ToolExecutionResponse>>(
+    {},
+  );
+  const executionId = execution?.id;
+  const full = execution ? loaded[execution.id] : undefined;
+  const isFresh = !!full && full.updated_at === execution?.updated_at;
+  const needsLoad = !!execution && isOffloaded(execution) && !isFresh;
+
+  useEffect(() => {
+    if (!executionId || !needsLoad) return;
+    let cancelled = false;
+    getToolExecutionAction({ executionId })
+      .then((result) => {
+        if (cancelled) return;
+        setLoaded((prev) => ({ ...prev, [result.id]: result }));
+      })
+      .catch((error) => {
+        console.error("[ComputerPanel] Failed to load full tool output:", error);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [executionId, needsLoad]);
+
+  if (!execution) return null;
+  return isFresh && full ? full : execution;
+}
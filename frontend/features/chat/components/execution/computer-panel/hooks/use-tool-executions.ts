@@ -6,9 +6,15 @@ import {
   getRunToolExecutionsDeltaAction,
 } from "@/features/chat/actions/query-actions";
 import type { ToolExecutionResponse } from "@/features/chat/types";
+import {
+  isSessionEventStreamOpen,
+  subscribeSessionEvents,
+} from "@/features/chat/lib/session-events";
 
 interface UseToolExecutionsOptions {
   runId?: string;
+  /** When set, pushed session events drive refreshes instead of the poll timer. */
+  sessionId?: string;
   isActive?: boolean;
   pollingIntervalMs?: number;
   limit?: number;
@@ -16,6 +22,7 @@ interface UseToolExecutionsOptions {
 
 export function useToolExecutions({
   runId,
+  sessionId,
   isActive = false,
   pollingIntervalMs = 2000,
   limit = 500,
@@ -256,15 +263,27 @@ export function useToolExecutions({
     void fetchSnapshot(true);
   }, [fetchSnapshot, runId]);
 
-  // Poll while active.
+  // Poll while active, unless the session event stream is delivering updates.
+  // Change events and (re)connects both trigger a delta fetch from our cursor.
   useEffect(() => {
     if (!runId) return;
     if (!isActive) return;
+    const unsubscribe = sessionId
+      ? subscribeSessionEvents(sessionId, (event) => {
+          if (event.type === "tool_executions" || event.type === "open") {
+            void fetchDelta();
+          }
+        })
+      : undefined;
     const id = setInterval(() => {
+      if (sessionId && isSessionEventStreamOpen(sessionId)) return;
       void fetchDelta();
     }, pollingIntervalMs);
-    return () => clearInterval(id);
-  }, [fetchDelta, isActive, pollingIntervalMs, runId]);
+    return () => {
+      unsubscribe?.();
+      clearInterval(id);
+    };
+  }, [fetchDelta, isActive, pollingIntervalMs, runId, sessionId]);
 
   // When a session transitions from active -> terminal, fetch once more so the UI
   // can pick up the final tool_output written during cancellation/failure.
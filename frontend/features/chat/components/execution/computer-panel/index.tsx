@@ -32,6 +32,7 @@ import { useT } from "@/lib/i18n/client";
 import { getRunBrowserScreenshotAction } from "@/features/chat/actions/query-actions";
 import type { ToolExecutionResponse } from "@/features/chat/types";
 import { useToolExecutions } from "./hooks/use-tool-executions";
+import { useFullToolExecution } from "./hooks/use-full-tool-execution";
 import { ApiError } from "@/lib/errors";
 import { Button } from "@/components/ui/button";
 import { Slider } from "@/components/ui/slider";
@@ -52,6 +53,7 @@ import {
 
 interface ComputerPanelProps {
   runId?: string;
+  sessionId?: string;
   legacySessionReplayAvailable?: boolean;
   sessionStatus?:
     | "queued"
@@ -96,6 +98,7 @@ function renderToolKindIcon(toolName: string): React.ReactNode {
 
 export function ComputerPanel({
   runId,
+  sessionId,
   legacySessionReplayAvailable = false,
   sessionStatus,
   headerAction,
@@ -113,6 +116,7 @@ export function ComputerPanel({
     loadMore,
   } = useToolExecutions({
     runId,
+    sessionId,
     isActive,
     pollingIntervalMs: 2000,
     limit: 100,
@@ -334,6 +338,11 @@ export function ComputerPanel({
   }, [replayFrames, selectedFrameId]);
 
   const selectedFrame = selectedIndex >= 0 ? replayFrames[selectedIndex] : null;
+  const selectedExecution = useFullToolExecution(
+    selectedFrame && selectedFrame.kind !== "browser"
+      ? selectedFrame.execution
+      : null,
+  );
   const sliderMax = Math.max(0, replayFrames.length - 1);
 
   const stopPlayback = React.useCallback(() => {
@@ -528,10 +537,11 @@ export function ComputerPanel({
         />
       );
     }
+    const execution = selectedExecution ?? selectedFrame.execution;
     if (selectedFrame.kind === "tool") {
-      return <GenericToolViewer execution={selectedFrame.execution} />;
+      return <GenericToolViewer execution={execution} />;
     }
-    return <TerminalViewer execution={selectedFrame.execution} />;
+    return <TerminalViewer execution={execution} />;
   })();
 
   const canGoPrev = replayFrames.length > 0 && selectedIndex > 0;
@@ -11,13 +11,16 @@ import {
   EyeOff,
   ChevronRight,
 } from "lucide-react";
+import { toast } from "sonner";
 import { Button } from "@/components/ui/button";
+import { chatService } from "@/features/chat/api/chat-api";
 import type { FileChange } from "@/features/chat/types";
 import { useT } from "@/lib/i18n/client";
 import { cn } from "@/lib/utils";
 
 interface FileChangeCardProps {
   change: FileChange;
+  sessionId?: string;
   sessionStatus?:
     | "queued"
     | "claimed"
@@ -68,6 +71,7 @@ function getStatusConfig(status: FileChange["status"]) {
  */
 export function FileChangeCard({
   change,
+  sessionId,
   sessionStatus,
   onFileClick,
 }: FileChangeCardProps) {
@@ -75,14 +79,22 @@ export function FileChangeCard({
   const statusConfig = getStatusConfig(change.status);
   const StatusIcon = statusConfig.icon;
   const [isDiffCollapsed, setIsDiffCollapsed] = React.useState(false);
+  const [fullDiff, setFullDiff] = React.useState<string | null>(null);
+  const [isLoadingFullDiff, setIsLoadingFullDiff] = React.useState(false);
+
+  React.useEffect(() => {
+    setFullDiff(null);
+  }, [change.diff]);
 
   const addedLines = change.added_lines ?? 0;
   const deletedLines = change.deleted_lines ?? 0;
   const hasLineChanges = addedLines > 0 || deletedLines > 0;
+  const diffText = fullDiff ?? change.diff;
   const diffLines = React.useMemo(
-    () => (change.diff ? change.diff.split("\n") : []),
-    [change.diff],
+    () => (diffText ? diffText.split("\n") : []),
+    [diffText],
   );
+  const isDiffTruncated = Boolean(change.diff_truncated) && fullDiff === null;
 
   // Determine if session is running (execution state)
   const isSessionRunning =
@@ -98,6 +110,28 @@ export function FileChangeCard({
     }
   };
 
+  // The full diff is computed by the session's executor, so it can only be
+  // loaded while the session is running.
+  const canLoadFullDiff = Boolean(sessionId) && isSessionRunning;
+
+  const handleLoadFullDiff = async (e: React.MouseEvent) => {
+    e.stopPropagation();
+    if (!sessionId || isLoadingFullDiff) return;
+    setIsLoadingFullDiff(true);
+    try {
+      const result = await chatService.getWorkspaceFileDiff(sessionId, {
+        path: change.path,
+        staged: change.status === "staged",
+      });
+      setFullDiff(result.diff);
+    } catch (error) {
+      console.error("[FileChangeCard] Failed to load full diff:", error);
+      toast.error(t("fileChange.loadFullDiffFailed"));
+    } finally {
+      setIsLoadingFullDiff(false);
+    }
+  };
+
   const handleToggleDiffCollapse = (e: React.MouseEvent) => {
     e.stopPropagation();
     setIsDiffCollapsed((prev) => !prev);
@@ -184,7 +218,7 @@ export function FileChangeCard({
       {/* Line changes statistics */}
       {hasLineChanges && (
         <div className="flex min-w-0 items-center gap-3 overflow-hidden bg-muted/30 px-4 py-2 text-xs">
-          {change.diff ? (
+          {diffText ? (
             <Button
               variant="ghost"
               size="icon"
@@ -228,7 +262,7 @@ export function FileChangeCard({
       )}
 
       {/* Diff preview (if available) */}
-      {change.diff && !isDiffCollapsed ? (
+      {diffText && !isDiffCollapsed ? (
         <div className="border-t border-border px-4 py-3">
           <div className="w-full min-w-0">
             <div className="w-full min-w-0 text-xs font-mono bg-muted/50 rounded p-2 whitespace-pre-wrap break-all">
@@ -242,6 +276,26 @@ export function FileChangeCard({
                 </div>
               ))}
             </div>
+            {isDiffTruncated ? (
+              <div className="mt-2 flex min-w-0 items-center gap-2 text-xs text-muted-foreground">
+                <span className="min-w-0 flex-1 truncate">
+                  {canLoadFullDiff
+                    ? t("fileChange.diffTruncated")
+                    : t("fileChange.fullDiffUnavailable")}
+                </span>
+                {canLoadFullDiff ? (
+                  <Button
+                    variant="ghost"
+                    size="sm"
+                    className="h-6 shrink-0 px-2 text-xs"
+                    onClick={handleLoadFullDiff}
+                    disabled={isLoadingFullDiff}
+                  >
+                    {t("fileChange.loadFullDiff")}
+                  </Button>
+                ) : null}
+              </div>
+            ) : null}
           </div>
         </div>
       ) : null}
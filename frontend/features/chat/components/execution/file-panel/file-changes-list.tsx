@@ -8,6 +8,7 @@ import type { FileChange } from "@/features/chat/types";
 
 interface FileChangesListProps {
   fileChanges?: FileChange[];
+  sessionId?: string;
   sessionStatus?:
     | "queued"
     | "claimed"
@@ -143,6 +144,7 @@ function Badge({ value, label, prefix = "", color }: BadgeProps) {
  */
 export function FileChangesList({
   fileChanges = [],
+  sessionId,
   sessionStatus,
   onFileClick,
 }: FileChangesListProps) {
@@ -188,6 +190,7 @@ export function FileChangesList({
             <FileChangeCard
               key={`${change.path}-${index}`}
               change={change}
+              sessionId={sessionId}
               sessionStatus={sessionStatus}
               onFileClick={() => onFileClick?.(change.path)}
             />
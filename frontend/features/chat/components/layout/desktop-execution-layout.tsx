@@ -173,6 +173,7 @@ export function DesktopExecutionLayout({
                       >
                         <ComputerPanel
                           runId={selectedRunId}
+                          sessionId={sessionId}
                           legacySessionReplayAvailable={
                             legacySessionReplayAvailable
                           }
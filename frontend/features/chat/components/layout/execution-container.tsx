@@ -64,6 +64,7 @@ export function ExecutionContainer({ sessionId }: ExecutionContainerProps) {
   );
   const { executions, isLoading: isLoadingToolExecutions } = useToolExecutions({
     runId: effectiveSelectedRunId ?? undefined,
+    sessionId,
     isActive:
       selectedRun?.run_id != null &&
       selectedRun.run_id === activeRun?.run_id &&
@@ -284,6 +284,7 @@ export function MobileExecutionView({
                     sessionId ? (
                       <ComputerPanel
                         runId={selectedRunId}
+                        sessionId={sessionId}
                         legacySessionReplayAvailable={
                           legacySessionReplayAvailable
                         }
@@ -1,6 +1,7 @@
 import { useState, useCallback, useEffect, useRef } from "react";
 import { getExecutionSessionAction } from "@/features/chat/actions/query-actions";
 import { useAdaptivePolling } from "./use-adaptive-polling";
+import { subscribeSessionEvents } from "@/features/chat/lib/session-events";
 import type { ExecutionSession } from "@/features/chat/types";
 import { playCompletionSound } from "@/lib/utils/sound";
 
@@ -62,7 +63,8 @@ interface UseExecutionSessionReturn {
  *
  * Features:
  * - Fetches session data from API
- * - Automatically polls while session is active
+ * - Follows the session event stream while active, polling only as a fallback
+ * - Automatically polls while session is active and the stream is down
  * - Adaptive polling with exponential backoff on errors
  * - Persists user_prompt across session updates
  * - Polling interval controlled by NEXT_PUBLIC_SESSION_POLLING_INTERVAL env variable
@@ -187,9 +189,31 @@ export function useExecutionSession({
     }
   }, [session, onPollingStop]);
 
+  // Refetch on pushed state/run changes instead of polling while the stream is up;
+  // a (re)connect also refetches to pick up changes made while it was down.
+  const [isStreamOpen, setIsStreamOpen] = useState(false);
+
+  useEffect(() => {
+    if (!isSessionActive) return;
+    const unsubscribe = subscribeSessionEvents(sessionId, (event) => {
+      if (event.type === "open") {
+        setIsStreamOpen(true);
+        void fetchSession();
+      } else if (event.type === "error") {
+        setIsStreamOpen(false);
+      } else if (event.type === "state" || event.type === "run") {
+        void fetchSession();
+      }
+    });
+    return () => {
+      unsubscribe();
+      setIsStreamOpen(false);
+    };
+  }, [sessionId, isSessionActive, fetchSession]);
+
   const { currentInterval, errorCount, trigger } = useAdaptivePolling({
     callback: fetchSession,
-    isActive: isSessionActive,
+    isActive: isSessionActive && !isStreamOpen,
     interval: pollingInterval,
     enableBackoff,
   });
@@ -0,0 +1,112 @@
+import { API_ENDPOINTS, API_PREFIX } from "@/services/api-client";
+
+export type SessionEventType = "messages" | "tool_executions" | "state" | "run";
+
+export type SessionEventListener = (event: {
+  type: SessionEventType | "open" | "error";
+  data?: unknown;
+}) => void;
+
+interface SessionEventChannel {
+  source: EventSource;
+  listeners: Set<SessionEventListener>;
+  isOpen: boolean;
+}
+
+const EVENT_TYPES: SessionEventType[] = [
+  "messages",
+  "tool_executions",
+  "state",
+  "run",
+];
+
+const channels = new Map<string, SessionEventChannel>();
+
+function emit(
+  channel: SessionEventChannel,
+  event: Parameters<SessionEventListener>[0],
+) {
+  channel.listeners.forEach((listener) => {
+    try {
+      listener(event);
+    } catch (error) {
+      console.error("[SessionEvents] Listener error:", error);
+    }
+  });
+}
+
+function openChannel(sessionId: string): SessionEventChannel {
+  const source = new EventSource(
+    `${API_PREFIX}${API_ENDPOINTS.sessionEvents(sessionId)}`,
+    { withCredentials: true },
+  );
+  const channel: SessionEventChannel = {
+    source,
+    listeners: new Set(),
+    isOpen: false,
+  };
+
+  source.onopen = () => {
+    channel.isOpen = true;
+    emit(channel, { type: "open" });
+  };
+  // EventSource reconnects on its own and resumes via Last-Event-ID; callers
+  // only need to know the stream is down so they can fall back to polling.
+  // Events are change notifications: listeners fetch the data themselves.
+  source.onerror = () => {
+    channel.isOpen = false;
+    emit(channel, { type: "error" });
+  };
+  EVENT_TYPES.forEach((type) => {
+    source.addEventListener(type, (event) => {
+      let data: unknown;
+      try {
+        data = JSON.parse((event as MessageEvent<string>).data);
+      } catch {
+        data = undefined;
+      }
+      emit(channel, { type, data });
+    });
+  });
+
+  return channel;
+}
+
+/**
+ * Subscribe to the server-sent event stream of a session.
+ *
+ * One EventSource is shared per session and closed when the last listener
+ * unsubscribes.
+ */
+export function subscribeSessionEvents(
+  sessionId: string,
+  listener: SessionEventListener,
+): () => void {
+  if (typeof window === "undefined" || typeof EventSource === "undefined") {
+    return () => {};
+  }
+
+  let channel = channels.get(sessionId);
+  if (!channel) {
+    channel = openChannel(sessionId);
+    channels.set(sessionId, channel);
+  }
+  channel.listeners.add(listener);
+  if (channel.isOpen) {
+    listener({ type: "open" });
+  }
+
+  return () => {
+    const current = channels.get(sessionId);
+    if (!current) return;
+    current.listeners.delete(listener);
+    if (current.listeners.size === 0) {
+      current.source.close();
+      channels.delete(sessionId);
+    }
+  };
+}
+
+export function isSessionEventStreamOpen(sessionId: string): boolean {
+  return channels.get(sessionId)?.isOpen ?? false;
+}
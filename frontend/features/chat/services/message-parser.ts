@@ -68,6 +68,19 @@ function typeIncludes(typeValue: unknown, needle: string): boolean {
   return typeValue === needle || typeValue.includes(needle);
 }
 
+// Oversized message contents are listed as a clipped preview plus this
+// reference; the single message endpoint returns the full body.
+const OFFLOAD_REFERENCE_KEY = "_offloaded";
+
+/** Records that `raw` contributed only a clipped preview to `message`. */
+function markOffloaded(message: ChatMessage, raw: RawApiMessage): void {
+  if (!raw.content || !(OFFLOAD_REFERENCE_KEY in raw.content)) return;
+  const ids = message.offloadedMessageIds ?? [];
+  if (!ids.includes(raw.id)) {
+    message.offloadedMessageIds = [...ids, raw.id];
+  }
+}
+
 /** Removes the Unicode replacement character (\uFFFD) from text. */
 function cleanText(text: string): string {
   if (!text) return text;
@@ -273,6 +286,7 @@ export function parseMessages(
         }));
 
         currentAssistantMessage.content = [...existingBlocks, ...uiToolBlocks];
+        markOffloaded(currentAssistantMessage, msg);
       }
     }
 
@@ -314,6 +328,7 @@ export function parseMessages(
           ...existingBlocks,
           ...uiResultBlocks,
         ];
+        markOffloaded(currentAssistantMessage, msg);
 
         if (msg.role === "user") continue;
       }
@@ -351,6 +366,7 @@ export function parseMessages(
           ...existingBlocks,
           ...uiThinkingBlocks,
         ];
+        markOffloaded(currentAssistantMessage, msg);
       }
     }
 
@@ -382,30 +398,35 @@ export function parseMessages(
         }
 
         currentAssistantMessage = null;
-        processedMessages.push({
+        const userMessage: ChatMessage = {
           id: msg.id.toString(),
           role: "user",
           content: textContent,
           status: "completed",
           timestamp: msg.created_at,
           attachments: msg.attachments ?? undefined,
-        });
+        };
+        markOffloaded(userMessage, msg);
+        processedMessages.push(userMessage);
       } else {
         if (currentAssistantMessage) {
           currentAssistantMessage = appendAssistantTextBlock(
             currentAssistantMessage,
             textContent,
           );
+          markOffloaded(currentAssistantMessage, msg);
           processedMessages[processedMessages.length - 1] =
             currentAssistantMessage;
         } else {
-          processedMessages.push({
+          const assistantMessage: ChatMessage = {
             id: msg.id.toString(),
             role: "assistant",
             content: textContent,
             status: "completed",
             timestamp: msg.created_at,
-          });
+          };
+          markOffloaded(assistantMessage, msg);
+          processedMessages.push(assistantMessage);
         }
       }
     }
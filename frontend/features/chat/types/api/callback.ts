@@ -27,6 +27,7 @@ export interface FileChange {
   added_lines?: number;
   deleted_lines?: number;
   diff?: string | null;
+  diff_truncated?: boolean;
   old_path?: string | null;
 }
 
@@ -22,6 +22,12 @@ export interface WorkspaceArchiveResponse {
   filename: string;
 }
 
+export interface WorkspaceFileDiffResponse {
+  path: string;
+  staged: boolean;
+  diff: string;
+}
+
 export interface SubmitSkillResponse {
   pending_id: string;
   status: string;
@@ -130,6 +130,12 @@ export interface MessageDeltaResponse {
   has_more: boolean;
 }
 
+export interface MessageWindowResponse {
+  items: MessageResponse[];
+  next_before_message_id: number | null;
+  has_more_before: boolean;
+}
+
 export interface MessageAttachmentsResponse {
   message_id: number;
   attachments: InputFile[];
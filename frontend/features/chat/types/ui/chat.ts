@@ -68,6 +68,8 @@ export type ChatMessage = {
   };
   parentId?: string;
   attachments?: InputFile[];
+  // Raw message ids whose content arrived as a clipped preview.
+  offloadedMessageIds?: number[];
 };
 
 export type ChatSession = {
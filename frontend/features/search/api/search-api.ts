@@ -1,5 +1,6 @@
 import { apiClient, API_ENDPOINTS } from "@/services/api-client";
 import type {
+  SearchHighlight,
   SearchResultMessage,
   SearchResultProject,
   SearchResultTask,
@@ -10,6 +11,7 @@ type SearchTaskApi = {
   title: string | null;
   status: string;
   timestamp: string;
+  highlights?: SearchHighlight[];
 };
 
 type SearchProjectApi = {
@@ -22,6 +24,8 @@ type SearchMessageApi = {
   session_id: string;
   text_preview: string;
   timestamp: string;
+  snippet?: string;
+  highlights?: SearchHighlight[];
 };
 
 type GlobalSearchApiResponse = {
@@ -29,6 +33,7 @@ type GlobalSearchApiResponse = {
   tasks: SearchTaskApi[];
   projects: SearchProjectApi[];
   messages: SearchMessageApi[];
+  messages_has_more?: boolean;
 };
 
 function mapTask(task: SearchTaskApi): SearchResultTask {
@@ -37,6 +42,7 @@ function mapTask(task: SearchTaskApi): SearchResultTask {
     title: task.title ?? "",
     status: task.status,
     timestamp: task.timestamp,
+    highlights: task.highlights ?? [],
     type: "task",
   };
 }
@@ -53,6 +59,8 @@ function mapMessage(message: SearchMessageApi): SearchResultMessage {
   return {
     id: message.message_id,
     content: message.text_preview,
+    snippet: message.snippet || message.text_preview,
+    highlights: message.snippet ? (message.highlights ?? []) : [],
     chatId: message.session_id,
     timestamp: message.timestamp,
     type: "message",
@@ -78,6 +86,7 @@ export const searchService = {
       limit_tasks?: number;
       limit_projects?: number;
       limit_messages?: number;
+      offset_messages?: number;
       project_id?: string | null;
     },
     options?: { signal?: AbortSignal },
@@ -85,6 +94,7 @@ export const searchService = {
     tasks: SearchResultTask[];
     projects: SearchResultProject[];
     messages: SearchResultMessage[];
+    messagesHasMore: boolean;
   }> => {
     const query = buildQuery(params);
     const data = await apiClient.get<GlobalSearchApiResponse>(
@@ -96,6 +106,7 @@ export const searchService = {
       tasks: (data.tasks ?? []).map(mapTask),
       projects: (data.projects ?? []).map(mapProject),
       messages: (data.messages ?? []).map(mapMessage),
+      messagesHasMore: data.messages_has_more ?? false,
     };
   },
 };
@@ -10,10 +10,17 @@ import {
   CommandItem,
   CommandList,
 } from "@/components/ui/command";
-import { FileText, Folder, MessageSquare, Loader2 } from "lucide-react";
+import {
+  ChevronDown,
+  FileText,
+  Folder,
+  MessageSquare,
+  Loader2,
+} from "lucide-react";
 import { useT } from "@/lib/i18n/client";
 import { useLanguage } from "@/hooks/use-language";
 import { useSearchData } from "@/features/search/hooks/use-search-data";
+import { HighlightedText } from "@/features/search/components/highlighted-text";
 
 interface GlobalSearchDialogProps {
   open: boolean;
@@ -33,7 +40,15 @@ export function GlobalSearchDialog({
   const lng = useLanguage();
   const [searchQuery, setSearchQuery] = React.useState("");
   const [isComposing, setIsComposing] = React.useState(false);
-  const { tasks, projects, messages, isLoading } = useSearchData(searchQuery, {
+  const {
+    tasks,
+    projects,
+    messages,
+    hasMoreMessages,
+    isLoading,
+    isLoadingMore,
+    loadMoreMessages,
+  } = useSearchData(searchQuery, {
     enabled: open,
   });
   const [mounted, setMounted] = React.useState(false);
@@ -120,9 +135,15 @@ export function GlobalSearchDialog({
                 onSelect={() => handleSelect("task", task.id)}
               >
                 <FileText className="size-4 text-muted-foreground" />
-                <span className="flex-1">
-                  {task.title || t("chat.newChat")}
-                </span>
+                {task.title ? (
+                  <HighlightedText
+                    className="flex-1"
+                    text={task.title}
+                    highlights={task.highlights}
+                  />
+                ) : (
+                  <span className="flex-1">{t("chat.newChat")}</span>
+                )}
                 <span className="text-xs text-muted-foreground">
                   {new Date(task.timestamp).toLocaleDateString()}
                 </span>
@@ -153,16 +174,36 @@ export function GlobalSearchDialog({
 
         {messages.length > 0 && (
           <CommandGroup heading={t("search.messages")}>
-            {messages.slice(0, 5).map((message) => (
+            {messages.map((message) => (
               <CommandItem
                 key={message.id}
                 value={`message:${message.id}`}
                 onSelect={() => handleSelect("message", message.chatId)}
               >
                 <MessageSquare className="size-4 text-muted-foreground" />
-                <span className="line-clamp-1 flex-1">{message.content}</span>
+                <HighlightedText
+                  className="line-clamp-1 flex-1"
+                  text={message.snippet}
+                  highlights={message.highlights}
+                />
               </CommandItem>
             ))}
+            {hasMoreMessages && (
+              <CommandItem
+                value="message:load-more"
+                onSelect={() => void loadMoreMessages()}
+                disabled={isLoadingMore}
+              >
+                {isLoadingMore ? (
+                  <Loader2 className="size-4 animate-spin text-muted-foreground" />
+                ) : (
+                  <ChevronDown className="size-4 text-muted-foreground" />
+                )}
+                <span className="flex-1 text-muted-foreground">
+                  {t("search.loadMoreMessages")}
+                </span>
+              </CommandItem>
+            )}
           </CommandGroup>
         )}
       </CommandList>
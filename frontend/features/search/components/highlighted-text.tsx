@@ -0,0 +1,38 @@
+import * as React from "react";
+import type { SearchHighlight } from "@/features/search/types";
+
+interface HighlightedTextProps {
+  text: string;
+  highlights: SearchHighlight[];
+  className?: string;
+}
+
+/**
+ * Renders `text` with the server-provided match ranges wrapped in <mark>.
+ */
+export function HighlightedText({
+  text,
+  highlights,
+  className,
+}: HighlightedTextProps) {
+  const parts: React.ReactNode[] = [];
+  let cursor = 0;
+  [...highlights]
+    .sort((a, b) => a.start - b.start)
+    .forEach(({ start, end }) => {
+      if (start < cursor || end > text.length || end <= start) return;
+      if (start > cursor) parts.push(text.slice(cursor, start));
+      parts.push(
+        <mark
+          key={start}
+          className="rounded-sm bg-primary/20 px-0.5 text-foreground"
+        >
+          {text.slice(start, end)}
+        </mark>,
+      );
+      cursor = end;
+    });
+  if (cursor < text.length) parts.push(text.slice(cursor));
+
+  return <span className={className}>{parts}</span>;
+}
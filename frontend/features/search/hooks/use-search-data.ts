@@ -28,7 +28,9 @@ export function useSearchData(
   const [tasks, setTasks] = React.useState<SearchResultTask[]>([]);
   const [projects, setProjects] = React.useState<SearchResultProject[]>([]);
   const [messages, setMessages] = React.useState<SearchResultMessage[]>([]);
+  const [hasMoreMessages, setHasMoreMessages] = React.useState(false);
   const [isLoading, setIsLoading] = React.useState(false);
+  const [isLoadingMore, setIsLoadingMore] = React.useState(false);
   const [error, setError] = React.useState<Error | null>(null);
 
   const abortRef = React.useRef<AbortController | null>(null);
@@ -37,6 +39,8 @@ export function useSearchData(
     setTasks([]);
     setProjects([]);
     setMessages([]);
+    setHasMoreMessages(false);
+    setIsLoadingMore(false);
   }, []);
 
   const fetchData = React.useCallback(
@@ -46,6 +50,7 @@ export function useSearchData(
       abortRef.current = controller;
 
       setIsLoading(true);
+      setIsLoadingMore(false);
       setError(null);
 
       try {
@@ -64,6 +69,7 @@ export function useSearchData(
         setTasks(data.tasks);
         setProjects(data.projects);
         setMessages(data.messages);
+        setHasMoreMessages(data.messagesHasMore);
       } catch (err) {
         if (controller.signal.aborted) return;
         setError(err instanceof Error ? err : new Error("Search failed"));
@@ -116,6 +122,54 @@ export function useSearchData(
     };
   }, []);
 
+  const loadMoreMessages = React.useCallback(async () => {
+    const q = query.trim();
+    if (!q || !hasMoreMessages || isLoadingMore) return;
+
+    abortRef.current?.abort();
+    const controller = new AbortController();
+    abortRef.current = controller;
+    setIsLoadingMore(true);
+
+    try {
+      const data = await searchService.globalSearch(
+        {
+          q,
+          project_id: options?.projectId ?? undefined,
+          limit_tasks: 0,
+          limit_projects: 0,
+          limit_messages: options?.limitMessages,
+          offset_messages: messages.length,
+        },
+        { signal: controller.signal },
+      );
+
+      if (controller.signal.aborted) return;
+      setMessages((prev) => {
+        const seen = new Set(prev.map((message) => message.id));
+        return [
+          ...prev,
+          ...data.messages.filter((message) => !seen.has(message.id)),
+        ];
+      });
+      setHasMoreMessages(data.messagesHasMore);
+    } catch (err) {
+      if (controller.signal.aborted) return;
+      setError(err instanceof Error ? err : new Error("Search failed"));
+    } finally {
+      if (!controller.signal.aborted) {
+        setIsLoadingMore(false);
+      }
+    }
+  }, [
+    hasMoreMessages,
+    isLoadingMore,
+    messages.length,
+    options?.limitMessages,
+    options?.projectId,
+    query,
+  ]);
+
   const refetch = React.useCallback(() => {
     const q = query.trim();
     if (!q) return;
@@ -126,9 +180,12 @@ export function useSearchData(
     tasks,
     projects,
     messages,
+    hasMoreMessages,
     isLoading,
+    isLoadingMore,
     error,
     refetch,
+    loadMoreMessages,
     disabled: !enabled,
   };
 }
@@ -1,8 +1,15 @@
+/** Matched character range in a result string, end exclusive. */
+export interface SearchHighlight {
+  start: number;
+  end: number;
+}
+
 export interface SearchResultTask {
   id: string;
   title: string;
   status: string;
   timestamp: string;
+  highlights: SearchHighlight[];
   type: "task";
 }
 
@@ -16,6 +23,9 @@ export interface SearchResultProject {
 export interface SearchResultMessage {
   id: number;
   content: string;
+  /** Window of `content` around the first match; `highlights` index into it. */
+  snippet: string;
+  highlights: SearchHighlight[];
   chatId: string;
   timestamp: string;
   type: "message";
@@ -30,6 +30,7 @@ export const API_ENDPOINTS = {
   sessionQueuedQuerySendNow: (sessionId: string, itemId: string) =>
     `/sessions/${sessionId}/queued-queries/${itemId}/send-now`,
   sessionState: (sessionId: string) => `/sessions/${sessionId}/state`,
+  sessionEvents: (sessionId: string) => `/sessions/${sessionId}/events`,
   sessionMessages: (sessionId: string) => `/sessions/${sessionId}/messages`,
   sessionMessagesDelta: (sessionId: string) =>
     `/sessions/${sessionId}/messages/delta`,
@@ -41,6 +42,8 @@ export const API_ENDPOINTS = {
     `/sessions/${sessionId}/messages-with-files`,
   sessionMessagesWithFilesDelta: (sessionId: string) =>
     `/sessions/${sessionId}/messages-with-files/delta`,
+  sessionMessagesWithFilesWindow: (sessionId: string) =>
+    `/sessions/${sessionId}/messages-with-files/window`,
   sessionToolExecutions: (sessionId: string) =>
     `/sessions/${sessionId}/tool-executions`,
   sessionToolExecutionsDelta: (sessionId: string) =>
@@ -51,6 +54,8 @@ export const API_ENDPOINTS = {
   usageAnalytics: "/usage/analytics",
   sessionWorkspaceFiles: (sessionId: string) =>
     `/sessions/${sessionId}/workspace/files`,
+  sessionWorkspaceDiff: (sessionId: string) =>
+    `/sessions/${sessionId}/workspace/diff`,
   sessionLocalMountFiles: (sessionId: string) =>
     `/sessions/${sessionId}/local-mounts/files`,
   sessionLocalMountFile: (sessionId: string) =>